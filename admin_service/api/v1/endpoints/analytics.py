@@ -20,9 +20,9 @@ from admin_service.services.analytics import (
     get_system_health,
 )
 from shared.core.api_response import api_response
-from shared.db.models import AdminUser
 from shared.db.sessions.database import get_db
-from shared.dependencies.admin import get_current_active_user
+from shared.dependencies.admin import get_current_principal
+from shared.dependencies.principal import Principal
 from shared.utils.exception_handlers import exception_handler
 
 router = APIRouter()
@@ -31,7 +31,7 @@ router = APIRouter()
 @router.get("/analytics", summary="Get admin-user analytics")
 @exception_handler
 async def user_analytics(
-    current_user: Annotated[AdminUser, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_principal)],
     db: AsyncSession = Depends(get_db),
 ) -> JSONResponse:
     """
@@ -69,7 +69,7 @@ async def user_analytics(
 )
 @exception_handler
 async def dashboard_analytics(
-    current_user: Annotated[AdminUser, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_principal)],
     db: AsyncSession = Depends(get_db),
 ) -> JSONResponse:
     """
@@ -102,7 +102,7 @@ async def dashboard_analytics(
 )
 @exception_handler
 async def recent_queries(
-    current_user: Annotated[AdminUser, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_principal)],
     db: AsyncSession = Depends(get_db),
     limit: int = Query(
         10, ge=1, le=50, description="Maximum number of queries to return"
@@ -133,7 +133,7 @@ async def recent_queries(
 )
 @exception_handler
 async def recent_contact_us(
-    current_user: Annotated[AdminUser, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_principal)],
     db: AsyncSession = Depends(get_db),
     limit: int = Query(
         10, ge=1, le=50, description="Maximum number of submissions to return"
@@ -164,7 +164,7 @@ async def recent_contact_us(
 )
 @exception_handler
 async def system_health(
-    current_user: Annotated[AdminUser, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_principal)],
     db: AsyncSession = Depends(get_db),
 ) -> JSONResponse:
     """
@@ -11,7 +11,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.responses import JSONResponse
 
 from admin_service.schemas.config import ConfigOut
-from admin_service.utils.auth import hash_password
 from shared.core.api_response import api_response
 from shared.core.config import settings
 from shared.db.models import Config
@@ -22,6 +21,7 @@ from shared.utils.file_uploads import (
     remove_file_if_exists,
     save_uploaded_file,
 )
+from shared.utils.password_hashing import password_hasher
 from shared.utils.password_validator import PasswordValidator
 
 router = APIRouter()
@@ -85,7 +85,7 @@ async def create_config(
     config = Config(
         id=1,  # Single config entry
         default_password=default_password,
-        default_password_hash=hash_password(default_password),
+        default_password_hash=await password_hasher.hash(default_password),
         logo_url=uploaded_logo_url,
         global_180_day_flag=global_180_day_flag,
     )
@@ -170,7 +170,9 @@ async def update_config(
             )
 
         config.default_password = default_password
-        config.default_password_hash = hash_password(default_password)
+        config.default_password_hash = await password_hasher.hash(
+            default_password
+        )
 
     # === Update boolean flag ===
     if global_180_day_flag is not None:
@@ -4,6 +4,7 @@ from typing import Annotated, Union
 import jwt
 from fastapi import (
     APIRouter,
+    BackgroundTasks,
     Depends,
     Request,
     Response,
@@ -18,6 +19,7 @@ from admin_service.services.auth import (
     check_password,
     check_password_expiry,
 )
+from admin_service.services.post_login import run_post_login_checks
 from admin_service.services.response_builders import (
     account_deactivated,
     account_not_approved,
@@ -34,7 +36,6 @@ from admin_service.services.session_management import (
 from admin_service.services.user_service import (
     check_user_email_verified,
     get_user_by_email,
-    get_user_role_name,
 )
 from admin_service.utils.auth import revoke_token
 from shared.constants import (
@@ -47,12 +48,13 @@ from shared.constants import (
 from shared.core.api_response import api_response
 from shared.core.config import PUBLIC_KEY, settings
 from shared.core.logging_config import get_logger
-from shared.db.models import AdminUser, BusinessProfile
+from shared.db.models import AdminUser, BusinessProfile, Role
 from shared.db.sessions.database import get_db
 from shared.dependencies.admin import (
     extract_token_from_request,
-    get_current_user,
+    get_current_principal,
 )
+from shared.dependencies.principal import Principal
 from shared.utils.exception_handlers import exception_handler
 
 logger = get_logger(__name__)
@@ -71,10 +73,28 @@ async def get_organizer_profile_info(user: AdminUser, db: AsyncSession) -> dict:
     For non-Organizer users:
     - Returns is_approved=2 (approved) to allow frontend flow
 
+    Role and business profile come from one joined query.
+
     Returns:
         dict: Contains is_approved, ref_number, and onboarding_status
     """
-    user_role_name = await get_user_role_name(db, user.user_id)
+    result = await db.execute(
+        select(
+            Role.role_name,
+            BusinessProfile.is_approved,
+            BusinessProfile.ref_number,
+            BusinessProfile.reviewer_comment,
+        )
+        .select_from(AdminUser)
+        .outerjoin(Role, Role.role_id == AdminUser.role_id)
+        .outerjoin(
+            BusinessProfile,
+            BusinessProfile.business_id == AdminUser.business_id,
+        )
+        .where(AdminUser.user_id == user.user_id)
+    )
+    row = result.one_or_none()
+    user_role_name = row.role_name if row else None
 
     # Non-organizer users
     if not user_role_name or user_role_name.lower() != "organizer":
@@ -93,18 +113,11 @@ async def get_organizer_profile_info(user: AdminUser, db: AsyncSession) -> dict:
     onboarding_status = "not_started"
     user_role_name = "organizer"
 
-    # Fetch business profile data
-    profile_stmt = select(
-        BusinessProfile.is_approved,
-        BusinessProfile.ref_number,
-        BusinessProfile.reviewer_comment,
-    ).where(BusinessProfile.business_id == user.business_id)
-
-    result = await db.execute(profile_stmt)
-    profile = result.one_or_none()
-
-    if profile:
-        is_approved, ref_number, reviewer_comment_from_db = profile
+    # No business profile yet if the outer join found none
+    if row.is_approved is not None:
+        is_approved = row.is_approved
+        ref_number = row.ref_number
+        reviewer_comment_from_db = row.reviewer_comment
 
         if is_approved == ONBOARDING_APPROVED and user.is_verified:
             onboarding_status = "approved"
@@ -136,6 +149,7 @@ async def login(
     request: Request,
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
     response: Response,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ) -> JSONResponse:
     """Handle user login with various validation checks"""
@@ -147,7 +161,9 @@ async def login(
     user = validation_result
 
     # Process successful authentication
-    return await process_successful_login(user, request, response, db)
+    return await process_successful_login(
+        user, request, response, db, background_tasks
+    )
 
 
 async def validate_login_attempt(
@@ -191,7 +207,11 @@ async def validate_login_attempt(
 
 
 async def process_successful_login(
-    user: AdminUser, request: Request, response: Response, db: AsyncSession
+    user: AdminUser,
+    request: Request,
+    response: Response,
+    db: AsyncSession,
+    background_tasks: BackgroundTasks,
 ) -> JSONResponse:
     """Process successful login and generate response"""
     # Step 5: 180-day password expiration policy
@@ -205,21 +225,21 @@ async def process_successful_login(
 
     # Step 7: Create a comprehensive device session record
     session = await SessionManager.create_session(
-        user, request, db, include_location=True
+        user,
+        request,
+        db,
+        include_location=True,
+        background_tasks=background_tasks,
     )
 
-    # Step 7.1: Check for suspicious activity
-    suspicious_alerts = await SessionManager.detect_suspicious_activity(
-        user.user_id, session, db
+    # Step 7.1: Check for suspicious activity after the response
+    background_tasks.add_task(
+        run_post_login_checks,
+        user.user_id,
+        session.session_id,
+        user.email,
+        user.username,
     )
-    if suspicious_alerts:
-        # Log suspicious activity (you might want to send notifications here)
-        for alert in suspicious_alerts:
-            logger.warning(
-                f"Suspicious activity detected for user {user.user_id}: {alert['message']}"
-            )
-
-    await db.refresh(user)
 
     # Step 8: Get organizer profile information if user is an organizer
     organizer_info = await get_organizer_profile_info(user, db)
@@ -270,7 +290,7 @@ async def process_successful_login(
 async def logout(
     request: Request,
     response: Response,
-    current_user: Annotated[AdminUser, Depends(get_current_user)],
+    current_user: Annotated[Principal, Depends(get_current_principal)],
     db: AsyncSession = Depends(get_db),
 ) -> JSONResponse:
     """Handle user logout by clearing cookies, revoking tokens, and deactivating sessions"""
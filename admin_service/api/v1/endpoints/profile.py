@@ -10,7 +10,8 @@ from shared.core.api_response import api_response
 from shared.core.config import settings
 from shared.db.models import AdminUser, Role
 from shared.db.sessions.database import get_db
-from shared.dependencies.admin import get_current_active_user
+from shared.dependencies.admin import get_current_principal
+from shared.dependencies.principal import Principal, admin_principal_cache
 from shared.utils.exception_handlers import exception_handler
 from shared.utils.file_uploads import (
     get_media_url,
@@ -25,7 +26,7 @@ router = APIRouter()
 @router.get("", response_model=UserProfile, summary="Get current user profile")
 @exception_handler
 async def get_profile(
-    current_user: Annotated[AdminUser, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_principal)],
     db: AsyncSession = Depends(get_db),
 ) -> JSONResponse:
     """
@@ -77,7 +78,7 @@ async def get_profile(
 # @router.put("", response_model=UserProfile, summary="Update user profile")
 # @exception_handler
 # async def update_profile(
-#     current_user: Annotated[AdminUser, Depends(get_current_active_user)],
+#     current_user: Annotated[Principal, Depends(get_current_principal)],
 #     profile_data: UpdateProfileRequest,
 #     db: AsyncSession = Depends(get_db),
 # ) -> JSONResponse:
@@ -204,7 +205,7 @@ async def get_profile(
 @router.patch("/picture", summary="Update profile picture")
 @exception_handler
 async def update_profile_picture(
-    current_user: Annotated[AdminUser, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_principal)],
     profile_picture: UploadFile = File(...),
     db: AsyncSession = Depends(get_db),
 ) -> JSONResponse:
@@ -265,7 +266,7 @@ async def update_profile_picture(
 @router.delete("", summary="Delete current user account")
 @exception_handler
 async def delete_account(
-    current_user: Annotated[AdminUser, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_principal)],
     db: AsyncSession = Depends(get_db),
 ) -> JSONResponse:
     """
@@ -298,6 +299,7 @@ async def delete_account(
     # Soft delete the user
     user.is_deleted = True
     await db.commit()
+    admin_principal_cache.invalidate(user.user_id)
 
     return api_response(
         status_code=status.HTTP_200_OK,
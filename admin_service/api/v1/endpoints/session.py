@@ -1,6 +1,5 @@
 from typing import Annotated
 
-import jwt
 from fastapi import APIRouter, Depends, Path, Response
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -13,14 +12,11 @@ from admin_service.schemas.session import (
 )
 from admin_service.services.session_management import SessionManager
 from shared.core.api_response import api_response
-from shared.core.config import PUBLIC_KEY, settings
 from shared.core.logging_config import get_logger
-from shared.db.models import AdminUser, AdminUserDeviceSession
+from shared.db.models import AdminUserDeviceSession
 from shared.db.sessions.database import get_db
-from shared.dependencies.admin import (
-    extract_token_from_request,
-    get_current_active_user,
-)
+from shared.dependencies.admin import get_current_principal
+from shared.dependencies.principal import Principal
 from shared.utils.exception_handlers import exception_handler
 
 logger = get_logger(__name__)
@@ -32,7 +28,7 @@ router = APIRouter()
 @exception_handler
 async def get_user_sessions(
     user_id: str,
-    current_user: Annotated[AdminUser, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_principal)],
     db: AsyncSession = Depends(get_db),
     active_only: bool = True,
     limit: int = 10,
@@ -81,31 +77,12 @@ async def get_user_sessions(
             )
         )
 
-    # Mark current session
-    # Get session ID from token
-    request = getattr(current_user, "_request", None)
-    if request:
-        token = extract_token_from_request(request)
-        if token:
-            try:
-                public_key = PUBLIC_KEY.get_secret_value()
-                if public_key:
-                    payload = jwt.decode(
-                        token,
-                        public_key,
-                        algorithms=[settings.JWT_ALGORITHM],
-                        options={"verify_exp": False},
-                    )
-                    current_session_id = payload.get("sid")
-                    if current_session_id:
-                        for session in formatted_sessions:
-                            if session.session_id == current_session_id:
-                                session.is_current = True
-                                break
-            except Exception as e:
-                logger.warning(
-                    f"Failed to decode token for session identification: {e}"
-                )
+    # Mark current session (the token's session)
+    if current_user.session_id:
+        for session in formatted_sessions:
+            if session.session_id == current_user.session_id:
+                session.is_current = True
+                break
 
     return api_response(
         status_code=200,
@@ -118,7 +95,7 @@ async def get_user_sessions(
 @exception_handler
 async def terminate_user_session(
     user_id: str,
-    current_user: Annotated[AdminUser, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_principal)],
     session_id: int = Path(
         ..., title="Session ID", description="ID of the session to terminate"
     ),
@@ -140,27 +117,7 @@ async def terminate_user_session(
         )
 
     # Check if this is the current session
-    is_current_session = False
-    request = getattr(current_user, "_request", None)
-    if request:
-        token = extract_token_from_request(request)
-        if token:
-            try:
-                public_key = PUBLIC_KEY.get_secret_value()
-                if public_key:
-                    payload = jwt.decode(
-                        token,
-                        public_key,
-                        algorithms=[settings.JWT_ALGORITHM],
-                        options={"verify_exp": False},
-                    )
-                    current_session_id = payload.get("sid")
-                    if current_session_id and current_session_id == session_id:
-                        is_current_session = True
-            except Exception as e:
-                logger.warning(
-                    f"Failed to decode token for session identification: {e}"
-                )
+    is_current_session = current_user.session_id == session_id
 
     # Terminate the session
     terminated = await SessionManager.terminate_session(
@@ -195,32 +152,13 @@ async def terminate_user_session(
 @exception_handler
 async def terminate_all_user_sessions(
     user_id: str,
-    current_user: Annotated[AdminUser, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_principal)],
     db: AsyncSession = Depends(get_db),
     keep_current: bool = True,
 ) -> JSONResponse:
     """Terminate all sessions for a specific user except optionally the current one"""
-    # Get current session ID from token
-    current_session_id = None
-    if keep_current:
-        request = getattr(current_user, "_request", None)
-        if request:
-            token = extract_token_from_request(request)
-            if token:
-                try:
-                    public_key = PUBLIC_KEY.get_secret_value()
-                    if public_key:
-                        payload = jwt.decode(
-                            token,
-                            public_key,
-                            algorithms=[settings.JWT_ALGORITHM],
-                            options={"verify_exp": False},
-                        )
-                        current_session_id = payload.get("sid")
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to decode token for session identification: {e}"
-                    )
+    # Current session ID from the token
+    current_session_id = current_user.session_id if keep_current else None
 
     # Terminate all sessions except current one
     terminated_count = await SessionManager.terminate_all_user_sessions(
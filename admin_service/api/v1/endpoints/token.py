@@ -25,6 +25,7 @@ from shared.core.logging_config import get_logger
 from shared.db.models import AdminUser, AdminUserDeviceSession
 from shared.db.sessions.database import get_db
 from shared.utils.exception_handlers import exception_handler
+from shared.utils.session_activity import admin_session_activity
 
 logger = get_logger(__name__)
 
@@ -264,6 +265,7 @@ async def perform_revoke_token(
             if session:
                 session.is_active = False
                 await db.commit()
+                admin_session_activity.invalidate([session_id])
 
                 return api_response(
                     status_code=status.HTTP_200_OK,
@@ -11,6 +11,7 @@ from admin_service.services.user_service import get_user_by_id
 from shared.core.api_response import api_response
 from shared.db.models import AdminUser, Role
 from shared.db.sessions.database import get_db
+from shared.dependencies.principal import admin_principal_cache
 from shared.utils.exception_handlers import exception_handler
 from shared.utils.file_uploads import get_media_url
 from shared.utils.username_validators import UsernameValidator
@@ -271,6 +272,7 @@ async def update_username_and_role(
     # === 4. Commit changes ===
     await db.commit()
     await db.refresh(user)
+    admin_principal_cache.invalidate(user.user_id)
 
     # === 5. Fetch role name explicitly ===
     role_result = await db.execute(
@@ -322,6 +324,7 @@ async def deactivate_user(
     user.is_deleted = True
     await db.commit()
     await db.refresh(user)
+    admin_principal_cache.invalidate(user.user_id)
 
     return api_response(
         status_code=status.HTTP_200_OK,
@@ -359,6 +362,7 @@ async def reactivate_user(
     user.is_deleted = False
     await db.commit()
     await db.refresh(user)
+    admin_principal_cache.invalidate(user.user_id)
 
     return api_response(
         status_code=status.HTTP_200_OK,
@@ -395,6 +399,7 @@ async def hard_delete_user(
 
     await db.delete(user)
     await db.commit()
+    admin_principal_cache.invalidate(user_id)
 
     return api_response(
         status_code=status.HTTP_200_OK,
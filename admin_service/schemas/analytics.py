@@ -178,6 +178,30 @@ class RecentContactsResponse(BaseModel):
     total: int = Field(..., description="Total number of contacts returned")
 
 
+class CacheStats(BaseModel):
+    """Counters of an in-process cache (per worker)."""
+
+    size: int = Field(..., description="Entries currently cached")
+    maxsize: int = Field(..., description="Maximum number of entries")
+    hits: int = Field(..., description="Lookups answered from the cache")
+    misses: int = Field(..., description="Lookups that had to compute")
+    hit_rate: float = Field(..., description="hits / (hits + misses)")
+
+
+class MediaStorageStats(BaseModel):
+    """Upload counters of the shared media client (per worker)."""
+
+    started: bool = Field(..., description="Shared client is open")
+    max_connections: int = Field(..., description="Connection pool size")
+    in_flight: int = Field(..., description="Uploads in progress")
+    uploads: int = Field(..., description="Uploads completed")
+    upload_failures: int = Field(..., description="Uploads that failed")
+    avg_upload_ms: float = Field(..., description="Mean recent upload time")
+    p95_upload_ms: float = Field(
+        ..., description="95th percentile of recent upload times"
+    )
+
+
 class SystemHealth(BaseModel):
     """System health status information."""
 
@@ -186,6 +210,12 @@ class SystemHealth(BaseModel):
     last_backup: str = Field(..., description="Last backup information")
     overall_status: str = Field(..., description="Overall system status")
     timestamp: str = Field(..., description="Health check timestamp")
+    user_agent_cache: Optional[CacheStats] = Field(
+        None, description="User-agent parse cache of this worker"
+    )
+    media_storage: Optional[MediaStorageStats] = Field(
+        None, description="Media upload client of this worker"
+    )
 
     class Config:
         """Pydantic configuration."""
@@ -24,6 +24,8 @@ from shared.db.models.new_events import (
     PaymentStatus,
 )
 from shared.db.models.rbac import Role
+from shared.utils.device_info import user_agent_cache
+from shared.utils.upload_files import media_storage
 
 
 async def get_admin_user_analytics(
@@ -782,4 +784,6 @@ async def get_system_health(db: AsyncSession) -> Dict[str, Any]:
         "last_backup": last_backup,
         "overall_status": overall_status,
         "timestamp": datetime.now(timezone.utc).isoformat(),
+        "user_agent_cache": user_agent_cache.stats(),
+        "media_storage": media_storage.stats(),
     }
@@ -6,7 +6,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.responses import JSONResponse
 
-from admin_service.utils.auth import create_jwt_token, verify_password
+from admin_service.utils.auth import create_jwt_token
 from shared.constants import (
     ACCOUNT_LOCKED_STATUS,
     ACCOUNT_LOCKOUT_DURATION_HOURS,
@@ -18,6 +18,7 @@ from shared.constants import (
 from shared.core.api_response import api_response
 from shared.core.config import PRIVATE_KEY, settings
 from shared.db.models import AdminUser, AdminUserDeviceSession
+from shared.utils.password_hashing import password_hasher
 
 
 async def check_account_lock(
@@ -44,7 +45,10 @@ async def check_account_lock(
 async def check_password(
     user: AdminUser, password: str, db: AsyncSession
 ) -> JSONResponse | None:
-    if not verify_password(password, user.password_hash):
+    verified, new_hash = await password_hasher.verify_and_update(
+        password, user.password_hash
+    )
+    if not verified:
         user.failure_login_attempts += 1
         await db.commit()
 
@@ -71,6 +75,10 @@ async def check_password(
             log_error=True,
         )
 
+    if new_hash:
+        # Stored with an outdated bcrypt cost (BCRYPT_ROUNDS changed)
+        user.password_hash = new_hash
+        await db.commit()
     return None
 
 
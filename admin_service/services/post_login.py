@@ -0,0 +1,60 @@
+"""
+Work that follows a successful admin login, run after the response.
+
+Risk analysis compares the new device session with the user's sessions of
+the last 24 hours and may email the user. Nothing in it changes what the
+login returns, so ``process_successful_login`` hands it to a background
+task and the response only waits for the credential checks and the
+session insert.
+"""
+
+from starlette.concurrency import run_in_threadpool
+
+from admin_service.services.session_management import SessionManager
+from shared.core.logging_config import get_logger
+from shared.db.models import AdminUserDeviceSession
+from shared.db.sessions.database import AsyncSessionLocal
+from shared.utils.email_utils import send_admin_login_alert_email
+
+logger = get_logger(__name__)
+
+# Alerts at these severities are emailed to the user, not only logged
+NOTIFY_SEVERITIES = {"medium", "high"}
+
+
+async def run_post_login_checks(
+    user_id: str, session_id: int, email: str, username: str
+) -> None:
+    """Detect suspicious activity for a new session and notify the user."""
+    try:
+        async with AsyncSessionLocal() as db:
+            session = await db.get(AdminUserDeviceSession, session_id)
+            if session is None:
+                return
+            alerts = await SessionManager.detect_suspicious_activity(
+                user_id, session, db
+            )
+    except Exception as e:
+        logger.error(f"Post-login checks failed for user {user_id}: {e}")
+        return
+
+    for alert in alerts:
+        logger.warning(
+            f"Suspicious activity detected for user {user_id}: "
+            f"{alert['message']}"
+        )
+
+    notify = [
+        alert for alert in alerts if alert["severity"] in NOTIFY_SEVERITIES
+    ]
+    if notify:
+        # SMTP is blocking; keep it off the event loop
+        await run_in_threadpool(
+            send_admin_login_alert_email,
+            email,
+            username,
+            notify,
+            device_name=session.device_name,
+            ip_address=session.ip_address,
+            location=session.location,
+        )
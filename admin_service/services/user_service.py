@@ -9,6 +9,7 @@ from shared.db.models import AdminUser
 from shared.db.models.admin_users import AdminUserVerification
 from shared.db.models.config import Config
 from shared.db.models.rbac import Role
+from shared.utils.rbac_matrix import get_role_name
 
 logger = get_logger(__name__)
 
@@ -62,6 +63,8 @@ async def get_user_role_name(db: AsyncSession, user_id: str) -> Optional[str]:
     """
     Get a user's role name without triggering lazy loading.
 
+    The name comes from the in-memory RBAC matrix.
+
     Args:
         db: Database session
         user_id: The user ID to check
@@ -70,12 +73,9 @@ async def get_user_role_name(db: AsyncSession, user_id: str) -> Optional[str]:
         Optional[str]: The role name if found, None otherwise
     """
     result = await db.execute(
-        select(Role.role_name)
-        .join(AdminUser, AdminUser.role_id == Role.role_id)
-        .where(AdminUser.user_id == user_id)
+        select(AdminUser.role_id).where(AdminUser.user_id == user_id)
     )
-    role_name = result.scalar_one_or_none()
-    return role_name
+    return await get_role_name(db, result.scalar_one_or_none())
 
 
 async def get_user_by_id(db: AsyncSession, user_id: str) -> AdminUser | None:
@@ -1,17 +1,20 @@
 import secrets
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Union
+from typing import Any, Dict, Tuple, Union
 
 import jwt
-from passlib.context import CryptContext
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicKey
 
-from shared.core.config import JWT_KEY_ID, PUBLIC_KEY, settings
+from shared.core.config import key_registry, settings
 from shared.core.logging_config import get_logger
+from shared.utils.password_hashing import password_hasher
 from shared.utils.token_blacklist import add_to_blacklist, is_blacklisted
+from shared.utils.verified_tokens import verified_tokens
 
 logger = get_logger(__name__)
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Blocking; request handlers use the async ``password_hasher`` instead
+pwd_context = password_hasher.context
 
 
 def hash_password(password: str) -> str:
@@ -33,7 +36,8 @@ def create_jwt_token(
 
     Args:
         data (dict): Payload data.
-        private_key (str/bytes): RSA private key.
+        private_key (str/bytes): RSA private key PEM; its parsed object and
+            kid come from the key registry.
         expires_in (int): Expiry time in seconds.
 
     Returns:
@@ -60,39 +64,40 @@ def create_jwt_token(
         "jti": secrets.token_hex(16),  # Add a unique token ID
         "iss": settings.JWT_ISSUER,  # Issuer claim
         "aud": settings.JWT_AUDIENCE,  # Audience claim
-        "kid": JWT_KEY_ID,  # Key ID for key rotation support
     }
 
     try:
+        kid, signing_key = key_registry.resolve_private(private_key)
+        payload["kid"] = kid  # Key ID for key rotation support
+
         # Ensure algorithm is explicitly set to RS256
         if settings.JWT_ALGORITHM != "RS256":
             logger.warning(
                 f"JWT algorithm in settings is {settings.JWT_ALGORITHM}, but RS256 is required"
             )
 
-        token = jwt.encode(payload, private_key, algorithm="RS256")
-
-        # Verify the token can be decoded (sanity check)
-        try:
-            jwt.decode(
-                token,
-                PUBLIC_KEY.get_secret_value(),
-                algorithms=["RS256"],
-                audience=settings.JWT_AUDIENCE,
-                issuer=settings.JWT_ISSUER,
-            )
-        except Exception as verify_error:
-            logger.error(f"Generated token failed verification: {verify_error}")
-            raise RuntimeError(
-                f"Token generation failed verification: {verify_error}"
-            )
-
-        return token
+        return jwt.encode(
+            payload,
+            signing_key,
+            algorithm="RS256",
+            headers={"kid": kid},
+        )
     except Exception as e:
         logger.exception("JWT encoding failed.")
         raise RuntimeError(f"JWT encoding failed: {e}") from e
 
 
+def _verification_key(
+    token: str, public_key: Union[str, bytes]
+) -> Tuple[str, RSAPublicKey]:
+    """The registered key named by the token's kid, else ``public_key``."""
+    kid = jwt.get_unverified_header(token).get("kid")
+    verifying_key = key_registry.public_key(kid) if kid else None
+    if verifying_key is None:
+        return key_registry.resolve_public(public_key)
+    return kid, verifying_key
+
+
 # JWT Verification Function
 def verify_jwt_token(
     token: str,
@@ -101,6 +106,10 @@ def verify_jwt_token(
     """
     Verify and decode a RS256 JWT token.
 
+    A token whose header ``kid`` is in the key registry is verified with
+    that key (so tokens signed before a key rotation stay valid); others
+    use ``public_key``. Verified tokens are cached until they expire.
+
     Args:
         token (str): JWT token to verify.
         public_key (str/bytes): RSA public key.
@@ -126,24 +135,29 @@ def verify_jwt_token(
     }
 
     try:
-        # Force RS256 algorithm to match token creation
-        payload = jwt.decode(
-            token,
-            public_key,
-            algorithms=["RS256"],  # Hardcode RS256 to ensure consistency
-            options=options,
-            audience=settings.JWT_AUDIENCE,
-            issuer=settings.JWT_ISSUER,
-        )
+        kid, verifying_key = _verification_key(token, public_key)
+        payload = verified_tokens.get(kid, token)
+        if payload is None:
+            # Force RS256 algorithm to match token creation
+            payload = jwt.decode(
+                token,
+                verifying_key,
+                algorithms=["RS256"],  # Hardcode RS256 to ensure consistency
+                options=options,
+                audience=settings.JWT_AUDIENCE,
+                issuer=settings.JWT_ISSUER,
+            )
+            verified_tokens.put(kid, token, payload)
 
         # Check if token is blacklisted
         if "jti" in payload and is_blacklisted(payload["jti"]):
+            verified_tokens.forget(token)
             logger.warning(
                 f"Attempt to use blacklisted token with JTI: {payload['jti']}"
             )
             raise ValueError("Token has been revoked.")
 
-        return payload
+        return dict(payload)
 
     except jwt.ExpiredSignatureError as exc:
         logger.warning("JWT token has expired.")
@@ -190,9 +204,10 @@ def revoke_token(token: str, public_key: Union[str, bytes]) -> bool:
     try:
         # Decode the token without verifying expiration
         # We want to blacklist even if it's already expired
+        _, verifying_key = _verification_key(token, public_key)
         payload = jwt.decode(
             token,
-            public_key,
+            verifying_key,
             algorithms=["RS256"],
             options={
                 "verify_signature": True,  # Still verify signature
@@ -215,6 +230,7 @@ def revoke_token(token: str, public_key: Union[str, bytes]) -> bool:
         # Add token to blacklist
         exp_datetime = datetime.fromtimestamp(payload["exp"], tz=timezone.utc)
         add_to_blacklist(payload["jti"], exp_datetime)
+        verified_tokens.forget(token)
 
         logger.info(
             f"Token for user {payload.get('uid', 'unknown')} has been revoked"
@@ -2,7 +2,6 @@ from typing import Any, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import RedirectResponse
-from paypalcheckoutsdk.orders import OrdersCaptureRequest, OrdersCreateRequest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from event_service.schemas.bookings import (
@@ -137,36 +136,31 @@ async def create_event_booking(
     booking = await create_booking(db, booking_data)
 
     # Step 4: Generate PayPal Order
-    request = OrdersCreateRequest()
-    request.headers["prefer"] = "return=representation"
-
-    request.request_body(
-        {
-            "intent": "CAPTURE",
-            "purchase_units": [
-                {
-                    "amount": {
-                        "currency_code": "AUD",
-                        "value": str(round(booking_data.total_price, 2)),
-                    }
+    order_body = {
+        "intent": "CAPTURE",
+        "purchase_units": [
+            {
+                "amount": {
+                    "currency_code": "AUD",
+                    "value": str(round(booking_data.total_price, 2)),
                 }
-            ],
-            "application_context": {
-                "payment_method_preference": "IMMEDIATE_PAYMENT_REQUIRED",
-                "brand_name": "Events2Go",
-                "landing_page": "LOGIN",
-                "locale": "en-AU",
-                "user_action": "PAY_NOW",
-                # "return_url": f"{settings.USERS_APPLICATION_FRONTEND_URL}/booking-success?booking_id={booking.booking_id}",
-                # "cancel_url": f"{settings.USERS_APPLICATION_FRONTEND_URL}/booking-failure?booking_id={booking.booking_id}",
-                "return_url": f"{settings.API_BACKEND_URL}/api/v1/bookings/confirm?booking_id={booking.booking_id}",
-                "cancel_url": f"{settings.API_BACKEND_URL}/api/v1/bookings/cancel?booking_id={booking.booking_id}",
-            },
-        }
-    )
+            }
+        ],
+        "application_context": {
+            "payment_method_preference": "IMMEDIATE_PAYMENT_REQUIRED",
+            "brand_name": "Events2Go",
+            "landing_page": "LOGIN",
+            "locale": "en-AU",
+            "user_action": "PAY_NOW",
+            # "return_url": f"{settings.USERS_APPLICATION_FRONTEND_URL}/booking-success?booking_id={booking.booking_id}",
+            # "cancel_url": f"{settings.USERS_APPLICATION_FRONTEND_URL}/booking-failure?booking_id={booking.booking_id}",
+            "return_url": f"{settings.API_BACKEND_URL}/api/v1/bookings/confirm?booking_id={booking.booking_id}",
+            "cancel_url": f"{settings.API_BACKEND_URL}/api/v1/bookings/cancel?booking_id={booking.booking_id}",
+        },
+    }
 
     try:
-        response = paypal_client.client.execute(request)
+        response = await paypal_client.client.create_order(order_body)
 
         # Extract approval URL using helper function
         approval_url = extract_approval_url_from_paypal_response(response)
@@ -197,9 +191,8 @@ async def confirm_booking(
     token: str, booking_id: str, db: AsyncSession = Depends(get_db)
 ):
     # Capture the payment
-    request = OrdersCaptureRequest(token)
     try:
-        response = paypal_client.client.execute(request)
+        response = await paypal_client.client.capture_order(token)
 
         # Check payment status using helper function
         payment_status = check_paypal_payment_status(response)
@@ -2,10 +2,11 @@ import logging
 import os
 
 from dotenv import load_dotenv
-from paypalcheckoutsdk.core import (
-    LiveEnvironment,
-    PayPalHttpClient,
-    SandboxEnvironment,
+
+from shared.utils.paypal import (
+    LIVE_BASE_URL,
+    SANDBOX_BASE_URL,
+    AsyncPayPalClient,
 )
 
 load_dotenv()
@@ -27,24 +28,25 @@ class PayPalClient:
             raise ValueError("PAYPAL_MODE must be either 'sandbox' or 'live'")
 
         if paypal_mode == "live":
-            self.environment = LiveEnvironment(
-                client_id=self.client_id, client_secret=self.client_secret
-            )
+            base_url = LIVE_BASE_URL
             logger.info("PayPal initialized in LIVE mode")
             # Security: Don't log sensitive URLs in production
         else:
-            self.environment = SandboxEnvironment(
-                client_id=self.client_id, client_secret=self.client_secret
-            )
+            base_url = SANDBOX_BASE_URL
             logger.info("PayPal initialized in SANDBOX mode")
 
-        self.client = PayPalHttpClient(self.environment)
+        # Pooled async client: calls never block the event loop
+        self.client = AsyncPayPalClient(
+            client_id=self.client_id,
+            client_secret=self.client_secret,
+            base_url=os.getenv("PAYPAL_BASE_URL", base_url),
+        )
 
         # Verify environment matches expectation
-        is_sandbox = "sandbox" in self.environment.base_url.lower()
+        is_sandbox = self.client.is_sandbox
         expected_sandbox = paypal_mode == "sandbox"
 
-        if is_sandbox != expected_sandbox:
+        if is_sandbox != expected_sandbox and not os.getenv("PAYPAL_BASE_URL"):
             raise ValueError(
                 f"Environment mismatch: Expected {'sandbox' if expected_sandbox else 'live'}, got {'sandbox' if is_sandbox else 'live'}"
             )
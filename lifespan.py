@@ -6,8 +6,18 @@ from fastapi import FastAPI
 from rbac_service.services.init_roles_permissions import init_roles_permissions
 
 # from schedulers.scheduler_runner import start_schedulers
+from schedulers.worker_tasks import start_worker_tasks, stop_worker_tasks
 from shared.core.logging_config import get_logger
 from shared.db.sessions.database import AsyncSessionLocal, init_db, shutdown_db
+from shared.utils.email import email_sender
+from shared.utils.email_outbox import close_smtp_pool
+from shared.utils.geolocation import geo_resolver
+from shared.utils.password_hashing import password_hasher
+from shared.utils.paypal import close_paypal_clients
+from shared.utils.rbac_matrix import rbac_matrix
+from shared.utils.session_activity import flush_session_activity
+from shared.utils.token_blacklist import sync_revocations
+from shared.utils.upload_files import media_storage
 
 logger = get_logger(__name__)
 
@@ -26,6 +36,24 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[Any, None]:
             await init_roles_permissions(session)
             logger.info("Default roles and permissions initialized")
 
+            # Answer role and permission checks from memory
+            await rbac_matrix.load(session)
+
+            # Load tokens revoked by other workers before serving requests
+            await sync_revocations(session)
+
+        # Load the GeoIP range table before the first login needs it
+        await geo_resolver.load()
+
+        # Compile email templates once rather than on the first sends
+        await email_sender.templates.load()
+
+        # One pooled Spaces client for every media upload
+        await media_storage.start()
+
+        # Jobs on this worker's in-memory state run in every worker
+        start_worker_tasks()
+
         # # Start background schedulers
         # start_schedulers()
         # logger.info("Schedulers started successfully")
@@ -38,6 +66,16 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[Any, None]:
 
     logger.info(msg="Shutting down FastAPI application...")
     try:
+        await stop_worker_tasks()
+        await close_paypal_clients()
+        await close_smtp_pool()
+        await geo_resolver.aclose()
+        await media_storage.aclose()
+        password_hasher.shutdown()
+        # Write buffered activity and revocations before the pool closes
+        async with AsyncSessionLocal() as session:
+            await flush_session_activity(session)
+            await sync_revocations(session)
         await shutdown_db()
         logger.info(msg="Database shutdown successfully")
     except Exception as e:
@@ -2,6 +2,7 @@ from fastapi import APIRouter
 
 from new_event_service.api.v1.endpoints import (
     analytics,
+    attendee_notifications,
     bookings,
     category_events,
     coupons,
@@ -30,6 +31,11 @@ new_event_router.include_router(
 new_event_router.include_router(
     events.router, prefix="/new-events", tags=["New Events"]
 )
+new_event_router.include_router(
+    attendee_notifications.router,
+    prefix="/new-events",
+    tags=["Attendee Notifications"],
+)
 new_event_router.include_router(
     slug_events.router, prefix="/new-events", tags=["New Slug Events"]
 )
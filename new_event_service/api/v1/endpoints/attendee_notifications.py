@@ -0,0 +1,116 @@
+from typing import Annotated
+
+from fastapi import APIRouter, BackgroundTasks, Depends, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from new_event_service.schemas.attendee_notifications import (
+    AttendeeNotificationJobResponse,
+    AttendeeNotificationRequest,
+)
+from new_event_service.services.attendee_notifications import (
+    create_notification_job,
+)
+from new_event_service.services.events import fetch_event_by_id
+from new_event_service.services.response_builder import (
+    event_not_found_response,
+)
+from schedulers.attendee_notifier import attendee_notification_job
+from shared.core.api_response import api_response
+from shared.db.models import AttendeeNotificationJob
+from shared.db.sessions.database import get_db
+from shared.dependencies.admin import get_current_principal
+from shared.dependencies.principal import Principal
+from shared.utils.exception_handlers import exception_handler
+
+router = APIRouter()
+
+
+def not_event_organizer_response():
+    return api_response(
+        status_code=status.HTTP_403_FORBIDDEN,
+        message="Only the event's organizer can notify its attendees",
+    )
+
+
+@router.post(
+    "/{event_id}/attendee-notifications",
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Email every attendee that the event was rescheduled or cancelled",
+)
+@exception_handler
+async def notify_event_attendees(
+    event_id: str,
+    payload: AttendeeNotificationRequest,
+    background_tasks: BackgroundTasks,
+    current_user: Annotated[Principal, Depends(get_current_principal)],
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Queue an email to every attendee with an approved booking.
+
+    Returns at once with the job; sending happens in the background. Poll
+    the job's progress with the GET endpoint below.
+    """
+    event = await fetch_event_by_id(db, event_id)
+    if not event:
+        return event_not_found_response()
+    if event.organizer_id != current_user.user_id:
+        return not_event_organizer_response()
+
+    job = await create_notification_job(
+        db,
+        event,
+        current_user.user_id,
+        payload.kind,
+        message=payload.message,
+        event_date=payload.event_date,
+        event_time=payload.event_time,
+        event_location=payload.event_location,
+    )
+    background_tasks.add_task(attendee_notification_job, job.job_id)
+
+    return api_response(
+        status_code=status.HTTP_202_ACCEPTED,
+        message="Attendee notification queued",
+        data=AttendeeNotificationJobResponse.model_validate(job).model_dump(),
+    )
+
+
+@router.get(
+    "/{event_id}/attendee-notifications/{job_id}",
+    status_code=status.HTTP_200_OK,
+    summary="Progress of an attendee notification",
+)
+@exception_handler
+async def get_attendee_notification(
+    event_id: str,
+    job_id: int,
+    current_user: Annotated[Principal, Depends(get_current_principal)],
+    db: AsyncSession = Depends(get_db),
+):
+    event = await fetch_event_by_id(db, event_id)
+    if not event:
+        return event_not_found_response()
+    if event.organizer_id != current_user.user_id:
+        return not_event_organizer_response()
+
+    job = (
+        await db.execute(
+            select(AttendeeNotificationJob).where(
+                AttendeeNotificationJob.job_id == job_id,
+                AttendeeNotificationJob.event_id == event_id,
+            )
+        )
+    ).scalar_one_or_none()
+    if not job:
+        return api_response(
+            status_code=status.HTTP_404_NOT_FOUND,
+            message="Attendee notification not found",
+        )
+
+    return api_response(
+        status_code=status.HTTP_200_OK,
+        message="Attendee notification retrieved successfully",
+        data=AttendeeNotificationJobResponse.model_validate(job).model_dump(),
+    )
@@ -1,13 +1,20 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Annotated, Optional
-
-from fastapi import APIRouter, Depends, HTTPException, Path, status
+from urllib.parse import quote_plus
+
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    Header,
+    Path,
+    Request,
+    status,
+)
 from fastapi.params import Query
 from fastapi.responses import JSONResponse, RedirectResponse
-from paypalcheckoutsdk.orders import OrdersCaptureRequest
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from new_event_service.schemas.bookings import (
     ID_REGEX,
@@ -16,41 +23,62 @@ from new_event_service.schemas.bookings import (
     OrganizerEventsStatsResponse,
     SeatCategoryItem,
 )
-from new_event_service.services.booking_helpers import (
-    check_paypal_payment_status,
-    create_paypal_order,
-    extract_capture_id,
+from new_event_service.services.booking_helpers import create_paypal_order
+from new_event_service.services.booking_payments import (
+    HANDLED_WEBHOOK_EVENTS,
+    cancel_order,
+    capture_and_finalize,
+    get_booking_status,
+    lock_processing_order,
+    queue_booking_confirmation,
+    record_webhook_event,
 )
+from new_event_service.services.booking_preflight import booking_preflight
 from new_event_service.services.bookings import get_organizer_events_with_stats
-from new_event_service.services.events import check_event_exists
 from new_event_service.services.response_builder import event_not_found_response
+from new_event_service.services.seat_inventory import (
+    get_available_seats,
+    release_held_seats,
+    reserve_seats,
+)
 from new_event_service.utils.barcode_generator import BarcodeGenerator
 from new_event_service.utils.paypal_client import paypal_client
 from new_event_service.utils.qrcode_generator import generate_qr_code
+from schedulers.email_outbox_dispatcher import email_outbox_job
+from schedulers.paypal_webhook_worker import webhook_inbox_job
 from shared.core.api_response import api_response
 from shared.core.config import settings
 from shared.core.logging_config import get_logger
-from shared.db.models import (
-    EventStatus,
-    NewEvent,
-    NewEventBooking,
-    NewEventSeatCategory,
-    NewEventSlot,
+from shared.db.idempotency import (
+    IDEMPOTENCY_HEADER,
+    request_fingerprint,
+    run_idempotent,
 )
+from shared.db.loader_profiles import LoaderProfile, loader_options
+from shared.db.models import EventStatus, NewEvent, NewEventBooking
 from shared.db.models.coupons import Coupon
 from shared.db.models.new_events import (
     BookingStatus,
     NewEventBookingOrder,
     PaymentStatus,
 )
+from shared.db.pagination import (
+    CountMode,
+    InvalidCursorError,
+    count_rows,
+    fetch_page,
+)
 from shared.db.sessions.database import get_db
-from shared.utils.email_utils import send_new_booking_success_email
 from shared.utils.exception_handlers import exception_handler
 from shared.utils.file_uploads import get_media_url
 from shared.utils.id_generators import generate_digits_letters
 
 logger = get_logger(__name__)
 
+IdempotencyKeyHeader = Annotated[
+    Optional[str], Header(alias=IDEMPOTENCY_HEADER, max_length=255)
+]
+
 
 def _extract_event_address(event: NewEvent) -> Optional[str]:
     """
@@ -85,6 +113,32 @@ def _extract_event_address(event: NewEvent) -> Optional[str]:
         return None
 
 
+def _build_pagination_info(
+    page: int,
+    limit: int,
+    cursor: Optional[str],
+    next_cursor: Optional[str],
+    total_count: Optional[int],
+) -> dict:
+    """
+    Pagination block for booking listings. Page/limit clients keep their
+    fields; cursor clients pass ``next_cursor`` back as ``cursor``.
+    ``total_count``/``total_pages`` are None when counting was skipped.
+    """
+    total_pages = (
+        (total_count + limit - 1) // limit if total_count is not None else None
+    )
+    return {
+        "current_page": None if cursor else page,
+        "total_pages": total_pages,
+        "total_count": total_count,
+        "limit": limit,
+        "has_next": next_cursor is not None,
+        "has_prev": bool(cursor) or page > 1,
+        "next_cursor": next_cursor,
+    }
+
+
 router = APIRouter()
 
 
@@ -96,6 +150,7 @@ router = APIRouter()
 @exception_handler
 async def create_event_booking_order(
     booking_req: BookingCreateRequest,
+    idempotency_key: IdempotencyKeyHeader = None,
     db: AsyncSession = Depends(get_db),
 ) -> JSONResponse:
     """
@@ -104,12 +159,31 @@ async def create_event_booking_order(
     - Slot must exist and be ACTIVE on the given date.
     - Seat categories must belong to that slot and have enough available seats.
     - Prevents duplicate/overlapping bookings for the same user (PROCESSING/APPROVED).
-    - Places seats in HELD state until payment confirmation.
+    - Places seats in HELD state until payment confirmation; the hold is an
+      atomic conditional update, so concurrent bookings cannot oversell.
     - Integrates with PayPal to create an order and return approval URL.
+    - A retry with the same Idempotency-Key gets the first response back
+      without holding seats or creating a PayPal order again.
     """
+    return await run_idempotent(
+        db,
+        "new-bookings:book",
+        idempotency_key,
+        request_fingerprint(booking_req.model_dump(mode="json")),
+        lambda: _create_event_booking_order(booking_req, db),
+    )
+
 
-    # 1. Validate event
-    event = await check_event_exists(db, booking_req.event_ref_id)
+async def _create_event_booking_order(
+    booking_req: BookingCreateRequest, db: AsyncSession
+) -> JSONResponse:
+
+    # 1. Load event, slot, seat categories, pending orders and coupons in
+    # one round trip
+    preflight = await booking_preflight(db, booking_req)
+
+    # 2. Validate event
+    event = preflight.event
     if not event:
         return event_not_found_response()
 
@@ -120,21 +194,16 @@ async def create_event_booking_order(
             data={},
         )
 
-    # 2. Validate event_date
-    if booking_req.event_date not in event.event_dates:
+    # 3. Validate event_date
+    if not event.has_date:
         return api_response(
             status_code=status.HTTP_400_BAD_REQUEST,
             message=f"Invalid event date {booking_req.event_date} for event {booking_req.event_ref_id}",
             data={},
         )
 
-    # 3. Validate slot
-    query_slot = select(NewEventSlot).where(
-        NewEventSlot.slot_id == booking_req.slot_ref_id,
-        NewEventSlot.event_ref_id == booking_req.event_ref_id,
-        NewEventSlot.slot_date == booking_req.event_date,
-    )
-    slot = (await db.execute(query_slot)).scalar_one_or_none()
+    # 4. Validate slot
+    slot = preflight.slot
     if not slot:
         return api_response(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -149,18 +218,11 @@ async def create_event_booking_order(
             data={},
         )
 
-    # 4. Validate seat categories
+    # 4.1 Validate seat categories
     seat_category_ids = [
         sc.seat_category_ref_id for sc in booking_req.seatCategories
     ]
-    query_seats = select(NewEventSeatCategory).where(
-        NewEventSeatCategory.slot_ref_id == slot.slot_id,
-        NewEventSeatCategory.seat_category_id.in_(seat_category_ids),
-    )
-    db_seat_categories = {
-        s.seat_category_id: s
-        for s in (await db.execute(query_seats)).scalars().all()
-    }
+    db_seat_categories = preflight.seat_categories
 
     if len(db_seat_categories) != len(seat_category_ids):
         return api_response(
@@ -177,24 +239,10 @@ async def create_event_booking_order(
     for seat_req in booking_req.seatCategories:
         db_seat = db_seat_categories[seat_req.seat_category_ref_id]
 
-        # 5.1 Duplicate booking check (PROCESSING or APPROVED)
-        existing_order_query = (
-            select(NewEventBookingOrder)
-            .join(NewEventBookingOrder.line_items)
-            .where(
-                NewEventBookingOrder.user_ref_id == booking_req.user_ref_id,
-                NewEventBookingOrder.event_ref_id == booking_req.event_ref_id,
-                NewEventBookingOrder.slot_ref_id == booking_req.slot_ref_id,
-                NewEventBookingOrder.booking_status.in_(
-                    [BookingStatus.PROCESSING] # ,  BookingStatus.APPROVED
-                ),
-                NewEventBooking.seat_category_ref_id
-                == seat_req.seat_category_ref_id,
-            )
+        # 5.1 Duplicate booking check (PROCESSING)
+        existing_order = preflight.pending_orders.get(
+            seat_req.seat_category_ref_id
         )
-        existing_order = (
-            await db.execute(existing_order_query)
-        ).scalar_one_or_none()
         if existing_order:
             return api_response(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -205,16 +253,7 @@ async def create_event_booking_order(
                 },
             )
 
-        # 5.2 Availability check
-        available = db_seat.total_tickets - (db_seat.booked + db_seat.held)
-        if seat_req.num_seats > available:
-            return api_response(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                message=f"Not enough seats available in category {db_seat.category_label}",
-                data={"available": available},
-            )
-
-        # 5.3 Price validation (anti-fraud)
+        # 5.2 Price validation (anti-fraud)
         if float(seat_req.price_per_seat) != float(db_seat.price):
             return api_response(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -222,10 +261,10 @@ async def create_event_booking_order(
                 data={},
             )
 
-        # 5.4 Build line item
+        # 5.3 Build line item
         discount_amount = 0.0
         if seat_req.coupon_id:
-            coupon_obj = await db.get(Coupon, seat_req.coupon_id)
+            coupon_obj = preflight.coupons.get(seat_req.coupon_id)
             if not coupon_obj:
                 return api_response(
                     status_code=status.HTTP_400_BAD_REQUEST,
@@ -263,8 +302,26 @@ async def create_event_booking_order(
     
         line_items.append(line_item)
 
-        # Hold seats
-        db_seat.held += seat_req.num_seats
+    # 5.4 Hold seats: one conditional UPDATE per category, in id order so
+    # concurrent multi-category bookings lock rows in the same order. The
+    # holds commit with the order below; any shortfall rolls all back.
+    for li in sorted(line_items, key=lambda li: li.seat_category_ref_id):
+        reservation = await reserve_seats(
+            db, li.seat_category_ref_id, li.num_seats
+        )
+        if reservation is None:
+            db_seat = db_seat_categories[li.seat_category_ref_id]
+            category_label = db_seat.category_label
+            await db.rollback()
+            return api_response(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message=f"Not enough seats available in category {category_label}",
+                data={
+                    "available": await get_available_seats(
+                        db, li.seat_category_ref_id
+                    )
+                },
+            )
 
     # 6. Create booking order
     order = NewEventBookingOrder(
@@ -278,6 +335,8 @@ async def create_event_booking_order(
         payment_status=PaymentStatus.PENDING,
         line_items=line_items,
         coupon_status=booking_req.coupon_status,
+        expires_at=datetime.now(timezone.utc)
+        + timedelta(minutes=settings.BOOKING_HOLD_MINUTES),
     )
 
     db.add(order)
@@ -324,7 +383,9 @@ async def create_event_booking_order(
         if not approval_url:
             # Rollback held seats & coupon count
             for li in line_items:
-                db_seat_categories[li.seat_category_ref_id].held -= li.num_seats
+                await release_held_seats(
+                    db, li.seat_category_ref_id, li.num_seats
+                )
                 if li.coupon_id:
                     coupon_obj = await db.get(Coupon, li.coupon_id)
                     if coupon_obj:
@@ -355,7 +416,7 @@ async def create_event_booking_order(
     except Exception as e:
         # Rollback held seats & coupon count on error
         for li in line_items:
-            db_seat_categories[li.seat_category_ref_id].held -= li.num_seats
+            await release_held_seats(db, li.seat_category_ref_id, li.num_seats)
             if li.coupon_id:
                 coupon_obj = await db.get(Coupon, li.coupon_id)
                 if coupon_obj:
@@ -381,171 +442,134 @@ async def create_event_booking_order(
 async def confirm_booking(
     token: str,
     order_id: str,
+    background_tasks: BackgroundTasks,
+    idempotency_key: IdempotencyKeyHeader = None,
     db: AsyncSession = Depends(get_db),
 ):
     """
     Confirm booking after PayPal redirect.
-    - Captures PayPal payment.
-    - Updates booking order & line items.
-    - Sends success email.
+    - Usually the PayPal webhook has already finalized the order, so this is
+      a status read.
+    - Otherwise captures the PayPal payment now, with the same request id
+      as the webhook worker so PayPal charges once.
+    - Queues the success email with the approval when this call approved
+      the order, and sends it after the response.
     - Redirects to frontend with status.
+    - A retry with the same Idempotency-Key replays the first redirect.
     """
-    # 1. Fetch order
-    order: NewEventBookingOrder | None = (
-        await db.execute(
-            select(NewEventBookingOrder).where(
-                NewEventBookingOrder.order_id == order_id
-            )
-        )
-    ).scalar_one_or_none()
+    response = await run_idempotent(
+        db,
+        "new-bookings:confirm",
+        idempotency_key,
+        request_fingerprint({"order_id": order_id, "token": token}),
+        lambda: _confirm_booking(token, order_id, db),
+    )
+    background_tasks.add_task(email_outbox_job)
+    return response
 
-    if not order:
+
+async def _confirm_booking(
+    token: str, order_id: str, db: AsyncSession
+) -> RedirectResponse:
+    # 1. Read order status
+    booking_status = await get_booking_status(db, order_id)
+
+    if booking_status is None:
         return RedirectResponse(
             url=f"{settings.USERS_APPLICATION_FRONTEND_URL}/booking/error?message=Order+not+found",
             status_code=302,
         )
 
-    if order.booking_status not in [BookingStatus.PROCESSING]:
+    # 2. Not finalized by the webhook yet: capture and finalize here
+    if booking_status == BookingStatus.PROCESSING:
+        try:
+            order = await capture_and_finalize(db, order_id, token)
+            if order is not None:
+                queue_booking_confirmation(db, order)
+            await db.commit()
+        except Exception as e:
+            # Transient PayPal error: the hold stays for the webhook worker
+            await db.rollback()
+            logger.warning(
+                "PayPal capture for order %s failed: %s", order_id, str(e)
+            )
+            return RedirectResponse(
+                url=f"{settings.USERS_APPLICATION_FRONTEND_URL}/booking/error?message={quote_plus(str(e))}",
+                status_code=302,
+            )
+
+        booking_status = await get_booking_status(db, order_id)
+
+    # 3. Redirect on the final status
+    if booking_status == BookingStatus.APPROVED:
         return RedirectResponse(
-            url=f"{settings.USERS_APPLICATION_FRONTEND_URL}/booking/error?message=Invalid+order+state",
+            url=f"{settings.USERS_APPLICATION_FRONTEND_URL}/booking-success?order_id={order_id}",
             status_code=302,
         )
 
-    # 2. Capture PayPal payment
-    try:
-        request = OrdersCaptureRequest(token)
-        response = paypal_client.client.execute(request)
-        payment_status = check_paypal_payment_status(response)
-
-        if payment_status == "COMPLETED":
-            # 3. Success: update booking order
-            order.booking_status = BookingStatus.APPROVED
-            order.payment_status = PaymentStatus.COMPLETED
-            order.payment_reference = extract_capture_id(response)
-
-            # 4. Update held → booked for all line items
-            total_seats = 0
-            for li in order.line_items:
-                seat_cat: NewEventSeatCategory = li.new_seat_category
-                seat_cat.held -= li.num_seats
-                seat_cat.booked += li.num_seats
-                total_seats += li.num_seats
-                
-                # Only increment coupons used in this order
-                if li.coupon_id and order.coupon_status:
-                    coupon_obj = await db.get(Coupon, li.coupon_id)
-                    if coupon_obj:
-                        coupon_obj.applied_coupons -= li.num_seats
-                        coupon_obj.sold_coupons += li.num_seats
-                    li.redeemed = True
-
-            await db.commit()
-
-            # 5. Send confirmation email
-            try:
-                user_name = (
-                    order.new_user.username
-                    or order.new_user.first_name
-                    or "Valued Customer"
-                )
-                if order.new_user.last_name:
-                    user_name += f" {order.new_user.last_name}"
-
-                # Build seat categories list
-                seat_categories = [
-                    {
-                        "label": li.new_seat_category.category_label,
-                        "num_seats": li.num_seats,
-                        "price_per_seat": float(li.price_per_seat),
-                        "subtotal": float(li.subtotal),
-                        "discount": float(li.discount_amount),
-                        "total_amount": float(li.total_amount),
-                    }
-                    for li in order.line_items
-                ]
-
-                # Send success email with full details
-                send_new_booking_success_email(
-                    email=order.new_user.email,
-                    user_name=user_name,
-                    order_id=order.order_id,
-                    event_title=order.new_booked_event.event_title,
-                    event_slug=order.new_booked_event.event_slug,
-                    event_date=order.new_slot.slot_date.strftime("%B %d, %Y"),
-                    event_time=(
-                        order.new_slot.start_time
-                        if order.new_slot.start_time
-                        else "N/A"
-                    ),
-                    event_duration=(
-                        f"{order.new_slot.duration_minutes} mins"
-                        if order.new_slot.duration_minutes
-                        else "N/A"
-                    ),
-                    event_location=order.new_booked_event.location or "",
-                    event_category=order.new_booked_event.new_category.category_name,
-                    booking_date=order.created_at.strftime("%B %d, %Y"),
-                    total_amount=float(order.total_amount),
-                    total_discount=float(sum(li.discount_amount for li in order.line_items)),
-                    seat_categories=seat_categories,
-                )
+    if booking_status == BookingStatus.FAILED:
+        return RedirectResponse(
+            url=f"{settings.USERS_APPLICATION_FRONTEND_URL}/booking-failure",
+            status_code=302,
+        )
 
-            except Exception as email_error:
-                logger.warning(
-                    "Failed to send booking confirmation email for order %s: %s",
-                    order.order_id,
-                    str(email_error),
-                )
+    return RedirectResponse(
+        url=f"{settings.USERS_APPLICATION_FRONTEND_URL}/booking/error?message=Invalid+order+state",
+        status_code=302,
+    )
 
-            # Redirect to success page
-            return RedirectResponse(
-                url=f"{settings.USERS_APPLICATION_FRONTEND_URL}/booking-success?order_id={order.order_id}",
-                status_code=302,
-            )
 
-        else:
-            # Payment not completed
-            order.booking_status = BookingStatus.FAILED
-            order.payment_status = PaymentStatus.FAILED
+@router.post(
+    "/paypal/webhook",
+    summary="Receive PayPal payment webhooks",
+)
+@exception_handler
+async def paypal_webhook(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+) -> JSONResponse:
+    """
+    Store a PayPal webhook event in the inbox and acknowledge it.
+    - Verifies the delivery signature with PayPal.
+    - Redeliveries of an event id are acknowledged without a new row.
+    - The webhook worker applies the event right after the response.
+    """
+    if not paypal_client.webhook_id:
+        return api_response(
+            status.HTTP_503_SERVICE_UNAVAILABLE,
+            message="PayPal webhooks are not configured",
+        )
 
-            for li in order.line_items:
-                li.new_seat_category.held -= li.num_seats
+    try:
+        event = await request.json()
+    except ValueError:
+        event = None
+    if not isinstance(event, dict) or not event.get("id"):
+        return api_response(
+            status.HTTP_400_BAD_REQUEST,
+            message="Invalid webhook payload",
+        )
 
-                # Rollback coupon usage
-                if li.coupon_id and order.coupon_status:
-                    coupon_obj = await db.get(Coupon, li.coupon_id)
-                    if coupon_obj:
-                        coupon_obj.applied_coupons -= li.num_seats
-                    li.redeemed = False
+    verified = await paypal_client.client.verify_webhook_signature(
+        request.headers, event, paypal_client.webhook_id
+    )
+    if not verified:
+        return api_response(
+            status.HTTP_400_BAD_REQUEST,
+            message="Invalid webhook signature",
+        )
 
-            await db.commit()
+    if event.get("event_type") not in HANDLED_WEBHOOK_EVENTS:
+        return api_response(status.HTTP_200_OK, message="Event ignored")
 
-            return RedirectResponse(
-                url=f"{settings.USERS_APPLICATION_FRONTEND_URL}/booking-failure",
-                status_code=302,
-            )
+    created = await record_webhook_event(db, event)
+    await db.commit()
+    if created:
+        background_tasks.add_task(webhook_inbox_job)
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        # PayPal capture error → rollback
-        order.booking_status = BookingStatus.FAILED
-        order.payment_status = PaymentStatus.FAILED
-        for li in order.line_items:
-            li.new_seat_category.held -= li.num_seats
-            if li.coupon_id and order.coupon_status:
-                coupon_obj = await db.get(Coupon, li.coupon_id)
-                if coupon_obj:
-                    coupon_obj.applied_coupons -= li.num_seats
-                li.redeemed = False
-        await db.commit()
+    return api_response(status.HTTP_200_OK, message="Event received")
 
-        # Safely encode error message
-        from urllib.parse import quote_plus
-        return RedirectResponse(
-            url=f"{settings.USERS_APPLICATION_FRONTEND_URL}/booking/error?message={quote_plus(str(e))}",
-            status_code=302,
-        )
 
 @router.get(
     "/cancel",
@@ -554,6 +578,7 @@ async def confirm_booking(
 @exception_handler
 async def cancel_booking(
     order_id: str,
+    idempotency_key: IdempotencyKeyHeader = None,
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -561,47 +586,33 @@ async def cancel_booking(
     - Frees held seats.
     - Marks order as CANCELLED (only if still PROCESSING).
     - Redirects to frontend failure page.
+    - A retry with the same Idempotency-Key replays the first redirect.
     """
-
-    # 1. Fetch order
-    result = await db.execute(
-        select(NewEventBookingOrder)
-        .where(NewEventBookingOrder.order_id == order_id)
-        .options(
-            selectinload(NewEventBookingOrder.line_items).selectinload(
-                NewEventBooking.new_seat_category
-            )
-        )
+    return await run_idempotent(
+        db,
+        "new-bookings:cancel",
+        idempotency_key,
+        request_fingerprint({"order_id": order_id}),
+        lambda: _cancel_booking(order_id, db),
     )
-    order: Optional[NewEventBookingOrder] = result.scalars().first()
 
-    if not order:
+
+async def _cancel_booking(order_id: str, db: AsyncSession) -> RedirectResponse:
+
+    # 1. Lock the order; only a still-PROCESSING order is cancelled, so a
+    # cancel racing the webhook or /confirm never undoes a captured payment
+    order = await lock_processing_order(db, order_id)
+
+    if order is None and await get_booking_status(db, order_id) is None:
         return RedirectResponse(
             url=f"{settings.USERS_APPLICATION_FRONTEND_URL}/booking/error?message=Order not found",
             status_code=302,
         )
 
-    # 2. Only cancel if still PROCESSING
-    if order.booking_status == BookingStatus.PROCESSING:
-        order.booking_status = BookingStatus.CANCELLED
-        order.payment_status = PaymentStatus.CANCELLED
-
-        # Release HELD seats safely
-        for li in order.line_items:
-            if li.new_seat_category and li.new_seat_category.held >= li.num_seats:
-                li.new_seat_category.held -= li.num_seats
-            else:
-                li.new_seat_category.held = 0
-                
-            # Rollback coupon usage if applied
-            if li.coupon_id and order.coupon_status:
-                coupon_obj = await db.get(Coupon, li.coupon_id)
-                if coupon_obj and (coupon_obj.applied_coupons or 0) >= li.num_seats:
-                    coupon_obj.applied_coupons -= li.num_seats
-                li.redeemed = False
-
+    # 2. Cancel and give the held seats back atomically
+    if order is not None:
+        await cancel_order(db, order)
         await db.commit()
-        await db.refresh(order)
 
     # 3. Redirect to frontend cancellation/failure page
     return RedirectResponse(
@@ -623,31 +634,29 @@ async def get_all_bookings(
         None,
         description="Filter by booking status (failed, processing, approved, cancelled)",
     ),
+    cursor: Optional[str] = Query(
+        None,
+        description="pagination.next_cursor of the previous page; takes precedence over page",
+    ),
+    count: CountMode = Query(
+        CountMode.EXACT,
+        description="Total count: exact, estimate (planner estimate) or none",
+    ),
     db: AsyncSession = Depends(get_db),
 ):
     """
     Get all booking orders with pagination and optional status filtering.
-    - Supports pagination with page and limit parameters
+    - Supports cursor pagination (cursor) and page/limit pagination
+    - Total count can be exact, estimated or skipped (count)
     - Optional status filtering (PROCESSING, APPROVED, FAILED, CANCELLED)
     - Returns booking orders with event and user details
     """
 
-    # Calculate offset for pagination
-    offset = (page - 1) * limit
-
     # Build base query
     query = select(NewEventBookingOrder).options(
-        selectinload(NewEventBookingOrder.line_items)
-        .selectinload(NewEventBooking.new_seat_category),
-        selectinload(NewEventBookingOrder.line_items)
-        .selectinload(NewEventBooking.coupon),
-        selectinload(NewEventBookingOrder.new_booked_event)
-        .selectinload(NewEvent.new_category),
-        selectinload(NewEventBookingOrder.new_booked_event)
-        .selectinload(NewEvent.new_organizer),
-        selectinload(NewEventBookingOrder.new_slot),
-        selectinload(NewEventBookingOrder.new_user),
+        *loader_options(LoaderProfile.BOOKING),
     )
+    count_query = select(NewEventBookingOrder.order_id)
 
     # Apply status filter if provided
     if status_filter:
@@ -656,6 +665,9 @@ async def get_all_bookings(
             query = query.where(
                 NewEventBookingOrder.booking_status == booking_status
             )
+            count_query = count_query.where(
+                NewEventBookingOrder.booking_status == booking_status
+            )
         except ValueError:
             return api_response(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -663,29 +675,24 @@ async def get_all_bookings(
                 data={},
             )
 
-    # Apply pagination and ordering
-    query = (
-        query.order_by(NewEventBookingOrder.created_at.desc())
-        .offset(offset)
-        .limit(limit)
-    )
-
-    # Execute query
-    result = await db.execute(query)
-    orders = result.scalars().all()
-
-    # Get total count for pagination info
-    count_query = select(func.count(NewEventBookingOrder.order_id))
-    if status_filter:
-        try:
-            booking_status = BookingStatus(status_filter.upper())
-            count_query = count_query.where(
-                NewEventBookingOrder.booking_status == booking_status
-            )
-        except ValueError:
-            pass  # Already handled above
-
-    total_count = (await db.execute(count_query)).scalar() or 0
+    # Fetch one page, newest first, and the total count for pagination info
+    try:
+        orders, next_cursor = await fetch_page(
+            db,
+            query,
+            NewEventBookingOrder.created_at,
+            NewEventBookingOrder.order_id,
+            limit=limit,
+            page=page,
+            cursor=cursor,
+        )
+    except InvalidCursorError as e:
+        return api_response(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            message=str(e),
+            data={},
+        )
+    total_count = await count_rows(db, count_query, count)
 
     # Build response data
     bookings_data = []
@@ -787,15 +794,9 @@ async def get_all_bookings(
         bookings_data.append(booking_data)
 
     # Build pagination info
-    total_pages = (total_count + limit - 1) // limit
-    pagination_info = {
-        "current_page": page,
-        "total_pages": total_pages,
-        "total_count": total_count,
-        "limit": limit,
-        "has_next": page < total_pages,
-        "has_prev": page > 1,
-    }
+    pagination_info = _build_pagination_info(
+        page, limit, cursor, next_cursor, total_count
+    )
 
     return api_response(
         status_code=status.HTTP_200_OK,
@@ -820,11 +821,20 @@ async def get_bookings_by_user(
         None,
         description="Filter by booking status (failed, processing, approved, cancelled)",
     ),
+    cursor: Optional[str] = Query(
+        None,
+        description="pagination.next_cursor of the previous page; takes precedence over page",
+    ),
+    count: CountMode = Query(
+        CountMode.EXACT,
+        description="Total count: exact, estimate (planner estimate) or none",
+    ),
     db: AsyncSession = Depends(get_db),
 ):
     """
     Get all booking orders for a specific user with pagination and optional status filtering.
-    - Supports pagination with page and limit parameters
+    - Supports cursor pagination (cursor) and page/limit pagination
+    - Total count can be exact, estimated or skipped (count)
     - Optional status filtering (PROCESSING, APPROVED, FAILED, CANCELLED)
     - Returns booking orders with event, seat categories, and coupon details
     """
@@ -837,26 +847,17 @@ async def get_bookings_by_user(
             data={},
         )
 
-    # Calculate offset for pagination
-    offset = (page - 1) * limit
-
     # Build base query
     query = (
         select(NewEventBookingOrder)
         .where(NewEventBookingOrder.user_ref_id == user_id)
         .options(
-            selectinload(NewEventBookingOrder.line_items)
-            .selectinload(NewEventBooking.new_seat_category),
-            selectinload(NewEventBookingOrder.line_items)
-            .selectinload(NewEventBooking.coupon),
-            selectinload(NewEventBookingOrder.new_booked_event)
-            .selectinload(NewEvent.new_category),
-            selectinload(NewEventBookingOrder.new_booked_event)
-            .selectinload(NewEvent.new_organizer),
-            selectinload(NewEventBookingOrder.new_slot),
-            selectinload(NewEventBookingOrder.new_user),
+            *loader_options(LoaderProfile.BOOKING),
         )
     )
+    count_query = select(NewEventBookingOrder.order_id).where(
+        NewEventBookingOrder.user_ref_id == user_id
+    )
 
     # Apply status filter if provided
     if status_filter:
@@ -865,6 +866,9 @@ async def get_bookings_by_user(
             query = query.where(
                 NewEventBookingOrder.booking_status == booking_status
             )
+            count_query = count_query.where(
+                NewEventBookingOrder.booking_status == booking_status
+            )
         except ValueError:
             return api_response(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -872,31 +876,24 @@ async def get_bookings_by_user(
                 data={},
             )
 
-    # Apply pagination and ordering
-    query = (
-        query.order_by(NewEventBookingOrder.created_at.desc())
-        .offset(offset)
-        .limit(limit)
-    )
-
-    # Execute query
-    result = await db.execute(query)
-    orders = result.scalars().all()
-
-    # Get total count for pagination info
-    count_query = select(func.count(NewEventBookingOrder.order_id)).where(
-        NewEventBookingOrder.user_ref_id == user_id
-    )
-    if status_filter:
-        try:
-            booking_status = BookingStatus(status_filter.upper())
-            count_query = count_query.where(
-                NewEventBookingOrder.booking_status == booking_status
-            )
-        except ValueError:
-            pass  # Already handled above
-
-    total_count = (await db.execute(count_query)).scalar() or 0
+    # Fetch one page, newest first, and the total count for pagination info
+    try:
+        orders, next_cursor = await fetch_page(
+            db,
+            query,
+            NewEventBookingOrder.created_at,
+            NewEventBookingOrder.order_id,
+            limit=limit,
+            page=page,
+            cursor=cursor,
+        )
+    except InvalidCursorError as e:
+        return api_response(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            message=str(e),
+            data={},
+        )
+    total_count = await count_rows(db, count_query, count)
 
     # Build response data
     bookings_data = []
@@ -986,15 +983,9 @@ async def get_bookings_by_user(
         bookings_data.append(booking_data)
 
     # Build pagination info
-    total_pages = (total_count + limit - 1) // limit
-    pagination_info = {
-        "current_page": page,
-        "total_pages": total_pages,
-        "total_count": total_count,
-        "limit": limit,
-        "has_next": page < total_pages,
-        "has_prev": page > 1,
-    }
+    pagination_info = _build_pagination_info(
+        page, limit, cursor, next_cursor, total_count
+    )
 
     return api_response(
         status_code=status.HTTP_200_OK,
@@ -1021,11 +1012,20 @@ async def get_bookings_by_organizer(
         None,
         description="Filter by booking status (failed, processing, approved, cancelled)",
     ),
+    cursor: Optional[str] = Query(
+        None,
+        description="pagination.next_cursor of the previous page; takes precedence over page",
+    ),
+    count: CountMode = Query(
+        CountMode.EXACT,
+        description="Total count: exact, estimate (planner estimate) or none",
+    ),
     db: AsyncSession = Depends(get_db),
 ):
     """
     Get all booking orders for events organized by a specific organizer with pagination and optional status filtering.
-    - Supports pagination with page and limit parameters
+    - Supports cursor pagination (cursor) and page/limit pagination
+    - Total count can be exact, estimated or skipped (count)
     - Optional status filtering (PROCESSING, APPROVED, FAILED, CANCELLED)
     - Returns booking orders with event and user details for events by the specified organizer
     """
@@ -1038,24 +1038,20 @@ async def get_bookings_by_organizer(
             data={},
         )
 
-    # Calculate offset for pagination
-    offset = (page - 1) * limit
-
     # Build base query - join with NewEvent to filter by organizer
     query = (
         select(NewEventBookingOrder)
         .join(NewEvent, NewEventBookingOrder.event_ref_id == NewEvent.event_id)
         .where(NewEvent.organizer_id == organizer_id)
         .options(
-            selectinload(NewEventBookingOrder.line_items)
-            .selectinload(NewEventBooking.new_seat_category),
-            selectinload(NewEventBookingOrder.line_items).selectinload(NewEventBooking.coupon),
-            selectinload(NewEventBookingOrder.new_booked_event).selectinload(NewEvent.new_category),
-            selectinload(NewEventBookingOrder.new_booked_event).selectinload(NewEvent.new_organizer),
-            selectinload(NewEventBookingOrder.new_slot),
-            selectinload(NewEventBookingOrder.new_user),
+            *loader_options(LoaderProfile.BOOKING),
         )
     )
+    count_query = (
+        select(NewEventBookingOrder.order_id)
+        .join(NewEvent, NewEventBookingOrder.event_ref_id == NewEvent.event_id)
+        .where(NewEvent.organizer_id == organizer_id)
+    )
 
     # Apply status filter if provided
     if status_filter:
@@ -1064,6 +1060,9 @@ async def get_bookings_by_organizer(
             query = query.where(
                 NewEventBookingOrder.booking_status == booking_status
             )
+            count_query = count_query.where(
+                NewEventBookingOrder.booking_status == booking_status
+            )
         except ValueError:
             return api_response(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -1071,33 +1070,24 @@ async def get_bookings_by_organizer(
                 data={},
             )
 
-    # Apply pagination and ordering
-    query = (
-        query.order_by(NewEventBookingOrder.created_at.desc())
-        .offset(offset)
-        .limit(limit)
-    )
-
-    # Execute query
-    result = await db.execute(query)
-    orders = result.scalars().all()
-
-    # Get total count for pagination info
-    count_query = (
-        select(func.count(NewEventBookingOrder.order_id))
-        .join(NewEvent, NewEventBookingOrder.event_ref_id == NewEvent.event_id)
-        .where(NewEvent.organizer_id == organizer_id)
-    )
-    if status_filter:
-        try:
-            booking_status = BookingStatus(status_filter.upper())
-            count_query = count_query.where(
-                NewEventBookingOrder.booking_status == booking_status
-            )
-        except ValueError:
-            pass  # Already handled above
-
-    total_count = (await db.execute(count_query)).scalar() or 0
+    # Fetch one page, newest first, and the total count for pagination info
+    try:
+        orders, next_cursor = await fetch_page(
+            db,
+            query,
+            NewEventBookingOrder.created_at,
+            NewEventBookingOrder.order_id,
+            limit=limit,
+            page=page,
+            cursor=cursor,
+        )
+    except InvalidCursorError as e:
+        return api_response(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            message=str(e),
+            data={},
+        )
+    total_count = await count_rows(db, count_query, count)
 
     # Build response data
     bookings_data = []
@@ -1189,15 +1179,9 @@ async def get_bookings_by_organizer(
         })
 
     # Build pagination info
-    total_pages = (total_count + limit - 1) // limit
-    pagination_info = {
-        "current_page": page,
-        "total_pages": total_pages,
-        "total_count": total_count,
-        "limit": limit,
-        "has_next": page < total_pages,
-        "has_prev": page > 1,
-    }
+    pagination_info = _build_pagination_info(
+        page, limit, cursor, next_cursor, total_count
+    )
 
     return api_response(
         status_code=status.HTTP_200_OK,
@@ -1226,16 +1210,7 @@ async def get_booking_order_details(
             select(NewEventBookingOrder)
             .where(NewEventBookingOrder.order_id == order_id)
             .options(
-                selectinload(NewEventBookingOrder.line_items)
-                .selectinload(NewEventBooking.new_seat_category),
-                selectinload(NewEventBookingOrder.line_items)
-                .selectinload(NewEventBooking.coupon),
-                selectinload(NewEventBookingOrder.new_booked_event)
-                .selectinload(NewEvent.new_category),
-                selectinload(NewEventBookingOrder.new_booked_event)
-                .selectinload(NewEvent.new_organizer),
-                selectinload(NewEventBookingOrder.new_slot),
-                selectinload(NewEventBookingOrder.new_user),
+                *loader_options(LoaderProfile.BOOKING),
             )
         )
     ).scalar_one_or_none()
@@ -1353,14 +1328,7 @@ async def generate_booking_barcode(
     query = (
         select(NewEventBookingOrder)
         .options(
-            selectinload(NewEventBookingOrder.new_user),
-            selectinload(NewEventBookingOrder.new_booked_event).selectinload(
-                NewEvent.new_category
-            ),
-            selectinload(NewEventBookingOrder.new_slot),
-            selectinload(NewEventBookingOrder.line_items).selectinload(
-                NewEventBooking.new_seat_category
-            ),
+            *loader_options(LoaderProfile.BOOKING),
         )
         .where(NewEventBookingOrder.order_id == order_id)
     )
@@ -1458,14 +1426,7 @@ async def generate_booking_qrcode(
     query = (
         select(NewEventBookingOrder)
         .options(
-            selectinload(NewEventBookingOrder.new_user),
-            selectinload(NewEventBookingOrder.new_booked_event).selectinload(
-                NewEvent.new_category
-            ),
-            selectinload(NewEventBookingOrder.new_slot),
-            selectinload(NewEventBookingOrder.line_items).selectinload(
-                NewEventBooking.new_seat_category
-            ),
+            *loader_options(LoaderProfile.BOOKING),
         )
         .where(NewEventBookingOrder.order_id == order_id)
     )
@@ -1,7 +1,7 @@
 from typing import Annotated, Dict, List, Literal, Optional
 
 from fastapi import APIRouter, Depends, Form, Query, status
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -24,8 +24,15 @@ from new_event_service.services.events import (
 from new_event_service.services.response_builder import event_not_found_response
 from new_event_service.utils.utils import minutes_to_duration_string
 from shared.core.api_response import api_response
+from shared.db.loader_profiles import LoaderProfile, loader_options
 from shared.db.models import NewEvent, NewEventSeatCategory, NewEventSlot
 from shared.db.models.new_events import EventStatus
+from shared.db.pagination import (
+    CountMode,
+    InvalidCursorError,
+    count_rows,
+    fetch_page,
+)
 from shared.db.sessions.database import get_db
 from shared.utils.exception_handlers import exception_handler
 
@@ -49,42 +56,49 @@ async def list_new_events(
             example=EventTypeStatus.UPCOMING,
         ),
     ] = EventTypeStatus.UPCOMING,
+    cursor: Optional[str] = Query(
+        None,
+        description="next_cursor of the previous page; takes precedence over page",
+    ),
+    count: CountMode = Query(
+        CountMode.EXACT,
+        description="Total count: exact, estimate (planner estimate) or none",
+    ),
     db: AsyncSession = Depends(get_db),
 ):
-    offset = (page - 1) * limit
-    
     # Base filter: events tied to the current user
     base_conditions = []
 
     # Unpack conditions + alias from helper
     base_conditions.extend(get_event_conditions(event_type))
 
-    # Proper total count with filters
-    total_count = await db.scalar(
-        select(func.count())
-        .select_from(NewEvent)
-        .where(and_(*base_conditions))
-    ) or 0
-
-    # Query with filters + pagination
+    # One page, newest first, keyed on (created_at, event_id)
     query = (
         select(NewEvent)
-        .options(
-            selectinload(NewEvent.new_category),
-            selectinload(NewEvent.new_subcategory),
-            selectinload(NewEvent.new_organizer),
-            selectinload(NewEvent.new_slots).selectinload(
-                NewEventSlot.new_seat_categories
-            ),
-        )
+        .options(*loader_options(LoaderProfile.DETAIL))
         .where(and_(*base_conditions))
-        .order_by(NewEvent.created_at.desc())
-        .offset(offset)
-        .limit(limit)
     )
+    try:
+        events, next_cursor = await fetch_page(
+            db,
+            query,
+            NewEvent.created_at,
+            NewEvent.event_id,
+            limit=limit,
+            page=page,
+            cursor=cursor,
+        )
+    except InvalidCursorError as e:
+        return api_response(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            message=str(e),
+            data={},
+        )
 
-    result = await db.execute(query)
-    events = result.scalars().all()
+    # Total count with the same filters, unless the client skipped it
+    total_count = await count_rows(
+        db, select(NewEvent.event_id).where(and_(*base_conditions)), count
+    )
 
     # Format into schema
     items = [
@@ -116,7 +130,12 @@ async def list_new_events(
         status_code=status.HTTP_200_OK,
         message="Event records retrieved successfully",
         data=EventListResponse(
-            events=items, page=page, limit=limit, total=total_count
+            events=items,
+            page=None if cursor else page,
+            limit=limit,
+            total=total_count,
+            has_next=next_cursor is not None,
+            next_cursor=next_cursor,
         ),
     )
 
@@ -8,17 +8,14 @@ from typing import Optional, Dict, Any, List, Set
 from fastapi import APIRouter, Depends, HTTPException, Path, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 # --- import your models and deps ---
 # Adjust import paths as per your project structure
+from shared.db.loader_profiles import LoaderProfile, loader_options
 from shared.db.sessions.database import get_db
 from shared.db.models.new_events import (
     NewEvent,
-    NewEventSlot,
-    NewEventSeatCategory,
     NewEventBookingOrder,
-    NewEventBooking,
     PaymentStatus,
 )
 from shared.utils.file_uploads import get_media_url  # keep using your helper if present
@@ -50,23 +47,7 @@ async def get_event_settlement(
     stmt = (
         select(NewEvent)
         .where(NewEvent.event_id == event_id)
-        .options(
-            selectinload(NewEvent.new_category),
-            selectinload(NewEvent.new_subcategory),
-            selectinload(NewEvent.new_organizer),
-            selectinload(NewEvent.coupons),
-            selectinload(NewEvent.new_slots).selectinload(
-                NewEventSlot.new_seat_categories
-            ),
-            # Orders & line items with coupon + seat -> slot for date
-            selectinload(NewEvent.new_booking_orders)
-            .selectinload(NewEventBookingOrder.line_items)
-            .selectinload(NewEventBooking.coupon),
-            selectinload(NewEvent.new_booking_orders)
-            .selectinload(NewEventBookingOrder.line_items)
-            .selectinload(NewEventBooking.new_seat_category)
-            .selectinload(NewEventSeatCategory.new_slot),
-        )
+        .options(*loader_options(LoaderProfile.SETTLEMENT))
     )
     result = await db.execute(stmt)
     event: Optional[NewEvent] = result.scalar_one_or_none()
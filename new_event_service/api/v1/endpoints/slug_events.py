@@ -2,7 +2,7 @@ from datetime import date
 from typing import Dict, List, Literal
 
 from fastapi import APIRouter, Depends, Form, Query, status
-from sqlalchemy import func, select
+from sqlalchemy import func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -34,7 +34,7 @@ from new_event_service.services.events import (
 from new_event_service.services.response_builder import event_not_found_response
 from new_event_service.utils.utils import minutes_to_duration_string
 from shared.core.api_response import api_response
-from shared.db.models import NewEvent, NewEventSeatCategory, NewEventSlot
+from shared.db.models import NewEvent
 from shared.db.models.new_events import EventStatus
 from shared.db.sessions.database import get_db
 from shared.utils.exception_handlers import exception_handler
@@ -55,19 +55,14 @@ async def get_event_by_id(
 ):
     """Retrieve full event details by event_slug, including only present & future slots"""
 
-    # 1. Fetch event with relations
+    # 1. Fetch event with slots and seat categories (detail loader profile)
     event = await fetch_event_by_slug_with_relations(db, event_slug)
     if not event:
         return event_not_found_response()
 
     today = date.today()
-    # 2. Fetch ONLY present and future slots for this event
-    query_slots = (
-        select(NewEventSlot)
-        .where(NewEventSlot.event_ref_id == event.event_id)
-        .where(NewEventSlot.slot_date >= today)
-    )
-    slots = (await db.execute(query_slots)).scalars().all()
+    # 2. Keep ONLY present and future slots for this event
+    slots = [slot for slot in event.new_slots if slot.slot_date >= today]
 
     # Dictionary to hold grouped slots by date
     slot_data_input: Dict[str, List[dict]] = {}
@@ -75,11 +70,8 @@ async def get_event_by_id(
     for slot in slots:
         date_str = slot.slot_date.strftime("%Y-%m-%d")
 
-        # 2. Fetch seat categories for this slot
-        query_seats = select(NewEventSeatCategory).where(
-            NewEventSeatCategory.slot_ref_id == slot.slot_id
-        )
-        seats = (await db.execute(query_seats)).scalars().all()
+        # Seat categories were loaded together with the slots
+        seats = slot.new_seat_categories
 
         seat_responses = [
             {
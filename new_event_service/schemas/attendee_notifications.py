@@ -0,0 +1,42 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from shared.db.models import AttendeeNotificationKind, NotificationJobStatus
+
+
+class AttendeeNotificationRequest(BaseModel):
+    kind: AttendeeNotificationKind = Field(
+        ..., description="RESCHEDULED or CANCELLED"
+    )
+    message: Optional[str] = Field(
+        None, max_length=2000, description="Note from the organizer"
+    )
+    event_date: Optional[str] = Field(
+        None, max_length=100, description="New date, when rescheduled"
+    )
+    event_time: Optional[str] = Field(
+        None, max_length=100, description="New time, when rescheduled"
+    )
+    event_location: Optional[str] = Field(
+        None,
+        max_length=255,
+        description="New location; defaults to the event's location",
+    )
+
+
+class AttendeeNotificationJobResponse(BaseModel):
+    job_id: int
+    event_id: str
+    kind: AttendeeNotificationKind
+    status: NotificationJobStatus
+    total_recipients: int
+    sent_count: int
+    failed_count: int
+    last_error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    model_config = {"from_attributes": True}
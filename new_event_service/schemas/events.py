@@ -47,9 +47,11 @@ class EventResponse(BaseModel):
 
 class EventListResponse(BaseModel):
     events: List[EventResponse]
-    page: int
+    page: Optional[int]  # None in cursor mode
     limit: int
-    total: int
+    total: Optional[int]  # None when count=none
+    has_next: bool = False
+    next_cursor: Optional[str] = None
 
 
 # Related entity schemas
@@ -0,0 +1,308 @@
+"""
+Bulk notifications to every attendee of an event.
+
+Telling tens of thousands of attendees that an event moved cannot happen
+inside a request, nor through the single-shot ``send_*_email`` helpers (an
+SMTP login each). The organizer's request only records an
+``AttendeeNotificationJob``; the job then runs in the background
+(``attendee_notification_job``):
+
+- attendees are streamed through a server-side cursor, ``NOTIFY_CHUNK_SIZE``
+  rows at a time in user id order; a user with several orders is one
+  recipient;
+- each chunk is rendered from the compiled template in a worker thread and
+  sent over the shared ``smtp_pool``, spaced to
+  ``ATTENDEE_NOTIFY_RATE_PER_SECOND``;
+- counts and the user id cursor are committed after every chunk, so the
+  organizer can poll progress and a job cut short by a restart resumes
+  after the last chunk it recorded.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, exists, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from shared.core.config import settings
+from shared.core.logging_config import get_logger
+from shared.db.models import (
+    AttendeeNotificationJob,
+    AttendeeNotificationKind,
+    NewEvent,
+    NotificationJobStatus,
+    User,
+)
+from shared.db.models.new_events import BookingStatus, NewEventBookingOrder
+from shared.utils.email import TemplatedEmail, email_sender
+from shared.utils.email_outbox import (
+    PermanentEmailError,
+    SmtpConnectionPool,
+    smtp_pool,
+)
+
+logger = get_logger(__name__)
+
+NOTIFY_CHUNK_SIZE = 500
+NOTIFY_TEMPLATE = "user/event_update.html"
+# A RUNNING job silent this long is taken over; must comfortably exceed the
+# time one chunk takes at the configured rate
+NOTIFY_STALE_AFTER = timedelta(minutes=15)
+
+
+class SendRateLimiter:
+    """Spaces callers of ``wait`` evenly at ``rate`` per second (0 = off)."""
+
+    def __init__(self, rate: float):
+        self.interval = 1 / rate if rate > 0 else 0.0
+        self._next = 0.0
+
+    async def wait(self) -> None:
+        if not self.interval:
+            return
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next)
+        self._next = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+def _booked_event(event_id: str):
+    return exists().where(
+        NewEventBookingOrder.user_ref_id == User.user_id,
+        NewEventBookingOrder.event_ref_id == event_id,
+        NewEventBookingOrder.booking_status == BookingStatus.APPROVED,
+    )
+
+
+def attendees_query(event_id: str, after_user_id: Optional[str] = None):
+    """Users with an approved order for the event, once each, by user id."""
+    query = (
+        select(
+            User.user_id,
+            User.email_encrypted,
+            User.first_name_encrypted,
+            User.username_encrypted,
+        )
+        .where(_booked_event(event_id), User.is_deleted.is_(False))
+        .order_by(User.user_id)
+    )
+    if after_user_id is not None:
+        query = query.where(User.user_id > after_user_id)
+    return query
+
+
+async def count_attendees(db: AsyncSession, event_id: str) -> int:
+    result = await db.execute(
+        select(func.count())
+        .select_from(User)
+        .where(_booked_event(event_id), User.is_deleted.is_(False))
+    )
+    return result.scalar() or 0
+
+
+def notification_email(
+    event: NewEvent,
+    kind: AttendeeNotificationKind,
+    message: Optional[str] = None,
+    event_date: Optional[str] = None,
+    event_time: Optional[str] = None,
+    event_location: Optional[str] = None,
+) -> Tuple[str, Dict[str, Any]]:
+    """Subject and the template values every recipient shares."""
+    is_cancelled = kind == AttendeeNotificationKind.CANCELLED
+    if is_cancelled:
+        subject = f"{event.event_title} has been cancelled"
+    else:
+        subject = f"{event.event_title} has been rescheduled"
+    context = {
+        "headline": "Event Cancelled" if is_cancelled else "Event Rescheduled",
+        "is_cancelled": is_cancelled,
+        "event_title": event.event_title,
+        "event_date": event_date,
+        "event_time": event_time,
+        "event_location": event_location or event.location,
+        "organizer_message": message,
+        "event_url": f"{settings.USERS_APPLICATION_FRONTEND_URL}"
+        f"/event/{event.event_slug}",
+        "support_email": settings.SUPPORT_EMAIL,
+        "year": str(datetime.now(tz=timezone.utc).year),
+    }
+    return subject, context
+
+
+async def create_notification_job(
+    db: AsyncSession,
+    event: NewEvent,
+    requested_by: str,
+    kind: AttendeeNotificationKind,
+    **details: Optional[str],
+) -> AttendeeNotificationJob:
+    """Record a PENDING job for the event's attendees and commit it."""
+    subject, context = notification_email(event, kind, **details)
+    job = AttendeeNotificationJob(
+        event_id=event.event_id,
+        requested_by=requested_by,
+        kind=kind,
+        subject=subject,
+        context=context,
+        status=NotificationJobStatus.PENDING,
+        total_recipients=await count_attendees(db, event.event_id),
+        sent_count=0,
+        failed_count=0,
+    )
+    db.add(job)
+    await db.commit()
+    return job
+
+
+async def claim_notification_job(
+    db: AsyncSession, job_id: Optional[int] = None
+) -> Optional[AttendeeNotificationJob]:
+    """
+    Mark a job RUNNING for this worker and commit.
+
+    Takes the given job, else the oldest one that is PENDING or whose
+    worker stopped reporting. Returns None when there is nothing to run
+    (or another worker has it).
+    """
+    now = datetime.now(timezone.utc)
+    query = (
+        select(AttendeeNotificationJob)
+        .where(
+            or_(
+                AttendeeNotificationJob.status == NotificationJobStatus.PENDING,
+                and_(
+                    AttendeeNotificationJob.status
+                    == NotificationJobStatus.RUNNING,
+                    AttendeeNotificationJob.heartbeat_at
+                    < now - NOTIFY_STALE_AFTER,
+                ),
+            )
+        )
+        .order_by(AttendeeNotificationJob.created_at)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+    )
+    if job_id is not None:
+        query = query.where(AttendeeNotificationJob.job_id == job_id)
+    job = (await db.execute(query)).scalars().first()
+    if job is None:
+        return None
+
+    job.status = NotificationJobStatus.RUNNING
+    job.started_at = job.started_at or now
+    job.heartbeat_at = now
+    await db.commit()
+    return job
+
+
+def _render_chunk(
+    job: AttendeeNotificationJob, attendees: Sequence[Any]
+) -> List[Any]:
+    return [
+        email_sender.render(
+            TemplatedEmail(
+                attendee.email_encrypted,
+                job.subject,
+                NOTIFY_TEMPLATE,
+                {
+                    **job.context,
+                    "user_name": attendee.first_name_encrypted
+                    or attendee.username_encrypted,
+                },
+            )
+        )
+        for attendee in attendees
+    ]
+
+
+async def _send_chunk(
+    pool: SmtpConnectionPool,
+    limiter: SendRateLimiter,
+    job: AttendeeNotificationJob,
+    attendees: Sequence[Any],
+) -> Tuple[int, List[BaseException]]:
+    # One thread hop per chunk rather than per recipient
+    messages = await asyncio.to_thread(_render_chunk, job, attendees)
+
+    async def send(message) -> None:
+        if message is None:
+            raise PermanentEmailError(f"Template {NOTIFY_TEMPLATE} failed")
+        await limiter.wait()
+        await pool.send(message)
+
+    results = await asyncio.gather(
+        *(send(message) for message in messages), return_exceptions=True
+    )
+    errors = [result for result in results if result is not None]
+    return len(results) - len(errors), errors
+
+
+async def deliver_notification_job(
+    db: AsyncSession,
+    stream_db: AsyncSession,
+    job: AttendeeNotificationJob,
+    pool: Optional[SmtpConnectionPool] = None,
+    rate: Optional[float] = None,
+) -> None:
+    """
+    Send a claimed job's emails from its cursor on, then mark it COMPLETED.
+
+    ``stream_db`` holds the server-side cursor open while progress is
+    committed through ``db``. Failed recipients are counted, not retried.
+    """
+    pool = pool or smtp_pool
+    limiter = SendRateLimiter(
+        settings.ATTENDEE_NOTIFY_RATE_PER_SECOND if rate is None else rate
+    )
+    result = await stream_db.stream(
+        attendees_query(job.event_id, job.last_user_id).execution_options(
+            yield_per=NOTIFY_CHUNK_SIZE
+        )
+    )
+    async for attendees in result.partitions():
+        sent, errors = await _send_chunk(pool, limiter, job, attendees)
+        job.sent_count += sent
+        job.failed_count += len(errors)
+        if errors:
+            job.last_error = str(errors[-1])[:1000]
+            logger.warning(
+                "Attendee notification %s: %d of %d emails failed: %s",
+                job.job_id,
+                len(errors),
+                len(attendees),
+                errors[-1],
+            )
+        job.last_user_id = attendees[-1].user_id
+        job.heartbeat_at = datetime.now(timezone.utc)
+        await db.commit()
+
+    job.status = NotificationJobStatus.COMPLETED
+    job.finished_at = datetime.now(timezone.utc)
+    await db.commit()
+    logger.info(
+        "Attendee notification %s completed: %d sent, %d failed",
+        job.job_id,
+        job.sent_count,
+        job.failed_count,
+    )
+
+
+async def fail_notification_job(
+    db: AsyncSession, job_id: int, error: Exception
+) -> None:
+    """Mark a job FAILED after ``deliver_notification_job`` raised."""
+    await db.rollback()
+    await db.execute(
+        update(AttendeeNotificationJob)
+        .where(AttendeeNotificationJob.job_id == job_id)
+        .values(
+            status=NotificationJobStatus.FAILED,
+            last_error=str(error)[:1000],
+            finished_at=datetime.now(timezone.utc),
+        )
+    )
+    await db.commit()
+    logger.error(f"Attendee notification {job_id} failed: {error}")
@@ -1,7 +1,6 @@
 from datetime import date
 from typing import Any, Optional, Tuple
 
-from paypalcheckoutsdk.orders import OrdersCreateRequest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from event_service.services.bookings import (
@@ -17,7 +16,7 @@ def extract_approval_url_from_paypal_response(response: Any) -> Optional[str]:
     Safely extract the approval URL from PayPal response.
 
     Args:
-        response: PayPal SDK response object
+        response: PayPal client response object
 
     Returns:
         Optional[str]: The approval URL if found, None otherwise
@@ -47,7 +46,7 @@ def check_paypal_payment_status(response: Any) -> Optional[str]:
     Safely extract the payment status from PayPal response.
 
     Args:
-        response: PayPal SDK response object
+        response: PayPal client response object
 
     Returns:
         Optional[str]: The payment status if found, None otherwise
@@ -69,7 +68,7 @@ def extract_capture_id(response):
     Safely extract the capture ID from a PayPal OrdersCaptureResponse.
 
     Args:
-        response: PayPalHttpResponse object from PayPal client execute()
+        response: PayPalResponse from the PayPal client's capture_order()
 
     Returns:
         str | None: The capture ID if available, otherwise None
@@ -95,17 +94,17 @@ async def create_paypal_order(
     total_price: float, order_id: str
 ) -> Optional[str]:
     """Create PayPal order and return approval URL."""
-    request = OrdersCreateRequest()
-    request.headers["prefer"] = "return=representation"
-    request.request_body(
+    response = await paypal_client.client.create_order(
         {
             "intent": "CAPTURE",
             "purchase_units": [
                 {
+                    # Echoed back in webhooks to find the booking order
+                    "custom_id": order_id,
                     "amount": {
                         "currency_code": "AUD",
                         "value": str(round(total_price, 2)),
-                    }
+                    },
                 }
             ],
             "application_context": {
@@ -119,5 +118,4 @@ async def create_paypal_order(
             },
         }
     )
-    response = paypal_client.client.execute(request)
     return extract_approval_url_from_paypal_response(response)
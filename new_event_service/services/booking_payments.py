@@ -0,0 +1,417 @@
+"""
+Payment finalization for booking orders.
+
+A PROCESSING order is finalized exactly once, by whichever path gets there
+first: the PayPal webhook worker or the browser returning through
+``/confirm``. Both capture with the same ``PayPal-Request-Id`` so PayPal
+charges once, then lock the order row and only act while it is still
+PROCESSING. Nothing here commits; callers queue the confirmation email of
+approved orders with ``queue_booking_confirmation`` and then commit, so the
+email goes out with the approval or not at all.
+
+Webhook deliveries are stored in ``PayPalWebhookEvent`` by
+``record_webhook_event`` and applied in batches by
+``schedulers.paypal_webhook_worker``. PayPal is always called before the
+order row is locked.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from new_event_service.services.booking_helpers import (
+    check_paypal_payment_status,
+    extract_capture_id,
+)
+from new_event_service.services.seat_inventory import (
+    confirm_held_seats,
+    release_held_seats,
+)
+from new_event_service.utils.paypal_client import paypal_client
+from shared.core.logging_config import get_logger
+from shared.db.loader_profiles import LoaderProfile, loader_options
+from shared.db.models.coupons import Coupon
+from shared.db.models.new_events import (
+    BookingStatus,
+    NewEventBookingOrder,
+    PaymentStatus,
+)
+from shared.db.models.payments import PayPalWebhookEvent, WebhookEventStatus
+from shared.utils.email_outbox import enqueue_email
+from shared.utils.email_utils import build_new_booking_success_email
+from shared.utils.paypal import PayPalError
+
+logger = get_logger(__name__)
+
+ORDER_APPROVED = "CHECKOUT.ORDER.APPROVED"
+CAPTURE_COMPLETED = "PAYMENT.CAPTURE.COMPLETED"
+CAPTURE_DENIED = "PAYMENT.CAPTURE.DENIED"
+HANDLED_WEBHOOK_EVENTS = {ORDER_APPROVED, CAPTURE_COMPLETED, CAPTURE_DENIED}
+
+
+def capture_request_id(order_id: str) -> str:
+    """PayPal-Request-Id shared by every capture attempt of an order."""
+    return f"capture-{order_id}"
+
+
+async def get_booking_status(
+    db: AsyncSession, order_id: str
+) -> Optional[BookingStatus]:
+    """Current status of an order without loading its relationships."""
+    return (
+        await db.execute(
+            select(NewEventBookingOrder.booking_status).where(
+                NewEventBookingOrder.order_id == order_id
+            )
+        )
+    ).scalar_one_or_none()
+
+
+async def lock_processing_order(
+    db: AsyncSession, order_id: str
+) -> Optional[NewEventBookingOrder]:
+    """Lock an order for finalization; None unless it is still PROCESSING."""
+    return (
+        await db.execute(
+            select(NewEventBookingOrder)
+            .where(
+                NewEventBookingOrder.order_id == order_id,
+                NewEventBookingOrder.booking_status == BookingStatus.PROCESSING,
+            )
+            .options(*loader_options(LoaderProfile.BOOKING))
+            .with_for_update(of=NewEventBookingOrder)
+            .execution_options(populate_existing=True)
+        )
+    ).scalar_one_or_none()
+
+
+async def complete_order(
+    db: AsyncSession,
+    order: NewEventBookingOrder,
+    capture_id: Optional[str],
+) -> None:
+    """Payment captured: approve the order and move held seats to booked."""
+    order.booking_status = BookingStatus.APPROVED
+    order.payment_status = PaymentStatus.COMPLETED
+    order.payment_reference = capture_id
+
+    for li in order.line_items:
+        await confirm_held_seats(db, li.seat_category_ref_id, li.num_seats)
+
+        # Only increment coupons used in this order
+        if li.coupon_id and order.coupon_status:
+            coupon_obj = await db.get(Coupon, li.coupon_id)
+            if coupon_obj:
+                coupon_obj.applied_coupons -= li.num_seats
+                coupon_obj.sold_coupons += li.num_seats
+            li.redeemed = True
+
+
+async def fail_order(db: AsyncSession, order: NewEventBookingOrder) -> None:
+    """Payment failed: mark the order FAILED and release its seats."""
+    order.booking_status = BookingStatus.FAILED
+    order.payment_status = PaymentStatus.FAILED
+
+    for li in order.line_items:
+        await release_held_seats(db, li.seat_category_ref_id, li.num_seats)
+
+        # Rollback coupon usage
+        if li.coupon_id and order.coupon_status:
+            coupon_obj = await db.get(Coupon, li.coupon_id)
+            if coupon_obj:
+                coupon_obj.applied_coupons -= li.num_seats
+            li.redeemed = False
+
+
+async def cancel_order(db: AsyncSession, order: NewEventBookingOrder) -> None:
+    """Buyer cancelled at PayPal: mark the order CANCELLED, release seats."""
+    order.booking_status = BookingStatus.CANCELLED
+    order.payment_status = PaymentStatus.CANCELLED
+
+    for li in order.line_items:
+        await release_held_seats(db, li.seat_category_ref_id, li.num_seats)
+
+        # Rollback coupon usage if applied
+        if li.coupon_id and order.coupon_status:
+            coupon_obj = await db.get(Coupon, li.coupon_id)
+            if coupon_obj and (coupon_obj.applied_coupons or 0) >= li.num_seats:
+                coupon_obj.applied_coupons -= li.num_seats
+            li.redeemed = False
+
+
+async def capture_payment(
+    order_id: str, paypal_order_id: str
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Capture a PayPal order, or read it back if it was already captured.
+
+    Returns:
+        Tuple of (PayPal status, capture id).
+
+    Raises:
+        PayPalError: If PayPal is unreachable or rejects the capture
+    """
+    try:
+        response = await paypal_client.client.capture_order(
+            paypal_order_id, request_id=capture_request_id(order_id)
+        )
+    except PayPalError as e:
+        # Captured earlier under another request id (e.g. before deploy)
+        if e.status_code != 422:
+            raise
+        response = await paypal_client.client.get_order(paypal_order_id)
+        if check_paypal_payment_status(response) != "COMPLETED":
+            raise
+    return check_paypal_payment_status(response), extract_capture_id(response)
+
+
+async def capture_outcome(
+    order_id: str, paypal_order_id: str
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Capture a PayPal order; a rejected capture is an outcome, not an error.
+
+    Returns:
+        Tuple of (PayPal status, capture id); (None, None) if PayPal
+        rejected the capture.
+
+    Raises:
+        PayPalError: If PayPal is unreachable or fails (network, 5xx)
+    """
+    try:
+        return await capture_payment(order_id, paypal_order_id)
+    except PayPalError as e:
+        if e.status_code is None or e.status_code >= 500:
+            raise
+        logger.warning("PayPal capture rejected for order %s: %s", order_id, e)
+        return None, None
+
+
+async def finalize_capture(
+    db: AsyncSession,
+    order_id: str,
+    payment_status: Optional[str],
+    capture_id: Optional[str],
+) -> Optional[NewEventBookingOrder]:
+    """
+    Apply a capture outcome to a still-PROCESSING order (not committed).
+
+    Returns:
+        The order if this call approved it, None otherwise.
+    """
+    order = await lock_processing_order(db, order_id)
+    if order is None:
+        # Finalized concurrently by the other path
+        return None
+
+    if payment_status == "COMPLETED":
+        await complete_order(db, order, capture_id)
+        return order
+
+    await fail_order(db, order)
+    return None
+
+
+async def capture_and_finalize(
+    db: AsyncSession, order_id: str, paypal_order_id: str
+) -> Optional[NewEventBookingOrder]:
+    """
+    Capture an approved PayPal order and finalize the booking order.
+
+    A declined capture fails the order. Transient PayPal errors (network,
+    5xx) propagate and leave the hold in place for a retry. The order row
+    is only locked after PayPal has answered.
+
+    Returns:
+        The order if this call approved it, None otherwise.
+    """
+    payment_status, capture_id = await capture_outcome(
+        order_id, paypal_order_id
+    )
+    return await finalize_capture(db, order_id, payment_status, capture_id)
+
+
+def queue_booking_confirmation(
+    db: AsyncSession, order: NewEventBookingOrder
+) -> None:
+    """Queue the booking confirmation email; failures are logged, not raised."""
+    try:
+        user_name = (
+            order.new_user.username
+            or order.new_user.first_name
+            or "Valued Customer"
+        )
+        if order.new_user.last_name:
+            user_name += f" {order.new_user.last_name}"
+
+        # Build seat categories list
+        seat_categories = [
+            {
+                "label": li.new_seat_category.category_label,
+                "num_seats": li.num_seats,
+                "price_per_seat": float(li.price_per_seat),
+                "subtotal": float(li.subtotal),
+                "discount": float(li.discount_amount),
+                "total_amount": float(li.total_amount),
+            }
+            for li in order.line_items
+        ]
+
+        message = build_new_booking_success_email(
+            email=order.new_user.email,
+            user_name=user_name,
+            order_id=order.order_id,
+            event_title=order.new_booked_event.event_title,
+            event_slug=order.new_booked_event.event_slug,
+            event_date=order.new_slot.slot_date.strftime("%B %d, %Y"),
+            event_time=(
+                order.new_slot.start_time
+                if order.new_slot.start_time
+                else "N/A"
+            ),
+            event_duration=(
+                f"{order.new_slot.duration_minutes} mins"
+                if order.new_slot.duration_minutes
+                else "N/A"
+            ),
+            event_location=order.new_booked_event.location or "",
+            event_category=order.new_booked_event.new_category.category_name,
+            booking_date=order.created_at.strftime("%B %d, %Y"),
+            total_amount=float(order.total_amount),
+            total_discount=float(
+                sum(li.discount_amount for li in order.line_items)
+            ),
+            seat_categories=seat_categories,
+        )
+        enqueue_email(db, message)
+    except Exception as email_error:
+        logger.warning(
+            "Failed to queue booking confirmation email for order %s: %s",
+            order.order_id,
+            str(email_error),
+        )
+
+
+# ---------------------------------------------------------------------- #
+# Webhook inbox
+# ---------------------------------------------------------------------- #
+
+
+def _webhook_references(
+    event: Dict[str, Any],
+) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """(our order id, PayPal order id, capture id) from a webhook event."""
+    resource = event.get("resource") or {}
+    if event.get("event_type") == ORDER_APPROVED:
+        units = resource.get("purchase_units") or [{}]
+        return units[0].get("custom_id"), resource.get("id"), None
+
+    related = (resource.get("supplementary_data") or {}).get(
+        "related_ids"
+    ) or {}
+    return (
+        resource.get("custom_id"),
+        related.get("order_id"),
+        resource.get("id"),
+    )
+
+
+async def record_webhook_event(db: AsyncSession, event: Dict[str, Any]) -> bool:
+    """
+    Store a verified webhook event in the inbox (not committed).
+
+    Returns:
+        True if the event is new, False for a redelivery.
+    """
+    order_ref_id, paypal_order_id, capture_id = _webhook_references(event)
+    stmt = (
+        insert(PayPalWebhookEvent)
+        .values(
+            event_id=event["id"],
+            event_type=event["event_type"],
+            order_ref_id=order_ref_id,
+            paypal_order_id=paypal_order_id,
+            capture_id=capture_id,
+            payload=event,
+            status=WebhookEventStatus.PENDING,
+            attempts=0,
+        )
+        .on_conflict_do_nothing(index_elements=[PayPalWebhookEvent.event_id])
+        .returning(PayPalWebhookEvent.event_id)
+    )
+    return (await db.execute(stmt)).scalar_one_or_none() is not None
+
+
+def needs_capture(event: PayPalWebhookEvent) -> bool:
+    """True if applying the event starts with a PayPal capture."""
+    return bool(
+        event.event_type == ORDER_APPROVED
+        and event.order_ref_id
+        and event.paypal_order_id
+    )
+
+
+async def apply_webhook_event(
+    db: AsyncSession,
+    event: PayPalWebhookEvent,
+    capture: Optional[Tuple[Optional[str], Optional[str]]] = None,
+) -> Tuple[WebhookEventStatus, Optional[NewEventBookingOrder]]:
+    """
+    Apply one inbox event to its booking order (not committed).
+
+    ``capture`` is the ``capture_outcome`` of an ORDER_APPROVED event, if
+    the caller already asked PayPal outside its transaction.
+
+    Returns:
+        Tuple of (resulting event status, order approved by this event).
+    """
+    if not event.order_ref_id:
+        return WebhookEventStatus.IGNORED, None
+
+    if event.event_type == ORDER_APPROVED:
+        if not event.paypal_order_id:
+            return WebhookEventStatus.IGNORED, None
+        if capture is None:
+            capture = await capture_outcome(
+                event.order_ref_id, event.paypal_order_id
+            )
+        order = await finalize_capture(db, event.order_ref_id, *capture)
+        return WebhookEventStatus.PROCESSED, order
+
+    order = await lock_processing_order(db, event.order_ref_id)
+    if order is None:
+        booking_status = await get_booking_status(db, event.order_ref_id)
+        if (
+            event.event_type == CAPTURE_COMPLETED
+            and booking_status != BookingStatus.APPROVED
+        ):
+            # Money taken for an order that already gave up its seats
+            logger.error(
+                "Capture %s completed for order %s in state %s; refund needed",
+                event.capture_id,
+                event.order_ref_id,
+                booking_status,
+            )
+        return WebhookEventStatus.IGNORED, None
+
+    if event.event_type == CAPTURE_COMPLETED:
+        await complete_order(db, order, event.capture_id)
+        return WebhookEventStatus.PROCESSED, order
+
+    await fail_order(db, order)
+    return WebhookEventStatus.PROCESSED, None
+
+
+def mark_webhook_event(
+    event: PayPalWebhookEvent,
+    status: WebhookEventStatus,
+    error: Optional[str] = None,
+) -> None:
+    event.status = status
+    event.last_error = error
+    event.leased_until = None
+    if status != WebhookEventStatus.PENDING:
+        event.processed_at = datetime.now(timezone.utc)
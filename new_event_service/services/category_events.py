@@ -1,4 +1,3 @@
-from datetime import date
 from typing import Dict, List, Optional, Tuple
 
 from sqlalchemy import and_, desc, func, select
@@ -27,75 +26,87 @@ async def fetch_categories_with_all_events(
             - 'upcoming': Return events where end_date is greater than or equal to current date
     """
 
-    # Get current date for filtering
-    current_date = date.today()
-
     # Base filter: only ACTIVE events
     base_conditions = [NewEvent.event_status == EventStatus.ACTIVE]
 
     # Unpack conditions + alias from helper
     base_conditions.extend(get_event_conditions(event_type))
 
-    # Get all categories that have events (either directly or through subcategories)
-    categories_query = (
-        select(Category)
-        .join(NewEvent, Category.category_id == NewEvent.category_id)
+    # Rank events inside each category (including events from subcategories)
+    # so the latest 5 per category come back in a single query
+    ranked_events = (
+        select(
+            NewEvent.event_id,
+            func.row_number()
+            .over(
+                partition_by=NewEvent.category_id,
+                order_by=desc(NewEvent.created_at),
+            )
+            .label("rank"),
+        )
         .where(and_(*base_conditions))
-        .distinct()
-        .order_by(Category.category_name)
+        .subquery()
     )
 
-    result = await db.execute(categories_query)
-    categories = list(result.scalars().all())
-
-    categories_data = []
-
-    for category in categories:
-        # Get latest 5 events for this category (including events from subcategories)
-        # Apply the same filtering conditions
-        events_conditions = [
-            NewEvent.category_id == category.category_id,
-            *base_conditions,
-        ]
-
-        events_query = (
-            select(NewEvent)
-            .where(and_(*events_conditions))
-            .order_by(desc(NewEvent.created_at))
-            .limit(5)
+    rows_query = (
+        select(
+            Category.category_id,
+            Category.category_name,
+            Category.category_slug,
+            NewEvent.event_id,
+            NewEvent.event_title,
+            NewEvent.event_slug,
+            NewEvent.event_type,
+            NewEvent.event_dates,
+            NewEvent.location,
+            NewEvent.is_online,
+            NewEvent.card_image,
+            NewEvent.event_status,
+            NewEvent.featured_event,
         )
+        .join(NewEvent, Category.category_id == NewEvent.category_id)
+        .join(ranked_events, ranked_events.c.event_id == NewEvent.event_id)
+        .where(ranked_events.c.rank <= 5)
+        .order_by(
+            Category.category_name,
+            Category.category_id,
+            desc(NewEvent.created_at),
+        )
+    )
 
-        events_result = await db.execute(events_query)
-        events = list(events_result.scalars().all())
-
-        # Convert events to the format expected by the schema
-        events_data = []
-        for event in events:
-            events_data.append(
-                {
-                    "event_id": event.event_id,
-                    "event_title": event.event_title,
-                    "event_slug": event.event_slug,
-                    "event_type": event.event_type,
-                    "event_dates": event.event_dates,
-                    "location": event.location,
-                    "is_online": event.is_online,
-                    "card_image": event.card_image,
-                    "event_status": event.event_status,
-                    "featured_event": event.featured_event,
-                }
-            )
+    result = await db.execute(rows_query)
 
-        # Only include categories that have events
-        if events_data:
+    # Group rows under their category, keeping the category ordering
+    categories_by_id: Dict[str, Dict] = {}
+    for row in result.all():
+        category_data = categories_by_id.get(row.category_id)
+        if category_data is None:
             category_data = {
-                "category_id": category.category_id,
-                "category_name": category.category_name,
-                "category_slug": category.category_slug,
-                "events": events_data,
-                "events_count": len(events_data),
+                "category_id": row.category_id,
+                "category_name": row.category_name,
+                "category_slug": row.category_slug,
+                "events": [],
+                "events_count": 0,
             }
-            categories_data.append(category_data)
+            categories_by_id[row.category_id] = category_data
+
+        category_data["events"].append(
+            {
+                "event_id": row.event_id,
+                "event_title": row.event_title,
+                "event_slug": row.event_slug,
+                "event_type": row.event_type,
+                "event_dates": row.event_dates,
+                "location": row.location,
+                "is_online": row.is_online,
+                "card_image": row.card_image,
+                "event_status": row.event_status,
+                "featured_event": row.featured_event,
+            }
+        )
+        category_data["events_count"] += 1
+
+    categories_data = list(categories_by_id.values())
 
     return categories_data
 
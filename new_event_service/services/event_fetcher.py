@@ -1,6 +1,5 @@
 from datetime import date
 from enum import Enum
-from sqlalchemy import func
 from shared.db.models.new_events import NewEvent
 
 class EventTypeStatus(str, Enum):
@@ -13,9 +12,9 @@ class EventTypeStatus(str, Enum):
 def get_event_conditions(event_type: EventTypeStatus):
     current_date = date.today()
 
-    # Safely get first and last element from array
-    min_date = NewEvent.event_dates[1]
-    max_date = NewEvent.event_dates[func.array_length(NewEvent.event_dates, 1)]
+    # Indexed bounds of event_dates (kept in sync by the model)
+    min_date = NewEvent.first_event_date
+    max_date = NewEvent.last_event_date
 
     conditions = []
 
@@ -0,0 +1,86 @@
+"""
+Ranked event search.
+
+Events carry a weighted ``search_vector`` (title > hashtags > location >
+category names) maintained by a database trigger and backed by a GIN
+index, so matching, ranking and paging all happen in SQL. Each word of the
+user's query is matched as a prefix, which keeps type-ahead working. When
+full-text search finds nothing, callers fall back to trigram similarity on
+the title to absorb typos.
+
+Usage:
+    clauses = full_text_clauses("jazz nig")
+    if clauses is not None:
+        stmt = stmt.where(clauses.condition).order_by(clauses.rank.desc())
+"""
+
+import re
+from typing import NamedTuple, Optional
+
+from sqlalchemy import Select, cast, func
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.engine import Result
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from shared.core.logging_config import get_logger
+from shared.db.models import NewEvent
+
+logger = get_logger(__name__)
+
+# Must match the configuration used by the search vector trigger
+SEARCH_CONFIG = "simple"
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+
+class SearchClauses(NamedTuple):
+    """A filter and the score to order its matches by."""
+
+    condition: ColumnElement[bool]
+    rank: ColumnElement[float]
+
+
+def prefix_tsquery(query: str) -> Optional[str]:
+    """Turn free text into a ``to_tsquery`` string that requires every word,
+    each as a prefix: ``"Jazz nig"`` -> ``"jazz:* & nig:*"``. Returns None
+    when the text has no searchable words."""
+    words = _WORD.findall(query.lower().replace("_", " "))
+    if not words:
+        return None
+    return " & ".join(f"{word}:*" for word in words)
+
+
+def full_text_clauses(query: str) -> Optional[SearchClauses]:
+    """Match ``query`` against the event search vector, ranked with
+    ``ts_rank`` so title hits outrank hashtag, location and category hits."""
+    terms = prefix_tsquery(query)
+    if terms is None:
+        return None
+    tsquery = func.to_tsquery(cast(SEARCH_CONFIG, REGCONFIG), terms)
+    return SearchClauses(
+        condition=NewEvent.search_vector.op("@@")(tsquery),
+        rank=func.ts_rank(NewEvent.search_vector, tsquery),
+    )
+
+
+def fuzzy_title_clauses(query: str) -> SearchClauses:
+    """Trigram similarity on the title (``pg_trgm``), for misspelt queries."""
+    term = query.strip().lower()
+    return SearchClauses(
+        condition=NewEvent.event_title.op("%")(term),
+        rank=func.similarity(NewEvent.event_title, term),
+    )
+
+
+async def execute_fuzzy(db: AsyncSession, stmt: Select) -> Optional[Result]:
+    """Run a statement built from ``fuzzy_title_clauses`` in a savepoint.
+    Returns None when trigram search is unavailable (``pg_trgm`` missing)
+    so the caller's transaction stays usable."""
+    try:
+        async with db.begin_nested():
+            return await db.execute(stmt)
+    except DBAPIError as e:
+        logger.warning("Fuzzy event search unavailable: %s", e)
+        return None
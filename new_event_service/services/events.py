@@ -1,12 +1,18 @@
 from datetime import date, datetime
 from typing import Any, List, Optional, Sequence, Tuple, TypedDict
 
-from sqlalchemy import and_, any_, asc, case, desc, exists, func, or_, select
+from sqlalchemy import and_, asc, desc, exists, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from new_event_service.services.event_fetcher import EventTypeStatus, get_event_conditions
+from new_event_service.services.event_search import (
+    execute_fuzzy,
+    full_text_clauses,
+    fuzzy_title_clauses,
+)
 from shared.core.logging_config import get_logger
+from shared.db.loader_profiles import LoaderProfile, loader_options
 from shared.db.models import (
     AdminUser,
     Category,
@@ -15,7 +21,7 @@ from shared.db.models import (
     NewEventSlot,
     SubCategory,
 )
-from shared.db.models.rbac import Role
+from shared.utils.rbac_matrix import get_role_name
 
 logger = get_logger(__name__)
 
@@ -83,6 +89,8 @@ async def get_user_role_name(db: AsyncSession, user_id: str) -> Optional[str]:
     """
     Get a user's role name without triggering lazy loading.
 
+    The name comes from the in-memory RBAC matrix.
+
     Args:
         db: Database session
         user_id: The user ID to check
@@ -91,12 +99,9 @@ async def get_user_role_name(db: AsyncSession, user_id: str) -> Optional[str]:
         Optional[str]: The role name if found, None otherwise
     """
     result = await db.execute(
-        select(Role.role_name)
-        .join(AdminUser, AdminUser.role_id == Role.role_id)
-        .where(AdminUser.user_id == user_id)
+        select(AdminUser.role_id).where(AdminUser.user_id == user_id)
     )
-    role_name = result.scalar_one_or_none()
-    return role_name
+    return await get_role_name(db, result.scalar_one_or_none())
 
 
 async def fetch_organizer_by_id(
@@ -216,10 +221,7 @@ async def fetch_event_by_slug_with_relations(
     query = (
         select(NewEvent)
         .options(
-            selectinload(NewEvent.new_category),
-            selectinload(NewEvent.new_subcategory),
-            selectinload(NewEvent.new_organizer),
-            selectinload(NewEvent.new_slots),
+            *loader_options(LoaderProfile.DETAIL),
         )
         .filter(
             NewEvent.event_slug == event_slug,
@@ -237,10 +239,7 @@ async def fetch_event_by_id_with_relations(
     query = (
         select(NewEvent)
         .options(
-            selectinload(NewEvent.new_category),
-            selectinload(NewEvent.new_subcategory),
-            selectinload(NewEvent.new_organizer),
-            selectinload(NewEvent.new_slots),
+            *loader_options(LoaderProfile.DETAIL),
         )
         .filter(NewEvent.event_id == event_id)
     )
@@ -255,9 +254,7 @@ async def fetch_events_without_filters(
 
     # Build base query with relations
     query = select(NewEvent).options(
-        selectinload(NewEvent.new_category),
-        selectinload(NewEvent.new_subcategory),
-        selectinload(NewEvent.new_organizer),
+        *loader_options(LoaderProfile.CARD),
     )
 
     # Get total count
@@ -281,9 +278,7 @@ async def fetch_limited_events_without_filters(
 
     # Build base query with relations
     query = select(NewEvent).options(
-        selectinload(NewEvent.new_category),
-        selectinload(NewEvent.new_subcategory),
-        selectinload(NewEvent.new_organizer),
+        *loader_options(LoaderProfile.CARD),
     )
 
     # Get total count
@@ -494,48 +489,19 @@ async def search_events(
     category_id: Optional[str] = None,
     subcategory_id: Optional[str] = None,
 ) -> Tuple[List[NewEvent], int]:
-    """Advanced search for events across multiple fields"""
+    """Advanced search for events across multiple fields.
+
+    Title, slug and hashtags are matched through the ranked full-text
+    index (the slug is derived from the title); results are ordered by
+    rank, then newest first. When nothing matches, a trigram search on the
+    title catches misspellings.
+    """
 
     # Build base query with relations
     base_query = select(NewEvent).options(
-        selectinload(NewEvent.new_category),
-        selectinload(NewEvent.new_subcategory),
-        selectinload(NewEvent.new_organizer),
+        *loader_options(LoaderProfile.CARD),
     )
 
-    # Build search conditions
-    search_conditions = []
-    search_term = f"%{query.lower()}%"
-
-    if "title" in search_fields:
-        search_conditions.append(NewEvent.event_title.ilike(search_term))
-
-    if "slug" in search_fields:
-        search_conditions.append(NewEvent.event_slug.ilike(search_term))
-
-    if "hashtags" in search_fields:
-        # Search in hashtags JSON array
-        search_conditions.append(
-            func.jsonb_array_elements_text(NewEvent.hash_tags).op("ILIKE")(
-                search_term
-            )
-        )
-
-    if "organizer" in search_fields:
-        # Join with AdminUser table to search organizer name
-        base_query = base_query.join(
-            AdminUser, NewEvent.organizer_id == AdminUser.user_id
-        )
-        search_conditions.extend(
-            [
-                AdminUser.username_hash.ilike(f"%{search_term}%"),
-            ]
-        )
-
-    # Combine search conditions with OR
-    if search_conditions:
-        base_query = base_query.filter(or_(*search_conditions))
-
     # Apply additional filters
     filters = []
 
@@ -548,29 +514,73 @@ async def search_events(
     if subcategory_id:
         filters.append(NewEvent.subcategory_id == subcategory_id)
 
-    if filters:
-        base_query = base_query.filter(and_(*filters))
+    # Build search conditions
+    search_conditions = []
+    order_by = []
 
-    # Get total count
-    count_query = select(func.count(NewEvent.event_id))
-    if search_conditions:
-        count_query = count_query.filter(or_(*search_conditions))
-    if filters:
-        count_query = count_query.filter(and_(*filters))
+    text_clauses = None
+    if {"title", "slug", "hashtags"} & set(search_fields):
+        text_clauses = full_text_clauses(query)
+    if text_clauses is not None:
+        search_conditions.append(text_clauses.condition)
+        order_by.append(text_clauses.rank.desc())
 
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
+    if "organizer" in search_fields:
+        # Join with AdminUser table to search organizer name
+        base_query = base_query.join(
+            AdminUser, NewEvent.organizer_id == AdminUser.user_id
+        )
+        search_conditions.append(
+            AdminUser.username_hash.ilike(f"%{query.lower()}%")
+        )
+
+    def build(conditions: list) -> Tuple[Any, Any]:
+        count_query = select(func.count(NewEvent.event_id))
+        page_query = base_query
+        if "organizer" in search_fields:
+            count_query = count_query.join(
+                AdminUser, NewEvent.organizer_id == AdminUser.user_id
+            )
+        if conditions:
+            count_query = count_query.filter(or_(*conditions))
+            page_query = page_query.filter(or_(*conditions))
+        if filters:
+            count_query = count_query.filter(and_(*filters))
+            page_query = page_query.filter(and_(*filters))
+        return count_query, page_query
 
-    # Apply pagination and ordering
     offset = (page - 1) * per_page
-    base_query = (
-        base_query.order_by(desc(NewEvent.created_at))
+    count_query, page_query = build(search_conditions)
+    total = (await db.execute(count_query)).scalar() or 0
+
+    if total == 0 and "title" in search_fields and query.strip():
+        fuzzy = fuzzy_title_clauses(query)
+        count_query, page_query = build([fuzzy.condition])
+        fuzzy_total = await execute_fuzzy(db, count_query)
+        if fuzzy_total is None:
+            return [], 0
+        total = fuzzy_total.scalar() or 0
+        order_by = [fuzzy.rank.desc()]
+        if total == 0:
+            return [], 0
+        fuzzy_page = await execute_fuzzy(
+            db,
+            page_query.order_by(*order_by, desc(NewEvent.created_at))
+            .offset(offset)
+            .limit(per_page),
+        )
+        events = list(fuzzy_page.scalars().all()) if fuzzy_page else []
+        return events, total
+
+    # Apply pagination and ordering
+    page_query = (
+        page_query.order_by(*order_by, desc(NewEvent.created_at))
         .offset(offset)
         .limit(per_page)
     )
 
     # Execute query
-    result = await db.execute(base_query)
+    result = await db.execute(page_query)
     events = list(result.scalars().all())
 
     return events, total
@@ -634,10 +644,7 @@ async def fetch_events_by_slug_comprehensive(
         category_events_query = (
             select(NewEvent)
             .options(
-                selectinload(NewEvent.new_category),
-                selectinload(NewEvent.new_subcategory),
-                selectinload(NewEvent.new_organizer),
-                selectinload(NewEvent.new_slots),
+                *loader_options(LoaderProfile.DETAIL),
             )
             .filter(NewEvent.category_id == category.category_id)
             .filter(
@@ -646,7 +653,7 @@ async def fetch_events_by_slug_comprehensive(
             .filter(
                 NewEvent.event_status == EventStatus.ACTIVE
             )  # Only active events
-            .filter(any_(NewEvent.event_dates) >= today)
+            .filter(NewEvent.last_event_date >= today)
             .order_by(desc(NewEvent.created_at))
             .offset(offset)
             .limit(per_page)
@@ -663,7 +670,7 @@ async def fetch_events_by_slug_comprehensive(
                 NewEvent.subcategory_id.is_(None)
             )  # Only events without subcategory
             .filter(NewEvent.event_status == EventStatus.ACTIVE)
-            .filter(any_(NewEvent.event_dates) >= today)
+            .filter(NewEvent.last_event_date >= today)
         )
         category_count_result = await db.execute(category_count_query)
         total_category_events = category_count_result.scalar() or 0
@@ -672,10 +679,7 @@ async def fetch_events_by_slug_comprehensive(
         subcategory_events_query = (
             select(NewEvent)
             .options(
-                selectinload(NewEvent.new_category),
-                selectinload(NewEvent.new_subcategory),
-                selectinload(NewEvent.new_organizer),
-                selectinload(NewEvent.new_slots),
+                *loader_options(LoaderProfile.DETAIL),
             )
             .filter(NewEvent.category_id == category.category_id)
             .filter(
@@ -684,7 +688,7 @@ async def fetch_events_by_slug_comprehensive(
             .filter(
                 NewEvent.event_status == EventStatus.ACTIVE
             )  # Only active events
-            .filter(any_(NewEvent.event_dates) >= today)
+            .filter(NewEvent.last_event_date >= today)
             .order_by(desc(NewEvent.created_at))
         )
 
@@ -719,7 +723,7 @@ async def fetch_events_by_slug_comprehensive(
                 select(func.count(NewEvent.event_id))
                 .filter(NewEvent.subcategory_id == subcategory_id)
                 .filter(NewEvent.event_status == EventStatus.ACTIVE)
-                .filter(any_(NewEvent.event_dates) >= today)
+                .filter(NewEvent.last_event_date >= today)
             )
             subcategory_count_result = await db.execute(subcategory_count_query)
             count = subcategory_count_result.scalar() or 0
@@ -740,17 +744,14 @@ async def fetch_events_by_slug_comprehensive(
         subcategory_events_query = (
             select(NewEvent)
             .options(
-                selectinload(NewEvent.new_category),
-                selectinload(NewEvent.new_subcategory),
-                selectinload(NewEvent.new_organizer),
-                selectinload(NewEvent.new_slots),
+                *loader_options(LoaderProfile.DETAIL),
             )
             .filter(NewEvent.subcategory_id == subcategory.subcategory_id)
             .filter(
                 NewEvent.event_status == EventStatus.ACTIVE
             )  # Only active events
             .order_by(desc(NewEvent.created_at))
-            .filter(any_(NewEvent.event_dates) >= today)
+            .filter(NewEvent.last_event_date >= today)
             .offset(offset)
             .limit(per_page)
         )
@@ -763,7 +764,7 @@ async def fetch_events_by_slug_comprehensive(
             select(func.count(NewEvent.event_id))
             .filter(NewEvent.subcategory_id == subcategory.subcategory_id)
             .filter(NewEvent.event_status == EventStatus.ACTIVE)
-            .filter(any_(NewEvent.event_dates) >= today)
+            .filter(NewEvent.last_event_date >= today)
         )
         subcategory_count_result = await db.execute(subcategory_count_query)
         total_subcategory_events = subcategory_count_result.scalar() or 0
@@ -837,10 +838,7 @@ async def fetch_events_by_category_or_subcategory_slug(
     category_query = (
         select(NewEvent)
         .options(
-            selectinload(NewEvent.new_category),
-            selectinload(NewEvent.new_subcategory),
-            selectinload(NewEvent.new_organizer),
-            selectinload(NewEvent.new_slots),
+            *loader_options(LoaderProfile.DETAIL),
         )
         .join(Category, NewEvent.category_id == Category.category_id)
         .filter(and_(*category_conditions))
@@ -883,10 +881,7 @@ async def fetch_events_by_category_or_subcategory_slug(
     subcategory_query = (
         select(NewEvent)
         .options(
-            selectinload(NewEvent.new_category),
-            selectinload(NewEvent.new_subcategory),
-            selectinload(NewEvent.new_organizer),
-            selectinload(NewEvent.new_slots),
+            *loader_options(LoaderProfile.DETAIL),
         )
         .join(
             SubCategory, NewEvent.subcategory_id == SubCategory.subcategory_id
@@ -934,10 +929,7 @@ async def filter_events_advanced(
 
     # Build base query with relations
     query = select(NewEvent).options(
-        selectinload(NewEvent.new_category),
-        selectinload(NewEvent.new_subcategory),
-        selectinload(NewEvent.new_organizer),
-        selectinload(NewEvent.new_slots),
+        *loader_options(LoaderProfile.DETAIL),
     )
 
     # Apply filters
@@ -1024,10 +1016,7 @@ async def get_events_by_organizer(
     query = (
         select(NewEvent)
         .options(
-            selectinload(NewEvent.new_category),
-            selectinload(NewEvent.new_subcategory),
-            selectinload(NewEvent.new_organizer),
-            selectinload(NewEvent.new_slots),
+            *loader_options(LoaderProfile.DETAIL),
         )
         .filter(NewEvent.organizer_id == organizer_id)
     )
@@ -1143,9 +1132,7 @@ async def get_upcoming_events(
     query = (
         select(NewEvent)
         .options(
-            selectinload(NewEvent.new_category),
-            selectinload(NewEvent.new_subcategory),
-            selectinload(NewEvent.new_organizer),
+            *loader_options(LoaderProfile.CARD),
         )
         .filter(NewEvent.event_status == EventStatus.INACTIVE)
     )
@@ -1203,9 +1190,7 @@ async def get_events_by_hashtag(
     query = (
         select(NewEvent)
         .options(
-            selectinload(NewEvent.new_category),
-            selectinload(NewEvent.new_subcategory),
-            selectinload(NewEvent.new_organizer),
+            *loader_options(LoaderProfile.CARD),
         )
         .filter(
             NewEvent.hash_tags.op("@>")([hashtag])
@@ -1286,10 +1271,7 @@ async def fetch_latest_event_from_each_category(
         )
         .where(and_(*base_conditions))
         .options(
-            selectinload(NewEvent.new_category),
-            selectinload(NewEvent.new_subcategory),
-            selectinload(NewEvent.new_organizer),
-            selectinload(NewEvent.new_slots),  # optional if you need slots
+            *loader_options(LoaderProfile.DETAIL),
         )
         .order_by(NewEvent.created_at.desc())
     )
@@ -1329,64 +1311,50 @@ class EventWithDate(TypedDict):
 async def search_events_for_global(
     db: AsyncSession, query: Optional[str] = None, limit: int = 10
 ) -> list[EventWithDate]:
+    """Active upcoming events for the global search box: the latest ones
+    when there is no query, otherwise the best ``limit`` full-text matches
+    (title > hashtags > location > category), falling back to a fuzzy
+    title match when nothing matches exactly."""
     current_date = date.today()
 
-    # If no query → latest active upcoming events
+    stmt = (
+        select(NewEvent)
+        .options(
+            selectinload(NewEvent.new_category),
+            selectinload(NewEvent.new_subcategory),
+        )
+        .where(
+            NewEvent.event_status == EventStatus.ACTIVE,
+            NewEvent.last_event_date >= current_date,
+        )
+    )
+
+    events: Sequence[NewEvent] = []
     if not query:
-        stmt = (
-            select(NewEvent)
-            .options(
-                selectinload(NewEvent.new_category),
-                selectinload(NewEvent.new_subcategory),
-            )
-            .where(NewEvent.event_status == EventStatus.ACTIVE)
-            .order_by(desc(NewEvent.created_at))
-            .limit(limit)
+        # If no query → latest active upcoming events
+        result = await db.execute(
+            stmt.order_by(desc(NewEvent.created_at)).limit(limit)
         )
-        result = await db.execute(stmt)
         events = result.scalars().all()
-
     else:
-        q = f"%{query.lower()}%"
-
-        # Weighted scoring: Title > Location > Subcategory > Category
-        rank = case(
-            (NewEvent.event_title.ilike(q), 4),
-            (NewEvent.location.ilike(q), 3),
-            (SubCategory.subcategory_name.ilike(q), 2),
-            (Category.category_name.ilike(q), 1),
-            else_=0,
-        )
-
-        stmt = (
-            select(NewEvent, rank.label("rank"))
-            .options(
-                selectinload(NewEvent.new_category),
-                selectinload(NewEvent.new_subcategory),
+        clauses = full_text_clauses(query)
+        if clauses is not None:
+            result = await db.execute(
+                stmt.where(clauses.condition)
+                .order_by(clauses.rank.desc(), desc(NewEvent.created_at))
+                .limit(limit)
             )
-            .join(
-                Category,
-                NewEvent.category_id == Category.category_id,
-                isouter=True,
+            events = result.scalars().all()
+
+        if not events and query.strip():
+            fuzzy = fuzzy_title_clauses(query)
+            fuzzy_result = await execute_fuzzy(
+                db,
+                stmt.where(fuzzy.condition)
+                .order_by(fuzzy.rank.desc(), desc(NewEvent.created_at))
+                .limit(limit),
             )
-            .join(
-                SubCategory,
-                NewEvent.subcategory_id == SubCategory.subcategory_id,
-                isouter=True,
-            )
-            .where(NewEvent.event_status == EventStatus.ACTIVE)
-            .order_by(desc("rank"), desc(NewEvent.created_at))
-        )
-
-        result = await db.execute(stmt)
-        rows = result.all()
-
-        # Keep only matched rows (rank > 0)
-        events = [row[0] for row in rows if row.rank > 0]
-
-        # Apply your rule: if <5 matches → just return those (don’t pad with unmatched)
-        if len(events) > limit:
-            events = events[:limit]
+            events = fuzzy_result.scalars().all() if fuzzy_result else []
 
     # Compute next_event_date only for upcoming dates
     upcoming: list[EventWithDate] = []
@@ -0,0 +1,106 @@
+"""
+Seat inventory primitives for booking.
+
+Holding seats is a single conditional ``UPDATE ... RETURNING``: the
+availability check and the increment happen in one statement under the
+row lock Postgres takes for the update, so concurrent bookings can never
+oversell and never need an explicit ``SELECT ... FOR UPDATE``. Nothing
+here commits; callers reserve every category of an order, insert the
+order and commit once, or roll back to drop all holds together.
+"""
+
+from typing import NamedTuple, Optional
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from shared.db.models import NewEventSeatCategory
+
+
+class SeatReservation(NamedTuple):
+    """State of a seat category right after a successful hold."""
+
+    seat_category_id: str
+    held: int
+    available: int
+
+
+def _available():
+    return (
+        NewEventSeatCategory.total_tickets
+        - NewEventSeatCategory.booked
+        - NewEventSeatCategory.held
+    )
+
+
+async def reserve_seats(
+    db: AsyncSession, seat_category_id: str, num_seats: int
+) -> Optional[SeatReservation]:
+    """
+    Hold ``num_seats`` in a seat category if that many are still available.
+
+    Args:
+        db: Database session (the caller owns the transaction)
+        seat_category_id: Seat category to hold seats in
+        num_seats: Number of seats to hold
+
+    Returns:
+        The reservation, or None when not enough seats are left.
+    """
+    stmt = (
+        update(NewEventSeatCategory)
+        .where(
+            NewEventSeatCategory.seat_category_id == seat_category_id,
+            _available() >= num_seats,
+        )
+        .values(held=NewEventSeatCategory.held + num_seats)
+        .returning(
+            NewEventSeatCategory.seat_category_id,
+            NewEventSeatCategory.held,
+            _available().label("available"),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    row = (await db.execute(stmt)).one_or_none()
+    if row is None:
+        return None
+    return SeatReservation(row.seat_category_id, row.held, row.available)
+
+
+async def release_held_seats(
+    db: AsyncSession, seat_category_id: str, num_seats: int
+) -> None:
+    """Give back ``num_seats`` held seats; ``held`` never goes below 0."""
+    await db.execute(
+        update(NewEventSeatCategory)
+        .where(NewEventSeatCategory.seat_category_id == seat_category_id)
+        .values(held=func.greatest(NewEventSeatCategory.held - num_seats, 0))
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def confirm_held_seats(
+    db: AsyncSession, seat_category_id: str, num_seats: int
+) -> None:
+    """Turn ``num_seats`` held seats into booked seats (payment captured)."""
+    await db.execute(
+        update(NewEventSeatCategory)
+        .where(NewEventSeatCategory.seat_category_id == seat_category_id)
+        .values(
+            held=func.greatest(NewEventSeatCategory.held - num_seats, 0),
+            booked=NewEventSeatCategory.booked + num_seats,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def get_available_seats(db: AsyncSession, seat_category_id: str) -> int:
+    """Seats currently available in a seat category (0 if it is gone)."""
+    available = (
+        await db.execute(
+            select(_available()).where(
+                NewEventSeatCategory.seat_category_id == seat_category_id
+            )
+        )
+    ).scalar_one_or_none()
+    return max(available or 0, 0)
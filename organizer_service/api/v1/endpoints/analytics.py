@@ -40,12 +40,13 @@ from shared.db.models.new_events import (
     NewEventBookingOrder,
     PaymentStatus,
 )
-from shared.db.models.rbac import Role
 from shared.db.sessions.database import get_db
-from shared.dependencies.admin import get_current_active_user
+from shared.dependencies.admin import get_current_principal
+from shared.dependencies.principal import Principal
 from shared.utils.data_utils import process_business_profile_data
 from shared.utils.exception_handlers import exception_handler
 from shared.utils.file_uploads import get_media_url
+from shared.utils.rbac_matrix import get_role_name
 
 router = APIRouter()
 
@@ -105,7 +106,6 @@ async def get_organizer_full_details(
         .options(
             selectinload(AdminUser.user_profile),
             selectinload(AdminUser.business_profile),
-            selectinload(AdminUser.role),
         )
         .where(AdminUser.user_id == user_id)
     )
@@ -256,6 +256,8 @@ async def get_organizer_full_details(
             "profile_bio": admin_user.user_profile.profile_bio,
         }
 
+    role_name = await get_role_name(db, admin_user.role_id)
+
     # Prepare complete response data
     response_data = {
         "organizer_info": {
@@ -264,11 +266,8 @@ async def get_organizer_full_details(
             "email": admin_user.email,
             "profile_picture": get_media_url(admin_user.profile_picture),
             "role": (
-                {
-                    "role_id": admin_user.role.role_id,
-                    "role_name": admin_user.role.role_name,
-                }
-                if admin_user.role
+                {"role_id": admin_user.role_id, "role_name": role_name}
+                if role_name
                 else None
             ),
             "is_verified": admin_user.is_verified,
@@ -326,7 +325,6 @@ async def get_organizer_summary(
         .options(
             selectinload(AdminUser.user_profile),
             selectinload(AdminUser.business_profile),
-            selectinload(AdminUser.role),
         )
         .where(AdminUser.user_id == user_id)
     )
@@ -365,7 +363,7 @@ async def get_organizer_summary(
             "username": admin_user.username,
             "email": admin_user.email,
             "profile_picture": get_media_url(admin_user.profile_picture),
-            "role_name": admin_user.role.role_name if admin_user.role else None,
+            "role_name": await get_role_name(db, admin_user.role_id),
             "is_verified": admin_user.is_verified,
             "created_at": admin_user.created_at,
         },
@@ -452,7 +450,7 @@ def calculate_profile_completion(
 )
 @exception_handler
 async def get_dashboard_overview(
-    current_user: Annotated[AdminUser, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_principal)],
     period: str = Query(
         "30d",
         description="Time period for analytics (7d, 30d, 90d, 1y)",
@@ -505,7 +503,7 @@ async def get_dashboard_overview(
 )
 @exception_handler
 async def get_event_analytics(
-    current_user: AdminUser = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_principal),
     period: str = Query(
         "30d",
         description="Time period for analytics (7d, 30d, 90d, 1y)",
@@ -532,13 +530,7 @@ async def get_event_analytics(
     user_id = current_user.user_id
 
     # Constraint 1: Check if user has organizer role
-    role_name = None
-    if current_user.role_id:
-        role_stmt = select(Role.role_name).where(
-            Role.role_id == current_user.role_id
-        )
-        role_result = await db.execute(role_stmt)
-        role_name = role_result.scalar()
+    role_name = await get_role_name(db, current_user.role_id)
     if not role_name or role_name.lower() != "organizer":
         return api_response(
             status_code=403,
@@ -733,7 +725,7 @@ async def get_event_analytics(
 )
 @exception_handler
 async def get_booking_analytics(
-    current_user: Annotated[AdminUser, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_principal)],
     period: str = Query(
         "30d",
         description="Time period for analytics (7d, 30d, 90d, 1y)",
@@ -931,7 +923,7 @@ async def get_booking_analytics(
 )
 @exception_handler
 async def get_query_analytics(
-    current_user: Annotated[AdminUser, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_principal)],
     period: str = Query(
         "30d",
         description="Time period for analytics (7d, 30d, 90d, 1y)",
@@ -1083,7 +1075,7 @@ async def get_query_analytics(
 )
 @exception_handler
 async def get_performance_metrics(
-    current_user: AdminUser = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
 ):
     """
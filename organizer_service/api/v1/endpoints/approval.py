@@ -13,6 +13,7 @@ from shared.constants import (
 from shared.core.api_response import api_response
 from shared.db.models import AdminUser, BusinessProfile
 from shared.db.sessions.database import get_db
+from shared.dependencies.principal import admin_principal_cache
 from shared.utils.email_utils import (
     send_organizer_approval_notification,
     send_organizer_rejection_notification,
@@ -63,6 +64,7 @@ async def approve_organizer(
 
     db.add_all([organizer, business_profile])
     await db.commit()
+    admin_principal_cache.invalidate(organizer.user_id)
 
     # Send approval notification email in background
     background_tasks.add_task(
@@ -130,6 +132,7 @@ async def reject_organizer(
 
     db.add_all([organizer, business_profile])
     await db.commit()
+    admin_principal_cache.invalidate(organizer.user_id)
 
     # Send rejection notification email in background
     background_tasks.add_task(
@@ -224,6 +227,7 @@ async def soft_delete_organizer(
     organizer.is_deleted = True
     db.add(organizer)
     await db.commit()
+    admin_principal_cache.invalidate(organizer.user_id)
 
     return api_response(
         status_code=status.HTTP_200_OK,
@@ -258,6 +262,7 @@ async def restore_organizer(
     organizer.is_deleted = False
     db.add(organizer)
     await db.commit()
+    admin_principal_cache.invalidate(organizer.user_id)
 
     return api_response(
         status_code=status.HTTP_200_OK,
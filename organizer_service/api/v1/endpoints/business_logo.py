@@ -1,4 +1,5 @@
 from typing import Annotated
+
 from fastapi import APIRouter, Depends, File, UploadFile, status
 from fastapi.responses import JSONResponse
 from sqlalchemy import select
@@ -9,19 +10,19 @@ from shared.core.config import settings
 from shared.db.models.admin_users import AdminUser
 from shared.db.models.organizer import BusinessProfile
 from shared.db.sessions.database import get_db
-from shared.dependencies.admin import get_current_active_user
+from shared.dependencies.admin import get_current_principal
+from shared.dependencies.principal import Principal
 from shared.utils.exception_handlers import exception_handler
 from shared.utils.file_uploads import get_media_url, remove_file_if_exists, save_uploaded_file
 from shared.utils.secure_filename import secure_filename
 
-
 router = APIRouter()
 
 
 @router.patch("/logo", summary="Update organizer business logo")
 @exception_handler
 async def update_profile_picture(
-    current_user: Annotated[AdminUser, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_principal)],
     business_logo: UploadFile = File(...),
     db: AsyncSession = Depends(get_db),
 ) -> JSONResponse:
@@ -91,7 +92,7 @@ async def update_profile_picture(
 @router.get("/logo", summary="Get organizer business logo")
 @exception_handler
 async def get_business_logo(
-    current_user: Annotated[AdminUser, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_principal)],
     db: AsyncSession = Depends(get_db),
 ) -> JSONResponse:
     """
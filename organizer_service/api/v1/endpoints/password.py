@@ -12,10 +12,6 @@ from admin_service.services.response_builders import (
 from admin_service.services.user_service import (
     get_user_by_email,
 )
-from admin_service.utils.auth import (
-    hash_password,
-    verify_password,
-)
 from organizer_service.schemas.password import (
     ForgotPassword,
     ResetPasswordWithToken,
@@ -32,12 +28,13 @@ from shared.core.api_response import api_response
 from shared.core.logging_config import get_logger
 from shared.db.models.admin_users import AdminUser
 from shared.db.sessions.database import get_db
-from shared.dependencies.admin import get_current_active_user
+from shared.dependencies.admin import get_current_user_full
 from shared.utils.email_utils import (
     send_organizer_password_reset_email,
 )
 from shared.utils.email_validators import EmailValidator
 from shared.utils.exception_handlers import exception_handler
+from shared.utils.password_hashing import password_hasher
 
 logger = get_logger(__name__)
 
@@ -127,14 +124,14 @@ async def reset_password_with_token(
         )
 
     # Step 2: Prevent using the same password
-    if verify_password(data.new_password, user.password_hash):
+    if await password_hasher.verify(data.new_password, user.password_hash):
         return api_response(
             status_code=status.HTTP_409_CONFLICT,
             message="New password cannot be the same as old password.",
         )
 
     # Step 3: Update the password
-    user.password_hash = hash_password(data.new_password)
+    user.password_hash = await password_hasher.hash(data.new_password)
     user.login_status = 0  # Normal login status
     user.failure_login_attempts = 0  # Reset login attempts
 
@@ -163,7 +160,7 @@ async def reset_password(
         return user_not_found_response()
 
     # Prevent using the same password
-    if verify_password(data.new_password, user.password_hash):
+    if await password_hasher.verify(data.new_password, user.password_hash):
         return api_response(
             status_code=status.HTTP_409_CONFLICT,
             message="New password cannot be the same as old password.",
@@ -171,7 +168,7 @@ async def reset_password(
         )
 
     # Hash and update password
-    user.password_hash = hash_password(data.new_password)
+    user.password_hash = await password_hasher.hash(data.new_password)
     # Set status 0 but require password reset
     user.login_status = 0
     await db.commit()
@@ -185,7 +182,7 @@ async def reset_password(
 @router.post("/change-password", status_code=status.HTTP_200_OK)
 @exception_handler
 async def change_password(
-    current_user: Annotated[AdminUser, Depends(get_current_active_user)],
+    current_user: Annotated[AdminUser, Depends(get_current_user_full)],
     data: UserChangePassword = Depends(UserChangePassword.as_form),
     db: AsyncSession = Depends(get_db),
 ) -> JSONResponse:
@@ -203,7 +200,9 @@ async def change_password(
         return account_deactivated()
 
     # Step 2: Verify current password
-    if not verify_password(data.current_password, current_user.password_hash):
+    if not await password_hasher.verify(
+        data.current_password, current_user.password_hash
+    ):
         logger.warning(
             f"Invalid current password attempt for user: {current_user.user_id}"
         )
@@ -214,7 +213,9 @@ async def change_password(
         )
 
     # Step 3: Prevent using the same password
-    if verify_password(data.new_password, current_user.password_hash):
+    if await password_hasher.verify(
+        data.new_password, current_user.password_hash
+    ):
         logger.info(
             f"User {current_user.user_id} attempted to use same password"
         )
@@ -225,7 +226,7 @@ async def change_password(
         )
 
     # Step 4: Update password and reset security fields
-    current_user.password_hash = hash_password(data.new_password)
+    current_user.password_hash = await password_hasher.hash(data.new_password)
     current_user.failure_login_attempts = 0  # Reset failed login attempts
     current_user.login_status = 0  # Ensure normal login status
     current_user.updated_at = datetime.now(timezone.utc)  # Update timestamp
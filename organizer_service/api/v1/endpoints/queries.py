@@ -24,6 +24,7 @@ from organizer_service.services.queries import (
     get_query_by_id,
     get_query_stats_service,
     get_user_by_id,
+    get_user_role,
     update_query_status_service,
 )
 from shared.core.api_response import api_response
@@ -52,7 +53,7 @@ async def create_query(
             status.HTTP_404_NOT_FOUND, "Sender user not found", log_error=True
         )
 
-    if sender.role.role_name.lower() != "organizer":
+    if await get_user_role(db, sender) != "organizer":
         return api_response(
             status.HTTP_403_FORBIDDEN,
             "Only organizers can create queries",
@@ -117,7 +118,7 @@ async def get_queries_list(
             status.HTTP_404_NOT_FOUND, "User not found", log_error=True
         )
 
-    user_role = user.role.role_name.lower()
+    user_role = await get_user_role(db, user)
     filters = QueryFilters(
         query_status=status_filter,
         category=category,
@@ -252,7 +253,7 @@ async def get_query(
         )
 
     if (
-        user.role.role_name.lower() == "organizer"
+        await get_user_role(db, user) == "organizer"
         and query.sender_user_id != user_id
     ):
         return api_response(
@@ -296,7 +297,7 @@ async def add_message_to_query(
             log_error=True,
         )
 
-    user_role = user.role.role_name.lower()
+    user_role = await get_user_role(db, user)
     if user_role == "organizer":
         if query.sender_user_id != request.user_id:
             return api_response(
@@ -353,8 +354,9 @@ async def update_query_status(
         return api_response(
             status.HTTP_404_NOT_FOUND, "User not found", log_error=True
         )
+    user_role = await get_user_role(db, user)
     if request.query_status == QueryStatus.QUERY_CLOSED:
-        if user.role.role_name.lower() == "admin":
+        if user_role == "admin":
             return api_response(
                 status.HTTP_403_FORBIDDEN,
                 "Admins cannot close queries. Only organizers can close their own queries.",
@@ -387,11 +389,7 @@ async def update_query_status(
     if request.message:
         status_message = ThreadMessage(
             type="response",
-            sender_type=(
-                "admin"
-                if user.role.role_name.lower() == "admin"
-                else "organizer"
-            ),
+            sender_type="admin" if user_role == "admin" else "organizer",
             user_id=request.user_id,
             username=user.username or "",
             message=request.message,
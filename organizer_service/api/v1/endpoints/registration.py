@@ -11,7 +11,6 @@ from admin_service.services.user_service import (
     get_role_by_name,
 )
 from admin_service.services.user_validation import validate_unique_user
-from admin_service.utils.auth import hash_password
 from organizer_service.schemas.register import (
     OrganizerRegisterRequest,
     OrganizerRegisterResponse,
@@ -29,6 +28,7 @@ from shared.utils.id_generators import (
     generate_lower_uppercase,
 )
 from shared.utils.otp_and_tokens import generate_verification_tokens
+from shared.utils.password_hashing import password_hasher
 
 router = APIRouter()
 
@@ -60,7 +60,7 @@ async def register_user(
     user_id = generate_lower_uppercase(length=6)
 
     # Hash the password
-    password_hash = hash_password(user_data.password)
+    password_hash = await password_hasher.hash(user_data.password)
 
     # fetch role from database
     role = await get_role_by_name(db, "ORGANIZER")
@@ -20,10 +20,11 @@ from shared.db.models.new_events import (
     NewEventBookingOrder,
     PaymentStatus,
 )
+from shared.dependencies.principal import Principal
 from shared.utils.file_uploads import get_media_url
 
 
-async def validate_user_access(user: AdminUser, db: AsyncSession) -> Any:
+async def validate_user_access(user: Principal, db: AsyncSession) -> Any:
     role_name = (
         await db.execute(
             select(Role.role_name)
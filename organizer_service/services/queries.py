@@ -5,7 +5,6 @@ from fastapi import HTTPException, Query, status
 from fastapi.responses import JSONResponse
 from sqlalchemy import and_, desc, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from organizer_service.schemas.queries import (
     AddMessageRequest,
@@ -17,18 +16,20 @@ from organizer_service.schemas.queries import (
 from shared.core.api_response import api_response
 from shared.db.models.admin_users import AdminUser
 from shared.db.models.organizer import OrganizerQuery, QueryStatus
+from shared.utils.rbac_matrix import get_role_name, rbac_matrix
 
 
 async def get_user_by_id(user_id: str, db: AsyncSession) -> Optional[AdminUser]:
-    stmt = (
-        select(AdminUser)
-        .options(selectinload(AdminUser.role))
-        .where(AdminUser.user_id == user_id)
-    )
+    stmt = select(AdminUser).where(AdminUser.user_id == user_id)
     result = await db.execute(stmt)
     return result.scalar_one_or_none()
 
 
+async def get_user_role(db: AsyncSession, user: AdminUser) -> str:
+    """Lower-case role name of a user, from the RBAC matrix"""
+    return (await get_role_name(db, user.role_id) or "").lower()
+
+
 async def get_query_by_id(
     query_id: int, db: AsyncSession
 ) -> Optional[OrganizerQuery]:
@@ -43,39 +44,32 @@ async def get_user_with_role(
     # current_admin: Annotated[AdminUser, Depends(get_current_active_admin)],
 ) -> Optional[AdminUser]:
     """Helper function to get user with role information"""
-    user_stmt = (
-        select(AdminUser)
-        .options(selectinload(AdminUser.role))
-        .where(AdminUser.user_id == user_id)
-    )
+    user_stmt = select(AdminUser).where(AdminUser.user_id == user_id)
     result = await db.execute(user_stmt)
     return result.scalars().first()
 
 
 def is_admin_user(user: AdminUser) -> bool:
     """Helper function to check if user is admin"""
-    if not user or not user.role:
+    if not user:
         return False
-    return user.role.role_name.lower() in ["admin", "superadmin"]
+    role_name = rbac_matrix.role_name(user.role_id) or ""
+    return role_name.lower() in ["admin", "superadmin"]
 
 
 async def get_organizer_user(
     db: AsyncSession, user_id: str
 ) -> Optional[AdminUser]:
     """Helper function to get user and validate they have organizer role"""
-    user_stmt = (
-        select(AdminUser)
-        .options(selectinload(AdminUser.role))
-        .where(AdminUser.user_id == user_id)
-    )
+    user_stmt = select(AdminUser).where(AdminUser.user_id == user_id)
     result = await db.execute(user_stmt)
     user = result.scalars().first()
 
-    if not user or not user.role:
+    if not user:
         return None
 
     # Check if user has organizer role
-    if user.role.role_name.lower() != "organizer":
+    if await get_user_role(db, user) != "organizer":
         return None
 
     return user
@@ -130,12 +124,8 @@ async def get_query_stats(
 ) -> Dict[str, int] | JSONResponse:
     """Get query statistics for dashboard"""
 
-    # Get user info - eagerly load the role relationship
-    user_stmt = (
-        select(AdminUser)
-        .options(selectinload(AdminUser.role))
-        .where(AdminUser.user_id == user_id)
-    )
+    # Get user info
+    user_stmt = select(AdminUser).where(AdminUser.user_id == user_id)
     user_result = await db.execute(user_stmt)
     user = user_result.scalar_one_or_none()
 
@@ -146,7 +136,7 @@ async def get_query_stats(
             log_error=True,
         )
 
-    user_role = user.role.role_name.lower()
+    user_role = await get_user_role(db, user)
 
     # Base stats query
     base_query = select(func.count()).select_from(OrganizerQuery)
@@ -228,7 +218,7 @@ async def get_query_stats_service(
             log_error=True,
         )
 
-    role = user.role.role_name.lower()
+    role = await get_user_role(db, user)
     stats = {}
     base_query = select(func.count()).select_from(OrganizerQuery)
 
@@ -294,7 +284,7 @@ async def update_query_status_service(
             log_error=True,
         )
 
-    user_role = user.role.role_name.lower()
+    user_role = await get_user_role(db, user)
 
     # Permission validation
     can_update = False
@@ -17,6 +17,7 @@ from shared.db.models import Permission
 from shared.db.sessions.database import get_db
 from shared.utils.exception_handlers import exception_handler
 from shared.utils.id_generators import generate_digits_lowercase
+from shared.utils.rbac_matrix import commit_rbac_change
 from shared.utils.validators import is_single_reserved_word
 
 router = APIRouter()
@@ -49,7 +50,7 @@ async def create_permission(
         # Reactivate soft-deleted permission
         existing_permission.permission_status = False
         existing_permission.permission_tstamp = datetime.now(timezone.utc)
-        await db.commit()
+        await commit_rbac_change(db)
         await db.refresh(existing_permission)
 
         return api_response(
@@ -74,7 +75,7 @@ async def create_permission(
     )
 
     db.add(new_permission)
-    await db.commit()
+    await commit_rbac_change(db)
     await db.refresh(new_permission)
 
     return api_response(
@@ -196,7 +197,7 @@ async def update_permission(
 
         permission.permission_name = update_data.permission_name
 
-    await db.commit()
+    await commit_rbac_change(db)
     await db.refresh(permission)
 
     return api_response(
@@ -230,7 +231,7 @@ async def update_permission_status(
         )
 
     permission.permission_status = perm_status
-    await db.commit()
+    await commit_rbac_change(db)
     await db.refresh(permission)
 
     return api_response(
@@ -275,7 +276,7 @@ async def delete_permission(
             )
         # Proceed with hard delete
         await db.delete(permission)
-        await db.commit()
+        await commit_rbac_change(db)
         return api_response(
             status_code=status.HTTP_200_OK,
             message="Permission permanently deleted (hard delete).",
@@ -284,7 +285,7 @@ async def delete_permission(
     # Execute hard or soft delete
     if hard_delete:
         await db.delete(permission)
-        await db.commit()
+        await commit_rbac_change(db)
         return api_response(
             status_code=status.HTTP_200_OK,
             message="Permission permanently deleted (hard delete).",
@@ -292,7 +293,7 @@ async def delete_permission(
 
     # Soft delete
     permission.permission_status = True
-    await db.commit()
+    await commit_rbac_change(db)
     return api_response(
         status_code=status.HTTP_200_OK,
         message="Permission soft-deleted successfully.",
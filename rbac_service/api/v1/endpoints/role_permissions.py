@@ -15,6 +15,7 @@ from shared.core.api_response import api_response
 from shared.db.models import Permission, Role, RolePermission
 from shared.db.sessions.database import get_db
 from shared.utils.exception_handlers import exception_handler
+from shared.utils.rbac_matrix import commit_rbac_change
 
 router = APIRouter()
 
@@ -74,7 +75,7 @@ async def create_role_permission(
         # Reactivate the existing one
         existing_rp.rp_status = False
         existing_rp.timestamp = datetime.now(timezone.utc)
-        await db.commit()
+        await commit_rbac_change(db)
         await db.refresh(existing_rp)
         return api_response(
             status_code=status.HTTP_200_OK,
@@ -90,7 +91,7 @@ async def create_role_permission(
     )
 
     db.add(new_role_perm)
-    await db.commit()
+    await commit_rbac_change(db)
     await db.refresh(new_role_perm)
 
     return api_response(
@@ -193,7 +194,7 @@ async def update_role_permission(
     if update_data.permission_id:
         role_permission.permission_id = update_data.permission_id
 
-    await db.commit()
+    await commit_rbac_change(db)
     await db.refresh(role_permission)
 
     return api_response(
@@ -229,7 +230,7 @@ async def update_role_permission_status(
         )
 
     role_permission.rp_status = role_perm_status
-    await db.commit()
+    await commit_rbac_change(db)
     await db.refresh(role_permission)
 
     return api_response(
@@ -273,7 +274,7 @@ async def delete_role_permission(
             )
         # Hard delete allowed if already soft-deleted
         await db.delete(role_permission)
-        await db.commit()
+        await commit_rbac_change(db)
         return api_response(
             status_code=status.HTTP_200_OK,
             message="Role-permission permanently deleted (hard delete).",
@@ -281,7 +282,7 @@ async def delete_role_permission(
 
     if hard_delete:
         await db.delete(role_permission)
-        await db.commit()
+        await commit_rbac_change(db)
         return api_response(
             status_code=status.HTTP_200_OK,
             message="Role-permission permanently deleted (hard delete).",
@@ -289,7 +290,7 @@ async def delete_role_permission(
 
     # Soft delete
     role_permission.rp_status = True
-    await db.commit()
+    await commit_rbac_change(db)
     return api_response(
         status_code=status.HTTP_200_OK,
         message="Role-permission soft-deleted successfully.",
@@ -13,6 +13,7 @@ from shared.db.models import Role
 from shared.db.sessions.database import get_db
 from shared.utils.exception_handlers import exception_handler
 from shared.utils.id_generators import generate_digits_lowercase
+from shared.utils.rbac_matrix import commit_rbac_change
 from shared.utils.validators import is_single_reserved_word
 
 router = APIRouter()
@@ -44,7 +45,7 @@ async def create_role(
         # Reactivate the soft-deleted role
         existing_role.role_status = False
         existing_role.role_tstamp = datetime.now(timezone.utc)
-        await db.commit()
+        await commit_rbac_change(db)
         await db.refresh(existing_role)
         return api_response(
             status_code=status.HTTP_200_OK,
@@ -67,7 +68,7 @@ async def create_role(
         role_tstamp=datetime.now(timezone.utc),
     )
     db.add(new_role)
-    await db.commit()
+    await commit_rbac_change(db)
     await db.refresh(new_role)
 
     return api_response(
@@ -187,7 +188,7 @@ async def update_role(
 
         role.role_name = update_data.role_name
 
-    await db.commit()
+    await commit_rbac_change(db)
     await db.refresh(role)
 
     return api_response(
@@ -221,7 +222,7 @@ async def update_role_status(
         )
 
     role.role_status = role_status
-    await db.commit()
+    await commit_rbac_change(db)
     await db.refresh(role)
 
     return api_response(
@@ -264,7 +265,7 @@ async def delete_role(
             )
         # Proceed with hard delete
         await db.delete(role)
-        await db.commit()
+        await commit_rbac_change(db)
         return api_response(
             status_code=status.HTTP_200_OK,
             message="Role permanently deleted (hard delete).",
@@ -272,7 +273,7 @@ async def delete_role(
 
     if hard_delete:
         await db.delete(role)
-        await db.commit()
+        await commit_rbac_change(db)
         return api_response(
             status_code=status.HTTP_200_OK,
             message="Role permanently deleted (hard delete).",
@@ -280,7 +281,7 @@ async def delete_role(
 
     # Soft delete
     role.role_status = True
-    await db.commit()
+    await commit_rbac_change(db)
     return api_response(
         status_code=status.HTTP_200_OK,
         message="Role soft-deleted successfully.",
@@ -1,7 +1,23 @@
 # services/init_roles_permissions.py
-from typing import Any
+"""
+Seed the default roles, permissions and role-permission mappings.
 
-from sqlalchemy import select
+Every worker runs this at startup, so it is made cheap to repeat:
+
+- A SHA-256 checksum of ``PERMISSION_NAMES``, ``ROLE_NAMES`` and
+  ``ROLE_PERMISSION_NAME_MAP`` is stored on the ``e2grbacversion`` row;
+  when it matches, seeding is skipped after a single SELECT.
+- Otherwise a transaction-scoped Postgres advisory lock lets one worker
+  seed while the others wait, then find the new checksum and skip.
+- Missing rows are written with bulk ``INSERT ... ON CONFLICT DO NOTHING``
+  statements in one transaction, which also bumps the RBAC version.
+"""
+
+import hashlib
+import json
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from shared.constants import (
@@ -9,64 +25,127 @@ from shared.constants import (
     ROLE_NAMES,
     ROLE_PERMISSION_NAME_MAP,
 )
-from shared.db.models import Permission, Role, RolePermission
+from shared.core.logging_config import get_logger
+from shared.db.models import Permission, RbacVersion, Role, RolePermission
 from shared.utils.id_generators import generate_digits_lowercase
+from shared.utils.rbac_matrix import VERSION_ROW_ID, bump_rbac_version
+
+logger = get_logger(__name__)
+
+# Key of the advisory lock held while seeding (any constant bigint)
+SEED_LOCK_ID = 4_207_351_120
+
 
+def defaults_checksum() -> str:
+    """SHA-256 of the default roles, permissions and mappings."""
+    encoded = json.dumps(
+        {
+            "permissions": PERMISSION_NAMES,
+            "roles": ROLE_NAMES,
+            "role_permissions": ROLE_PERMISSION_NAME_MAP,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(encoded.encode()).hexdigest()
 
-async def init_roles_permissions(db: AsyncSession) -> None:
-    permission_name_id_map: dict[Any, Any] = {}
-    role_name_id_map: dict[Any, Any] = {}
 
-    # --- Insert Permissions ---
-    for name in PERMISSION_NAMES:
-        result = await db.execute(
-            select(Permission).where(Permission.permission_name == name)
+async def read_seed_checksum(db: AsyncSession) -> str | None:
+    result = await db.execute(
+        select(RbacVersion.seed_checksum).where(
+            RbacVersion.id == VERSION_ROW_ID
         )
-        permission = result.scalar()
-        if not permission:
-            permission = Permission(
-                permission_id=generate_digits_lowercase(),
-                permission_name=name,
-                permission_status=False,
-            )
-            db.add(permission)
-            await db.flush()
-        permission_name_id_map[name] = permission.permission_id
-
-    # --- Insert Roles ---
-    for name in ROLE_NAMES:
-        result = await db.execute(select(Role).where(Role.role_name == name))
-        role = result.scalar()
-        if not role:
-            role = Role(
-                role_id=generate_digits_lowercase(),
-                role_name=name,
-                role_status=False,
-            )
-            db.add(role)
-            await db.flush()
-        role_name_id_map[name] = role.role_id
-
-    await db.commit()
-
-    # --- Insert Role-Permission Mappings ---
-    for role_name, perm_names in ROLE_PERMISSION_NAME_MAP.items():
-        role_id = role_name_id_map[role_name]
-        for perm_name in perm_names:
-            permission_id = permission_name_id_map[perm_name]
-            result = await db.execute(
-                select(RolePermission).where(
-                    RolePermission.role_id == role_id,
-                    RolePermission.permission_id == permission_id,
-                )
+    )
+    return result.scalar()
+
+
+async def init_roles_permissions(db: AsyncSession) -> bool:
+    """
+    Insert any missing default roles, permissions and mappings.
+
+    Returns:
+        bool: True if this call seeded, False if the defaults were current.
+    """
+    checksum = defaults_checksum()
+    if await read_seed_checksum(db) == checksum:
+        await db.commit()
+        return False
+
+    try:
+        # Released at commit; other workers block here until seeding is done
+        await db.execute(select(func.pg_advisory_xact_lock(SEED_LOCK_ID)))
+        if await read_seed_checksum(db) == checksum:
+            await db.commit()
+            return False
+
+        permission_ids = await _insert_missing(
+            db,
+            Permission,
+            Permission.permission_id,
+            Permission.permission_name,
+            PERMISSION_NAMES,
+            {"permission_status": False},
+        )
+        role_ids = await _insert_missing(
+            db,
+            Role,
+            Role.role_id,
+            Role.role_name,
+            ROLE_NAMES,
+            {"role_status": False},
+        )
+
+        mappings = [
+            {
+                "role_id": role_ids[role_name],
+                "permission_id": permission_ids[permission_name],
+                "rp_status": False,
+            }
+            for role_name, permission_names in ROLE_PERMISSION_NAME_MAP.items()
+            for permission_name in permission_names
+        ]
+        if mappings:
+            await db.execute(
+                insert(RolePermission)
+                .values(mappings)
+                .on_conflict_do_nothing(constraint="uq_role_permission")
             )
-            if not result.scalar():
-                db.add(
-                    RolePermission(
-                        role_id=role_id,
-                        permission_id=permission_id,
-                        rp_status=False,
-                    )
-                )
-
-    await db.commit()
+
+        await bump_rbac_version(db, seed_checksum=checksum)
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+
+    logger.info("Default roles and permissions seeded")
+    return True
+
+
+async def _insert_missing(
+    db: AsyncSession, model, id_column, name_column, names, defaults: dict
+) -> dict[str, str]:
+    """
+    Insert the names not present yet; returns name -> id for all of them.
+
+    Names have no unique constraint, so existing ones are read first (under
+    the seed lock nothing else inserts defaults meanwhile).
+    """
+    result = await db.execute(
+        select(name_column, id_column).where(name_column.in_(names))
+    )
+    ids = {name: row_id for name, row_id in result.all()}
+    missing = [
+        {
+            id_column.key: generate_digits_lowercase(),
+            name_column.key: name,
+            **defaults,
+        }
+        for name in names
+        if name not in ids
+    ]
+    if missing:
+        await db.execute(insert(model).values(missing).on_conflict_do_nothing())
+        ids.update(
+            {row[name_column.key]: row[id_column.key] for row in missing}
+        )
+    return ids
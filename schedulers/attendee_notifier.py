@@ -0,0 +1,29 @@
+from typing import Optional
+
+from new_event_service.services.attendee_notifications import (
+    claim_notification_job,
+    deliver_notification_job,
+    fail_notification_job,
+)
+from shared.core.logging_config import get_logger
+from shared.db.sessions.database import AsyncSessionLocal
+
+logger = get_logger(__name__)
+
+
+async def attendee_notification_job(job_id: Optional[int] = None):
+    """Run the given attendee notification, else the oldest open one."""
+    try:
+        async with AsyncSessionLocal() as db:
+            job = await claim_notification_job(db, job_id)
+            if job is None:
+                return
+            claimed_id = job.job_id
+            try:
+                # A second connection holds the attendee cursor open
+                async with AsyncSessionLocal() as stream_db:
+                    await deliver_notification_job(db, stream_db, job)
+            except Exception as e:
+                await fail_notification_job(db, claimed_id, e)
+    except Exception as e:
+        logger.error(f"Attendee notification job failed: {e}")
@@ -1,9 +1,9 @@
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import func, select
+from sqlalchemy import and_, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
+from shared.core.config import settings
 from shared.core.logging_config import get_logger
 from shared.db.models.new_events import (
     BookingStatus,
@@ -16,115 +16,115 @@ from shared.db.sessions.database import AsyncSessionLocal
 
 logger = get_logger(__name__)
 
-HOLD_DURATION_MINUTES = 15  # configurable
 
-
-async def backfill_held_counts(db: AsyncSession):
+async def backfill_held_counts(db: AsyncSession) -> int:
     """
     Recalculate 'held' seats for all seat categories based on active PROCESSING orders.
-    Fixes pre-existing inconsistencies.
+    Fixes pre-existing inconsistencies. One set-based UPDATE that only
+    touches categories whose count has drifted; run rarely (reconcile job).
+    Returns: number of seat categories corrected.
     """
-    result = await db.execute(select(NewEventSeatCategory))
-    seat_categories = result.scalars().all()
-
-    for cat in seat_categories:
-        # Sum all seats currently held in active PROCESSING orders
-        held_result = await db.execute(
-            select(func.sum(NewEventBooking.num_seats))
-            .join(
-                NewEventBookingOrder,
-                NewEventBooking.order_id == NewEventBookingOrder.order_id,
-            )
-            .where(
-                NewEventBooking.seat_category_ref_id == cat.seat_category_id,
-                NewEventBookingOrder.booking_status == BookingStatus.PROCESSING,
-            )
+    held_seats = (
+        select(func.coalesce(func.sum(NewEventBooking.num_seats), 0))
+        .join(
+            NewEventBookingOrder,
+            NewEventBooking.order_id == NewEventBookingOrder.order_id,
         )
-        total_held = held_result.scalar() or 0
-        cat.held = total_held
-        db.add(cat)
-
+        .where(
+            NewEventBooking.seat_category_ref_id
+            == NewEventSeatCategory.seat_category_id,
+            NewEventBookingOrder.booking_status == BookingStatus.PROCESSING,
+        )
+        .scalar_subquery()
+    )
+    result = await db.execute(
+        update(NewEventSeatCategory)
+        .where(NewEventSeatCategory.held != held_seats)
+        .values(held=held_seats)
+        .execution_options(synchronize_session=False)
+    )
     await db.commit()
     logger.info("Backfilled seat category held counts successfully.")
+    return result.rowcount
 
 
 async def release_expired_holds(db: AsyncSession) -> int:
     """
-    Release seats for orders that are still PROCESSING beyond the hold duration.
-    Updates order status to CANCELLED/FAILED and decrements seat_category.held counts.
+    Release seats for orders that are still PROCESSING past their expires_at.
+    Updates order status to CANCELLED/FAILED and decrements seat_category.held
+    counts, all in one statement: the expired orders are cancelled in a CTE
+    and their seats are summed per seat category for a single UPDATE ... FROM.
     Returns: number of line items released.
     """
     now = datetime.now(timezone.utc)
-    expiry_time = now - timedelta(minutes=HOLD_DURATION_MINUTES)
+    # Orders created before expires_at existed use the default hold window
+    legacy_cutoff = now - timedelta(minutes=settings.BOOKING_HOLD_MINUTES)
 
-    # Step 1: Find expired orders
-    result = await db.execute(
-        select(NewEventBookingOrder)
+    expired_orders = (
+        update(NewEventBookingOrder)
         .where(
             NewEventBookingOrder.booking_status == BookingStatus.PROCESSING,
             NewEventBookingOrder.payment_status.notin_(
                 [PaymentStatus.COMPLETED, PaymentStatus.FAILED]
             ),
-            NewEventBookingOrder.created_at <= expiry_time,
+            or_(
+                NewEventBookingOrder.expires_at <= now,
+                and_(
+                    NewEventBookingOrder.expires_at.is_(None),
+                    NewEventBookingOrder.created_at <= legacy_cutoff,
+                ),
+            ),
         )
-        .options(selectinload(NewEventBookingOrder.line_items))
+        .values(
+            booking_status=BookingStatus.CANCELLED,
+            payment_status=PaymentStatus.FAILED,
+            updated_at=func.now(),
+        )
+        .returning(NewEventBookingOrder.order_id)
+        .cte("expired_orders")
+    )
+    released = (
+        select(
+            NewEventBooking.seat_category_ref_id,
+            func.sum(NewEventBooking.num_seats).label("seats"),
+            func.count().label("line_items"),
+        )
+        .join(
+            expired_orders,
+            NewEventBooking.order_id == expired_orders.c.order_id,
+        )
+        .group_by(NewEventBooking.seat_category_ref_id)
+        .subquery("released")
     )
-    expired_orders = result.scalars().all()
-
-    if not expired_orders:
-        return 0
-
-    released_count = 0
-
-    # Step 2: Release seats for each line item
-    for order in expired_orders:
-        for line_item in order.line_items:
-            await release_seat_category_hold(
-                db=db,
-                seat_category_id=line_item.seat_category_ref_id,
-                num_seats=line_item.num_seats,
-            )
-            released_count += 1
-
-        # Step 3: Mark order as cancelled/failed
-        order.booking_status = BookingStatus.CANCELLED
-        order.payment_status = PaymentStatus.FAILED
-        db.add(order)
-
-    await db.commit()
-    return released_count
-
-
-async def release_seat_category_hold(
-    db: AsyncSession,
-    seat_category_id: str,
-    num_seats: int,
-):
-    """
-    Decrement held seats for a specific seat category when a booking expires.
-    Ensures held does not go below 0.
-    """
     result = await db.execute(
-        select(NewEventSeatCategory).where(
-            NewEventSeatCategory.seat_category_id == seat_category_id
+        update(NewEventSeatCategory)
+        .where(
+            NewEventSeatCategory.seat_category_id
+            == released.c.seat_category_ref_id
         )
+        .values(
+            held=func.greatest(NewEventSeatCategory.held - released.c.seats, 0)
+        )
+        .returning(released.c.line_items)
+        .execution_options(synchronize_session=False)
     )
-    seat_category = result.scalar_one_or_none()
-
-    if not seat_category:
-        return  # Invalid reference, skip
+    released_count = sum(result.scalars().all())
 
-    seat_category.held = max(0, seat_category.held - num_seats)
-    db.add(seat_category)
-    await db.flush()
+    await db.commit()
+    return released_count
 
 
 async def cleanup_job():
     async with AsyncSessionLocal() as db:
-        # Step 0: Backfill existing data to fix inconsistencies
-        await backfill_held_counts(db)
-
-        # Step 1: Release expired holds
         released = await release_expired_holds(db)
         if released:
             logger.info(f"Released {released} expired holds.")
+
+
+async def reconcile_held_counts_job():
+    async with AsyncSessionLocal() as db:
+        corrected = await backfill_held_counts(db)
+        if corrected:
+            logger.warning(
+                f"Corrected held counts of {corrected} seat categories."
+            )
@@ -0,0 +1,34 @@
+from shared.core.logging_config import get_logger
+from shared.db.sessions.database import AsyncSessionLocal
+from shared.utils.email_outbox import (
+    EMAIL_PURGE_BATCH_SIZE,
+    dispatch_outbox_batch,
+    purge_finished_emails,
+)
+
+logger = get_logger(__name__)
+
+
+async def email_outbox_job():
+    try:
+        async with AsyncSessionLocal() as db:
+            sent = await dispatch_outbox_batch(db)
+            if sent:
+                logger.info(f"Dispatched {sent} queued emails.")
+    except Exception as e:
+        logger.error(f"Email outbox dispatch failed: {e}")
+
+
+async def email_outbox_retention_job():
+    try:
+        purged = 0
+        async with AsyncSessionLocal() as db:
+            while True:
+                batch = await purge_finished_emails(db)
+                purged += batch
+                if batch < EMAIL_PURGE_BATCH_SIZE:
+                    break
+        if purged:
+            logger.info(f"Purged {purged} sent or dead-lettered emails.")
+    except Exception as e:
+        logger.error(f"Email outbox purge failed: {e}")
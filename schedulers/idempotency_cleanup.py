@@ -0,0 +1,22 @@
+from shared.core.logging_config import get_logger
+from shared.db.idempotency import PURGE_BATCH_SIZE, purge_expired_keys
+from shared.db.sessions.database import AsyncSessionLocal
+
+logger = get_logger(__name__)
+
+
+async def cleanup_idempotency_keys():
+    try:
+        purged = 0
+        async with AsyncSessionLocal() as db:
+            # One short transaction per batch; keep going while batches
+            # come back full so a backlog drains in a single run
+            while True:
+                batch = await purge_expired_keys(db)
+                purged += batch
+                if batch < PURGE_BATCH_SIZE:
+                    break
+        if purged:
+            logger.info(f"Purged {purged} expired idempotency keys.")
+    except Exception as e:
+        logger.error(f"Error purging expired idempotency keys: {e}")
@@ -0,0 +1,126 @@
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from new_event_service.services.booking_payments import (
+    apply_webhook_event,
+    capture_outcome,
+    mark_webhook_event,
+    needs_capture,
+    queue_booking_confirmation,
+)
+from schedulers.email_outbox_dispatcher import email_outbox_job
+from shared.core.logging_config import get_logger
+from shared.db.models.payments import PayPalWebhookEvent, WebhookEventStatus
+from shared.db.sessions.database import AsyncSessionLocal
+
+logger = get_logger(__name__)
+
+WEBHOOK_BATCH_SIZE = 50
+# Events still failing after this many attempts are left for manual review
+WEBHOOK_MAX_ATTEMPTS = 5
+# A claimed event is retried by another worker once this runs out; longer
+# than a capture with all its retries takes
+WEBHOOK_LEASE = timedelta(minutes=5)
+
+
+async def claim_webhook_events(
+    db: AsyncSession, batch_size: int = WEBHOOK_BATCH_SIZE
+) -> List[PayPalWebhookEvent]:
+    """
+    Lease up to ``batch_size`` pending events, oldest first, and commit.
+
+    Rows are claimed with SKIP LOCKED and leased for ``WEBHOOK_LEASE``, so
+    several workers (or a webhook kick racing the interval job) never
+    process the same event, and no row lock is held while PayPal is called.
+    """
+    now = datetime.now(timezone.utc)
+    events = (
+        (
+            await db.execute(
+                select(PayPalWebhookEvent)
+                .where(
+                    PayPalWebhookEvent.status == WebhookEventStatus.PENDING,
+                    or_(
+                        PayPalWebhookEvent.leased_until.is_(None),
+                        PayPalWebhookEvent.leased_until <= now,
+                    ),
+                )
+                .order_by(PayPalWebhookEvent.received_at)
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+            )
+        )
+        .scalars()
+        .all()
+    )
+    for event in events:
+        event.attempts += 1
+        event.leased_until = now + WEBHOOK_LEASE
+    await db.commit()
+    return list(events)
+
+
+async def process_webhook_batch(
+    db: AsyncSession, batch_size: int = WEBHOOK_BATCH_SIZE
+) -> int:
+    """
+    Apply up to ``batch_size`` pending PayPal webhook events, oldest first.
+
+    Events are leased and committed first (``claim_webhook_events``). Each
+    event is then captured at PayPal with no transaction open and applied
+    in its own short transaction, together with the confirmation email of
+    an order it approved. A failing event is retried on a later batch.
+    Returns: number of events handled.
+    """
+    events = await claim_webhook_events(db, batch_size)
+
+    for event in events:
+        try:
+            capture = None
+            if needs_capture(event):
+                capture = await capture_outcome(
+                    event.order_ref_id, event.paypal_order_id
+                )
+            async with db.begin_nested():
+                status, order = await apply_webhook_event(db, event, capture)
+        except Exception as e:
+            logger.warning(
+                "PayPal webhook %s (%s) failed on attempt %d: %s",
+                event.event_id,
+                event.event_type,
+                event.attempts,
+                e,
+            )
+            mark_webhook_event(
+                event,
+                (
+                    WebhookEventStatus.FAILED
+                    if event.attempts >= WEBHOOK_MAX_ATTEMPTS
+                    else WebhookEventStatus.PENDING
+                ),
+                str(e)[:1000],
+            )
+        else:
+            mark_webhook_event(event, status)
+            if order is not None:
+                queue_booking_confirmation(db, order)
+        await db.commit()
+
+    return len(events)
+
+
+async def webhook_inbox_job():
+    try:
+        async with AsyncSessionLocal() as db:
+            handled = await process_webhook_batch(db)
+            if handled:
+                logger.info(f"Processed {handled} PayPal webhook events.")
+    except Exception as e:
+        logger.error(f"PayPal webhook inbox failed: {e}")
+        return
+    if handled:
+        # Send the confirmations just queued without waiting for the interval
+        await email_outbox_job()
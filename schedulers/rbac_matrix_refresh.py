@@ -0,0 +1,16 @@
+from shared.core.logging_config import get_logger
+from shared.db.sessions.database import AsyncSessionLocal
+from shared.utils.rbac_matrix import rbac_matrix
+
+logger = get_logger(__name__)
+
+
+async def rbac_matrix_refresh_job():
+    try:
+        async with AsyncSessionLocal() as db:
+            if await rbac_matrix.refresh(db):
+                logger.info(
+                    f"RBAC matrix reloaded at version {rbac_matrix.version}."
+                )
+    except Exception as e:
+        logger.error(f"RBAC matrix refresh failed: {e}")
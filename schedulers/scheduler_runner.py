@@ -1,10 +1,14 @@
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
-from schedulers.booking_status_updater import cleanup_job
+from schedulers.booking_status_updater import (
+    cleanup_job,
+    reconcile_held_counts_job,
+)
 from schedulers.coupon_cleanup import cleanup_expired_coupons
 from schedulers.expired_event_updater import cleanup_expired_events
 
 BOOKING_SEATS_CLEANUP_INTERVAL_MINUTES = 15
+HELD_COUNTS_RECONCILE_INTERVAL_HOURS = 24
 EXPIRED_EVENTS_CHECK_INTERVAL_HOURS = 24
 COUPON_CLEANUP_INTERVAL_MINUTES = 15
 
@@ -22,6 +26,15 @@ def start_schedulers():
             replace_existing=True,
         )
 
+        # Held seat count reconciliation (safety net for drift)
+        scheduler.add_job(
+            reconcile_held_counts_job,
+            "interval",
+            hours=HELD_COUNTS_RECONCILE_INTERVAL_HOURS,
+            id="held_counts_reconcile",
+            replace_existing=True,
+        )
+
         # Expired event updater
         scheduler.add_job(
             cleanup_expired_events,
@@ -0,0 +1,15 @@
+from shared.core.logging_config import get_logger
+from shared.db.sessions.database import AsyncSessionLocal
+from shared.utils.session_activity import flush_session_activity
+
+logger = get_logger(__name__)
+
+
+async def session_activity_flush_job():
+    try:
+        async with AsyncSessionLocal() as db:
+            written = await flush_session_activity(db)
+            if written:
+                logger.debug(f"Flushed last_used_at for {written} sessions.")
+    except Exception as e:
+        logger.error(f"Session activity flush failed: {e}")
@@ -0,0 +1,15 @@
+from shared.core.logging_config import get_logger
+from shared.db.sessions.database import AsyncSessionLocal
+from shared.utils.token_blacklist import sync_revocations
+
+logger = get_logger(__name__)
+
+
+async def token_revocation_sync_job():
+    try:
+        async with AsyncSessionLocal() as db:
+            learned = await sync_revocations(db)
+            if learned:
+                logger.debug(f"Learned {learned} revoked tokens.")
+    except Exception as e:
+        logger.error(f"Token revocation sync failed: {e}")
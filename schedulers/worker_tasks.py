@@ -0,0 +1,94 @@
+"""
+Periodic jobs that every worker process runs for itself.
+
+These are started as plain asyncio tasks from the application lifespan, so
+they run whenever the app serves requests. They either work on in-process
+state (buffered activity, in-memory caches) and must run in each worker, or
+claim their rows with SKIP LOCKED, so running them in every worker at once
+is safe. The APScheduler jobs in ``scheduler_runner`` are not started by
+the app.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, List, Tuple
+
+from schedulers.attendee_notifier import attendee_notification_job
+from schedulers.email_outbox_dispatcher import (
+    email_outbox_job,
+    email_outbox_retention_job,
+)
+from schedulers.idempotency_cleanup import cleanup_idempotency_keys
+from schedulers.paypal_webhook_worker import webhook_inbox_job
+from schedulers.rbac_matrix_refresh import rbac_matrix_refresh_job
+from schedulers.session_activity_flush import session_activity_flush_job
+from schedulers.token_revocation_sync import token_revocation_sync_job
+from shared.core.config import settings
+from shared.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+WorkerJob = Callable[[], Awaitable[None]]
+
+# Safety net; the webhook endpoint also kicks the worker on every delivery
+WEBHOOK_INBOX_INTERVAL_SECONDS = 10
+IDEMPOTENCY_KEYS_CLEANUP_INTERVAL_SECONDS = 60 * 60
+EMAIL_OUTBOX_RETENTION_INTERVAL_SECONDS = 60 * 60
+
+_tasks: List[asyncio.Task] = []
+
+
+def worker_jobs() -> List[Tuple[WorkerJob, float]]:
+    """Jobs and their intervals in seconds."""
+    return [
+        # Batched device-session last_used_at writes
+        (session_activity_flush_job, settings.SESSION_ACTIVITY_FLUSH_SECONDS),
+        # Revoked tokens shared between worker processes
+        (token_revocation_sync_job, settings.TOKEN_REVOCATION_SYNC_SECONDS),
+        # Role/permission changes made by other workers
+        (rbac_matrix_refresh_job, settings.RBAC_MATRIX_REFRESH_SECONDS),
+        # Queued transactional emails (handlers also kick it after commit);
+        # rows are claimed with SKIP LOCKED and a lease, so workers never
+        # double-send
+        (email_outbox_job, settings.EMAIL_OUTBOX_DISPATCH_SECONDS),
+        # PayPal webhook inbox (retries and anything the kick missed); rows
+        # are claimed with SKIP LOCKED and a lease
+        (webhook_inbox_job, WEBHOOK_INBOX_INTERVAL_SECONDS),
+        # Bulk attendee notifications whose request task never started or
+        # whose worker stopped (the endpoint also starts each job)
+        (attendee_notification_job, settings.ATTENDEE_NOTIFY_POLL_SECONDS),
+        # Expired idempotency keys, in bounded SKIP LOCKED batches
+        (cleanup_idempotency_keys, IDEMPOTENCY_KEYS_CLEANUP_INTERVAL_SECONDS),
+        # Sent and dead-lettered emails past their retention
+        (email_outbox_retention_job, EMAIL_OUTBOX_RETENTION_INTERVAL_SECONDS),
+    ]
+
+
+async def run_periodically(job: WorkerJob, interval: float) -> None:
+    """Run ``job`` every ``interval`` seconds until cancelled."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await job()
+        except Exception as e:
+            # The jobs log their own failures; never let one end the loop
+            logger.error(f"Worker job {job.__name__} failed: {e}")
+
+
+def start_worker_tasks() -> None:
+    """Start the periodic jobs in this worker (idempotent)."""
+    if _tasks:
+        return
+    for job, interval in worker_jobs():
+        _tasks.append(
+            asyncio.create_task(
+                run_periodically(job, interval), name=job.__name__
+            )
+        )
+
+
+async def stop_worker_tasks() -> None:
+    """Cancel the periodic jobs and wait for them to finish."""
+    for task in _tasks:
+        task.cancel()
+    await asyncio.gather(*_tasks, return_exceptions=True)
+    _tasks.clear()
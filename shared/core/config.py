@@ -14,6 +14,7 @@ from pydantic_settings import (
 from shared.core import ENVIRONMENT
 from shared.core.secrets import fetch_vault_secrets_sync
 from shared.keys.key_manager import KeyManager
+from shared.keys.key_registry import KeyRegistry
 
 # Development override (uncomment if needed for local development)
 # os.environ.pop("ENVIRONMENT", None)
@@ -151,6 +152,14 @@ class Settings(BaseSettings):
     POSTGRES_USER: str = "postgres"
     POSTGRES_PASSWORD: str = "postgres"
     POSTGRES_DB: str = "events2go"
+    # Warn when one statement shape runs more often than this per request
+    DB_REPEATED_STATEMENT_THRESHOLD: int = 10
+
+    # === Bookings ===
+    # Seats of an unpaid order are held this long before they are released
+    BOOKING_HOLD_MINUTES: int = 15
+    # Responses stored for an Idempotency-Key are replayed this long
+    IDEMPOTENCY_KEY_TTL_HOURS: int = 24
 
     # === Email ===
     SMTP_TLS: bool = True
@@ -161,7 +170,20 @@ class Settings(BaseSettings):
     EMAIL_FROM: str = "your-email@gmail.com"
     EMAIL_FROM_NAME: str = "Events2Go API"
     EMAIL_TEMPLATES_DIR: str = "shared/templates"
+    # Compiled template bytecode, reused across restarts ("" to disable)
+    EMAIL_TEMPLATE_CACHE_DIR: str = ".cache/email_templates"
     SUPPORT_EMAIL: str = "support@events2go.com"
+    # Persistent SMTP connections per worker for the email outbox
+    SMTP_POOL_SIZE: int = 3
+    # The outbox dispatcher sends queued emails this often
+    EMAIL_OUTBOX_DISPATCH_SECONDS: int = 5
+    # Sent and dead-lettered outbox rows (recipients, tokens) are kept this
+    # long, then deleted
+    EMAIL_OUTBOX_RETENTION_DAYS: int = 7
+    # Bulk attendee notification emails per second per worker (0 = no cap)
+    ATTENDEE_NOTIFY_RATE_PER_SECOND: float = 10
+    # Queued or stalled attendee notification jobs are picked up this often
+    ATTENDEE_NOTIFY_POLL_SECONDS: int = 30
 
     # === DigitalOcean Spaces ===
     SPACES_REGION_NAME: str = "syd1"
@@ -171,6 +193,8 @@ class Settings(BaseSettings):
     SPACES_BUCKET_NAME: str = "events2go"
     SPACES_ACCESS_KEY_ID: str = "spaces-access-key-id"
     SPACES_SECRET_ACCESS_KEY: str = "spaces-secret-access-key"
+    # Connections the shared media client keeps open per worker
+    SPACES_MAX_POOL_CONNECTIONS: int = 20
 
     # === CORS ===
     ALLOWED_ORIGINS: str = "http://localhost,http://localhost:3000"
@@ -209,6 +233,39 @@ class Settings(BaseSettings):
     JWT_KEYS_DIR: str = "shared/keys"
     JWT_ISSUER: str = "e2g-api"
     JWT_AUDIENCE: str = "e2g-clients"
+    # Verified tokens remembered per process to skip repeat RSA checks
+    JWT_VERIFIED_CACHE_SIZE: int = 4096
+    # Device sessions found active are trusted this long without a query
+    SESSION_ACTIVE_CACHE_SECONDS: int = 30
+    # last_used_at of device sessions is written in batches this often
+    SESSION_ACTIVITY_FLUSH_SECONDS: int = 5
+    # Role/deleted status of authenticated users is cached this long
+    PRINCIPAL_STATUS_CACHE_SECONDS: int = 30
+    # Revoked-token store: "memory" (single worker) or "postgres"
+    TOKEN_REVOCATION_BACKEND: str = "memory"
+    # Workers pick up tokens revoked by other workers this often
+    TOKEN_REVOCATION_SYNC_SECONDS: int = 5
+
+    # === RBAC ===
+    # Workers check the role/permission version for changes this often
+    RBAC_MATRIX_REFRESH_SECONDS: int = 30
+
+    # === GeoIP ===
+    # Session locations: "table" (offline CSV), "ipapi" (hosted) or "none"
+    GEOIP_BACKEND: str = "ipapi"
+    GEOIP_DATABASE_PATH: str = "shared/geoip/ip_ranges.csv"
+    # Recent IP lookups remembered per process
+    GEOIP_CACHE_SIZE: int = 4096
+    # Write the session row first and fill in location after the response
+    GEOIP_ENRICH_IN_BACKGROUND: bool = True
+
+    # === Password hashing ===
+    # bcrypt cost; hashes made with another cost are redone at login
+    BCRYPT_ROUNDS: int = 12
+    # Threads (roughly CPU cores) bcrypt may use per worker process
+    PASSWORD_HASH_WORKERS: int = 4
+    # Hash/verify calls running or queued before logins get 429
+    PASSWORD_HASH_MAX_PENDING: int = 64
 
     # === AES256 Encryption ===
     FERNET_KEY: str = "fernet-key"
@@ -294,3 +351,5 @@ key_manager = KeyManager(
 PRIVATE_KEY = SecretBytes(key_manager.get_private_key())
 PUBLIC_KEY = SecretBytes(key_manager.get_public_key())
 JWT_KEY_ID = key_manager.get_key_id()
+# Parsed key objects by kid, so signing and verifying skip PEM parsing
+key_registry = KeyRegistry.from_key_manager(key_manager)
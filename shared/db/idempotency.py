@@ -0,0 +1,327 @@
+"""
+Idempotency keys for retried requests.
+
+A client that may retry a request (mobile apps retrying ``/book`` on a
+timeout, a browser reloading a payment redirect) sends an
+``Idempotency-Key`` header. The first request with the key claims a row in
+``IdempotencyKey`` and runs; its response is stored for
+``IDEMPOTENCY_KEY_TTL_HOURS``. Retries get the stored response back from
+one primary-key lookup, or from a bounded in-process LRU in front of the
+table, without running the endpoint again.
+
+- A retry while the first request still runs gets 409.
+- Reusing a key for a different request (other body or parameters) gets
+  422.
+- 5xx responses, 409 and 429 are not stored, so the client can retry them.
+- A claim left behind by a crashed worker can be taken over after
+  ``IN_FLIGHT_TIMEOUT``.
+
+Usage:
+    return await run_idempotent(
+        db, "new-bookings:book", idempotency_key,
+        request_fingerprint(booking_req.model_dump(mode="json")),
+        lambda: _create_booking_order(booking_req, db),
+    )
+"""
+
+import hashlib
+import json
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from fastapi import HTTPException, Response, status
+from fastapi.responses import JSONResponse
+from sqlalchemy import and_, delete, or_, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from shared.core.api_response import api_response
+from shared.core.config import settings
+from shared.core.logging_config import get_logger
+from shared.db.models.idempotency import IdempotencyKey
+from shared.utils.bounded_cache import BoundedTTLCache
+
+logger = get_logger(__name__)
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAY_HEADER = "Idempotent-Replayed"
+IN_FLIGHT_TIMEOUT = timedelta(seconds=60)
+CACHE_SIZE = 2048
+# Expired keys deleted per statement by ``purge_expired_keys``
+PURGE_BATCH_SIZE = 5000
+
+# Response headers worth replaying; the rest are recomputed
+_STORED_HEADERS = ("content-type", "location")
+_RETRYABLE_STATUS_CODES = {
+    status.HTTP_409_CONFLICT,
+    status.HTTP_429_TOO_MANY_REQUESTS,
+}
+
+
+@dataclass(frozen=True)
+class StoredResponse:
+    """A completed response, as kept in the table and the LRU."""
+
+    request_hash: str
+    status_code: int
+    headers: Dict[str, str]
+    body: str
+    expires_at: datetime
+
+    def to_response(self) -> Response:
+        return Response(
+            content=self.body,
+            status_code=self.status_code,
+            headers={**self.headers, REPLAY_HEADER: "true"},
+        )
+
+
+class _ResponseCache:
+    """Bounded LRU of stored responses; entries drop out at expiry."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: BoundedTTLCache[Tuple[str, str], StoredResponse] = (
+            BoundedTTLCache(maxsize, clock=time.time)
+        )
+
+    def get(self, key: Tuple[str, str]) -> Optional[StoredResponse]:
+        return self._entries.get(key)
+
+    def put(self, key: Tuple[str, str], entry: StoredResponse) -> None:
+        self._entries.put(key, entry, expires_at=entry.expires_at.timestamp())
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_cache = _ResponseCache(CACHE_SIZE)
+
+
+def request_fingerprint(payload: Any) -> str:
+    """Stable SHA-256 of a JSON-serialisable request description."""
+    encoded = json.dumps(
+        payload, sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def _replay(stored: StoredResponse, request_hash: str) -> Response:
+    if stored.request_hash != request_hash:
+        return api_response(
+            status.HTTP_422_UNPROCESSABLE_ENTITY,
+            message=(
+                f"{IDEMPOTENCY_HEADER} was already used for a different request"
+            ),
+        )
+    return stored.to_response()
+
+
+def _from_row(row: IdempotencyKey) -> StoredResponse:
+    return StoredResponse(
+        request_hash=row.request_hash,
+        status_code=row.status_code,
+        headers=row.response_headers or {},
+        body=row.response_body or "",
+        expires_at=row.expires_at,
+    )
+
+
+def _http_exception_response(e: HTTPException) -> Response:
+    # Same body the application's HTTPException handler renders
+    return JSONResponse(
+        status_code=e.status_code,
+        content=(
+            e.detail
+            if isinstance(e.detail, dict)
+            else {"message": str(e.detail)}
+        ),
+        headers=e.headers,
+    )
+
+
+async def _claim(
+    db: AsyncSession, scope: str, key: str, request_hash: str
+) -> bool:
+    """Insert the claim row; True if this request owns the key."""
+    now = datetime.now(timezone.utc)
+    stmt = insert(IdempotencyKey).values(
+        scope=scope,
+        idempotency_key=key,
+        request_hash=request_hash,
+        created_at=now,
+        expires_at=now + timedelta(hours=settings.IDEMPOTENCY_KEY_TTL_HOURS),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[IdempotencyKey.scope, IdempotencyKey.idempotency_key],
+        set_={
+            "request_hash": stmt.excluded.request_hash,
+            "status_code": None,
+            "response_headers": None,
+            "response_body": None,
+            "created_at": stmt.excluded.created_at,
+            "expires_at": stmt.excluded.expires_at,
+        },
+        # Only expired keys and abandoned claims can be taken over
+        where=or_(
+            IdempotencyKey.expires_at <= now,
+            and_(
+                IdempotencyKey.status_code.is_(None),
+                IdempotencyKey.created_at <= now - IN_FLIGHT_TIMEOUT,
+            ),
+        ),
+    ).returning(IdempotencyKey.idempotency_key)
+    claimed = (await db.execute(stmt)).scalar_one_or_none() is not None
+    await db.commit()
+    return claimed
+
+
+async def _release(db: AsyncSession, scope: str, key: str) -> None:
+    """Drop an unfinished claim so the client can retry."""
+    await db.execute(
+        delete(IdempotencyKey).where(
+            IdempotencyKey.scope == scope,
+            IdempotencyKey.idempotency_key == key,
+            IdempotencyKey.status_code.is_(None),
+        )
+    )
+    await db.commit()
+
+
+async def _store(
+    db: AsyncSession,
+    scope: str,
+    key: str,
+    request_hash: str,
+    response: Response,
+) -> StoredResponse:
+    headers = {
+        name: response.headers[name]
+        for name in _STORED_HEADERS
+        if name in response.headers
+    }
+    body = bytes(response.body).decode("utf-8")
+    expires_at = (
+        await db.execute(
+            update(IdempotencyKey)
+            .where(
+                IdempotencyKey.scope == scope,
+                IdempotencyKey.idempotency_key == key,
+            )
+            .values(
+                status_code=response.status_code,
+                response_headers=headers,
+                response_body=body,
+            )
+            .returning(IdempotencyKey.expires_at)
+            .execution_options(synchronize_session=False)
+        )
+    ).scalar_one()
+    await db.commit()
+    return StoredResponse(
+        request_hash=request_hash,
+        status_code=response.status_code,
+        headers=headers,
+        body=body,
+        expires_at=expires_at,
+    )
+
+
+async def run_idempotent(
+    db: AsyncSession,
+    scope: str,
+    key: Optional[str],
+    request_hash: str,
+    handler: Callable[[], Awaitable[Response]],
+) -> Response:
+    """
+    Run ``handler`` once per ``(scope, key)`` and replay its response.
+
+    Args:
+        db: Database session; the handler may share it
+        scope: Endpoint name the key belongs to
+        key: Client's Idempotency-Key header, or None to just run handler
+        request_hash: ``request_fingerprint`` of the request
+        handler: Produces the endpoint response
+
+    Returns:
+        The handler's response, or the stored one for a retry.
+    """
+    if not key:
+        return await handler()
+
+    cache_key = (scope, key)
+    cached = _cache.get(cache_key)
+    if cached is not None:
+        return _replay(cached, request_hash)
+
+    if not await _claim(db, scope, key, request_hash):
+        row = await db.get(IdempotencyKey, cache_key, populate_existing=True)
+        if row is None or row.status_code is None:
+            return api_response(
+                status.HTTP_409_CONFLICT,
+                message=(
+                    f"A request with this {IDEMPOTENCY_HEADER} is still "
+                    "in progress"
+                ),
+            )
+        stored = _from_row(row)
+        _cache.put(cache_key, stored)
+        return _replay(stored, request_hash)
+
+    try:
+        response = await handler()
+    except HTTPException as e:
+        response = _http_exception_response(e)
+    except Exception:
+        await db.rollback()
+        await _release(db, scope, key)
+        raise
+
+    if (
+        response.status_code >= 500
+        or response.status_code in _RETRYABLE_STATUS_CODES
+    ):
+        await _release(db, scope, key)
+        return response
+
+    try:
+        stored = await _store(db, scope, key, request_hash, response)
+    except Exception as e:
+        # The work is done; a lost record only costs a later replay
+        logger.warning("Could not store idempotent response for %s: %s", key, e)
+        await db.rollback()
+        return response
+    _cache.put(cache_key, stored)
+    return response
+
+
+async def purge_expired_keys(
+    db: AsyncSession, batch_size: int = PURGE_BATCH_SIZE
+) -> int:
+    """
+    Delete up to ``batch_size`` expired keys and commit.
+
+    Rows another worker is already deleting are skipped (SKIP LOCKED), so
+    every worker can run the purge at once.
+
+    Returns:
+        Number of rows deleted.
+    """
+    expired = (
+        select(IdempotencyKey.scope, IdempotencyKey.idempotency_key)
+        .where(IdempotencyKey.expires_at <= datetime.now(timezone.utc))
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    result = await db.execute(
+        delete(IdempotencyKey).where(
+            tuple_(IdempotencyKey.scope, IdempotencyKey.idempotency_key).in_(
+                expired
+            )
+        )
+    )
+    await db.commit()
+    return result.rowcount
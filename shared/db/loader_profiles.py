@@ -0,0 +1,98 @@
+"""
+Named eager-loading profiles for the event/booking graph.
+
+Collections that grow with the number of bookings (orders, line items,
+an organizer's events, a category's events) are declared ``lazy="raise"``
+on the models, so nothing reachable from a single row is pulled in unless
+the query asks for it. Services pick one of these profiles instead of
+hand-writing ``selectinload`` chains:
+
+- ``card``: event list cards (category, subcategory, organizer)
+- ``detail``: single event page (card + slots + seat categories)
+- ``booking``: booking orders with line items, event, slot and user
+- ``settlement``: event with every order and line item, for invoices
+
+Usage:
+    query = select(NewEvent).options(*loader_options(LoaderProfile.DETAIL))
+"""
+
+from enum import Enum
+from typing import Dict, Tuple
+
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from shared.db.models.new_events import (
+    NewEvent,
+    NewEventBooking,
+    NewEventBookingOrder,
+    NewEventSeatCategory,
+    NewEventSlot,
+)
+
+
+class LoaderProfile(str, Enum):
+    """Named loader profiles. ``BOOKING`` is rooted at
+    ``NewEventBookingOrder``, the others at ``NewEvent``."""
+
+    CARD = "card"
+    DETAIL = "detail"
+    BOOKING = "booking"
+    SETTLEMENT = "settlement"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+_EVENT_CARD: Tuple[LoaderOption, ...] = (
+    selectinload(NewEvent.new_category),
+    selectinload(NewEvent.new_subcategory),
+    selectinload(NewEvent.new_organizer),
+)
+
+_EVENT_DETAIL: Tuple[LoaderOption, ...] = _EVENT_CARD + (
+    selectinload(NewEvent.new_slots).selectinload(
+        NewEventSlot.new_seat_categories
+    ),
+)
+
+_BOOKING_ORDER: Tuple[LoaderOption, ...] = (
+    selectinload(NewEventBookingOrder.line_items).selectinload(
+        NewEventBooking.new_seat_category
+    ),
+    selectinload(NewEventBookingOrder.line_items).selectinload(
+        NewEventBooking.coupon
+    ),
+    selectinload(NewEventBookingOrder.new_booked_event).selectinload(
+        NewEvent.new_category
+    ),
+    selectinload(NewEventBookingOrder.new_booked_event).selectinload(
+        NewEvent.new_organizer
+    ),
+    selectinload(NewEventBookingOrder.new_slot),
+    selectinload(NewEventBookingOrder.new_user),
+)
+
+_EVENT_SETTLEMENT: Tuple[LoaderOption, ...] = _EVENT_DETAIL + (
+    selectinload(NewEvent.coupons),
+    selectinload(NewEvent.new_booking_orders)
+    .selectinload(NewEventBookingOrder.line_items)
+    .selectinload(NewEventBooking.coupon),
+    selectinload(NewEvent.new_booking_orders)
+    .selectinload(NewEventBookingOrder.line_items)
+    .selectinload(NewEventBooking.new_seat_category)
+    .selectinload(NewEventSeatCategory.new_slot),
+)
+
+LOADER_PROFILES: Dict[LoaderProfile, Tuple[LoaderOption, ...]] = {
+    LoaderProfile.CARD: _EVENT_CARD,
+    LoaderProfile.DETAIL: _EVENT_DETAIL,
+    LoaderProfile.BOOKING: _BOOKING_ORDER,
+    LoaderProfile.SETTLEMENT: _EVENT_SETTLEMENT,
+}
+
+
+def loader_options(profile: LoaderProfile) -> Tuple[LoaderOption, ...]:
+    """Return the loader options for ``profile`` to splat into
+    ``select(...).options(...)``."""
+    return LOADER_PROFILES[profile]
@@ -38,8 +38,11 @@ from .categories import Category, SubCategory
 from .config import Config
 from .contact_us import ContactUs, ContactUsStatus
 from .coupons import Coupon
+from .custom_sub_category import CustomSubCategory
+from .email_outbox import EmailOutbox, EmailOutboxStatus
 from .events import BookingStatus, Event, EventBooking, EventSlot, EventStatus
 from .featured_events import EventType, FeaturedEvents
+from .idempotency import IdempotencyKey
 from .new_events import (
     NewEvent,
     NewEventBooking,
@@ -47,12 +50,25 @@ from .new_events import (
     NewEventSlot,
 )
 
+# Bulk notifications to the attendees of an event
+from .notification_jobs import (
+    AttendeeNotificationJob,
+    AttendeeNotificationKind,
+    NotificationJobStatus,
+)
+
 # Models that depend on Organization Profile
 from .organizer import BusinessProfile, OrganizerQuery, QueryStatus
 
+# Payment provider webhooks
+from .payments import PayPalWebhookEvent, WebhookEventStatus
+
 # Models with potential circular dependencies - order matters
 # Import RBAC models before user models since user.py imports from rbac.py
-from .rbac import Permission, Role, RolePermission
+from .rbac import Permission, RbacVersion, Role, RolePermission
+
+# Token revocation shared between workers
+from .revoked_tokens import RevokedToken
 
 # Models that depend on other models
 from .users import User, UserDeviceSession, UserPasswordReset, UserVerification
@@ -66,6 +82,7 @@ __all__ = [
     # Categories
     "Category",
     "SubCategory",
+    "CustomSubCategory",
     # Events
     "Event",
     "EventBooking",
@@ -84,6 +101,7 @@ __all__ = [
     "Role",
     "Permission",
     "RolePermission",
+    "RbacVersion",
     # Admin Users
     "AdminUser",
     "PasswordReset",
@@ -104,6 +122,20 @@ __all__ = [
     "QueryStatus",
     # coupon
     "Coupon",
+    # Payments
+    "PayPalWebhookEvent",
+    "WebhookEventStatus",
+    # Idempotency
+    "IdempotencyKey",
+    # Token revocation
+    "RevokedToken",
+    # Email outbox
+    "EmailOutbox",
+    "EmailOutboxStatus",
+    # Attendee notifications
+    "AttendeeNotificationJob",
+    "AttendeeNotificationKind",
+    "NotificationJobStatus",
 ]
 
 # Model relationships overview:
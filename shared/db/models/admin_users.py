@@ -121,7 +121,7 @@ class AdminUser(EventsBase):
         "NewEvent",
         back_populates="new_organizer",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise",
     )
     business_profile: Mapped[Optional["BusinessProfile"]] = relationship(
         "BusinessProfile",
@@ -60,7 +60,7 @@ class Category(EventsBase):
         "NewEvent",
         back_populates="new_category",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise",
     )
     custom_subcategories: Mapped[List["CustomSubCategory"]] = relationship(
         "CustomSubCategory", back_populates="custom_category"
@@ -116,7 +116,7 @@ class SubCategory(EventsBase):
         "NewEvent",
         back_populates="new_subcategory",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise",
     )
     custom_subcategories: Mapped[List["CustomSubCategory"]] = relationship(
         "CustomSubCategory", back_populates="custom_subcategory"
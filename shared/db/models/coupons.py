@@ -82,7 +82,7 @@ class Coupon(EventsBase):
     bookings: Mapped[List["NewEventBooking"]] = relationship(
         "NewEventBooking",
         back_populates="coupon",   # <- must match the name in NewEventBooking
-        lazy="selectin"
+        lazy="raise"
     )
 
     __table_args__ = (
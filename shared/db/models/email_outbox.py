@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Optional
+
+from sqlalchemy import BigInteger, DateTime, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func, text
+from sqlalchemy.types import Enum as SQLAlchemyEnum
+
+from shared.db.models.base import EventsBase
+
+
+class EmailOutboxStatus(str, Enum):
+    """Delivery state of a queued email."""
+
+    PENDING = "PENDING"
+    SENT = "SENT"
+    # Failed permanently or too often; left for manual review
+    DEAD = "DEAD"
+
+    def __str__(self) -> str:
+        return self.value.lower()
+
+
+class EmailOutbox(EventsBase):
+    """Transactional email queued by a request, sent by a background worker.
+
+    Rows are inserted in the same transaction as the change they announce,
+    so an email goes out if and only if that change was committed.
+    """
+
+    __tablename__ = "e2gemail_outbox"
+
+    id: Mapped[int] = mapped_column(
+        BigInteger, primary_key=True, autoincrement=True
+    )
+    recipient: Mapped[str] = mapped_column(String(255), nullable=False)
+    subject: Mapped[str] = mapped_column(String(255), nullable=False)
+    # Path under EMAIL_TEMPLATES_DIR and the values it is rendered with
+    template_file: Mapped[str] = mapped_column(String(255), nullable=False)
+    context: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False)
+
+    status: Mapped[EmailOutboxStatus] = mapped_column(
+        SQLAlchemyEnum(
+            EmailOutboxStatus,
+            name="email_outbox_status_enum",
+            native_enum=False,
+        ),
+        default=EmailOutboxStatus.PENDING,
+        nullable=False,
+    )
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    sent_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+    __table_args__ = (
+        # The dispatcher only scans what is still pending, due first
+        Index(
+            "ix_email_outbox_pending",
+            "next_attempt_at",
+            postgresql_where=text("status = 'PENDING'"),
+        ),
+    )
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Dict, Optional
+
+from sqlalchemy import DateTime, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from shared.db.models.base import EventsBase
+
+
+class IdempotencyKey(EventsBase):
+    """Response stored for a client-supplied ``Idempotency-Key``.
+
+    A row without ``status_code`` is a claim: the first request with the
+    key is still running.
+    """
+
+    __tablename__ = "e2gidempotency_keys"
+
+    # Endpoint the key was used on, e.g. "new-bookings:book"
+    scope: Mapped[str] = mapped_column(String(64), primary_key=True)
+    idempotency_key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    # SHA-256 of the request, to reject a key reused for another request
+    request_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+
+    status_code: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    response_headers: Mapped[Optional[Dict[str, str]]] = mapped_column(
+        JSONB, nullable=True
+    )
+    response_body: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
@@ -17,9 +17,9 @@ from sqlalchemy import (
     UniqueConstraint,
 )
 from sqlalchemy.dialects.postgresql import ARRAY as PG_ARRAY
-from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.sql import func
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
+from sqlalchemy.sql import func, text
 from sqlalchemy.types import Enum as SQLAlchemyEnum
 
 from shared.db.models.base import EventsBase
@@ -107,6 +107,14 @@ class NewEvent(EventsBase):
     event_dates: Mapped[List[date]] = mapped_column(
         PG_ARRAY(Date), nullable=False, default=list
     )
+    # Denormalized bounds of event_dates so date filters can use an index.
+    # Kept in sync by _sync_event_date_bounds below.
+    first_event_date: Mapped[Optional[date]] = mapped_column(
+        Date, nullable=True
+    )
+    last_event_date: Mapped[Optional[date]] = mapped_column(
+        Date, nullable=True
+    )
     event_type: Mapped[str] = mapped_column(String(100), nullable=True)
 
     location: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
@@ -124,6 +132,11 @@ class NewEvent(EventsBase):
         JSONB, default={}, nullable=True
     )
     hash_tags: Mapped[Optional[List[str]]] = mapped_column(JSONB, nullable=True)
+    # Weighted title/hashtags/location/category document, maintained by a
+    # database trigger on write (see shared.db.schema_upgrades).
+    search_vector: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR, nullable=True
+    )
 
     event_status: Mapped[EventStatus] = mapped_column(
         SQLAlchemyEnum(
@@ -165,10 +178,11 @@ class NewEvent(EventsBase):
         cascade="all, delete-orphan",
         lazy="selectin",
     )
+    # Grows with bookings: load explicitly (see shared.db.loader_profiles)
     new_booking_orders: Mapped[List["NewEventBookingOrder"]] = relationship(
         "NewEventBookingOrder",
         back_populates="new_booked_event",
-        lazy="selectin",
+        lazy="raise",
     )
     coupons: Mapped[List["Coupon"]] = relationship(
         "Coupon",
@@ -187,9 +201,29 @@ class NewEvent(EventsBase):
 
     __table_args__ = (
         Index("ix_new_events_organizer_created", "organizer_id", "created_at"),
+        # Keyset pagination on (created_at, event_id)
+        Index("ix_new_events_created_id", "created_at", "event_id"),
         Index("ix_new_events_title_search", "event_title"),
+        Index(
+            "ix_new_events_status_last_date", "event_status", "last_event_date"
+        ),
+        Index("ix_new_events_first_date", "first_event_date"),
+        Index(
+            "ix_new_events_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+        ),
     )
 
+    @validates("event_dates")
+    def _sync_event_date_bounds(
+        self, _key: str, event_dates: Optional[List[date]]
+    ) -> Optional[List[date]]:
+        """Keep first_event_date/last_event_date in step with event_dates."""
+        self.first_event_date = min(event_dates) if event_dates else None
+        self.last_event_date = max(event_dates) if event_dates else None
+        return event_dates
+
 
 # -------------------- EVENT SLOT TABLE -------------------- #
 
@@ -235,7 +269,7 @@ class NewEventSlot(EventsBase):
         lazy="selectin",
     )
     new_booking_orders: Mapped[List["NewEventBookingOrder"]] = relationship(
-        "NewEventBookingOrder", back_populates="new_slot", lazy="selectin"
+        "NewEventBookingOrder", back_populates="new_slot", lazy="raise"
     )
 
     __table_args__ = (
@@ -288,7 +322,7 @@ class NewEventSeatCategory(EventsBase):
         "NewEventSlot", back_populates="new_seat_categories"
     )
     new_bookings: Mapped[List["NewEventBooking"]] = relationship(
-        "NewEventBooking", back_populates="new_seat_category", lazy="selectin"
+        "NewEventBooking", back_populates="new_seat_category", lazy="raise"
     )
 
     # __table_args__ = (
@@ -366,6 +400,10 @@ class NewEventBookingOrder(EventsBase):
         onupdate=func.now(),
         nullable=False,
     )
+    # When the seats held by a PROCESSING order are released
+    expires_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
 
     # Relationships
     new_user: Mapped["User"] = relationship(
@@ -392,6 +430,35 @@ class NewEventBookingOrder(EventsBase):
         lazy="selectin",
     )
 
+    # Keyset pagination on (created_at, order_id), per listing filter
+    __table_args__ = (
+        Index("ix_booking_orders_created_id", "created_at", "order_id"),
+        Index(
+            "ix_booking_orders_user_created_id",
+            "user_ref_id",
+            "created_at",
+            "order_id",
+        ),
+        Index(
+            "ix_booking_orders_event_created_id",
+            "event_ref_id",
+            "created_at",
+            "order_id",
+        ),
+        Index(
+            "ix_booking_orders_status_created_id",
+            "booking_status",
+            "created_at",
+            "order_id",
+        ),
+        # Hold expiry only ever scans orders that still hold seats
+        Index(
+            "ix_booking_orders_processing_expires",
+            "expires_at",
+            postgresql_where=text("booking_status = 'PROCESSING'"),
+        ),
+    )
+
 
 # -------------------- EVENT BOOKING TABLE -------------------- #
 
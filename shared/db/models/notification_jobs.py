@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Optional
+
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func, text
+from sqlalchemy.types import Enum as SQLAlchemyEnum
+
+from shared.db.models.base import EventsBase
+
+
+class AttendeeNotificationKind(str, Enum):
+    """What happened to the event the attendees are told about."""
+
+    RESCHEDULED = "RESCHEDULED"
+    CANCELLED = "CANCELLED"
+
+    def __str__(self) -> str:
+        return self.value.lower()
+
+
+class NotificationJobStatus(str, Enum):
+    """Progress of a bulk attendee notification."""
+
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+
+    def __str__(self) -> str:
+        return self.value.lower()
+
+
+class AttendeeNotificationJob(EventsBase):
+    """Email to every attendee of an event, sent in the background.
+
+    ``last_user_id`` is the keyset cursor over attendees: a job picked up
+    again after a restart carries on after the last chunk it recorded.
+    """
+
+    __tablename__ = "e2gattendee_notification_jobs"
+
+    job_id: Mapped[int] = mapped_column(
+        BigInteger, primary_key=True, autoincrement=True
+    )
+    event_id: Mapped[str] = mapped_column(
+        String(6),
+        ForeignKey("e2gevents_new.event_id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    requested_by: Mapped[str] = mapped_column(
+        String(6), ForeignKey("e2gadminusers.user_id"), nullable=False
+    )
+    kind: Mapped[AttendeeNotificationKind] = mapped_column(
+        SQLAlchemyEnum(
+            AttendeeNotificationKind,
+            name="attendee_notification_kind_enum",
+            native_enum=False,
+        ),
+        nullable=False,
+    )
+    subject: Mapped[str] = mapped_column(String(255), nullable=False)
+    # Template values shared by every recipient
+    context: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False)
+
+    status: Mapped[NotificationJobStatus] = mapped_column(
+        SQLAlchemyEnum(
+            NotificationJobStatus,
+            name="notification_job_status_enum",
+            native_enum=False,
+        ),
+        default=NotificationJobStatus.PENDING,
+        nullable=False,
+    )
+    total_recipients: Mapped[int] = mapped_column(
+        Integer, default=0, nullable=False
+    )
+    sent_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    failed_count: Mapped[int] = mapped_column(
+        Integer, default=0, nullable=False
+    )
+    last_user_id: Mapped[Optional[str]] = mapped_column(
+        String(6), nullable=True
+    )
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    started_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    # Touched after every chunk; a RUNNING job that stops is taken over
+    heartbeat_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    finished_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+    __table_args__ = (
+        # The worker only scans jobs that still have emails to send
+        Index(
+            "ix_attendee_notification_jobs_open",
+            "created_at",
+            postgresql_where=text("status IN ('PENDING', 'RUNNING')"),
+        ),
+    )
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Optional
+
+from sqlalchemy import DateTime, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func, text
+from sqlalchemy.types import Enum as SQLAlchemyEnum
+
+from shared.db.models.base import EventsBase
+
+
+class WebhookEventStatus(str, Enum):
+    """Processing state of a received PayPal webhook event."""
+
+    PENDING = "PENDING"
+    PROCESSED = "PROCESSED"
+    IGNORED = "IGNORED"
+    FAILED = "FAILED"
+
+    def __str__(self) -> str:
+        return self.value.lower()
+
+
+class PayPalWebhookEvent(EventsBase):
+    """Inbox of PayPal webhook deliveries, processed by a background worker.
+
+    PayPal redelivers an event with the same ``event_id`` until it gets a
+    2xx, so the primary key doubles as the idempotency key.
+    """
+
+    __tablename__ = "e2gpaypal_webhook_events"
+
+    event_id: Mapped[str] = mapped_column(String(64), primary_key=True)
+    event_type: Mapped[str] = mapped_column(String(64), nullable=False)
+
+    # Our booking order (sent to PayPal as the purchase unit custom_id)
+    order_ref_id: Mapped[Optional[str]] = mapped_column(
+        String(12), nullable=True, index=True
+    )
+    paypal_order_id: Mapped[Optional[str]] = mapped_column(
+        String(64), nullable=True
+    )
+    capture_id: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    payload: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False)
+
+    status: Mapped[WebhookEventStatus] = mapped_column(
+        SQLAlchemyEnum(
+            WebhookEventStatus,
+            name="paypal_webhook_status_enum",
+            native_enum=False,
+        ),
+        default=WebhookEventStatus.PENDING,
+        nullable=False,
+    )
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Claimed by a worker until then; a crashed worker's claim runs out
+    leased_until: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+    received_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    processed_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+    __table_args__ = (
+        # The worker only ever scans what is still pending, oldest first
+        Index(
+            "ix_paypal_webhook_events_pending",
+            "received_at",
+            postgresql_where=text("status = 'PENDING'"),
+        ),
+    )
@@ -1,8 +1,9 @@
 # Third-Party Library Imports
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     DateTime,
     ForeignKey,
@@ -78,3 +79,23 @@ class RolePermission(EventsBase):
     __table_args__ = (
         UniqueConstraint("role_id", "permission_id", name="uq_role_permission"),
     )
+
+
+class RbacVersion(EventsBase):
+    """Single-row counter bumped whenever roles or permissions change.
+
+    Workers keep an in-memory permission matrix and reload it when this
+    version moves.
+    """
+
+    __tablename__ = "e2grbacversion"
+
+    id: Mapped[int] = mapped_column(primary_key=True, default=1)
+    version: Mapped[int] = mapped_column(BigInteger, default=0)
+    # SHA-256 of the default roles and permissions last seeded
+    seed_checksum: Mapped[Optional[str]] = mapped_column(
+        String(length=64), nullable=True
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=True, server_default=func.now()
+    )
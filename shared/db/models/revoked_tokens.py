@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from shared.db.models.base import EventsBase
+
+
+class RevokedToken(EventsBase):
+    """JWT revoked before its expiry, shared by every worker process.
+
+    Rows are only inserted; workers read the ones past the highest ``id``
+    they have seen, and expired rows are purged.
+    """
+
+    __tablename__ = "e2grevoked_tokens"
+
+    id: Mapped[int] = mapped_column(
+        BigInteger, primary_key=True, autoincrement=True
+    )
+    jti: Mapped[str] = mapped_column(String(64), unique=True, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
+    revoked_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
@@ -120,7 +120,7 @@ class User(EventsBase):
     )
     new_event_booking_orders: Mapped[List["NewEventBookingOrder"]] = (
         relationship(
-            "NewEventBookingOrder", back_populates="new_user", lazy="selectin"
+            "NewEventBookingOrder", back_populates="new_user", lazy="raise"
         )
     )
 
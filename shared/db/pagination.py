@@ -0,0 +1,157 @@
+"""
+Keyset (cursor) pagination and optional row counts for list endpoints.
+
+Listings are ordered on ``(created_at, id)``. A page is fetched with one
+extra row to learn whether another page follows, and the last row of the
+page becomes an opaque cursor. Following the cursor uses a row comparison
+that a ``(..., created_at, id)`` index can seek to, so page 500 costs the
+same as page 1. The old ``page``/``limit`` offset mode is kept for existing
+clients.
+
+Counting every matching row is what made deep listings slow, so the total
+is optional: ``exact`` runs ``COUNT(*)``, ``estimate`` reads the planner's
+row estimate from ``EXPLAIN`` and ``none`` skips it.
+
+Usage:
+    rows = select(NewEventBookingOrder).where(...)
+    orders, next_cursor = await fetch_page(
+        db, rows, NewEventBookingOrder.created_at,
+        NewEventBookingOrder.order_id, limit=20, cursor=cursor,
+    )
+    total = await count_rows(db, select(NewEventBookingOrder.order_id)
+                             .where(...), CountMode.ESTIMATE)
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from enum import Enum
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import Select, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+
+class CountMode(str, Enum):
+    """How the total row count of a listing is obtained."""
+
+    EXACT = "exact"
+    ESTIMATE = "estimate"
+    NONE = "none"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+class InvalidCursorError(ValueError):
+    """The cursor was not produced by ``encode_cursor`` or cannot be used
+    with the requested ordering."""
+
+
+def encode_cursor(created_at: datetime, row_id: str) -> str:
+    """Opaque cursor for the row after which the next page starts."""
+    payload = json.dumps(
+        {"c": created_at.isoformat(), "i": row_id}, separators=(",", ":")
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Inverse of ``encode_cursor``. Raises InvalidCursorError."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(payload["c"]), str(payload["i"])
+    except (
+        binascii.Error,
+        UnicodeDecodeError,
+        ValueError,
+        KeyError,
+        TypeError,
+    ) as e:
+        raise InvalidCursorError("Invalid pagination cursor") from e
+
+
+async def fetch_page(
+    db: AsyncSession,
+    stmt: Select,
+    created_column: InstrumentedAttribute,
+    id_column: InstrumentedAttribute,
+    limit: int,
+    page: int = 1,
+    cursor: Optional[str] = None,
+    descending: bool = True,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Fetch one page of ``stmt`` ordered by ``(created_column, id_column)``.
+
+    Args:
+        db: Database session
+        stmt: Filtered select of one ORM entity, without ordering or limit
+        created_column: Creation timestamp column of that entity
+        id_column: Unique id column used as tie-breaker
+        limit: Page size
+        page: 1-based page for offset mode; ignored when ``cursor`` is set
+        cursor: Cursor returned with the previous page
+        descending: Newest first (default) or oldest first
+
+    Returns:
+        Tuple of (rows, next_cursor); next_cursor is None on the last page.
+
+    Raises:
+        InvalidCursorError: If ``cursor`` cannot be decoded
+    """
+    if descending:
+        stmt = stmt.order_by(created_column.desc(), id_column.desc())
+    else:
+        stmt = stmt.order_by(created_column.asc(), id_column.asc())
+
+    if cursor:
+        position = tuple_(created_column, id_column)
+        after = tuple_(*decode_cursor(cursor))
+        stmt = stmt.where(position < after if descending else position > after)
+    else:
+        stmt = stmt.offset((page - 1) * limit)
+
+    result = await db.execute(stmt.limit(limit + 1))
+    rows = list(result.scalars().all())
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(
+        getattr(last, created_column.key), getattr(last, id_column.key)
+    )
+
+
+async def count_rows(
+    db: AsyncSession, stmt: Select, mode: CountMode = CountMode.EXACT
+) -> Optional[int]:
+    """
+    Count the rows of ``stmt`` (a filtered select, e.g. of the id column).
+
+    Returns:
+        The exact count, the planner's estimate, or None for ``NONE``.
+    """
+    if mode == CountMode.NONE:
+        return None
+
+    if mode == CountMode.EXACT:
+        count_stmt = select(func.count()).select_from(
+            stmt.order_by(None).subquery()
+        )
+        return (await db.execute(count_stmt)).scalar() or 0
+
+    # Planner estimate: no rows are read, so cost does not grow with depth
+    conn = await db.connection()
+    compiled = stmt.order_by(None).compile(
+        dialect=conn.dialect, compile_kwargs={"literal_binds": True}
+    )
+    result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}")
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
@@ -0,0 +1,177 @@
+"""
+Per-request SQL statement accounting.
+
+Engine hooks charge every statement (count, rows, wall time) to the request
+found through ``request_context`` and to any open ``track_queries()`` block.
+``ExecutionTimeMiddleware`` exposes the request totals as ``X-DB-Queries`` and
+``X-DB-Time``. When the same statement shape runs more than the configured
+threshold within one request, a warning is logged once for that shape; that
+is almost always an N+1 loop that should be a join or an eager load.
+
+Usage:
+    install_query_instrumentation(engine, repeated_statement_threshold=10)
+
+    with track_queries() as stats:
+        await db.execute(select(NewEvent))
+    print(stats.statements, stats.rows, stats.db_time)
+"""
+
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Iterator, List, Optional, Set
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from shared.core.logging_config import get_logger
+from shared.core.request_context import request_context
+
+logger = get_logger(__name__)
+
+REQUEST_STATE_KEY = "db_query_stats"
+
+_PLACEHOLDER = re.compile(r"\$\d+|%\(\w+\)s|\?")
+_PLACEHOLDER_LIST = re.compile(r"\?(?:\s*,\s*\?)+")
+_WHITESPACE = re.compile(r"\s+")
+
+# Explicit collector opened by track_queries(), independent of any request
+_tracked_stats: ContextVar[Optional["QueryStats"]] = ContextVar(
+    "tracked_query_stats", default=None
+)
+
+
+@dataclass
+class QueryStats:
+    """Running totals for the statements issued in one scope."""
+
+    statements: int = 0
+    rows: int = 0
+    db_time: float = 0.0
+    shapes: Counter = field(default_factory=Counter)
+    flagged: Set[str] = field(default_factory=set)
+
+    def record(self, shape: str, rowcount: int, duration: float) -> int:
+        """Add one statement and return how often its shape has run."""
+        self.statements += 1
+        self.rows += max(rowcount, 0)
+        self.db_time += duration
+        self.shapes[shape] += 1
+        return self.shapes[shape]
+
+
+def statement_shape(statement: str) -> str:
+    """Normalize SQL so that the same query with different bind values or
+    a different ``IN (...)`` length maps to the same shape."""
+    shape = _PLACEHOLDER.sub("?", statement)
+    shape = _PLACEHOLDER_LIST.sub("?", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+def start_request_query_stats(request: Request) -> QueryStats:
+    """Attach a fresh collector to ``request``; statements executed while
+    ``request_context`` points at this request are charged to it."""
+    stats = QueryStats()
+    setattr(request.state, REQUEST_STATE_KEY, stats)
+    return stats
+
+
+def _current_request_stats() -> Optional[QueryStats]:
+    request = request_context.get(None)
+    if request is None:
+        return None
+    return getattr(request.state, REQUEST_STATE_KEY, None)
+
+
+def _active_collectors() -> List[QueryStats]:
+    collectors = []
+    tracked = _tracked_stats.get()
+    if tracked is not None:
+        collectors.append(tracked)
+    request_stats = _current_request_stats()
+    if request_stats is not None and request_stats is not tracked:
+        collectors.append(request_stats)
+    return collectors
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Collect statement totals for the enclosed block."""
+    stats = QueryStats()
+    token = _tracked_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _tracked_stats.reset(token)
+
+
+def install_query_instrumentation(
+    engine: AsyncEngine, repeated_statement_threshold: int
+) -> None:
+    """Register the accounting hooks on ``engine``.
+
+    Args:
+        engine: Engine whose statements should be counted
+        repeated_statement_threshold: Warn when one statement shape runs
+            more than this many times in a single request
+    """
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        started = conn.info.get("query_start_time")
+        if not started:
+            return
+        duration = time.perf_counter() - started.pop()
+
+        collectors = _active_collectors()
+        if not collectors:
+            return
+
+        shape = statement_shape(statement)
+        rowcount = getattr(cursor, "rowcount", -1) or 0
+        for stats in collectors:
+            count = stats.record(shape, rowcount, duration)
+            if (
+                count > repeated_statement_threshold
+                and shape not in stats.flagged
+            ):
+                stats.flagged.add(shape)
+                _warn_repeated_statement(count, shape)
+
+
+def _warn_repeated_statement(count: int, shape: str) -> None:
+    request = request_context.get(None)
+    where = (
+        f"{request.method} {request.url.path}"
+        if request is not None
+        else "tracked block"
+    )
+    logger.warning(
+        "[SQL] Possible N+1 in %s: statement ran %d times: %s",
+        where,
+        count,
+        shape[:300],
+    )
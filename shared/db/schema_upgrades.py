@@ -0,0 +1,367 @@
+"""
+Idempotent schema upgrades and data backfills for existing databases.
+
+``EventsBase.metadata.create_all`` creates missing tables but never adds
+columns or indexes to tables that already exist. ``COLUMN_UPGRADES`` and
+``INDEX_UPGRADES`` list what was introduced after a table was first
+created; ``init_db`` adds whatever is missing on start-up, together with
+the extensions, trigger functions and triggers the ORM cannot declare.
+
+Columns that queries filter on are filled in the same step that adds them:
+``apply_schema_upgrades`` backfills the event date bounds and search
+vectors whenever some event is still missing them. The backfills can also be run explicitly:
+
+    python -m shared.db.schema_upgrades event-date-bounds
+    python -m shared.db.schema_upgrades event-search-vectors
+"""
+
+import argparse
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Set, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from shared.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# (table, column, type) added after the table was first created
+COLUMN_UPGRADES: List[Tuple[str, str, str]] = [
+    ("e2gevents_new", "first_event_date", "DATE"),
+    ("e2gevents_new", "last_event_date", "DATE"),
+    ("e2gevents_new", "search_vector", "TSVECTOR"),
+    ("e2gevent_booking_orders", "expires_at", "TIMESTAMP WITH TIME ZONE"),
+    (
+        "e2gpaypal_webhook_events",
+        "leased_until",
+        "TIMESTAMP WITH TIME ZONE",
+    ),
+]
+
+# Optional extensions; features that need a missing one are skipped
+EXTENSION_UPGRADES: List[str] = ["pg_trgm"]
+
+# index name -> definition, for indexes added to existing tables
+INDEX_UPGRADES: Dict[str, str] = {
+    "ix_new_events_status_last_date": (
+        "ON e2gevents_new (event_status, last_event_date)"
+    ),
+    "ix_new_events_first_date": "ON e2gevents_new (first_event_date)",
+    "ix_new_events_search_vector": (
+        "ON e2gevents_new USING GIN (search_vector)"
+    ),
+    "ix_new_events_created_id": "ON e2gevents_new (created_at, event_id)",
+    "ix_booking_orders_created_id": (
+        "ON e2gevent_booking_orders (created_at, order_id)"
+    ),
+    "ix_booking_orders_user_created_id": (
+        "ON e2gevent_booking_orders (user_ref_id, created_at, order_id)"
+    ),
+    "ix_booking_orders_event_created_id": (
+        "ON e2gevent_booking_orders (event_ref_id, created_at, order_id)"
+    ),
+    "ix_booking_orders_status_created_id": (
+        "ON e2gevent_booking_orders (booking_status, created_at, order_id)"
+    ),
+    "ix_booking_orders_processing_expires": (
+        "ON e2gevent_booking_orders (expires_at) "
+        "WHERE booking_status = 'PROCESSING'"
+    ),
+}
+
+# index name -> (required extension, definition)
+EXTENSION_INDEX_UPGRADES: Dict[str, Tuple[str, str]] = {
+    "ix_new_events_title_trgm": (
+        "pg_trgm",
+        "ON e2gevents_new USING GIN (event_title gin_trgm_ops)",
+    ),
+}
+
+# function name -> definition. Functions are only created when missing, so
+# a changed body needs a new name.
+FUNCTION_UPGRADES: Dict[str, str] = {
+    # Search document: title (A) > hashtags (B) > location (C) >
+    # category and subcategory names (D)
+    "e2gevents_new_search_vector_v1": """
+        CREATE OR REPLACE FUNCTION e2gevents_new_search_vector_v1()
+        RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector :=
+                setweight(to_tsvector('simple',
+                    coalesce(NEW.event_title, '')), 'A')
+                || setweight(to_tsvector('simple', coalesce(
+                    CASE WHEN jsonb_typeof(NEW.hash_tags) = 'array' THEN
+                        (SELECT string_agg(tag, ' ')
+                         FROM jsonb_array_elements_text(NEW.hash_tags)
+                             AS tag)
+                    END, '')), 'B')
+                || setweight(to_tsvector('simple',
+                    coalesce(NEW.location, '')), 'C')
+                || setweight(to_tsvector('simple',
+                    coalesce((SELECT category_name FROM e2gcategories
+                              WHERE category_id = NEW.category_id), '')
+                    || ' ' ||
+                    coalesce((SELECT subcategory_name FROM e2gsubcategories
+                              WHERE subcategory_id = NEW.subcategory_id), '')
+                ), 'D');
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+    """,
+    # Renaming a category re-runs the event trigger for its events
+    "e2gcategories_refresh_event_search_v1": """
+        CREATE OR REPLACE FUNCTION e2gcategories_refresh_event_search_v1()
+        RETURNS trigger AS $$
+        BEGIN
+            UPDATE e2gevents_new SET category_id = category_id
+            WHERE category_id = NEW.category_id;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """,
+    "e2gsubcategories_refresh_event_search_v1": """
+        CREATE OR REPLACE FUNCTION e2gsubcategories_refresh_event_search_v1()
+        RETURNS trigger AS $$
+        BEGIN
+            UPDATE e2gevents_new SET subcategory_id = subcategory_id
+            WHERE subcategory_id = NEW.subcategory_id;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """,
+}
+
+# trigger name -> definition
+TRIGGER_UPGRADES: Dict[str, str] = {
+    "trg_e2gevents_new_search_vector": """
+        CREATE TRIGGER trg_e2gevents_new_search_vector
+        BEFORE INSERT OR UPDATE OF
+            event_title, hash_tags, location, category_id, subcategory_id
+        ON e2gevents_new
+        FOR EACH ROW EXECUTE FUNCTION e2gevents_new_search_vector_v1()
+    """,
+    "trg_e2gcategories_refresh_event_search": """
+        CREATE TRIGGER trg_e2gcategories_refresh_event_search
+        AFTER UPDATE OF category_name ON e2gcategories
+        FOR EACH ROW
+        WHEN (OLD.category_name IS DISTINCT FROM NEW.category_name)
+        EXECUTE FUNCTION e2gcategories_refresh_event_search_v1()
+    """,
+    "trg_e2gsubcategories_refresh_event_search": """
+        CREATE TRIGGER trg_e2gsubcategories_refresh_event_search
+        AFTER UPDATE OF subcategory_name ON e2gsubcategories
+        FOR EACH ROW
+        WHEN (OLD.subcategory_name IS DISTINCT FROM NEW.subcategory_name)
+        EXECUTE FUNCTION e2gsubcategories_refresh_event_search_v1()
+    """,
+}
+
+
+async def _ensure_extensions(conn: AsyncConnection) -> Set[str]:
+    """Create the optional extensions that are missing and return the ones
+    available. A role without the privilege to create one gets a warning,
+    not a failed start-up."""
+    installed = {
+        row.extname
+        for row in await conn.execute(text("SELECT extname FROM pg_extension"))
+    }
+    for extension in EXTENSION_UPGRADES:
+        if extension in installed:
+            continue
+        try:
+            async with conn.begin_nested():
+                await conn.execute(
+                    text(f"CREATE EXTENSION IF NOT EXISTS {extension}")
+                )
+            installed.add(extension)
+            logger.info("Created extension %s", extension)
+        except DBAPIError as e:
+            logger.warning("Extension %s unavailable: %s", extension, e)
+    return installed
+
+
+async def apply_schema_upgrades(conn: AsyncConnection) -> None:
+    """Add the columns, indexes, functions and triggers that are missing.
+    Existing ones are detected from the catalog first, so a start-up against
+    an up-to-date schema takes no table locks."""
+    extensions = await _ensure_extensions(conn)
+    existing_columns = {
+        (row.table_name, row.column_name)
+        for row in await conn.execute(
+            text(
+                "SELECT table_name, column_name FROM information_schema.columns "
+                "WHERE table_schema = current_schema()"
+            )
+        )
+    }
+    existing_indexes = {
+        row.indexname
+        for row in await conn.execute(
+            text(
+                "SELECT indexname FROM pg_indexes "
+                "WHERE schemaname = current_schema()"
+            )
+        )
+    }
+
+    for table, column, column_type in COLUMN_UPGRADES:
+        if (table, column) not in existing_columns:
+            logger.info("Adding column %s.%s", table, column)
+            await conn.execute(
+                text(
+                    f"ALTER TABLE {table} "
+                    f"ADD COLUMN IF NOT EXISTS {column} {column_type}"
+                )
+            )
+
+    for index_name, definition in INDEX_UPGRADES.items():
+        if index_name not in existing_indexes:
+            logger.info("Creating index %s", index_name)
+            await conn.execute(
+                text(f"CREATE INDEX IF NOT EXISTS {index_name} {definition}")
+            )
+
+    for index_name, (extension, definition) in EXTENSION_INDEX_UPGRADES.items():
+        if index_name not in existing_indexes and extension in extensions:
+            logger.info("Creating index %s", index_name)
+            await conn.execute(
+                text(f"CREATE INDEX IF NOT EXISTS {index_name} {definition}")
+            )
+
+    existing_functions = {
+        row.proname
+        for row in await conn.execute(
+            text(
+                "SELECT proname FROM pg_proc "
+                "WHERE pronamespace = current_schema()::regnamespace"
+            )
+        )
+    }
+    for function_name, definition in FUNCTION_UPGRADES.items():
+        if function_name not in existing_functions:
+            logger.info("Creating function %s", function_name)
+            await conn.execute(text(definition))
+
+    existing_triggers = {
+        row.tgname
+        for row in await conn.execute(
+            text("SELECT tgname FROM pg_trigger WHERE NOT tgisinternal")
+        )
+    }
+    for trigger_name, definition in TRIGGER_UPGRADES.items():
+        if trigger_name not in existing_triggers:
+            logger.info("Creating trigger %s", trigger_name)
+            await conn.execute(text(definition))
+
+    # Listings and search filter on the date bounds, so events written
+    # before the columns existed must get them before the first request
+    if await _event_date_bounds_pending(conn):
+        updated = await backfill_event_date_bounds(conn)
+        logger.info("Backfilled date bounds for %d events", updated)
+
+    # Search matches on search_vector only, so events written before the
+    # trigger existed would never be found
+    if await _event_search_vectors_pending(conn):
+        updated = await backfill_event_search_vectors(conn)
+        logger.info("Backfilled search vectors for %d events", updated)
+
+
+async def _event_date_bounds_pending(conn: AsyncConnection) -> bool:
+    """Whether some dated event has no first_event_date yet. Stops at the
+    first such row, so an up-to-date table costs one scan and no locks."""
+    result = await conn.execute(
+        text(
+            "SELECT 1 FROM e2gevents_new "
+            "WHERE first_event_date IS NULL "
+            "AND cardinality(event_dates) > 0 LIMIT 1"
+        )
+    )
+    return result.first() is not None
+
+
+async def _event_search_vectors_pending(conn: AsyncConnection) -> bool:
+    """Whether some event has no search_vector yet. Stops at the first such
+    row, like ``_event_date_bounds_pending``."""
+    result = await conn.execute(
+        text("SELECT 1 FROM e2gevents_new WHERE search_vector IS NULL LIMIT 1")
+    )
+    return result.first() is not None
+
+
+async def backfill_event_date_bounds(conn: AsyncConnection) -> int:
+    """
+    Recompute first_event_date/last_event_date from event_dates for rows
+    that are missing or out of date.
+
+    Returns: number of events updated.
+    """
+    result = await conn.execute(
+        text(
+            """
+            UPDATE e2gevents_new AS e
+            SET first_event_date = b.first_date,
+                last_event_date = b.last_date
+            FROM (
+                SELECT event_id,
+                       (SELECT min(d) FROM unnest(event_dates) AS d)
+                           AS first_date,
+                       (SELECT max(d) FROM unnest(event_dates) AS d)
+                           AS last_date
+                FROM e2gevents_new
+            ) AS b
+            WHERE e.event_id = b.event_id
+              AND (
+                  e.first_event_date IS DISTINCT FROM b.first_date
+                  OR e.last_event_date IS DISTINCT FROM b.last_date
+              )
+            """
+        )
+    )
+    return result.rowcount
+
+
+async def backfill_event_search_vectors(conn: AsyncConnection) -> int:
+    """
+    Fill search_vector for events written before the trigger existed. The
+    no-op assignment fires the search vector trigger for each row.
+
+    Returns: number of events updated.
+    """
+    result = await conn.execute(
+        text(
+            "UPDATE e2gevents_new SET event_title = event_title "
+            "WHERE search_vector IS NULL"
+        )
+    )
+    return result.rowcount
+
+
+BACKFILLS: Dict[str, Callable[[AsyncConnection], Awaitable[int]]] = {
+    "event-date-bounds": backfill_event_date_bounds,
+    "event-search-vectors": backfill_event_search_vectors,
+}
+
+
+async def run_backfill(name: str) -> int:
+    """Apply pending schema upgrades, then run the named backfill in one
+    transaction."""
+    # Imported here so importing this module does not create the engine
+    from shared.db.sessions.database import engine
+
+    try:
+        async with engine.begin() as conn:
+            await apply_schema_upgrades(conn)
+            updated = await BACKFILLS[name](conn)
+        logger.info("Backfill '%s' updated %d rows", name, updated)
+        return updated
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("backfill", choices=sorted(BACKFILLS))
+    args = parser.parse_args()
+    asyncio.run(run_backfill(args.backfill))
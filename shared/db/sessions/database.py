@@ -20,6 +20,8 @@ from shared.core.config import settings
 
 # from db.events import init_db_event_listeners
 from shared.db.models import EventsBase
+from shared.db.query_stats import install_query_instrumentation
+from shared.db.schema_upgrades import apply_schema_upgrades
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -42,6 +44,12 @@ engine: AsyncEngine = create_async_engine(
     future=True,  # Enable asyncio support
 )
 
+# Per-request statement counts, DB time and N+1 warnings
+install_query_instrumentation(
+    engine,
+    repeated_statement_threshold=settings.DB_REPEATED_STATEMENT_THRESHOLD,
+)
+
 # Create async session factory
 AsyncSessionLocal: async_sessionmaker[AsyncSession] = async_sessionmaker(
     bind=engine,
@@ -109,6 +117,8 @@ async def init_db() -> None:
         async with engine.begin() as conn:
             logger.info("Creating database tables if they do not exist")
             await conn.run_sync(EventsBase.metadata.create_all, checkfirst=True)
+            # Columns/indexes added to tables that already existed
+            await apply_schema_upgrades(conn)
     except OperationalError as e:
         logger.error("Failed to connect to database: %s", str(e))
         raise
@@ -1,4 +1,4 @@
-from typing import Annotated, Optional
+from typing import Annotated, Callable, Optional
 
 from fastapi import (
     Depends,
@@ -6,6 +6,7 @@ from fastapi import (
     Request,
 )
 from fastapi.security import HTTPBearer, OAuth2PasswordBearer
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.responses import JSONResponse
 
@@ -19,6 +20,12 @@ from shared.core.config import PUBLIC_KEY
 from shared.core.logging_config import get_logger
 from shared.db.models import AdminUser
 from shared.db.sessions.database import get_db
+from shared.dependencies.principal import (
+    Principal,
+    PrincipalStatus,
+    admin_principal_cache,
+)
+from shared.utils.rbac_matrix import rbac_matrix
 
 logger = get_logger(__name__)
 
@@ -51,15 +58,78 @@ async def get_current_user(
     return user
 
 
-async def get_current_active_user(
+async def get_current_user_full(
     current_user: Annotated[AdminUser, Depends(get_current_user)],
 ) -> AdminUser:
-    """Get current active user (ensure user is not deleted/disabled)"""
+    """Get the full current user row, for endpoints that read or change it"""
     if current_user.is_deleted:
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
 
 
+# Previous name of get_current_user_full
+get_current_active_user = get_current_user_full
+
+
+async def get_current_principal(
+    request: Request,
+    token: Annotated[str, Depends(admin_oauth2_scheme)],
+    db: AsyncSession = Depends(get_db),
+) -> Principal:
+    """Get the authenticated caller from JWT claims and a cached status"""
+    auth_token = token or extract_token_from_request(request)
+    if not auth_token:
+        raise HTTPException(
+            status_code=401, detail="Missing authentication token"
+        )
+    payload = await verify_token_and_session(auth_token, db)
+    user_id = payload["uid"]
+
+    status = admin_principal_cache.get(user_id)
+    if status is None:
+        status = await load_principal_status(db, user_id)
+        if status is None:
+            return user_not_found_response()
+        admin_principal_cache.put(user_id, status)
+
+    if status.is_deleted:
+        raise HTTPException(status_code=401, detail="Inactive user")
+
+    return Principal(
+        user_id=user_id,
+        session_id=payload.get("sid"),
+        is_deleted=status.is_deleted,
+        role_id=status.role_id,
+        business_id=status.business_id,
+    )
+
+
+def require_permission(*permission_names: str) -> Callable:
+    """
+    Dependency that admits callers whose role grants every named permission.
+
+    Answered from the in-memory RBAC matrix; usage:
+    ``Depends(require_permission("EDIT"))``.
+    """
+
+    async def check_permission(
+        principal: Annotated[Principal, Depends(get_current_principal)],
+        db: AsyncSession = Depends(get_db),
+    ) -> Principal:
+        if not rbac_matrix.loaded:
+            await rbac_matrix.load(db)
+        if not all(
+            rbac_matrix.has_permission(principal.role_id, name)
+            for name in permission_names
+        ):
+            raise HTTPException(
+                status_code=403, detail="Insufficient permissions"
+            )
+        return principal
+
+    return check_permission
+
+
 def extract_token_from_request(request: Request) -> Optional[str]:
     """Extract token from Authorization header or cookie"""
     header = request.headers.get("authorization")
@@ -73,10 +143,8 @@ def extract_token_from_request(request: Request) -> Optional[str]:
     )
 
 
-async def get_current_user_from_token(
-    token: str, db: AsyncSession
-) -> AdminUser | JSONResponse:
-    """Get current authenticated user from JWT token with session validation"""
+async def verify_token_and_session(token: str, db: AsyncSession) -> dict:
+    """Verify the JWT and its device session; returns the token payload"""
     public_key = PUBLIC_KEY.get_secret_value()
     if not public_key:
         logger.error("Missing public key for token verification")
@@ -99,6 +167,30 @@ async def get_current_user_from_token(
         logger.warning(f"Session validation failed: {session_error}")
         raise HTTPException(status_code=401, detail="Session no longer valid")
 
+    return payload
+
+
+async def load_principal_status(
+    db: AsyncSession, user_id: str
+) -> Optional[PrincipalStatus]:
+    """Role, business and deleted flag of an admin user, by primary key"""
+    row = (
+        await db.execute(
+            select(
+                AdminUser.is_deleted, AdminUser.role_id, AdminUser.business_id
+            ).where(AdminUser.user_id == user_id)
+        )
+    ).one_or_none()
+    return PrincipalStatus(*row) if row else None
+
+
+async def get_current_user_from_token(
+    token: str, db: AsyncSession
+) -> AdminUser | JSONResponse:
+    """Get current authenticated user from JWT token with session validation"""
+    payload = await verify_token_and_session(token, db)
+    user_id = payload["uid"]
+
     user = await get_user_by_id(db, user_id)
     if not user:
         return user_not_found_response()
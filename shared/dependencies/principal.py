@@ -0,0 +1,81 @@
+"""
+The authenticated caller, without loading the full user row.
+
+Most endpoints only need to know who is calling: the user id, role and
+whether the account is still active. Loading the whole ``AdminUser`` or
+``User`` for that means decrypting its encrypted columns and following its
+eager relationships on every request. A ``Principal`` is built from the
+verified JWT claims plus a small status record (role, business, deleted
+flag) selected by primary key and cached per process for
+``PRINCIPAL_STATUS_CACHE_SECONDS``.
+
+Endpoints that change the status record call ``invalidate`` on the matching
+cache. Endpoints that read or modify the user row itself depend on
+``get_current_user_full`` instead.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from shared.core.config import settings
+from shared.utils.bounded_cache import BoundedTTLCache
+
+# Status records cached per process; least recently used drop first
+STATUS_CACHE_SIZE = 10000
+
+
+@dataclass(frozen=True)
+class PrincipalStatus:
+    """The columns of a user row that authorization depends on."""
+
+    is_deleted: bool
+    role_id: Optional[str] = None
+    business_id: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Authenticated caller of a request."""
+
+    user_id: str
+    # Device session of the token (``sid`` claim), if any
+    session_id: Optional[int]
+    is_deleted: bool
+    role_id: Optional[str] = None
+    business_id: Optional[str] = None
+
+
+class PrincipalStatusCache:
+    """Bounded, short-lived cache of ``PrincipalStatus`` by user id."""
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        maxsize: int = STATUS_CACHE_SIZE,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._entries: BoundedTTLCache[str, PrincipalStatus] = BoundedTTLCache(
+            maxsize, ttl_seconds
+        )
+
+    def get(self, user_id: str) -> Optional[PrincipalStatus]:
+        return self._entries.get(user_id)
+
+    def put(self, user_id: str, status: PrincipalStatus) -> None:
+        self._entries.put(user_id, status)
+
+    def invalidate(self, user_id: str) -> None:
+        """Forget a user's status after it changed (role, deletion)."""
+        self._entries.pop(user_id)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+admin_principal_cache = PrincipalStatusCache(
+    settings.PRINCIPAL_STATUS_CACHE_SECONDS
+)
+user_principal_cache = PrincipalStatusCache(
+    settings.PRINCIPAL_STATUS_CACHE_SECONDS
+)
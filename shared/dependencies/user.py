@@ -6,6 +6,7 @@ from fastapi import (
     Request,
 )
 from fastapi.security import HTTPBearer, OAuth2PasswordBearer
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.responses import JSONResponse
 
@@ -13,6 +14,11 @@ from shared.core.config import PUBLIC_KEY
 from shared.core.logging_config import get_logger
 from shared.db.models import User
 from shared.db.sessions.database import get_db
+from shared.dependencies.principal import (
+    Principal,
+    PrincipalStatus,
+    user_principal_cache,
+)
 from user_service.services.response_builders import (
     user_not_found_response,
 )
@@ -51,15 +57,52 @@ async def get_current_user(
     return user
 
 
-async def get_current_active_user(
+async def get_current_user_full(
     current_user: Annotated[User, Depends(get_current_user)],
 ) -> User:
-    """Get current active user (ensure user is not deleted/disabled)"""
+    """Get the full current user row, for endpoints that read or change it"""
     if current_user.is_deleted:
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
 
 
+# Previous name of get_current_user_full
+get_current_active_user = get_current_user_full
+
+
+async def get_current_principal(
+    request: Request,
+    token: Annotated[str, Depends(user_oauth2_scheme)],
+    db: AsyncSession = Depends(get_db),
+) -> Principal:
+    """Get the authenticated caller from JWT claims and a cached status"""
+    auth_token = token or extract_token_from_request(request)
+    if not auth_token:
+        raise HTTPException(
+            status_code=401, detail="Missing authentication token"
+        )
+    payload = await verify_token_and_session(auth_token, db)
+    user_id = payload["uid"]
+
+    status = user_principal_cache.get(user_id)
+    if status is None:
+        status = await load_principal_status(db, user_id)
+        if status is None:
+            return user_not_found_response()
+        user_principal_cache.put(user_id, status)
+
+    if status.is_deleted:
+        raise HTTPException(status_code=401, detail="Inactive user")
+
+    return Principal(
+        user_id=user_id,
+        session_id=payload.get("sid"),
+        is_deleted=status.is_deleted,
+        role_id=status.role_id,
+        business_id=status.business_id,
+    )
+
+
 def extract_token_from_request(request: Request) -> Optional[str]:
     """Extract token from Authorization header or cookie"""
     header = request.headers.get("authorization")
@@ -73,10 +116,8 @@ def extract_token_from_request(request: Request) -> Optional[str]:
     )
 
 
-async def get_current_user_from_token(
-    token: str, db: AsyncSession
-) -> User | JSONResponse:
-    """Get current authenticated user from JWT token with session validation"""
+async def verify_token_and_session(token: str, db: AsyncSession) -> dict:
+    """Verify the JWT and its device session; returns the token payload"""
     public_key = PUBLIC_KEY.get_secret_value()
     if not public_key:
         logger.error("Missing public key for token verification")
@@ -99,6 +140,26 @@ async def get_current_user_from_token(
         logger.warning(f"Session validation failed: {session_error}")
         raise HTTPException(status_code=401, detail="Session no longer valid")
 
+    return payload
+
+
+async def load_principal_status(
+    db: AsyncSession, user_id: str
+) -> Optional[PrincipalStatus]:
+    """Deleted flag of a user, by primary key"""
+    is_deleted = (
+        await db.execute(select(User.is_deleted).where(User.user_id == user_id))
+    ).scalar_one_or_none()
+    return PrincipalStatus(is_deleted) if is_deleted is not None else None
+
+
+async def get_current_user_from_token(
+    token: str, db: AsyncSession
+) -> User | JSONResponse:
+    """Get current authenticated user from JWT token with session validation"""
+    payload = await verify_token_and_session(token, db)
+    user_id = payload["uid"]
+
     user = await get_user_by_id(db, user_id)
     if not user:
         return user_not_found_response()
@@ -0,0 +1,135 @@
+"""
+Parsed RSA key objects, keyed by key ID (kid).
+
+PyJWT parses a PEM string into a key object on every encode and decode,
+which is a noticeable share of the cost of verifying a token on each
+request. The registry parses each key once and hands out the
+``RSAPublicKey``/``RSAPrivateKey`` objects, which PyJWT uses as they are.
+
+Keys are stored per ``kid`` so several can be live at once: after a
+rotation by ``KeyManager`` the new pair is registered as current (used for
+signing) while tokens signed with the previous key still verify until they
+expire. A PEM passed in directly that was never registered is parsed once
+and remembered under a kid derived from its content.
+"""
+
+import hashlib
+import threading
+from typing import Dict, Optional, Tuple, Union
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.rsa import (
+    RSAPrivateKey,
+    RSAPublicKey,
+)
+
+from shared.keys.key_manager import KeyManager
+
+PemKey = Union[str, bytes]
+
+
+def _pem_bytes(pem: PemKey) -> bytes:
+    return pem.encode() if isinstance(pem, str) else pem
+
+
+def _derived_kid(pem: bytes) -> str:
+    return "pem:" + hashlib.sha256(pem).hexdigest()[:16]
+
+
+class KeyRegistry:
+    """Public and private RSA key objects by kid."""
+
+    def __init__(self) -> None:
+        self.current_kid: Optional[str] = None
+        self._public: Dict[str, RSAPublicKey] = {}
+        self._private: Dict[str, RSAPrivateKey] = {}
+        # PEM bytes -> kid, so callers holding PEMs skip parsing
+        self._kid_by_pem: Dict[bytes, str] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_key_manager(cls, key_manager: KeyManager) -> "KeyRegistry":
+        registry = cls()
+        registry.load_from(key_manager)
+        return registry
+
+    def load_from(self, key_manager: KeyManager) -> str:
+        """Register the manager's current key pair as the signing key."""
+        kid = key_manager.get_key_id()
+        self.register(
+            kid,
+            public_pem=key_manager.get_public_key(),
+            private_pem=key_manager.get_private_key(),
+            current=True,
+        )
+        return kid
+
+    def register(
+        self,
+        kid: str,
+        public_pem: PemKey,
+        private_pem: Optional[PemKey] = None,
+        current: bool = False,
+    ) -> None:
+        public_bytes = _pem_bytes(public_pem)
+        public_key = serialization.load_pem_public_key(public_bytes)
+        private_bytes = private_key = None
+        if private_pem is not None:
+            private_bytes = _pem_bytes(private_pem)
+            private_key = serialization.load_pem_private_key(
+                private_bytes, password=None
+            )
+
+        with self._lock:
+            self._public[kid] = public_key
+            self._kid_by_pem[public_bytes] = kid
+            if private_key is not None:
+                self._private[kid] = private_key
+                self._kid_by_pem[private_bytes] = kid
+            if current:
+                self.current_kid = kid
+
+    def retire(self, kid: str) -> None:
+        """Forget a key; tokens signed with it stop verifying."""
+        with self._lock:
+            self._public.pop(kid, None)
+            self._private.pop(kid, None)
+            self._kid_by_pem = {
+                pem: known
+                for pem, known in self._kid_by_pem.items()
+                if known != kid
+            }
+
+    def public_key(self, kid: str) -> Optional[RSAPublicKey]:
+        return self._public.get(kid)
+
+    def private_key(self, kid: str) -> Optional[RSAPrivateKey]:
+        return self._private.get(kid)
+
+    def resolve_public(self, pem: PemKey) -> Tuple[str, RSAPublicKey]:
+        """The kid and parsed object for a public key PEM."""
+        pem_bytes = _pem_bytes(pem)
+        kid = self._kid_by_pem.get(pem_bytes)
+        if kid is None or kid not in self._public:
+            kid = _derived_kid(pem_bytes)
+            self.register(kid, public_pem=pem_bytes)
+        return kid, self._public[kid]
+
+    def resolve_private(self, pem: PemKey) -> Tuple[str, RSAPrivateKey]:
+        """The kid and parsed object for a private key PEM."""
+        pem_bytes = _pem_bytes(pem)
+        kid = self._kid_by_pem.get(pem_bytes)
+        if kid is None or kid not in self._private:
+            private_key = serialization.load_pem_private_key(
+                pem_bytes, password=None
+            )
+            kid = _derived_kid(pem_bytes)
+            self.register(
+                kid,
+                public_pem=private_key.public_key().public_bytes(
+                    encoding=serialization.Encoding.PEM,
+                    format=serialization.PublicFormat.SubjectPublicKeyInfo,
+                ),
+                private_pem=pem_bytes,
+            )
+        return kid, self._private[kid]
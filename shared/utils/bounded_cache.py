@@ -0,0 +1,104 @@
+"""
+Bounded, thread-safe LRU with optional per-entry expiry.
+
+Per-process caches in front of the database or of expensive parsing need
+the same thing: at most ``maxsize`` entries, least recently used dropping
+first, and entries that stop being returned once they expire. They share
+this one implementation and only decide what the key, the value and the
+expiry are.
+
+Expiry times are in the units of ``clock``: ``time.monotonic`` (default)
+for entries that live ``ttl_seconds``, ``time.time`` for entries that carry
+their own wall-clock expiry (a stored response's ``expires_at``).
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Hashable,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class BoundedTTLCache(Generic[K, V]):
+    """At most ``maxsize`` entries; each expires at its own time, if any."""
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        # key -> (expiry in clock units or None, value)
+        self._entries: "OrderedDict[K, Tuple[Optional[float], V]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: K, default: Any = None) -> Any:
+        """The live value for ``key``, or ``default``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= self.clock():
+                del self._entries[key]
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: K, value: V, expires_at: Optional[float] = None) -> None:
+        """Store ``value`` until ``expires_at``, or for ``ttl_seconds``."""
+        if self.maxsize <= 0:
+            return
+        if expires_at is None and self.ttl_seconds is not None:
+            if self.ttl_seconds <= 0:
+                return
+            expires_at = self.clock() + self.ttl_seconds
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: K) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def discard(self, predicate: Callable[[K], bool]) -> None:
+        """Drop every entry whose key matches ``predicate``."""
+        with self._lock:
+            for key in [k for k in self._entries if predicate(k)]:
+                del self._entries[key]
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def clear(self) -> None:
+        """Drop every entry and reset the hit counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -6,14 +6,89 @@ Note: MAC addresses cannot be captured from web requests for security reasons.
 """
 
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Type, Union
 
-import httpx
 from fastapi import Request
+from sqlalchemy import update
 from user_agents import parse
 from user_agents.parsers import UserAgent
 
+from shared.core.logging_config import get_logger
 from shared.db.models import AdminUserDeviceSession, UserDeviceSession
+from shared.db.sessions.database import AsyncSessionLocal
+from shared.utils.bounded_cache import BoundedTTLCache
+from shared.utils.geolocation import geo_resolver, parse_public_ip
+
+logger = get_logger(__name__)
+
+# Distinct user-agent strings remembered; least recently used drop first
+USER_AGENT_CACHE_SIZE = 1024
+
+
+class UserAgentCache:
+    """
+    Bounded LRU of parsed user-agent fields, keyed by the raw string.
+
+    ``user_agents.parse`` runs dozens of regexes, while real traffic comes
+    from a few hundred distinct strings, so most requests are cache hits.
+    """
+
+    def __init__(self, maxsize: int = USER_AGENT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries: BoundedTTLCache[str, Dict[str, Any]] = BoundedTTLCache(
+            maxsize
+        )
+
+    @property
+    def hits(self) -> int:
+        return self._entries.hits
+
+    @property
+    def misses(self) -> int:
+        return self._entries.misses
+
+    def get(self, user_agent_string: str) -> Dict[str, Any]:
+        """Parsed device, browser and OS fields (a fresh copy)."""
+        fields = self._entries.get(user_agent_string)
+        if fields is None:
+            fields = parse_user_agent(user_agent_string)
+            self._entries.put(user_agent_string, fields)
+        return dict(fields)
+
+    @property
+    def hit_rate(self) -> float:
+        return self._entries.hit_rate
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+        }
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def parse_user_agent(user_agent_string: str) -> Dict[str, Any]:
+    """Device, browser and OS fields of a user-agent string (uncached)."""
+    user_agent = parse(user_agent_string)
+    return {
+        "device_family": user_agent.device.family,
+        "device_brand": user_agent.device.brand,
+        "device_model": user_agent.device.model,
+        "browser_family": user_agent.browser.family,
+        "browser_version": user_agent.browser.version_string,
+        "os_family": user_agent.os.family,
+        "os_version": user_agent.os.version_string,
+        "is_mobile": user_agent.is_mobile,
+        "is_tablet": user_agent.is_tablet,
+        "is_pc": user_agent.is_pc,
+        "is_bot": user_agent.is_bot,
+        "device_type": DeviceInfoExtractor._determine_device_type(user_agent),
+    }
 
 
 class DeviceInfoExtractor:
@@ -31,7 +106,7 @@ class DeviceInfoExtractor:
             Dict containing device information
         """
         user_agent_string = request.headers.get("user-agent", "")
-        user_agent = parse(user_agent_string)
+        parsed = user_agent_cache.get(user_agent_string)
 
         # Extract IP address
         ip_address = DeviceInfoExtractor._extract_ip_address(request)
@@ -40,20 +115,7 @@ class DeviceInfoExtractor:
         device_info = {
             "ip_address": ip_address,
             "user_agent": user_agent_string,
-            "device_family": user_agent.device.family,
-            "device_brand": user_agent.device.brand,
-            "device_model": user_agent.device.model,
-            "browser_family": user_agent.browser.family,
-            "browser_version": user_agent.browser.version_string,
-            "os_family": user_agent.os.family,
-            "os_version": user_agent.os.version_string,
-            "is_mobile": user_agent.is_mobile,
-            "is_tablet": user_agent.is_tablet,
-            "is_pc": user_agent.is_pc,
-            "is_bot": user_agent.is_bot,
-            "device_type": DeviceInfoExtractor._determine_device_type(
-                user_agent
-            ),
+            **parsed,
             "screen_info": DeviceInfoExtractor._extract_screen_info(request),
             "language": request.headers.get("accept-language", "").split(",")[
                 0
@@ -63,7 +125,7 @@ class DeviceInfoExtractor:
                 request
             ),
             "fingerprint": DeviceInfoExtractor._generate_device_fingerprint(
-                request, user_agent
+                request, parsed
             ),
             "extracted_at": datetime.now(timezone.utc),
         }
@@ -161,18 +223,18 @@ class DeviceInfoExtractor:
 
     @staticmethod
     def _generate_device_fingerprint(
-        request: Request, user_agent: UserAgent
+        request: Request, parsed: Dict[str, Any]
     ) -> str:
         """Generate a device fingerprint for identification"""
         import hashlib
 
         # Combine various attributes to create a fingerprint
         fingerprint_data = [
-            user_agent.browser.family,
-            user_agent.browser.version_string,
-            user_agent.os.family,
-            user_agent.os.version_string,
-            user_agent.device.family,
+            parsed["browser_family"],
+            parsed["browser_version"],
+            parsed["os_family"],
+            parsed["os_version"],
+            parsed["device_family"],
             request.headers.get("accept-language", ""),
             request.headers.get("accept-encoding", ""),
             request.headers.get("x-screen-width", ""),
@@ -184,13 +246,17 @@ class DeviceInfoExtractor:
         return hashlib.sha256(fingerprint_string.encode()).hexdigest()[:16]
 
 
+user_agent_cache = UserAgentCache()
+
+
 class LocationService:
     """Service for extracting location information from IP addresses"""
 
     @staticmethod
     async def get_location_from_ip(ip_address: str) -> Optional[Dict[str, Any]]:
         """
-        Get location information from IP address using a free IP geolocation service.
+        Get location information from IP address using the configured
+        GeoIP resolver (see ``shared.utils.geolocation``).
 
         Args:
             ip_address: IP address to lookup
@@ -198,44 +264,77 @@ class LocationService:
         Returns:
             Dict containing location information or None if failed
         """
-        if not ip_address or ip_address in ["unknown", "127.0.0.1", "::1"]:
+        ip = parse_public_ip(ip_address or "")
+        if ip is None:
             return None
 
         try:
-            # Using ipapi.co as a free service (consider using a paid service for production)
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(
-                    f"https://ipapi.co/{ip_address}/json/"
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-
-                    # Check if the response contains an error
-                    if "error" in data:
-                        return None
-
-                    return {
-                        "ip": data.get("ip"),
-                        "city": data.get("city"),
-                        "region": data.get("region"),
-                        "country": data.get("country_name"),
-                        "country_code": data.get("country_code"),
-                        "latitude": data.get("latitude"),
-                        "longitude": data.get("longitude"),
-                        "timezone": data.get("timezone"),
-                        "isp": data.get("org"),
-                        "as": data.get("asn"),
-                        "retrieved_at": datetime.now(timezone.utc),
-                    }
+            location = await geo_resolver.lookup(ip)
         except Exception as e:
             # Log the error but don't fail the login process
-            from core.logging_config import get_logger
-
-            logger = get_logger(__name__)
             logger.warning(f"Failed to get location for IP {ip_address}: {e}")
+            return None
+
+        if not location:
+            return None
+        return {
+            "ip": str(ip),
+            **location,
+            "retrieved_at": datetime.now(timezone.utc),
+        }
+
+    @staticmethod
+    def location_columns(location_info: Dict[str, Any]) -> Dict[str, Any]:
+        """Device-session column values for a location lookup result"""
+        city = location_info.get("city", "")
+        country = location_info.get("country", "")
+        return {
+            "location": f"{city}, {country}",
+            "country": location_info.get("country"),
+            "country_code": location_info.get("country_code"),
+            "city": location_info.get("city"),
+            "latitude": (
+                str(location_info.get("latitude"))
+                if location_info.get("latitude")
+                else None
+            ),
+            "longitude": (
+                str(location_info.get("longitude"))
+                if location_info.get("longitude")
+                else None
+            ),
+            "timezone": location_info.get("timezone"),
+            "isp": location_info.get("isp"),
+        }
+
+    @staticmethod
+    async def enrich_session_location(
+        model: Type[Union[AdminUserDeviceSession, UserDeviceSession]],
+        session_id: int,
+        ip_address: str,
+    ) -> None:
+        """
+        Fill in the location columns of an already written session.
+
+        Runs as a background task after the login response, with its own
+        database session.
+        """
+        location_info = await LocationService.get_location_from_ip(ip_address)
+        if not location_info:
+            return
 
-        return None
+        try:
+            async with AsyncSessionLocal() as db:
+                await db.execute(
+                    update(model)
+                    .where(model.session_id == session_id)
+                    .values(**LocationService.location_columns(location_info))
+                )
+                await db.commit()
+        except Exception as e:
+            logger.warning(
+                f"Failed to store location for session {session_id}: {e}"
+            )
 
 
 class DeviceSessionManager:
@@ -4,11 +4,11 @@ from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from typing import Any, Dict, Optional, Union
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
 from pydantic import EmailStr
 
 from shared.core.config import settings
 from shared.core.logging_config import get_logger
+from shared.utils.email_templates import TemplateRegistry
 
 logger = get_logger(__name__)
 
@@ -32,6 +32,9 @@ class EmailConfig:
     # Connection security (combined into a single attribute)
     connection_security: str = "tls"  # Options: "tls", "ssl", "none"
 
+    # Compiled template bytecode, kept across restarts ("" to disable)
+    template_cache_dir: str = ""
+
     @property
     def use_tls(self) -> bool:
         """Determine if TLS should be used."""
@@ -48,21 +51,39 @@ class EmailConfig:
     #         self.smtp_password = SecretStr(self.smtp_password)
 
 
+@dataclass
+class TemplatedEmail:
+    """An email to render from a template: what the outbox stores."""
+
+    to: str
+    subject: str
+    template_file: str
+    context: Dict[str, Any]
+
+
 # Email Utility
 class EmailSender:
     def __init__(self, config: EmailConfig):
         self.config = config
-        self.env = Environment(
-            loader=FileSystemLoader(self.config.template_dir),
-            autoescape=select_autoescape(["html", "xml"]),
+        self.templates = TemplateRegistry(
+            self.config.template_dir, self.config.template_cache_dir
         )
+        self.env = self.templates.env
 
     def _render_template(
         self, template_file: str, context: Dict[str, Any]
     ) -> str:
         try:
-            template = self.env.get_template(template_file)
-            return template.render(**context)
+            return self.templates.render(template_file, context)
+        except Exception as e:
+            logger.error("Template rendering failed: %s", e)
+            return ""
+
+    async def _render_template_async(
+        self, template_file: str, context: Dict[str, Any]
+    ) -> str:
+        try:
+            return await self.templates.render_async(template_file, context)
         except Exception as e:
             logger.error("Template rendering failed: %s", e)
             return ""
@@ -90,6 +111,33 @@ class EmailSender:
             logger.error("SMTP connection/login failed: %s", e)
             return None
 
+    def _build_message(
+        self, email: TemplatedEmail, html: str
+    ) -> Optional[MIMEMultipart]:
+        if not html:
+            return None
+
+        msg = MIMEMultipart()
+        msg["From"] = self.config.from_email
+        msg["To"] = email.to
+        msg["Subject"] = email.subject
+        msg.attach(MIMEText(html, "html"))
+        return msg
+
+    def render(self, email: TemplatedEmail) -> Optional[MIMEMultipart]:
+        """The email as a MIME message, or None if its template failed."""
+        html = self._render_template(email.template_file, email.context)
+        return self._build_message(email, html)
+
+    async def render_async(
+        self, email: TemplatedEmail
+    ) -> Optional[MIMEMultipart]:
+        """``render``, with the template rendered off the event loop."""
+        html = await self._render_template_async(
+            email.template_file, email.context
+        )
+        return self._build_message(email, html)
+
     def send_email(
         self,
         to: EmailStr,
@@ -98,20 +146,14 @@ class EmailSender:
         context: Dict[str, Any],
     ) -> bool:
         """Send a rendered HTML email to a recipient."""
-        server = self._connect_smtp()
-        if not server:
+        msg = self.render(TemplatedEmail(to, subject, template_file, context))
+        if msg is None:
             return False
 
-        html = self._render_template(template_file, context)
-        if not html:
+        server = self._connect_smtp()
+        if not server:
             return False
 
-        msg = MIMEMultipart()
-        msg["From"] = self.config.from_email
-        msg["To"] = to
-        msg["Subject"] = subject
-        msg.attach(MIMEText(html, "html"))
-
         try:
             server.sendmail(self.config.from_email, to, msg.as_string())
             logger.info("Email sent to %s", to)
@@ -134,6 +176,7 @@ email_config = EmailConfig(
     smtp_password=settings.SMTP_PASSWORD,
     from_email=settings.EMAIL_FROM,
     template_dir=settings.EMAIL_TEMPLATES_DIR,
+    template_cache_dir=settings.EMAIL_TEMPLATE_CACHE_DIR,
     connection_security="tls",  # Use TLS by default (port 587), use "ssl" for port 465
 )
 
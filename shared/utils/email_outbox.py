@@ -0,0 +1,322 @@
+"""
+Transactional email outbox.
+
+Handlers used to send email inline through ``smtplib``: a fresh connection,
+STARTTLS and login per message, blocking the event loop, so one slow SMTP
+server stalled the whole worker. Now a handler calls ``enqueue_email`` to
+add an ``EmailOutbox`` row to the transaction of the change it announces,
+and ``dispatch_outbox_batch`` (``email_outbox_job``, run in every worker by
+``schedulers.worker_tasks``) sends what is due:
+
+- over ``SmtpConnectionPool``, ``SMTP_POOL_SIZE`` persistent, logged-in
+  ``aiosmtplib`` connections per worker, sending concurrently;
+- rows are claimed with SKIP LOCKED and leased for ``EMAIL_SEND_LEASE``
+  (``next_attempt_at`` moves past the sends) in a committed transaction,
+  so no row lock is held while talking to SMTP and several dispatchers
+  never send the same email;
+- transient failures are retried with exponential backoff; permanent ones
+  (5xx replies, refused recipients, broken templates) and emails still
+  failing after ``EMAIL_MAX_ATTEMPTS`` are dead-lettered as ``DEAD``;
+- ``purge_finished_emails`` deletes SENT and DEAD rows after
+  ``EMAIL_OUTBOX_RETENTION_DAYS``, since their context holds recipient
+  addresses and verification tokens.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.message import Message
+from typing import List, Optional
+
+import aiosmtplib
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import and_, delete, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from shared.core.config import settings
+from shared.core.logging_config import get_logger
+from shared.db.models import EmailOutbox, EmailOutboxStatus
+from shared.utils.email import (
+    EmailConfig,
+    TemplatedEmail,
+    email_config,
+    email_sender,
+)
+
+logger = get_logger(__name__)
+
+EMAIL_BATCH_SIZE = 50
+EMAIL_MAX_ATTEMPTS = 6
+# Retry delays double from the base up to the cap
+EMAIL_RETRY_BASE_SECONDS = 30
+EMAIL_RETRY_MAX_SECONDS = 3600
+SMTP_TIMEOUT_SECONDS = 30
+# A claimed batch is due again after this if its dispatcher never records
+# the results (the worker died mid-send)
+EMAIL_SEND_LEASE = timedelta(minutes=15)
+# Finished rows deleted per statement by ``purge_finished_emails``
+EMAIL_PURGE_BATCH_SIZE = 1000
+
+
+class PermanentEmailError(Exception):
+    """The email can never be sent as queued; retrying will not help."""
+
+
+def enqueue_email(db: AsyncSession, email: TemplatedEmail) -> EmailOutbox:
+    """
+    Queue an email in the caller's transaction; it is sent after commit.
+
+    The context must be JSON-serialisable once encoded (dates become ISO
+    strings).
+    """
+    row = EmailOutbox(
+        recipient=email.to,
+        subject=email.subject,
+        template_file=email.template_file,
+        context=jsonable_encoder(email.context),
+        status=EmailOutboxStatus.PENDING,
+        attempts=0,
+    )
+    db.add(row)
+    return row
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Backoff before the next attempt, after ``attempts`` failures."""
+    seconds = EMAIL_RETRY_BASE_SECONDS * 2 ** max(attempts - 1, 0)
+    return timedelta(seconds=min(seconds, EMAIL_RETRY_MAX_SECONDS))
+
+
+def is_permanent_failure(error: Exception) -> bool:
+    if isinstance(
+        error, (PermanentEmailError, aiosmtplib.SMTPRecipientsRefused)
+    ):
+        return True
+    return (
+        isinstance(error, aiosmtplib.SMTPResponseException)
+        and 500 <= error.code < 600
+    )
+
+
+class SmtpConnectionPool:
+    """
+    Up to ``size`` authenticated SMTP connections, reused between sends.
+
+    A connection that fails is closed and replaced on the next send; one
+    the server dropped while idle is reconnected once, transparently.
+    """
+
+    def __init__(
+        self,
+        config: EmailConfig,
+        size: int,
+        timeout: float = SMTP_TIMEOUT_SECONDS,
+    ):
+        self.config = config
+        self.size = max(1, size)
+        self.timeout = timeout
+        self.connects = 0
+        self._idle: List[aiosmtplib.SMTP] = []
+        self._slots = asyncio.Semaphore(self.size)
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        client = aiosmtplib.SMTP(
+            hostname=self.config.smtp_server,
+            port=self.config.smtp_port,
+            username=self.config.smtp_username or None,
+            password=self.config.smtp_password or None,
+            use_tls=self.config.use_ssl,
+            start_tls=self.config.use_tls,
+            timeout=self.timeout,
+        )
+        await client.connect()
+        self.connects += 1
+        return client
+
+    @staticmethod
+    async def _discard(client: aiosmtplib.SMTP) -> None:
+        try:
+            client.close()
+        except Exception as e:
+            logger.debug(f"Closing SMTP connection failed: {e}")
+
+    async def send(self, message: Message) -> None:
+        async with self._slots:
+            client = self._idle.pop() if self._idle else None
+            try:
+                if client is None or not client.is_connected:
+                    client = await self._connect()
+                    await client.send_message(message)
+                else:
+                    try:
+                        await client.send_message(message)
+                    except aiosmtplib.SMTPServerDisconnected:
+                        # Dropped while idle; the message was not accepted
+                        await self._discard(client)
+                        client = await self._connect()
+                        await client.send_message(message)
+            except Exception:
+                if client is not None:
+                    await self._discard(client)
+                raise
+            self._idle.append(client)
+
+    async def aclose(self) -> None:
+        idle, self._idle = self._idle, []
+        for client in idle:
+            try:
+                await client.quit()
+            except Exception:
+                await self._discard(client)
+
+
+smtp_pool = SmtpConnectionPool(email_config, settings.SMTP_POOL_SIZE)
+
+
+async def _send_row(pool: SmtpConnectionPool, row: EmailOutbox) -> None:
+    message = await email_sender.render_async(
+        TemplatedEmail(
+            row.recipient, row.subject, row.template_file, row.context
+        )
+    )
+    if message is None:
+        raise PermanentEmailError(f"Template {row.template_file} failed")
+    await pool.send(message)
+
+
+async def claim_outbox_batch(
+    db: AsyncSession, batch_size: int = EMAIL_BATCH_SIZE
+) -> List[EmailOutbox]:
+    """
+    Lease up to ``batch_size`` due emails, oldest due first, and commit.
+
+    Each claimed row counts an attempt and is not due again until the lease
+    runs out, so other dispatchers skip it without a lock being held.
+    """
+    now = datetime.now(timezone.utc)
+    rows = (
+        (
+            await db.execute(
+                select(EmailOutbox)
+                .where(
+                    EmailOutbox.status == EmailOutboxStatus.PENDING,
+                    EmailOutbox.next_attempt_at <= now,
+                )
+                .order_by(EmailOutbox.next_attempt_at)
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+            )
+        )
+        .scalars()
+        .all()
+    )
+    if not rows:
+        return []
+    for row in rows:
+        row.attempts += 1
+        row.next_attempt_at = now + EMAIL_SEND_LEASE
+    await db.commit()
+    return list(rows)
+
+
+def _record_result(
+    row: EmailOutbox, error: Optional[BaseException], now: datetime
+) -> None:
+    if error is None:
+        row.status = EmailOutboxStatus.SENT
+        row.sent_at = now
+        row.last_error = None
+        return
+
+    row.last_error = str(error)[:1000]
+    if is_permanent_failure(error) or row.attempts >= EMAIL_MAX_ATTEMPTS:
+        row.status = EmailOutboxStatus.DEAD
+        row.next_attempt_at = now
+        logger.error(
+            "Email %s to %s dead-lettered after %d attempts: %s",
+            row.id,
+            row.recipient,
+            row.attempts,
+            error,
+        )
+    else:
+        row.next_attempt_at = now + retry_delay(row.attempts)
+        logger.warning(
+            "Email %s to %s failed on attempt %d: %s",
+            row.id,
+            row.recipient,
+            row.attempts,
+            error,
+        )
+
+
+async def dispatch_outbox_batch(
+    db: AsyncSession,
+    pool: Optional[SmtpConnectionPool] = None,
+    batch_size: int = EMAIL_BATCH_SIZE,
+) -> int:
+    """
+    Claim up to ``batch_size`` due emails, send them with no transaction
+    open, then record the results in a second short transaction.
+
+    The session must not expire on commit (``AsyncSessionLocal``): the
+    claimed rows are used after the claim is committed.
+
+    Returns: number of emails attempted.
+    """
+    pool = pool or smtp_pool
+    rows = await claim_outbox_batch(db, batch_size)
+    if not rows:
+        return 0
+
+    results = await asyncio.gather(
+        *(_send_row(pool, row) for row in rows), return_exceptions=True
+    )
+
+    now = datetime.now(timezone.utc)
+    for row, error in zip(rows, results):
+        _record_result(row, error, now)
+    await db.commit()
+    return len(rows)
+
+
+async def purge_finished_emails(
+    db: AsyncSession,
+    retention_days: Optional[int] = None,
+    batch_size: int = EMAIL_PURGE_BATCH_SIZE,
+) -> int:
+    """
+    Delete up to ``batch_size`` SENT rows sent, and DEAD rows last tried,
+    more than ``retention_days`` (``EMAIL_OUTBOX_RETENTION_DAYS``) ago,
+    then commit.
+
+    Returns: number of rows deleted.
+    """
+    if retention_days is None:
+        retention_days = settings.EMAIL_OUTBOX_RETENTION_DAYS
+    cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
+    finished = (
+        select(EmailOutbox.id)
+        .where(
+            or_(
+                and_(
+                    EmailOutbox.status == EmailOutboxStatus.SENT,
+                    EmailOutbox.sent_at < cutoff,
+                ),
+                and_(
+                    EmailOutbox.status == EmailOutboxStatus.DEAD,
+                    EmailOutbox.next_attempt_at < cutoff,
+                ),
+            )
+        )
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    result = await db.execute(
+        delete(EmailOutbox).where(EmailOutbox.id.in_(finished))
+    )
+    await db.commit()
+    return result.rowcount
+
+
+async def close_smtp_pool() -> None:
+    await smtp_pool.aclose()
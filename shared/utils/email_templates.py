@@ -0,0 +1,100 @@
+"""
+Precompiled email templates.
+
+``EmailSender`` used to look every template up in the Jinja environment per
+send: a stat of the file to check it was still up to date and, after each
+restart, a full parse and compile. ``TemplateRegistry`` instead compiles
+every template under ``shared/templates/{admin,organizer,user}`` once at
+startup and keeps the ``Template`` objects:
+
+- compiled bytecode is written to ``EMAIL_TEMPLATE_CACHE_DIR`` so later
+  restarts skip the Jinja compiler; an empty setting disables it;
+- templates are not re-checked on disk, so edits need a restart;
+- ``render_async`` renders in a worker thread, keeping bulk sends (booking
+  confirmations, organizer notices) off the event loop.
+"""
+
+import asyncio
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    Template,
+    select_autoescape,
+)
+
+from shared.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+TEMPLATE_GROUPS: Tuple[str, ...] = ("admin", "organizer", "user")
+
+
+def _bytecode_cache(
+    cache_dir: Optional[str],
+) -> Optional[FileSystemBytecodeCache]:
+    if not cache_dir:
+        return None
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+    except OSError as e:
+        logger.warning(f"Template bytecode cache disabled: {e}")
+        return None
+    return FileSystemBytecodeCache(cache_dir)
+
+
+class TemplateRegistry:
+    """Compiled templates by name, loaded once and shared by all sends."""
+
+    def __init__(self, template_dir: str, cache_dir: Optional[str] = None):
+        self.env = Environment(
+            loader=FileSystemLoader(template_dir),
+            autoescape=select_autoescape(["html", "xml"]),
+            bytecode_cache=_bytecode_cache(cache_dir),
+            auto_reload=False,
+        )
+        self._templates: Dict[str, Template] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._templates
+
+    async def load(self) -> None:
+        """Compile every email template (called at startup)."""
+        # Compiling is CPU-bound; keep the loop responsive
+        await asyncio.to_thread(self.compile_all)
+
+    def compile_all(self) -> int:
+        names = self.env.list_templates(
+            filter_func=lambda name: name.split("/", 1)[0] in TEMPLATE_GROUPS
+            and name.endswith(".html")
+        )
+        for name in names:
+            self.get(name)
+        logger.info(f"Compiled {len(names)} email templates")
+        return len(names)
+
+    def get(self, name: str) -> Template:
+        """The compiled template; ones not loaded yet are compiled now."""
+        template = self._templates.get(name)
+        if template is None:
+            with self._lock:
+                template = self._templates.get(name)
+                if template is None:
+                    template = self.env.get_template(name)
+                    self._templates[name] = template
+        return template
+
+    def render(self, name: str, context: Dict[str, Any]) -> str:
+        return self.get(name).render(**context)
+
+    async def render_async(self, name: str, context: Dict[str, Any]) -> str:
+        """Render in a worker thread rather than on the event loop."""
+        return await asyncio.to_thread(self.render, name, context)
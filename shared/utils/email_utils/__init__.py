@@ -7,6 +7,7 @@ from .admin_emails import (
     send_admin_contact_us_email,
     send_admin_organizer_query_email,
     send_admin_organizer_verification_email,
+    send_admin_login_alert_email,
 )
 from .organizer_emails import (
     send_organizer_verification_email,
@@ -18,6 +19,8 @@ from .organizer_emails import (
     send_organizer_review_notification,
 )
 from .user_emails import (
+    build_new_booking_success_email,
+    build_user_verification_email,
     send_password_reset_email,
     send_user_verification_email,
     send_email_verification_resend,
@@ -46,7 +49,10 @@ __all__ = [
     # Admin email functions
     "send_admin_password_reset_email",
     "send_admin_welcome_email",
+    "send_admin_login_alert_email",
     "send_email_verification_resend",
     "send_booking_success_email",
     "send_new_booking_success_email",
+    "build_user_verification_email",
+    "build_new_booking_success_email",
 ]
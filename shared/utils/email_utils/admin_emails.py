@@ -263,3 +263,42 @@ def send_admin_organizer_verification_email(
         template_file="admin/organizer_verification.html",
         context=context,
     )
+
+
+def send_admin_login_alert_email(
+    email: EmailStr,
+    username: str,
+    alerts: Sequence[Dict],
+    device_name: Optional[str] = None,
+    ip_address: Optional[str] = None,
+    location: Optional[str] = None,
+) -> bool:
+    """Warn an admin user about an unusual sign-in to their account.
+
+    Uses template: admin/login_alert.html
+    """
+    context = {
+        "username": username,
+        "alerts": alerts,
+        "device_name": device_name,
+        "ip_address": ip_address,
+        "location": location,
+        "login_time": datetime.now(tz=timezone.utc).strftime(
+            "%B %d, %Y at %I:%M %p UTC"
+        ),
+        "admin_url": f"{settings.ADMIN_FRONTEND_URL}/",
+        "support_email": settings.SUPPORT_EMAIL,
+        "year": str(datetime.now(tz=timezone.utc).year),
+    }
+
+    success = email_sender.send_email(
+        to=email,
+        subject="New Sign-in Alert - Events2Go",
+        template_file="admin/login_alert.html",
+        context=context,
+    )
+
+    if not success:
+        logger.warning("Failed to send admin login alert email to %s", email)
+
+    return success
@@ -8,7 +8,7 @@ from pydantic import EmailStr
 
 from shared.core.config import settings
 from shared.core.logging_config import get_logger
-from shared.utils.email import email_sender
+from shared.utils.email import TemplatedEmail, email_sender
 
 logger = get_logger(__name__)
 
@@ -48,24 +48,13 @@ def send_password_reset_email(
     return success
 
 
-def send_user_verification_email(
+def build_user_verification_email(
     email: EmailStr,
     username: str,
     verification_token: str,
     expires_in_minutes: int = 60,
-) -> bool:
-    """
-    Send a welcome email to a new user with email verification link.
-
-    Args:
-        email: User's email address
-        username: User's username
-        verification_token: Email verification token
-        user_id: User's unique identifier
-
-    Returns:
-        bool: True if email was sent successfully, False otherwise
-    """
+) -> TemplatedEmail:
+    """The welcome email with an email verification link, unsent."""
     encoded_email = quote(email, safe="")
     verification_link = (
         f"{settings.USERS_APPLICATION_FRONTEND_URL}/VerifyEmail?email={encoded_email}"
@@ -81,13 +70,39 @@ def send_user_verification_email(
         "expires_in_minutes": expires_in_minutes,
     }
 
-    success = email_sender.send_email(
+    return TemplatedEmail(
         to=email,
         subject="Welcome to Events2Go - Verify Your Email",
         template_file="user/email_verification.html",
         context=context,
     )
 
+
+def send_user_verification_email(
+    email: EmailStr,
+    username: str,
+    verification_token: str,
+    expires_in_minutes: int = 60,
+) -> bool:
+    """
+    Send a welcome email to a new user with email verification link.
+
+    Args:
+        email: User's email address
+        username: User's username
+        verification_token: Email verification token
+        expires_in_minutes: Lifetime of the verification link
+
+    Returns:
+        bool: True if email was sent successfully, False otherwise
+    """
+    message = build_user_verification_email(
+        email, username, verification_token, expires_in_minutes
+    )
+    success = email_sender.send_email(
+        message.to, message.subject, message.template_file, message.context
+    )
+
     if not success:
         logger.warning("Failed to send welcome email to %s", email)
 
@@ -219,7 +234,7 @@ def send_booking_success_email(
     return success
 
 
-def send_new_booking_success_email(
+def build_new_booking_success_email(
     email: EmailStr,
     user_name: str,
     order_id: str,
@@ -241,33 +256,8 @@ def send_new_booking_success_email(
     support_url: Optional[str] = None,
     help_center_url: Optional[str] = None,
     logo_url: Optional[str] = None,
-) -> bool:
-    """
-    Send booking success confirmation email with detailed ticket info.
-
-    Args:
-        email: User's email address
-        user_name: Name of the user who made the booking
-        order_id: Unique booking order identifier
-        event_title: Title of the booked event
-        event_slug: Slug for event details page
-        event_date: Event date (string)
-        event_time: Event start time (string)
-        event_duration: Duration of the event (string)
-        event_location: Event venue
-        event_category: Event category name
-        booking_date: Date when booking was made
-        total_amount: Total order amount
-        seat_categories: List of seat categories booked with details
-        event_url: URL to view event details
-        my_bookings_url: URL to user's bookings page
-        support_url: URL to support page
-        help_center_url: URL to help center
-        logo_url: URL to company logo
-
-    Returns:
-        bool: True if email sent successfully, False otherwise
-    """
+) -> TemplatedEmail:
+    """The booking success email with detailed ticket info, unsent."""
 
     # Build a structured table-like representation for email template
     seat_categories_summary = [
@@ -304,13 +294,88 @@ def send_new_booking_success_email(
         "year": str(datetime.now(tz=timezone.utc).year),
     }
 
-    success = email_sender.send_email(
+    return TemplatedEmail(
         to=email,
         subject=f"🎉 Booking Confirmed - {event_title} | Events2Go",
         template_file="user/booking_success.html",
         context=context,
     )
 
+
+def send_new_booking_success_email(
+    email: EmailStr,
+    user_name: str,
+    order_id: str,
+    event_title: str,
+    event_slug: str,
+    event_date: str,
+    event_time: str,
+    event_duration: str,
+    event_location: str,
+    event_category: str,
+    booking_date: str,
+    total_amount: float,
+    total_discount: float,
+    seat_categories: List[
+        Dict[str, str]
+    ],  # list of {label, num_seats, price_per_seat, total_price}
+    event_url: Optional[str] = None,
+    my_bookings_url: Optional[str] = None,
+    support_url: Optional[str] = None,
+    help_center_url: Optional[str] = None,
+    logo_url: Optional[str] = None,
+) -> bool:
+    """
+    Send booking success confirmation email with detailed ticket info.
+
+    Args:
+        email: User's email address
+        user_name: Name of the user who made the booking
+        order_id: Unique booking order identifier
+        event_title: Title of the booked event
+        event_slug: Slug for event details page
+        event_date: Event date (string)
+        event_time: Event start time (string)
+        event_duration: Duration of the event (string)
+        event_location: Event venue
+        event_category: Event category name
+        booking_date: Date when booking was made
+        total_amount: Total order amount
+        seat_categories: List of seat categories booked with details
+        event_url: URL to view event details
+        my_bookings_url: URL to user's bookings page
+        support_url: URL to support page
+        help_center_url: URL to help center
+        logo_url: URL to company logo
+
+    Returns:
+        bool: True if email sent successfully, False otherwise
+    """
+    message = build_new_booking_success_email(
+        email=email,
+        user_name=user_name,
+        order_id=order_id,
+        event_title=event_title,
+        event_slug=event_slug,
+        event_date=event_date,
+        event_time=event_time,
+        event_duration=event_duration,
+        event_location=event_location,
+        event_category=event_category,
+        booking_date=booking_date,
+        total_amount=total_amount,
+        total_discount=total_discount,
+        seat_categories=seat_categories,
+        event_url=event_url,
+        my_bookings_url=my_bookings_url,
+        support_url=support_url,
+        help_center_url=help_center_url,
+        logo_url=logo_url,
+    )
+    success = email_sender.send_email(
+        message.to, message.subject, message.template_file, message.context
+    )
+
     if not success:
         logger.warning(
             "Failed to send booking success email to %s for order %s",
@@ -8,6 +8,7 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import Response
 
 from shared.core.logging_config import get_logger
+from shared.db.query_stats import start_request_query_stats
 
 logger = get_logger(__name__)
 
@@ -19,15 +20,22 @@ class ExecutionTimeMiddleware(BaseHTTPMiddleware):
         call_next: Callable[[Request], Awaitable[Response]],
     ) -> Response:
         start_time = time.perf_counter()
+        db_stats = start_request_query_stats(request)
         response = await call_next(request)
         total_time = time.perf_counter() - start_time
         logger.info(
-            "[API] %s %s completed in %.4f seconds",
+            "[API] %s %s completed in %.4f seconds "
+            "(%d queries, %d rows, %.4f seconds in DB)",
             request.method,
             request.url.path,
             total_time,
+            db_stats.statements,
+            db_stats.rows,
+            db_stats.db_time,
         )
         response.headers["X-API-Execution-Time"] = f"{total_time:.4f} seconds"
+        response.headers["X-DB-Queries"] = str(db_stats.statements)
+        response.headers["X-DB-Time"] = f"{db_stats.db_time:.4f} seconds"
         return response
 
 
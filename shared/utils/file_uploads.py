@@ -8,7 +8,11 @@ from shared.core.config import settings
 from shared.core.logging_config import get_logger
 from shared.utils.format_validators import is_valid_filename, sanitize_filename
 from shared.utils.secure_filename import secure_filename
-from shared.utils.upload_files import delete_file_from_s3, upload_file_to_s3
+from shared.utils.upload_files import (
+    MediaStorage,
+    delete_file_from_s3,
+    upload_file_to_s3,
+)
 
 logger = get_logger(__name__)
 
@@ -16,10 +20,12 @@ logger = get_logger(__name__)
 async def save_uploaded_file(
     file: UploadFile,
     relative_sub_path: str,
+    storage: Optional[MediaStorage] = None,
 ) -> str | None:
     """
     Validates and uploads a file to DigitalOcean Spaces.
     Returns the relative path for DB/API usage.
+    ``storage`` defaults to the shared ``media_storage`` client.
     """
     if not file or not file.filename:
         return None
@@ -52,6 +58,7 @@ async def save_uploaded_file(
             file_content=content,
             file_path=relative_path,
             file_type=file.content_type,
+            storage=storage,
         )
     except Exception as e:
         logger.exception("Failed to upload file to Spaces")
@@ -62,15 +69,18 @@ async def save_uploaded_file(
     return relative_path
 
 
-async def remove_file_if_exists(relative_path: str) -> None:
+async def remove_file_if_exists(
+    relative_path: str, storage: Optional[MediaStorage] = None
+) -> None:
     """
     Deletes a file from DigitalOcean Spaces if it exists.
+    ``storage`` defaults to the shared ``media_storage`` client.
     """
     if not relative_path:
         return
 
     try:
-        await delete_file_from_s3(relative_path)
+        await delete_file_from_s3(relative_path, storage=storage)
         logger.info("Successfully deleted file: %s", relative_path)
     except Exception as e:
         logger.warning("Failed to delete file '%s': %s", relative_path, e)
@@ -0,0 +1,260 @@
+"""
+IP geolocation for device sessions.
+
+Logins used to call ipapi.co inline, adding up to five seconds per login
+and getting rate-limited under load. Lookups now go through a
+``GeoResolver`` chosen by ``GEOIP_BACKEND``:
+
+- ``table``: ``RangeTableResolver``, a local CSV of IP ranges loaded once
+  into sorted arrays and searched with ``bisect`` (microseconds, offline).
+  Falls back to ``ipapi`` if the CSV is missing.
+- ``ipapi`` (default): ``IpApiResolver``, the hosted lookup over one shared
+  client. Pair it with ``GEOIP_ENRICH_IN_BACKGROUND`` so logins don't wait.
+- ``none``: no location.
+
+Whichever is used sits behind ``CachedResolver``, an LRU of recent IPs
+(``GEOIP_CACHE_SIZE``). Private and loopback addresses are never looked up.
+"""
+
+import asyncio
+import bisect
+import csv
+import ipaddress
+import os
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import httpx
+
+from shared.core.config import settings
+from shared.core.logging_config import get_logger
+from shared.utils.bounded_cache import BoundedTTLCache
+
+logger = get_logger(__name__)
+
+IPAddress = Union[ipaddress.IPv4Address, ipaddress.IPv6Address]
+Location = Dict[str, Any]
+
+# Columns of the range table after start_ip and end_ip; all optional
+LOCATION_FIELDS = (
+    "country_code",
+    "country",
+    "region",
+    "city",
+    "latitude",
+    "longitude",
+    "timezone",
+)
+IPAPI_URL = "https://ipapi.co/{ip}/json/"
+IPAPI_TIMEOUT_SECONDS = 5.0
+
+
+def parse_public_ip(ip_address: str) -> Optional[IPAddress]:
+    """The address if it is valid and globally routable, else None."""
+    try:
+        ip = ipaddress.ip_address(ip_address.strip())
+    except (AttributeError, ValueError):
+        return None
+    return ip if ip.is_global else None
+
+
+class GeoResolver(ABC):
+    """Source of locations for public IP addresses."""
+
+    async def load(self) -> None:
+        """Prepare the resolver (called at startup; optional)."""
+
+    @abstractmethod
+    async def lookup(self, ip: IPAddress) -> Optional[Location]:
+        """Location of ``ip``, or None if unknown."""
+
+    async def aclose(self) -> None:
+        """Release connections or other resources."""
+
+
+class NullResolver(GeoResolver):
+    async def lookup(self, ip: IPAddress) -> Optional[Location]:
+        return None
+
+
+class RangeTableResolver(GeoResolver):
+    """
+    Offline lookups in a CSV of IP ranges.
+
+    The file has a header row with ``start_ip`` and ``end_ip`` (inclusive)
+    plus any of ``LOCATION_FIELDS``; IPv4 and IPv6 rows may be mixed. Each
+    address family becomes three parallel sorted lists (range starts, range
+    ends, locations), and identical locations share one tuple.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._tables: Optional[
+            Dict[int, Tuple[List[int], List[int], List[tuple]]]
+        ] = None
+        self._lock = threading.Lock()
+
+    async def load(self) -> None:
+        if self._tables is None:
+            # Large tables take a while to parse; keep the loop responsive
+            await asyncio.to_thread(self._load)
+
+    def _load(self) -> None:
+        with self._lock:
+            if self._tables is not None:
+                return
+            with open(self.path, newline="", encoding="utf-8") as file:
+                self._tables = self._build(csv.DictReader(file))
+            logger.info(f"Loaded {len(self)} IP ranges from {self.path}")
+
+    @staticmethod
+    def _build(
+        rows: Iterable[Dict[str, str]],
+    ) -> Dict[int, Tuple[List[int], List[int], List[tuple]]]:
+        ranges: Dict[int, List[Tuple[int, int, tuple]]] = {4: [], 6: []}
+        interned: Dict[tuple, tuple] = {}
+        skipped = 0
+        for row in rows:
+            try:
+                start = ipaddress.ip_address(row["start_ip"].strip())
+                end = ipaddress.ip_address(row["end_ip"].strip())
+            except (KeyError, AttributeError, ValueError):
+                skipped += 1
+                continue
+            if start.version != end.version or end < start:
+                skipped += 1
+                continue
+            location = tuple(
+                row.get(field) or None for field in LOCATION_FIELDS
+            )
+            location = interned.setdefault(location, location)
+            ranges[start.version].append((int(start), int(end), location))
+        if skipped:
+            logger.warning(f"Skipped {skipped} malformed IP range rows")
+
+        tables = {}
+        for version, entries in ranges.items():
+            entries.sort(key=lambda entry: entry[0])
+            tables[version] = (
+                [entry[0] for entry in entries],
+                [entry[1] for entry in entries],
+                [entry[2] for entry in entries],
+            )
+        return tables
+
+    def find(self, ip: IPAddress) -> Optional[Location]:
+        if self._tables is None:
+            self._load()
+        starts, ends, locations = self._tables[ip.version]
+        value = int(ip)
+        index = bisect.bisect_right(starts, value) - 1
+        if index < 0 or value > ends[index]:
+            return None
+        return dict(zip(LOCATION_FIELDS, locations[index]))
+
+    async def lookup(self, ip: IPAddress) -> Optional[Location]:
+        if self._tables is None:
+            await self.load()
+        return self.find(ip)
+
+    def __len__(self) -> int:
+        if self._tables is None:
+            return 0
+        return sum(len(starts) for starts, _, _ in self._tables.values())
+
+
+class IpApiResolver(GeoResolver):
+    """Hosted ipapi.co lookups over one shared HTTP client."""
+
+    def __init__(self, timeout: float = IPAPI_TIMEOUT_SECONDS):
+        self.timeout = timeout
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def lookup(self, ip: IPAddress) -> Optional[Location]:
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=self.timeout)
+        response = await self._client.get(IPAPI_URL.format(ip=ip))
+        response.raise_for_status()
+        data = response.json()
+        if "error" in data:
+            return None
+        return {
+            "country_code": data.get("country_code"),
+            "country": data.get("country_name"),
+            "region": data.get("region"),
+            "city": data.get("city"),
+            "latitude": data.get("latitude"),
+            "longitude": data.get("longitude"),
+            "timezone": data.get("timezone"),
+            "isp": data.get("org"),
+            "as": data.get("asn"),
+        }
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+class CachedResolver(GeoResolver):
+    """LRU of recent lookups (unknown IPs included) in front of a resolver.
+
+    Failed lookups (exceptions) are not cached.
+    """
+
+    _MISSING = object()
+
+    def __init__(self, resolver: GeoResolver, maxsize: int):
+        self.resolver = resolver
+        self.maxsize = maxsize
+        self._entries: BoundedTTLCache[IPAddress, Optional[Location]] = (
+            BoundedTTLCache(maxsize)
+        )
+
+    @property
+    def hits(self) -> int:
+        return self._entries.hits
+
+    @property
+    def misses(self) -> int:
+        return self._entries.misses
+
+    async def load(self) -> None:
+        await self.resolver.load()
+
+    async def lookup(self, ip: IPAddress) -> Optional[Location]:
+        location = self._entries.get(ip, self._MISSING)
+        if location is self._MISSING:
+            location = await self.resolver.lookup(ip)
+            self._entries.put(ip, location)
+        return None if location is None else dict(location)
+
+    async def aclose(self) -> None:
+        await self.resolver.aclose()
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def create_geo_resolver(backend: str, database_path: str) -> GeoResolver:
+    if backend == "table":
+        if os.path.isfile(database_path):
+            resolver: GeoResolver = RangeTableResolver(database_path)
+        else:
+            logger.warning(
+                f"GeoIP database {database_path!r} not found; using ipapi"
+            )
+            resolver = IpApiResolver()
+    elif backend == "ipapi":
+        resolver = IpApiResolver()
+    else:
+        if backend != "none":
+            logger.warning(f"Unknown GEOIP_BACKEND {backend!r}; using none")
+        resolver = NullResolver()
+    return CachedResolver(resolver, settings.GEOIP_CACHE_SIZE)
+
+
+geo_resolver = create_geo_resolver(
+    settings.GEOIP_BACKEND, settings.GEOIP_DATABASE_PATH
+)
@@ -0,0 +1,117 @@
+"""
+Async bcrypt hashing off the event loop.
+
+A bcrypt hash or verify costs tens of milliseconds of CPU. Run inline in an
+async endpoint it stalls every other request on the worker, so a burst of
+logins freezes the whole service. ``PasswordHasher`` runs bcrypt in its own
+small thread pool instead (bcrypt releases the GIL while it works), which
+caps the CPU that password checks can take at ``PASSWORD_HASH_WORKERS``
+cores while the event loop keeps serving other requests.
+
+At most ``PASSWORD_HASH_MAX_PENDING`` operations may be running or queued
+at once; beyond that callers get 429 straight away instead of piling up
+behind minutes of queued bcrypt work.
+
+Hashes use ``BCRYPT_ROUNDS``. ``verify_and_update`` also returns a new hash
+when the stored one was made with another cost, so raising or lowering the
+setting rehashes users as they log in.
+
+Usage:
+    ok, new_hash = await password_hasher.verify_and_update(password, stored)
+    if ok and new_hash:
+        user.password_hash = new_hash
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, Tuple, TypeVar
+
+from fastapi import status
+from passlib.context import CryptContext
+
+from shared.core.api_response import api_response
+from shared.core.config import settings
+from shared.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class PasswordHasher:
+    """bcrypt in a bounded thread pool, with a cap on queued operations."""
+
+    def __init__(self, rounds: int, max_workers: int, max_pending: int):
+        self.context = CryptContext(
+            schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=rounds
+        )
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="bcrypt"
+        )
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        """Operations currently running or waiting for a worker."""
+        return self._pending
+
+    def _acquire(self) -> None:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                logger.warning(
+                    "Password hashing queue is full (%s pending)",
+                    self._pending,
+                )
+                api_response(
+                    status.HTTP_429_TOO_MANY_REQUESTS,
+                    message="Too many login attempts in progress. "
+                    "Please try again shortly.",
+                )
+            self._pending += 1
+
+    def _release(self) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        self._acquire()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self._release()
+
+    async def hash(self, password: str) -> str:
+        return await self._run(self.context.hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._run(self.context.verify, password, hashed_password)
+
+    async def verify_and_update(
+        self, password: str, hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Verify ``password``; rehash it if the stored cost is out of date.
+
+        Returns:
+            (matches, new hash or None when the stored hash is current)
+        """
+        return await self._run(
+            self.context.verify_and_update, password, hashed_password
+        )
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        return self.context.needs_update(hashed_password)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+password_hasher = PasswordHasher(
+    rounds=settings.BCRYPT_ROUNDS,
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
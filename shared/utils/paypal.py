@@ -0,0 +1,354 @@
+"""
+Async PayPal REST client.
+
+One pooled ``httpx.AsyncClient`` per PayPal client keeps connections to
+PayPal alive across requests, so a capture costs one round trip instead of
+a TLS handshake plus OAuth call, and never blocks the event loop.
+
+- OAuth tokens are cached; within ``token_refresh_margin`` seconds of
+  expiry the current token is still used while one background task fetches
+  the next (refresh-ahead). Concurrent callers never refresh twice.
+- Connection errors, timeouts, 429 and 5xx responses are retried with
+  exponential backoff and full jitter. POSTs carry a ``PayPal-Request-Id``
+  that stays the same across retries, so PayPal applies them once.
+- A 401 drops the cached token and retries once with a fresh one.
+
+Responses are returned with ``result`` as attribute objects, the shape the
+``paypalcheckoutsdk`` responses had, so existing helpers such as
+``extract_capture_id`` keep working.
+
+Usage:
+    client = AsyncPayPalClient(client_id, client_secret, SANDBOX_BASE_URL)
+    response = await client.capture_order(token)
+    print(response.result.status)
+"""
+
+import asyncio
+import random
+import time
+import uuid
+import weakref
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any, Dict, Mapping, Optional
+
+import httpx
+
+from shared.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+SANDBOX_BASE_URL = "https://api-m.sandbox.paypal.com"
+LIVE_BASE_URL = "https://api-m.paypal.com"
+
+_RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Every client ever created, so shutdown can close their pools
+_clients: "weakref.WeakSet[AsyncPayPalClient]" = weakref.WeakSet()
+
+
+class PayPalError(Exception):
+    """A PayPal API call failed after retries."""
+
+    def __init__(
+        self,
+        message: str,
+        status_code: Optional[int] = None,
+        details: Optional[Any] = None,
+    ):
+        super().__init__(message)
+        self.status_code = status_code
+        self.details = details
+
+
+@dataclass
+class PayPalResponse:
+    """Status code, headers and JSON body (as attribute objects)."""
+
+    status_code: int
+    headers: httpx.Headers
+    result: Any
+
+
+def _to_attributes(value: Any) -> Any:
+    """JSON -> nested SimpleNamespace/list, like paypalhttp responses."""
+    if isinstance(value, dict):
+        return SimpleNamespace(
+            **{key: _to_attributes(item) for key, item in value.items()}
+        )
+    if isinstance(value, list):
+        return [_to_attributes(item) for item in value]
+    return value
+
+
+class AsyncPayPalClient:
+    """Pooled, retrying PayPal Orders API client for one set of credentials."""
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        base_url: str = SANDBOX_BASE_URL,
+        timeout: float = 10.0,
+        connect_timeout: float = 3.0,
+        max_retries: int = 3,
+        backoff_base: float = 0.2,
+        backoff_max: float = 2.0,
+        token_refresh_margin: float = 300.0,
+        max_connections: int = 50,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.base_url = base_url.rstrip("/")
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.token_refresh_margin = token_refresh_margin
+
+        self._timeout = httpx.Timeout(timeout, connect=connect_timeout)
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        )
+        self._transport = transport
+        self._http: Optional[httpx.AsyncClient] = None
+
+        self._access_token: Optional[str] = None
+        self._token_expires_at = 0.0
+        self._token_lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+        _clients.add(self)
+
+    @property
+    def is_sandbox(self) -> bool:
+        return "sandbox" in self.base_url.lower()
+
+    def _client(self) -> httpx.AsyncClient:
+        # Created on first use so it binds to the running event loop
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self._timeout,
+                limits=self._limits,
+                transport=self._transport,
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close pooled connections and any in-flight token refresh."""
+        if self._refresh_task and not self._refresh_task.done():
+            self._refresh_task.cancel()
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    # ------------------------------------------------------------------ #
+    # OAuth token
+    # ------------------------------------------------------------------ #
+
+    async def _fetch_token(self) -> None:
+        response = await self._send(
+            "POST",
+            "/v1/oauth2/token",
+            data={"grant_type": "client_credentials"},
+            auth=(self.client_id, self.client_secret),
+        )
+        if response.status_code != 200:
+            raise PayPalError(
+                "PayPal authentication failed",
+                status_code=response.status_code,
+                details=response.text,
+            )
+        body = response.json()
+        self._access_token = body["access_token"]
+        self._token_expires_at = time.monotonic() + float(
+            body.get("expires_in", 0)
+        )
+
+    async def _refresh_token(self) -> None:
+        async with self._token_lock:
+            # Another caller may have refreshed while we waited
+            if time.monotonic() < self._token_expires_at - (
+                self.token_refresh_margin
+            ):
+                return
+            await self._fetch_token()
+
+    async def _background_refresh(self) -> None:
+        try:
+            await self._refresh_token()
+        except Exception as e:
+            logger.warning("PayPal token refresh-ahead failed: %s", e)
+
+    async def get_access_token(self) -> str:
+        """Cached token; refreshed in the background shortly before expiry
+        and synchronously only once it has actually expired."""
+        now = time.monotonic()
+        if self._access_token and now < self._token_expires_at:
+            refresh_at = self._token_expires_at - self.token_refresh_margin
+            if now >= refresh_at and (
+                self._refresh_task is None or self._refresh_task.done()
+            ):
+                self._refresh_task = asyncio.create_task(
+                    self._background_refresh()
+                )
+            return self._access_token
+
+        async with self._token_lock:
+            if not self._access_token or (
+                time.monotonic() >= self._token_expires_at
+            ):
+                await self._fetch_token()
+        assert self._access_token is not None
+        return self._access_token
+
+    def _invalidate_token(self, token: str) -> None:
+        if self._access_token == token:
+            self._access_token = None
+            self._token_expires_at = 0.0
+
+    # ------------------------------------------------------------------ #
+    # Transport with retries
+    # ------------------------------------------------------------------ #
+
+    def _backoff(self, attempt: int) -> float:
+        """Full jitter: uniform in [0, min(max, base * 2**attempt)]."""
+        return random.uniform(
+            0, min(self.backoff_max, self.backoff_base * (2**attempt))
+        )
+
+    async def _send(
+        self, method: str, path: str, **kwargs: Any
+    ) -> httpx.Response:
+        """Send with retries on transport errors, 429 and 5xx."""
+        attempt = 0
+        while True:
+            try:
+                response = await self._client().request(method, path, **kwargs)
+                if (
+                    response.status_code not in _RETRY_STATUS_CODES
+                    or attempt >= self.max_retries
+                ):
+                    return response
+                reason = f"HTTP {response.status_code}"
+            except httpx.TransportError as e:
+                if attempt >= self.max_retries:
+                    raise PayPalError(f"PayPal unreachable: {e}") from e
+                reason = type(e).__name__
+
+            delay = self._backoff(attempt)
+            attempt += 1
+            logger.warning(
+                "PayPal %s %s failed (%s), retry %d/%d in %.2fs",
+                method,
+                path,
+                reason,
+                attempt,
+                self.max_retries,
+                delay,
+            )
+            await asyncio.sleep(delay)
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        json: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> PayPalResponse:
+        """
+        Authenticated API call.
+
+        Raises:
+            PayPalError: For a non-2xx response or when PayPal is unreachable
+        """
+        request_headers = {"Content-Type": "application/json"}
+        if method.upper() == "POST":
+            # Same id on every retry, so PayPal processes the call once
+            request_headers["PayPal-Request-Id"] = str(uuid.uuid4())
+        request_headers.update(headers or {})
+
+        for auth_attempt in range(2):
+            token = await self.get_access_token()
+            response = await self._send(
+                method,
+                path,
+                json=json,
+                headers={
+                    **request_headers,
+                    "Authorization": f"Bearer {token}",
+                },
+            )
+            if response.status_code == 401 and auth_attempt == 0:
+                self._invalidate_token(token)
+                continue
+            break
+
+        body = response.json() if response.content else {}
+        if response.status_code >= 400:
+            raise PayPalError(
+                f"PayPal {method} {path} failed with {response.status_code}",
+                status_code=response.status_code,
+                details=body,
+            )
+        return PayPalResponse(
+            status_code=response.status_code,
+            headers=response.headers,
+            result=_to_attributes(body),
+        )
+
+    # ------------------------------------------------------------------ #
+    # Orders API
+    # ------------------------------------------------------------------ #
+
+    async def create_order(self, body: Dict[str, Any]) -> PayPalResponse:
+        return await self.request(
+            "POST",
+            "/v2/checkout/orders",
+            json=body,
+            headers={"Prefer": "return=representation"},
+        )
+
+    async def capture_order(
+        self, order_id: str, request_id: Optional[str] = None
+    ) -> PayPalResponse:
+        """Capture an approved order. Callers racing to capture the same
+        order should pass the same ``request_id`` so PayPal captures once
+        and replays the result to the others."""
+        headers = {"Prefer": "return=representation"}
+        if request_id:
+            headers["PayPal-Request-Id"] = request_id
+        return await self.request(
+            "POST", f"/v2/checkout/orders/{order_id}/capture", headers=headers
+        )
+
+    async def get_order(self, order_id: str) -> PayPalResponse:
+        return await self.request("GET", f"/v2/checkout/orders/{order_id}")
+
+    async def verify_webhook_signature(
+        self, headers: Mapping[str, str], event: Dict[str, Any], webhook_id: str
+    ) -> bool:
+        """Ask PayPal whether a webhook delivery really came from it."""
+        response = await self.request(
+            "POST",
+            "/v1/notifications/verify-webhook-signature",
+            json={
+                "auth_algo": headers.get("paypal-auth-algo"),
+                "cert_url": headers.get("paypal-cert-url"),
+                "transmission_id": headers.get("paypal-transmission-id"),
+                "transmission_sig": headers.get("paypal-transmission-sig"),
+                "transmission_time": headers.get("paypal-transmission-time"),
+                "webhook_id": webhook_id,
+                "webhook_event": event,
+            },
+        )
+        return (
+            getattr(response.result, "verification_status", None) == "SUCCESS"
+        )
+
+
+async def close_paypal_clients() -> None:
+    """Close the connection pools of every PayPal client (app shutdown)."""
+    for client in list(_clients):
+        await client.aclose()
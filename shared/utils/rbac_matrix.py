@@ -0,0 +1,186 @@
+"""
+In-memory role and permission matrix.
+
+Roles, permissions and their mappings change rarely but were read from the
+database on every organizer and admin call. Each worker now keeps them as
+a ``PermissionMatrix``: role id -> role name and role id -> granted
+permission names, so checks are dictionary lookups.
+
+The matrix is loaded at startup and versioned by the single
+``e2grbacversion`` row. The rbac_service endpoints commit through
+``commit_rbac_change``, which bumps the version in the same transaction and
+reloads this worker's matrix; other workers notice the new version within
+``RBAC_MATRIX_REFRESH_SECONDS`` (``rbac_matrix_refresh_job``, run in every
+worker by ``schedulers.worker_tasks``), or sooner when they meet a role id
+they do not know.
+
+Only active rows (status ``False``) grant permissions. Role names resolve
+for inactive roles too, as the database lookups they replace did.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Optional
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import func
+
+from shared.core.logging_config import get_logger
+from shared.db.models import Permission, RbacVersion, Role, RolePermission
+
+logger = get_logger(__name__)
+
+VERSION_ROW_ID = 1
+
+
+@dataclass(frozen=True)
+class PermissionMatrix:
+    """Immutable snapshot of roles and their active permissions."""
+
+    version: int
+    # role_id -> role_name
+    role_names: Dict[str, str] = field(default_factory=dict)
+    # role_id -> upper-case permission names
+    grants: Dict[str, FrozenSet[str]] = field(default_factory=dict)
+    # lower-case role_name -> role_id
+    role_ids: Dict[str, str] = field(default_factory=dict)
+
+
+class RbacMatrixCache:
+    """The current ``PermissionMatrix`` of this worker, swapped on reload."""
+
+    def __init__(self):
+        self._matrix: Optional[PermissionMatrix] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._matrix is not None
+
+    @property
+    def version(self) -> Optional[int]:
+        return self._matrix.version if self._matrix else None
+
+    def __contains__(self, role_id: str) -> bool:
+        return self._matrix is not None and role_id in self._matrix.role_names
+
+    def role_name(self, role_id: Optional[str]) -> Optional[str]:
+        if self._matrix is None or role_id is None:
+            return None
+        return self._matrix.role_names.get(role_id)
+
+    def role_id(self, role_name: str) -> Optional[str]:
+        if self._matrix is None:
+            return None
+        return self._matrix.role_ids.get(role_name.lower())
+
+    def permissions(self, role_id: Optional[str]) -> FrozenSet[str]:
+        if self._matrix is None or role_id is None:
+            return frozenset()
+        return self._matrix.grants.get(role_id, frozenset())
+
+    def has_permission(
+        self, role_id: Optional[str], permission_name: str
+    ) -> bool:
+        return permission_name.upper() in self.permissions(role_id)
+
+    async def load(self, db: AsyncSession) -> PermissionMatrix:
+        """Read every role and active grant and replace the matrix."""
+        # Read the version first: a change committed while loading leaves
+        # a newer version behind, so the next refresh loads again
+        version = await read_rbac_version(db)
+        roles = (await db.execute(select(Role.role_id, Role.role_name))).all()
+        grants = (
+            await db.execute(
+                select(RolePermission.role_id, Permission.permission_name)
+                .join(
+                    Permission,
+                    Permission.permission_id == RolePermission.permission_id,
+                )
+                .join(Role, Role.role_id == RolePermission.role_id)
+                .where(
+                    RolePermission.rp_status.is_(False),
+                    Permission.permission_status.is_(False),
+                    Role.role_status.is_(False),
+                )
+            )
+        ).all()
+
+        granted: Dict[str, set] = {}
+        for role_id, permission_name in grants:
+            granted.setdefault(role_id, set()).add(permission_name.upper())
+        matrix = PermissionMatrix(
+            version=version,
+            role_names={role_id: name for role_id, name in roles},
+            grants={
+                role_id: frozenset(names) for role_id, names in granted.items()
+            },
+            role_ids={name.lower(): role_id for role_id, name in roles},
+        )
+        self._matrix = matrix
+        logger.info(
+            f"Loaded RBAC matrix version {version}: {len(roles)} roles, "
+            f"{len(grants)} grants"
+        )
+        return matrix
+
+    async def refresh(self, db: AsyncSession) -> bool:
+        """Reload if the stored version moved. Returns: True if reloaded."""
+        if self._matrix is not None:
+            if await read_rbac_version(db) == self._matrix.version:
+                return False
+        await self.load(db)
+        return True
+
+    def clear(self) -> None:
+        self._matrix = None
+
+
+rbac_matrix = RbacMatrixCache()
+
+
+async def read_rbac_version(db: AsyncSession) -> int:
+    result = await db.execute(
+        select(RbacVersion.version).where(RbacVersion.id == VERSION_ROW_ID)
+    )
+    return result.scalar() or 0
+
+
+async def bump_rbac_version(
+    db: AsyncSession, seed_checksum: Optional[str] = None
+) -> None:
+    """Move the version on, as part of the caller's transaction."""
+    values = {"version": RbacVersion.version + 1, "updated_at": func.now()}
+    if seed_checksum is not None:
+        values["seed_checksum"] = seed_checksum
+    await db.execute(
+        insert(RbacVersion)
+        .values(id=VERSION_ROW_ID, version=1, seed_checksum=seed_checksum)
+        .on_conflict_do_update(index_elements=[RbacVersion.id], set_=values)
+    )
+
+
+async def commit_rbac_change(db: AsyncSession) -> None:
+    """
+    Commit a change to roles or permissions and reload the matrix.
+
+    Other workers reload when they next see the bumped version.
+    """
+    await bump_rbac_version(db)
+    await db.commit()
+    try:
+        await rbac_matrix.load(db)
+    except Exception as e:
+        # The change is committed; the periodic refresh will catch up
+        logger.error(f"RBAC matrix reload failed: {e}")
+
+
+async def get_role_name(
+    db: AsyncSession, role_id: Optional[str]
+) -> Optional[str]:
+    """Role name from the matrix, refreshing it once for unknown ids."""
+    if role_id is None:
+        return None
+    if role_id not in rbac_matrix:
+        await rbac_matrix.refresh(db)
+    return rbac_matrix.role_name(role_id)
@@ -0,0 +1,139 @@
+"""
+Write-behind buffer for device-session activity.
+
+Every authenticated request checks that its token's device session is
+still active and bumps the session's ``last_used_at``. Done directly, that
+is a SELECT plus a write transaction per request, even for read-only
+endpoints. ``SessionActivityBuffer`` instead:
+
+- remembers sessions found active for ``SESSION_ACTIVE_CACHE_SECONDS``, so
+  repeat requests skip the SELECT;
+- keeps the latest ``last_used_at`` per session in memory and writes all of
+  them in one ``UPDATE ... FROM (VALUES ...)`` every
+  ``SESSION_ACTIVITY_FLUSH_SECONDS`` (``session_activity_flush_job``, run in
+  every worker by ``schedulers.worker_tasks``).
+
+Logout, revoke and terminate paths call ``invalidate`` so this process
+stops trusting the session at once. Other worker processes notice within
+``SESSION_ACTIVE_CACHE_SECONDS``, when their cached entry expires.
+"""
+
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Tuple, Type, Union
+
+from sqlalchemy import DateTime, Integer, column, or_, update, values
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from shared.core.config import settings
+from shared.db.models import AdminUserDeviceSession, UserDeviceSession
+from shared.utils.bounded_cache import BoundedTTLCache
+
+DeviceSessionModel = Type[Union[AdminUserDeviceSession, UserDeviceSession]]
+
+# Active sessions remembered per process; least recently used drop first
+ACTIVE_CACHE_SIZE = 10000
+
+
+class SessionActivityBuffer:
+    """Active-session cache and pending ``last_used_at`` writes for a model."""
+
+    def __init__(
+        self,
+        model: DeviceSessionModel,
+        ttl_seconds: float,
+        maxsize: int = ACTIVE_CACHE_SIZE,
+    ):
+        self.model = model
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        # (session_id, user_id) recently found active
+        self._active: BoundedTTLCache[Tuple[int, str], bool] = BoundedTTLCache(
+            maxsize, ttl_seconds
+        )
+        # session_id -> latest last_used_at not yet written
+        self._pending: Dict[int, datetime] = {}
+        self._lock = threading.Lock()
+
+    def is_active(self, session_id: int, user_id: str) -> bool:
+        """True if the session was recently found active (cache hit)."""
+        return self._active.get((session_id, user_id), False)
+
+    def mark_active(self, session_id: int, user_id: str) -> None:
+        self._active.put((session_id, user_id), True)
+
+    def touch(self, session_id: int) -> None:
+        """Record a use of the session, written at the next flush."""
+        with self._lock:
+            self._pending[session_id] = datetime.now(timezone.utc)
+
+    def invalidate(self, session_ids: Iterable[int]) -> None:
+        """Stop treating these sessions as active (logout, revoke)."""
+        session_ids = set(session_ids)
+        self._active.discard(lambda key: key[0] in session_ids)
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def clear(self) -> None:
+        self._active.clear()
+        with self._lock:
+            self._pending.clear()
+
+    async def flush(self, db: AsyncSession) -> int:
+        """
+        Write buffered ``last_used_at`` values in one statement.
+
+        Returns:
+            Number of sessions written.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+
+        activity = values(
+            column("session_id", Integer),
+            column("last_used_at", DateTime(timezone=True)),
+            name="activity",
+        ).data(sorted(pending.items()))
+        try:
+            await db.execute(
+                update(self.model)
+                .where(
+                    self.model.session_id == activity.c.session_id,
+                    # Never move last_used_at backwards
+                    or_(
+                        self.model.last_used_at.is_(None),
+                        self.model.last_used_at < activity.c.last_used_at,
+                    ),
+                )
+                .values(last_used_at=activity.c.last_used_at)
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            # Keep the values (unless a newer use replaced them) for next time
+            with self._lock:
+                for session_id, used_at in pending.items():
+                    self._pending.setdefault(session_id, used_at)
+            raise
+        return len(pending)
+
+
+admin_session_activity = SessionActivityBuffer(
+    AdminUserDeviceSession, settings.SESSION_ACTIVE_CACHE_SECONDS
+)
+user_session_activity = SessionActivityBuffer(
+    UserDeviceSession, settings.SESSION_ACTIVE_CACHE_SECONDS
+)
+
+
+async def flush_session_activity(db: AsyncSession) -> int:
+    """Flush both buffers. Returns: number of sessions written."""
+    written = 0
+    for buffer in (admin_session_activity, user_session_activity):
+        written += await buffer.flush(db)
+    return written
@@ -1,21 +1,277 @@
 """
 Token blacklist implementation for JWT token revocation.
+
+Revoked token ids (``jti``) live in a ``RevocationBackend`` chosen by
+``TOKEN_REVOCATION_BACKEND``:
+
+- ``memory``: ``InMemoryRevocationStore``, for a single worker process.
+- ``postgres``: ``PostgresRevocationStore``, shared by every worker through
+  the ``e2grevoked_tokens`` table. Each worker answers lookups from memory
+  behind a Bloom filter, so the common "not revoked" case costs a few bit
+  probes, and picks up other workers' revocations every
+  ``TOKEN_REVOCATION_SYNC_SECONDS`` (``token_revocation_sync_job``, run in
+  every worker by ``schedulers.worker_tasks``).
+
+Entries expire lazily with the token: a min-heap ordered by expiry is
+popped only as far as the entries that have run out, so neither adding nor
+checking a token scans the whole blacklist.
 """
 
+import hashlib
+import heapq
+import math
+import threading
 import time
-from datetime import datetime
-from typing import Dict
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from typing import Dict, List, Tuple
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from shared.core.config import settings
 from shared.core.logging_config import get_logger
+from shared.db.models import RevokedToken
 
 logger = get_logger(__name__)
 
-# In-memory blacklist storage
-# Structure: {token_jti: expiration_timestamp}
-_token_blacklist: Dict[str, float] = {}
+# Revoked tokens the Bloom filter is sized for before it is rebuilt larger
+BLOOM_CAPACITY = 100_000
+BLOOM_ERROR_RATE = 0.001
+# Rows re-read below the highest id seen, for inserts committed out of order
+SYNC_OVERLAP_IDS = 256
+# Expired rows are deleted from the shared table this often
+PURGE_INTERVAL_SECONDS = 3600
+
+
+class RevocationBackend(ABC):
+    """Where revoked token ids are kept until their tokens expire."""
+
+    @abstractmethod
+    def add(self, jti: str, expires_at: float) -> None:
+        """Revoke ``jti`` until the Unix time ``expires_at``."""
+
+    @abstractmethod
+    def contains(self, jti: str) -> bool:
+        """True if ``jti`` is revoked and not yet expired."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    async def sync(self, db: AsyncSession) -> int:
+        """
+        Exchange revocations with other workers, if the backend shares any.
+
+        Returns:
+            Number of revocations learned from other workers.
+        """
+        return 0
+
+
+class InMemoryRevocationStore(RevocationBackend):
+    """Dict of revoked ids with a heap of expiries for lazy cleanup."""
+
+    def __init__(self):
+        self._entries: Dict[str, float] = {}
+        self._expiries: List[Tuple[float, str]] = []
+        self._lock = threading.Lock()
+
+    def add(self, jti: str, expires_at: float) -> None:
+        with self._lock:
+            if self._entries.get(jti, 0) >= expires_at:
+                return
+            self._entries[jti] = expires_at
+            heapq.heappush(self._expiries, (expires_at, jti))
+            self._expire(time.time())
+
+    def contains(self, jti: str) -> bool:
+        with self._lock:
+            self._expire(time.time())
+            return jti in self._entries
+
+    def items(self) -> List[Tuple[str, float]]:
+        with self._lock:
+            self._expire(time.time())
+            return list(self._entries.items())
+
+    def _expire(self, now: float) -> None:
+        while self._expiries and self._expiries[0][0] <= now:
+            expires_at, jti = heapq.heappop(self._expiries)
+            # Skip heap entries superseded by a later add of the same id
+            if self._entries.get(jti) == expires_at:
+                del self._entries[jti]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._expiries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._expire(time.time())
+            return len(self._entries)
+
+
+class BloomFilter:
+    """Bit-array set with no false negatives and no removal."""
+
+    def __init__(self, capacity: int, error_rate: float = BLOOM_ERROR_RATE):
+        self.capacity = capacity
+        self.size = max(
+            8, int(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (first + i * second) % self.size
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+
+class PostgresRevocationStore(RevocationBackend):
+    """
+    Revocations shared through ``e2grevoked_tokens``.
+
+    ``add`` takes effect in this worker at once and is written to the table
+    at the next ``sync``, which also reads the rows other workers wrote
+    since the last one. Lookups never touch the database.
+    """
+
+    def __init__(self, bloom_capacity: int = BLOOM_CAPACITY):
+        self._known = InMemoryRevocationStore()
+        self._bloom = BloomFilter(bloom_capacity)
+        # jti -> expiry not yet written to the table
+        self._pending: Dict[str, float] = {}
+        self._last_id = 0
+        self._purged_at = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, jti: str, expires_at: float) -> None:
+        self._remember(jti, expires_at)
+        with self._lock:
+            self._pending[jti] = expires_at
+
+    def contains(self, jti: str) -> bool:
+        # Most tokens were never revoked; the filter rules them out
+        if jti not in self._bloom:
+            return False
+        return self._known.contains(jti)
+
+    def __len__(self) -> int:
+        return len(self._known)
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def _remember(self, jti: str, expires_at: float) -> None:
+        self._known.add(jti, expires_at)
+        with self._lock:
+            self._bloom.add(jti)
+            # Expired ids stay set in the filter; rebuild from live ones
+            if self._bloom.count > self._bloom.capacity:
+                live = self._known.items()
+                bloom = BloomFilter(max(self._bloom.capacity, 2 * len(live)))
+                for live_jti, _ in live:
+                    bloom.add(live_jti)
+                self._bloom = bloom
+
+    async def sync(self, db: AsyncSession) -> int:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        try:
+            if pending:
+                await db.execute(
+                    insert(RevokedToken)
+                    .values(
+                        [
+                            {
+                                "jti": jti,
+                                "expires_at": datetime.fromtimestamp(
+                                    expires_at, timezone.utc
+                                ),
+                            }
+                            for jti, expires_at in pending.items()
+                        ]
+                    )
+                    .on_conflict_do_nothing(index_elements=["jti"])
+                )
+            rows = (
+                await db.execute(
+                    select(
+                        RevokedToken.id,
+                        RevokedToken.jti,
+                        RevokedToken.expires_at,
+                    )
+                    .where(
+                        RevokedToken.id > self._last_id - SYNC_OVERLAP_IDS,
+                        RevokedToken.expires_at > func.now(),
+                    )
+                    .order_by(RevokedToken.id)
+                )
+            ).all()
+            purge = time.monotonic() - self._purged_at > PURGE_INTERVAL_SECONDS
+            if purge:
+                await db.execute(
+                    delete(RevokedToken).where(
+                        RevokedToken.expires_at <= func.now()
+                    )
+                )
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            # Keep unwritten revocations (unless re-added since) for next time
+            with self._lock:
+                for jti, expires_at in pending.items():
+                    self._pending.setdefault(jti, expires_at)
+            raise
+
+        if purge:
+            self._purged_at = time.monotonic()
+        learned = 0
+        for row_id, jti, expires_at in rows:
+            self._last_id = max(self._last_id, row_id)
+            if not self._known.contains(jti):
+                self._remember(jti, expires_at.timestamp())
+                learned += 1
+        return learned
+
+    def clear(self) -> None:
+        self._known.clear()
+        with self._lock:
+            self._bloom = BloomFilter(self._bloom.capacity)
+            self._pending.clear()
+            self._last_id = 0
 
-# Cleanup interval in seconds
-_CLEANUP_INTERVAL = 3600  # 1 hour
+
+def create_revocation_store(backend: str) -> RevocationBackend:
+    if backend == "postgres":
+        return PostgresRevocationStore()
+    if backend != "memory":
+        logger.warning(
+            f"Unknown TOKEN_REVOCATION_BACKEND {backend!r}; using memory"
+        )
+    return InMemoryRevocationStore()
+
+
+revocation_store = create_revocation_store(settings.TOKEN_REVOCATION_BACKEND)
 
 
 def add_to_blacklist(jti: str, exp_timestamp: datetime) -> None:
@@ -26,16 +282,11 @@ def add_to_blacklist(jti: str, exp_timestamp: datetime) -> None:
         jti: The token's unique identifier (jti claim)
         exp_timestamp: The token's expiration time
     """
-    # Convert datetime to Unix timestamp
-    exp_unix_time = exp_timestamp.timestamp()
-    _token_blacklist[jti] = exp_unix_time
+    revocation_store.add(jti, exp_timestamp.timestamp())
     logger.info(
         f"Token {jti[:8]}... added to blacklist until {exp_timestamp.isoformat()}"
     )
 
-    # Perform cleanup if needed
-    _cleanup_expired()
-
 
 def is_blacklisted(jti: str) -> bool:
     """
@@ -47,43 +298,7 @@ def is_blacklisted(jti: str) -> bool:
     Returns:
         bool: True if token is blacklisted, False otherwise
     """
-    # If token is not in blacklist, it's not blacklisted
-    if jti not in _token_blacklist:
-        return False
-
-    # If token is in blacklist but expired, remove it and return False
-    current_time = time.time()
-    if _token_blacklist[jti] < current_time:
-        del _token_blacklist[jti]
-        return False
-
-    # Token is in blacklist and not expired
-    return True
-
-
-def _cleanup_expired() -> None:
-    """
-    Remove expired tokens from the blacklist.
-    This is called periodically to prevent memory leaks.
-    """
-    # Get current time as Unix timestamp
-    current_time = time.time()
-
-    # Find expired tokens
-    expired_jtis = [
-        jti
-        for jti, exp_time in _token_blacklist.items()
-        if exp_time < current_time
-    ]
-
-    # Remove expired tokens
-    for jti in expired_jtis:
-        del _token_blacklist[jti]
-
-    if expired_jtis:
-        logger.info(
-            f"Cleaned up {len(expired_jtis)} expired tokens from blacklist"
-        )
+    return revocation_store.contains(jti)
 
 
 def get_blacklist_size() -> int:
@@ -93,4 +308,9 @@ def get_blacklist_size() -> int:
     Returns:
         int: Number of tokens in the blacklist
     """
-    return len(_token_blacklist)
+    return len(revocation_store)
+
+
+async def sync_revocations(db: AsyncSession) -> int:
+    """Share revocations with other workers. Returns: number learned."""
+    return await revocation_store.sync(db)
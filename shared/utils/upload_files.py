@@ -1,8 +1,28 @@
+"""
+Media uploads to DigitalOcean Spaces (S3-compatible).
+
+Every upload and delete used to open its own ``aioboto3.Session`` and S3
+client: credential resolution, endpoint setup and a TLS handshake per
+image. ``MediaStorage`` holds one client, started in ``lifespan`` and
+closed on shutdown, whose connection pool (``SPACES_MAX_POOL_CONNECTIONS``)
+is shared by all requests of the worker. Calls made before ``start``, or
+from another event loop (``remove_file_if_exists_sync``), fall back to a
+short-lived client.
+
+``media_storage.stats()`` reports uploads in flight, failures and recent
+upload latency; the admin system health endpoint includes it.
+"""
+
+import asyncio
 import mimetypes
-from typing import Optional, Tuple
+import time
+from collections import deque
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Optional, Tuple
 
 import aioboto3
 import filetype
+from aiobotocore.config import AioConfig
 from botocore.exceptions import ClientError
 from fastapi import HTTPException, UploadFile
 
@@ -11,6 +31,9 @@ from shared.core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Upload durations kept for the latency figures in stats()
+LATENCY_SAMPLES = 1024
+
 
 def get_file_mime_type(file: UploadFile) -> Tuple[str, bytes]:
     """
@@ -51,10 +74,186 @@ def get_mime_type_from_bytes(file_content: bytes) -> str:
     return kind.mime if kind else "application/octet-stream"
 
 
+class MediaStorage:
+    """One pooled S3 client for the media bucket, shared by all requests."""
+
+    def __init__(
+        self,
+        bucket: str,
+        public_url: str,
+        region_name: str,
+        endpoint_url: str,
+        access_key_id: str,
+        secret_access_key: str,
+        max_connections: int,
+        addressing_style: str = "auto",
+    ):
+        self.bucket = bucket
+        self.public_url = public_url
+        self.max_connections = max_connections
+        self._client_kwargs: Dict[str, Any] = {
+            "region_name": region_name,
+            "endpoint_url": endpoint_url,
+            "aws_access_key_id": access_key_id,
+            "aws_secret_access_key": secret_access_key,
+            "config": AioConfig(
+                max_pool_connections=max_connections,
+                s3={"addressing_style": addressing_style},
+                # S3-compatible stores reject the newer default checksums
+                request_checksum_calculation="when_required",
+                response_checksum_validation="when_required",
+            ),
+        }
+        self._session = aioboto3.Session()
+        self._client: Any = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._exit_stack: Optional[AsyncExitStack] = None
+
+        self.in_flight = 0
+        self.uploads = 0
+        self.upload_failures = 0
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+    @property
+    def started(self) -> bool:
+        return self._client is not None
+
+    async def start(self) -> None:
+        """Create the shared client (called from lifespan)."""
+        if self._client is not None:
+            return
+        exit_stack = AsyncExitStack()
+        self._client = await exit_stack.enter_async_context(
+            self._session.client("s3", **self._client_kwargs)
+        )
+        self._exit_stack = exit_stack
+        self._loop = asyncio.get_running_loop()
+
+    async def aclose(self) -> None:
+        exit_stack, self._exit_stack = self._exit_stack, None
+        self._client = self._loop = None
+        if exit_stack is not None:
+            await exit_stack.aclose()
+
+    @asynccontextmanager
+    async def client(self) -> AsyncIterator[Any]:
+        """The shared client, or a short-lived one if it cannot be used."""
+        if (
+            self._client is not None
+            and self._loop is asyncio.get_running_loop()
+        ):
+            yield self._client
+            return
+        async with self._session.client("s3", **self._client_kwargs) as client:
+            yield client
+
+    async def upload(
+        self, file_content: bytes, file_path: str, content_type: str
+    ) -> str:
+        """Store the object publicly readable; returns its URL."""
+        self.in_flight += 1
+        start = time.perf_counter()
+        try:
+            async with self.client() as s3_client:
+                await s3_client.put_object(
+                    Bucket=self.bucket,
+                    Key=file_path,
+                    Body=file_content,
+                    ContentType=content_type,
+                    ACL="public-read",
+                )
+        except Exception:
+            self.upload_failures += 1
+            raise
+        finally:
+            self.in_flight -= 1
+        self.uploads += 1
+        self._latencies.append(time.perf_counter() - start)
+        return f"{self.public_url}/{file_path}"
+
+    async def delete(self, key: str, delete_folder: bool = False) -> bool:
+        """
+        Delete one object, or every object under ``key/``.
+
+        Returns False when a folder had nothing in it.
+        """
+        async with self.client() as s3_client:
+            if not delete_folder:
+                logger.info("Attempting to delete file: %s", key)
+                await s3_client.delete_object(Bucket=self.bucket, Key=key)
+                logger.info("File deleted successfully: %s", key)
+                return True
+
+            prefix = key.rstrip("/") + "/"
+            logger.info("Deleting all files under: %s", prefix)
+            continuation_token = None
+            deleted = False
+
+            while True:
+                list_kwargs = {
+                    "Bucket": self.bucket,
+                    "Prefix": prefix,
+                    "MaxKeys": 1000,
+                }
+                if continuation_token:
+                    list_kwargs["ContinuationToken"] = continuation_token
+
+                response = await s3_client.list_objects_v2(**list_kwargs)
+                contents = response.get("Contents", [])
+
+                if not contents:
+                    break
+
+                delete_keys = [{"Key": obj["Key"]} for obj in contents]
+                await s3_client.delete_objects(
+                    Bucket=self.bucket,
+                    Delete={"Objects": delete_keys},
+                )
+                logger.info(
+                    "Deleted %d objects under %s", len(delete_keys), prefix
+                )
+                deleted = True
+
+                if not response.get("IsTruncated"):
+                    break
+                continuation_token = response.get("NextContinuationToken")
+
+            return deleted
+
+    def stats(self) -> Dict[str, Any]:
+        latencies = sorted(self._latencies)
+        if latencies:
+            avg_ms = sum(latencies) / len(latencies) * 1000
+            p95_ms = latencies[int(len(latencies) * 0.95)] * 1000
+        else:
+            avg_ms = p95_ms = 0.0
+        return {
+            "started": self.started,
+            "max_connections": self.max_connections,
+            "in_flight": self.in_flight,
+            "uploads": self.uploads,
+            "upload_failures": self.upload_failures,
+            "avg_upload_ms": round(avg_ms, 1),
+            "p95_upload_ms": round(p95_ms, 1),
+        }
+
+
+media_storage = MediaStorage(
+    bucket=settings.SPACES_BUCKET_NAME,
+    public_url=settings.spaces_public_url,
+    region_name=settings.SPACES_REGION_NAME,
+    endpoint_url=settings.SPACES_ENDPOINT_URL,
+    access_key_id=settings.SPACES_ACCESS_KEY_ID,
+    secret_access_key=settings.SPACES_SECRET_ACCESS_KEY,
+    max_connections=settings.SPACES_MAX_POOL_CONNECTIONS,
+)
+
+
 async def upload_file_to_s3(
     file_content: bytes,
     file_path: str,
     file_type: Optional[str] = None,
+    storage: Optional[MediaStorage] = None,
 ) -> str:
     """
     Upload a file asynchronously to DigitalOcean Spaces (S3-compatible).
@@ -64,6 +263,8 @@ async def upload_file_to_s3(
         file_path (str): The path where the file will be stored in the bucket.
         file_type (Optional[str]): MIME type of the file. If not provided,
         it's auto-detected.
+        storage (Optional[MediaStorage]): Client to use; defaults to the
+        shared ``media_storage``.
 
     Returns:
         str: Public URL to access the uploaded file.
@@ -72,57 +273,44 @@ async def upload_file_to_s3(
         HTTPException: Raised if the upload fails.
     """
     content_type = file_type or get_mime_type_from_bytes(file_content)
-
-    session = aioboto3.Session()
-    async with session.client(
-        "s3",
-        region_name=settings.SPACES_REGION_NAME,
-        endpoint_url=settings.SPACES_ENDPOINT_URL,
-        aws_access_key_id=settings.SPACES_ACCESS_KEY_ID,
-        aws_secret_access_key=settings.SPACES_SECRET_ACCESS_KEY,
-    ) as s3_client:
-        try:
-            await s3_client.put_object(
-                Bucket=settings.SPACES_BUCKET_NAME,
-                Key=file_path,
-                Body=file_content,
-                ContentType=content_type,
-                ACL="public-read",
-            )
-
-            file_url = f"{settings.spaces_public_url}/{file_path}"
-            logger.info(
-                "File uploaded successfully",
-                extra={
-                    "file_url": file_url,
-                    "file_path": file_path,
-                    "content_type": content_type,
-                },
-            )
-            return file_url
-
-        except ClientError as e:
-            logger.error(
-                "S3 upload error",
-                exc_info=True,
-                extra={"error": str(e), "file_path": file_path},
-            )
-            raise HTTPException(
-                status_code=500, detail=f"Failed to upload file: {str(e)}"
-            ) from e
-        except Exception as e:
-            logger.error(
-                "Unexpected error during upload",
-                exc_info=True,
-                extra={"error": str(e), "file_path": file_path},
-            )
-            raise HTTPException(
-                status_code=500, detail="Unexpected error during file upload."
-            ) from e
+    storage = storage or media_storage
+
+    try:
+        file_url = await storage.upload(file_content, file_path, content_type)
+        logger.info(
+            "File uploaded successfully",
+            extra={
+                "file_url": file_url,
+                "file_path": file_path,
+                "content_type": content_type,
+            },
+        )
+        return file_url
+
+    except ClientError as e:
+        logger.error(
+            "S3 upload error",
+            exc_info=True,
+            extra={"error": str(e), "file_path": file_path},
+        )
+        raise HTTPException(
+            status_code=500, detail=f"Failed to upload file: {str(e)}"
+        ) from e
+    except Exception as e:
+        logger.error(
+            "Unexpected error during upload",
+            exc_info=True,
+            extra={"error": str(e), "file_path": file_path},
+        )
+        raise HTTPException(
+            status_code=500, detail="Unexpected error during file upload."
+        ) from e
 
 
 async def delete_file_from_s3(
-    relative_path: str, delete_folder: bool = False
+    relative_path: str,
+    delete_folder: bool = False,
+    storage: Optional[MediaStorage] = None,
 ) -> bool:
     """
     Delete a file or folder from DigitalOcean Spaces using a relative path only.
@@ -130,6 +318,8 @@ async def delete_file_from_s3(
     Args:
         relative_path (str): Relative S3 key (e.g., 'uploads/images/file.jpg').
         delete_folder (bool): If True, deletes all files under that folder prefix.
+        storage (Optional[MediaStorage]): Client to use; defaults to the
+        shared ``media_storage``.
 
     Returns:
         bool: True if deleted successfully, False if nothing found (folder delete).
@@ -141,69 +331,18 @@ async def delete_file_from_s3(
     if not key:
         raise HTTPException(status_code=400, detail="Invalid file path")
 
-    session = aioboto3.Session()
-    async with session.client(
-        "s3",
-        region_name=settings.SPACES_REGION_NAME,
-        endpoint_url=settings.SPACES_ENDPOINT_URL,
-        aws_access_key_id=settings.SPACES_ACCESS_KEY_ID,
-        aws_secret_access_key=settings.SPACES_SECRET_ACCESS_KEY,
-    ) as s3_client:
-        try:
-            if delete_folder:
-                prefix = key.rstrip("/") + "/"
-                logger.info("Deleting all files under: %s", prefix)
-                continuation_token = None
-                deleted = False
-
-                while True:
-                    list_kwargs = {
-                        "Bucket": settings.SPACES_BUCKET_NAME,
-                        "Prefix": prefix,
-                        "MaxKeys": 1000,
-                    }
-                    if continuation_token:
-                        list_kwargs["ContinuationToken"] = continuation_token
-
-                    response = await s3_client.list_objects_v2(**list_kwargs)
-                    contents = response.get("Contents", [])
-
-                    if not contents:
-                        break
-
-                    delete_keys = [{"Key": obj["Key"]} for obj in contents]
-                    await s3_client.delete_objects(
-                        Bucket=settings.SPACES_BUCKET_NAME,
-                        Delete={"Objects": delete_keys},
-                    )
-                    logger.info(
-                        "Deleted %d objects under %s", len(delete_keys), prefix
-                    )
-                    deleted = True
-
-                    if not response.get("IsTruncated"):
-                        break
-                    continuation_token = response.get("NextContinuationToken")
-
-                return deleted
-
-            # Delete a single file
-            logger.info("Attempting to delete file: %s", key)
-            await s3_client.delete_object(
-                Bucket=settings.SPACES_BUCKET_NAME,
-                Key=key,
-            )
-            logger.info("File deleted successfully: %s", key)
-            return True
-
-        except ClientError as e:
-            logger.error("S3 ClientError: %s", e)
-            raise HTTPException(
-                status_code=500,
-                detail=f"DigitalOcean Spaces deletion error: {str(e)}",
-            )
-        except Exception as e:
-            logger.error("Unexpected error: %s", e)
-            raise HTTPException(
-                status_code=500, detail="Unexpected error during file deletion."
-            )
+    storage = storage or media_storage
+    try:
+        return await storage.delete(key, delete_folder=delete_folder)
+
+    except ClientError as e:
+        logger.error("S3 ClientError: %s", e)
+        raise HTTPException(
+            status_code=500,
+            detail=f"DigitalOcean Spaces deletion error: {str(e)}",
+        )
+    except Exception as e:
+        logger.error("Unexpected error: %s", e)
+        raise HTTPException(
+            status_code=500, detail="Unexpected error during file deletion."
+        )
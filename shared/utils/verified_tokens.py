@@ -0,0 +1,69 @@
+"""
+Per-process cache of JWTs whose signature and claims already checked out.
+
+Clients send the same access token on every request until it expires, and
+each time ``verify_jwt_token`` would redo the RS256 verification. The cache
+remembers the decoded payload under the SHA-256 of the token (and the kid
+of the key that verified it), so a repeat costs one hash and a dict lookup.
+
+- Entries drop out at the token's ``exp``; a cached token never outlives
+  its own expiry.
+- The cache is a bounded LRU (``JWT_VERIFIED_CACHE_SIZE``).
+- Revocation still applies: callers check the blacklist on every hit, and
+  ``forget`` drops a token as soon as it is revoked.
+"""
+
+import hashlib
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from shared.core.config import settings
+from shared.utils.bounded_cache import BoundedTTLCache
+
+CacheKey = Tuple[str, str]
+
+
+def token_digest(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class VerifiedTokenCache:
+    """Bounded LRU of verified payloads, each expiring at its ``exp``."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        # Expiry is the token's wall-clock ``exp``
+        self._entries: BoundedTTLCache[CacheKey, Dict[str, Any]] = (
+            BoundedTTLCache(maxsize, clock=time.time)
+        )
+
+    @property
+    def hits(self) -> int:
+        return self._entries.hits
+
+    @property
+    def misses(self) -> int:
+        return self._entries.misses
+
+    def get(self, kid: str, token: str) -> Optional[Dict[str, Any]]:
+        return self._entries.get((kid, token_digest(token)))
+
+    def put(self, kid: str, token: str, payload: Dict[str, Any]) -> None:
+        if "exp" not in payload:
+            return
+        key = (kid, token_digest(token))
+        self._entries.put(key, payload, expires_at=payload["exp"])
+
+    def forget(self, token: str) -> None:
+        """Drop every cached verification of ``token``."""
+        digest = token_digest(token)
+        self._entries.discard(lambda key: key[1] == digest)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+verified_tokens = VerifiedTokenCache(settings.JWT_VERIFIED_CACHE_SIZE)
@@ -4,6 +4,17 @@ import pytest
 from httpx import AsyncClient
 
 from shared.db.models import AdminUser
+from shared.dependencies.principal import Principal
+
+
+def as_principal(user: AdminUser) -> Principal:
+    return Principal(
+        user_id=user.user_id,
+        session_id=None,
+        is_deleted=user.is_deleted,
+        role_id=user.role_id,
+        business_id=user.business_id,
+    )
 
 
 @pytest.mark.asyncio
@@ -21,14 +32,14 @@ async def test_user_analytics_success(test_client: AsyncClient, test_app):
         is_deleted=False,
     )
 
-    async def mock_get_current_active_user():
-        return mock_admin_user
+    async def mock_get_current_principal():
+        return as_principal(mock_admin_user)
 
     # Override the dependency
-    from shared.dependencies.admin import get_current_active_user
+    from shared.dependencies.admin import get_current_principal
 
-    test_app.dependency_overrides[get_current_active_user] = (
-        mock_get_current_active_user
+    test_app.dependency_overrides[get_current_principal] = (
+        mock_get_current_principal
     )
 
     try:
@@ -43,7 +54,7 @@ async def test_user_analytics_success(test_client: AsyncClient, test_app):
         assert isinstance(body["data"]["daily_registrations"], list)
     finally:
         # Clean up the override
-        test_app.dependency_overrides.pop(get_current_active_user, None)
+        test_app.dependency_overrides.pop(get_current_principal, None)
 
 
 @pytest.mark.asyncio
@@ -60,14 +71,14 @@ async def test_user_analytics_empty_db(test_client: AsyncClient, test_app):
         is_deleted=False,
     )
 
-    async def mock_get_current_active_user():
-        return mock_admin_user
+    async def mock_get_current_principal():
+        return as_principal(mock_admin_user)
 
     # Override the dependency
-    from shared.dependencies.admin import get_current_active_user
+    from shared.dependencies.admin import get_current_principal
 
-    test_app.dependency_overrides[get_current_active_user] = (
-        mock_get_current_active_user
+    test_app.dependency_overrides[get_current_principal] = (
+        mock_get_current_principal
     )
 
     # Dictionary to simulate what your actual SQL function would return
@@ -120,7 +131,7 @@ async def test_user_analytics_empty_db(test_client: AsyncClient, test_app):
             ]
     finally:
         # Clean up the override
-        test_app.dependency_overrides.pop(get_current_active_user, None)
+        test_app.dependency_overrides.pop(get_current_principal, None)
 
 
 @pytest.mark.asyncio
@@ -137,14 +148,14 @@ async def test_user_analytics_failure(test_client: AsyncClient, test_app):
         is_deleted=False,
     )
 
-    async def mock_get_current_active_user():
-        return mock_admin_user
+    async def mock_get_current_principal():
+        return as_principal(mock_admin_user)
 
     # Override the dependency
-    from shared.dependencies.admin import get_current_active_user
+    from shared.dependencies.admin import get_current_principal
 
-    test_app.dependency_overrides[get_current_active_user] = (
-        mock_get_current_active_user
+    test_app.dependency_overrides[get_current_principal] = (
+        mock_get_current_principal
     )
 
     async def failing_summary(db=None):
@@ -164,7 +175,7 @@ async def test_user_analytics_failure(test_client: AsyncClient, test_app):
             assert "Something went wrong" in error_message
     finally:
         # Clean up the override
-        test_app.dependency_overrides.pop(get_current_active_user, None)
+        test_app.dependency_overrides.pop(get_current_principal, None)
 
 
 @pytest.mark.asyncio
@@ -181,14 +192,14 @@ async def test_dashboard_analytics_success(test_client: AsyncClient, test_app):
         is_deleted=False,
     )
 
-    async def mock_get_current_active_user():
-        return mock_admin_user
+    async def mock_get_current_principal():
+        return as_principal(mock_admin_user)
 
     # Override the dependency
-    from shared.dependencies.admin import get_current_active_user
+    from shared.dependencies.admin import get_current_principal
 
-    test_app.dependency_overrides[get_current_active_user] = (
-        mock_get_current_active_user
+    test_app.dependency_overrides[get_current_principal] = (
+        mock_get_current_principal
     )
 
     # Mock dashboard analytics data
@@ -277,7 +288,7 @@ async def test_dashboard_analytics_success(test_client: AsyncClient, test_app):
 
     finally:
         # Clean up the override
-        test_app.dependency_overrides.pop(get_current_active_user, None)
+        test_app.dependency_overrides.pop(get_current_principal, None)
 
 
 @pytest.mark.asyncio
@@ -294,14 +305,14 @@ async def test_dashboard_analytics_failure(test_client: AsyncClient, test_app):
         is_deleted=False,
     )
 
-    async def mock_get_current_active_user():
-        return mock_admin_user
+    async def mock_get_current_principal():
+        return as_principal(mock_admin_user)
 
     # Override the dependency
-    from shared.dependencies.admin import get_current_active_user
+    from shared.dependencies.admin import get_current_principal
 
-    test_app.dependency_overrides[get_current_active_user] = (
-        mock_get_current_active_user
+    test_app.dependency_overrides[get_current_principal] = (
+        mock_get_current_principal
     )
 
     async def failing_dashboard_analytics(db=None):
@@ -321,4 +332,4 @@ async def test_dashboard_analytics_failure(test_client: AsyncClient, test_app):
             assert "Something went wrong" in error_message
     finally:
         # Clean up the override
-        test_app.dependency_overrides.pop(get_current_active_user, None)
+        test_app.dependency_overrides.pop(get_current_principal, None)
@@ -6,6 +6,17 @@ import pytest
 from httpx import AsyncClient
 
 from shared.db.models import AdminUser
+from shared.dependencies.principal import Principal
+
+
+def as_principal(user: AdminUser) -> Principal:
+    return Principal(
+        user_id=user.user_id,
+        session_id=None,
+        is_deleted=user.is_deleted,
+        role_id=user.role_id,
+        business_id=user.business_id,
+    )
 
 
 @pytest.mark.asyncio
@@ -35,14 +46,14 @@ async def test_update_profile_picture_success(
     await test_db_session.commit()
 
     # Mock the authentication dependency
-    async def mock_get_current_active_user():
-        return user
+    async def mock_get_current_principal():
+        return as_principal(user)
 
     # Override the dependency
-    from shared.dependencies.admin import get_current_active_user
+    from shared.dependencies.admin import get_current_principal
 
-    test_app.dependency_overrides[get_current_active_user] = (
-        mock_get_current_active_user
+    test_app.dependency_overrides[get_current_principal] = (
+        mock_get_current_principal
     )
 
     # Mock file upload functions to avoid actual file operations
@@ -77,7 +88,7 @@ async def test_update_profile_picture_success(
             assert body["data"]["profile_picture"] == mock_media_url
         finally:
             # Clean up the override
-            test_app.dependency_overrides.pop(get_current_active_user, None)
+            test_app.dependency_overrides.pop(get_current_principal, None)
 
 
 @pytest.mark.asyncio
@@ -107,14 +118,14 @@ async def test_update_picture_invalid_file_type(
     await test_db_session.commit()
 
     # Mock the authentication dependency
-    async def mock_get_current_active_user():
-        return user
+    async def mock_get_current_principal():
+        return as_principal(user)
 
     # Override the dependency
-    from shared.dependencies.admin import get_current_active_user
+    from shared.dependencies.admin import get_current_principal
 
-    test_app.dependency_overrides[get_current_active_user] = (
-        mock_get_current_active_user
+    test_app.dependency_overrides[get_current_principal] = (
+        mock_get_current_principal
     )
 
     files = {
@@ -137,7 +148,7 @@ async def test_update_picture_invalid_file_type(
         )
     finally:
         # Clean up the override
-        test_app.dependency_overrides.pop(get_current_active_user, None)
+        test_app.dependency_overrides.pop(get_current_principal, None)
 
 
 @pytest.mark.asyncio
@@ -167,14 +178,14 @@ async def test_update_picture_missing_file(
     await test_db_session.commit()
 
     # Mock the authentication dependency
-    async def mock_get_current_active_user():
-        return user
+    async def mock_get_current_principal():
+        return as_principal(user)
 
     # Override the dependency
-    from shared.dependencies.admin import get_current_active_user
+    from shared.dependencies.admin import get_current_principal
 
-    test_app.dependency_overrides[get_current_active_user] = (
-        mock_get_current_active_user
+    test_app.dependency_overrides[get_current_principal] = (
+        mock_get_current_principal
     )
 
     # Send request without profile_picture file
@@ -190,7 +201,7 @@ async def test_update_picture_missing_file(
         )
     finally:
         # Clean up the override
-        test_app.dependency_overrides.pop(get_current_active_user, None)
+        test_app.dependency_overrides.pop(get_current_principal, None)
 
 
 @pytest.mark.asyncio
@@ -206,14 +217,14 @@ async def test_update_picture_user_not_found(
         is_deleted=False,
     )
 
-    async def mock_get_current_active_user():
-        return mock_user
+    async def mock_get_current_principal():
+        return as_principal(mock_user)
 
     # Override the dependency
-    from shared.dependencies.admin import get_current_active_user
+    from shared.dependencies.admin import get_current_principal
 
-    test_app.dependency_overrides[get_current_active_user] = (
-        mock_get_current_active_user
+    test_app.dependency_overrides[get_current_principal] = (
+        mock_get_current_principal
     )
 
     files = {
@@ -230,7 +241,7 @@ async def test_update_picture_user_not_found(
         assert "User not found" in body["detail"]["message"]
     finally:
         # Clean up the override
-        test_app.dependency_overrides.pop(get_current_active_user, None)
+        test_app.dependency_overrides.pop(get_current_principal, None)
 
 
 @pytest.mark.asyncio
@@ -34,6 +34,8 @@ from main import create_app
 # Local application imports
 from shared.core import config
 from shared.db.models import Config, EventsBase, Role
+from shared.db.query_stats import install_query_instrumentation
+from shared.db.schema_upgrades import apply_schema_upgrades
 from shared.db.sessions.database import get_db
 from tests.test_config import AppTestSettings, get_test_settings
 from user_service.utils.auth import hash_password
@@ -77,10 +79,17 @@ async def test_engine() -> AsyncGenerator[AsyncEngine, None]:
         isolation_level="READ COMMITTED",
         future=True,
     )
+    install_query_instrumentation(
+        engine,
+        repeated_statement_threshold=(
+            test_settings.DB_REPEATED_STATEMENT_THRESHOLD
+        ),
+    )
 
     # Create all tables
     async with engine.begin() as conn:
         await conn.run_sync(EventsBase.metadata.create_all)
+        await apply_schema_upgrades(conn)
 
     yield engine
 
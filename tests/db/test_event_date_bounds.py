@@ -0,0 +1,95 @@
+"""
+Test cases for the denormalized first/last event date columns
+"""
+
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.dialects import postgresql
+
+from new_event_service.services.event_fetcher import (
+    EventTypeStatus,
+    get_event_conditions,
+)
+from shared.db.models.new_events import EventStatus, NewEvent
+from shared.db.schema_upgrades import apply_schema_upgrades
+from tests.utils.db_helpers import AsyncDatabaseTestHelper
+
+
+def test_bounds_follow_event_dates_on_create():
+    """Constructing an event fills the bounds from event_dates."""
+    event = NewEvent(
+        event_dates=[date(2025, 3, 2), date(2025, 1, 5), date(2025, 2, 1)]
+    )
+    assert event.first_event_date == date(2025, 1, 5)
+    assert event.last_event_date == date(2025, 3, 2)
+
+
+def test_bounds_follow_event_dates_on_replace():
+    """Replacing event_dates (slot create/update/replace) moves the bounds."""
+    event = NewEvent(event_dates=[date(2025, 1, 5)])
+    event.event_dates = sorted([date(2026, 6, 1), date(2026, 7, 1)])
+    assert event.first_event_date == date(2026, 6, 1)
+    assert event.last_event_date == date(2026, 7, 1)
+
+
+def test_bounds_cleared_when_event_dates_empty():
+    """An event without dates has no bounds."""
+    event = NewEvent(event_dates=[date(2025, 1, 5)])
+    event.event_dates = []
+    assert event.first_event_date is None
+    assert event.last_event_date is None
+
+
+def test_event_conditions_use_indexed_columns():
+    """Date filters compare the bound columns, not array subscripts."""
+    conditions = get_event_conditions(EventTypeStatus.LIVE)
+    sql = " AND ".join(
+        str(c.compile(dialect=postgresql.dialect())) for c in conditions
+    )
+    assert "first_event_date" in sql
+    assert "last_event_date" in sql
+    assert "array_length" not in sql
+
+
+@pytest.mark.asyncio
+@pytest.mark.db
+async def test_schema_upgrade_backfills_missing_bounds(
+    test_engine, test_db_session, clean_db
+):
+    """Events written before the bound columns existed get them on start-up,
+    so upcoming/live listings do not drop them."""
+    helper = AsyncDatabaseTestHelper(test_db_session)
+    role = await helper.create_role()
+    organizer = await helper.create_admin_user(role_id=role.role_id)
+    category = await helper.create_category()
+    today = date.today()
+    test_db_session.add(
+        NewEvent(
+            event_id="LEGACY",
+            category_id=category.category_id,
+            organizer_id=organizer.user_id,
+            event_slug="legacy-event",
+            event_title="Legacy Event",
+            event_dates=[today, today + timedelta(days=3)],
+            event_status=EventStatus.ACTIVE,
+        )
+    )
+    await test_db_session.commit()
+    await test_db_session.execute(
+        update(NewEvent)
+        .where(NewEvent.event_id == "LEGACY")
+        .values(first_event_date=None, last_event_date=None)
+    )
+    await test_db_session.commit()
+
+    async with test_engine.begin() as conn:
+        await apply_schema_upgrades(conn)
+
+    upcoming = await test_db_session.scalars(
+        select(NewEvent.event_id)
+        .where(*get_event_conditions(EventTypeStatus.UPCOMING))
+        .execution_options(populate_existing=True)
+    )
+    assert upcoming.all() == ["LEGACY"]
@@ -0,0 +1,182 @@
+"""
+Test cases for ranked event search
+"""
+
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import asyncpg
+
+from new_event_service.services.event_search import (
+    execute_fuzzy,
+    full_text_clauses,
+    fuzzy_title_clauses,
+    prefix_tsquery,
+)
+from shared.db.models.new_events import EventStatus, NewEvent
+from shared.db.schema_upgrades import (
+    COLUMN_UPGRADES,
+    FUNCTION_UPGRADES,
+    TRIGGER_UPGRADES,
+    apply_schema_upgrades,
+)
+from tests.utils.db_helpers import AsyncDatabaseTestHelper
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=asyncpg.dialect()))
+
+
+def test_prefix_tsquery_requires_every_word_as_prefix():
+    assert prefix_tsquery("Jazz  nig") == "jazz:* & nig:*"
+
+
+def test_prefix_tsquery_drops_tsquery_syntax():
+    """Operators typed by the user cannot break the tsquery."""
+    assert prefix_tsquery("rock & (roll | !pop):*") == (
+        "rock:* & roll:* & pop:*"
+    )
+    assert prefix_tsquery(" &|!' ") is None
+
+
+def test_full_text_search_ranks_in_sql():
+    """Matching, ranking and paging are all pushed into the statement."""
+    clauses = full_text_clauses("summer fest")
+    stmt = (
+        select(NewEvent.event_id)
+        .where(clauses.condition)
+        .order_by(clauses.rank.desc())
+        .limit(10)
+        .offset(20)
+    )
+    sql = _sql(stmt)
+    assert "search_vector @@ to_tsquery(CAST($1::REGCONFIG AS REGCONFIG)" in sql
+    assert "ts_rank(e2gevents_new.search_vector" in sql
+    assert "LIMIT $" in sql and "OFFSET $" in sql
+    assert "ILIKE" not in sql
+
+
+def test_fuzzy_fallback_uses_trigram_operator():
+    clauses = fuzzy_title_clauses(" Concrt ")
+    sql = _sql(select(NewEvent.event_id).where(clauses.condition))
+    assert "e2gevents_new.event_title % $1" in sql
+    assert clauses.condition.right.value == "concrt"
+
+
+def test_search_vector_is_maintained_by_trigger():
+    assert ("e2gevents_new", "search_vector", "TSVECTOR") in COLUMN_UPGRADES
+    trigger = TRIGGER_UPGRADES["trg_e2gevents_new_search_vector"]
+    assert "e2gevents_new_search_vector_v1" in trigger
+    body = FUNCTION_UPGRADES["e2gevents_new_search_vector_v1"]
+    for column, weight in (
+        ("event_title", "'A'"),
+        ("hash_tags", "'B'"),
+        ("location", "'C'"),
+        ("subcategory_name", "'D'"),
+    ):
+        assert column in body
+        assert weight in body
+
+
+async def _add_events(db, *events):
+    """Insert events as (event_id, title, location)."""
+    helper = AsyncDatabaseTestHelper(db)
+    role = await helper.create_role()
+    organizer = await helper.create_admin_user(role_id=role.role_id)
+    category = await helper.create_category()
+    for event_id, title, location in events:
+        db.add(
+            NewEvent(
+                event_id=event_id,
+                category_id=category.category_id,
+                organizer_id=organizer.user_id,
+                event_slug=event_id.lower(),
+                event_title=title,
+                location=location,
+                event_status=EventStatus.ACTIVE,
+            )
+        )
+    await db.commit()
+
+
+async def _ranked_ids(db, clauses):
+    result = await db.scalars(
+        select(NewEvent.event_id)
+        .where(clauses.condition)
+        .order_by(clauses.rank.desc())
+    )
+    return result.all()
+
+
+@pytest.mark.asyncio
+@pytest.mark.db
+async def test_inserted_event_gets_search_vector(test_db_session, clean_db):
+    await _add_events(test_db_session, ("EVT1", "Jazz Night", "Austin"))
+
+    vector = await test_db_session.scalar(
+        select(NewEvent.search_vector).where(NewEvent.event_id == "EVT1")
+    )
+    assert vector is not None
+    assert await _ranked_ids(test_db_session, full_text_clauses("jaz")) == [
+        "EVT1"
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.db
+async def test_title_match_outranks_location_match(test_db_session, clean_db):
+    await _add_events(
+        test_db_session,
+        ("BYLOC", "Food Fair", "Garden Hall"),
+        ("BYTTL", "Garden Party", "Town Square"),
+    )
+
+    assert await _ranked_ids(test_db_session, full_text_clauses("garden")) == [
+        "BYTTL",
+        "BYLOC",
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.db
+async def test_fuzzy_fallback_finds_misspelt_title(test_db_session, clean_db):
+    await _add_events(
+        test_db_session,
+        ("CONCRT", "Concert", "Dallas"),
+        ("POTTRY", "Pottery Class", "Dallas"),
+    )
+    assert await _ranked_ids(test_db_session, full_text_clauses("concrt")) == []
+
+    clauses = fuzzy_title_clauses("concrt")
+    result = await execute_fuzzy(
+        test_db_session,
+        select(NewEvent.event_id)
+        .where(clauses.condition)
+        .order_by(clauses.rank.desc()),
+    )
+    if result is None:
+        pytest.skip("pg_trgm is not available")
+    assert result.scalars().all() == ["CONCRT"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.db
+async def test_schema_upgrade_backfills_missing_search_vectors(
+    test_engine, test_db_session, clean_db
+):
+    """Events written before the trigger existed become searchable on
+    start-up."""
+    await _add_events(test_db_session, ("LEGACY", "Legacy Gala", "Austin"))
+    await test_db_session.execute(
+        update(NewEvent)
+        .where(NewEvent.event_id == "LEGACY")
+        .values(search_vector=None)
+    )
+    await test_db_session.commit()
+    assert await _ranked_ids(test_db_session, full_text_clauses("gala")) == []
+
+    async with test_engine.begin() as conn:
+        await apply_schema_upgrades(conn)
+
+    assert await _ranked_ids(test_db_session, full_text_clauses("gala")) == [
+        "LEGACY"
+    ]
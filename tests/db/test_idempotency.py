@@ -0,0 +1,289 @@
+"""
+Test cases for Idempotency-Key handling
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse, RedirectResponse
+from sqlalchemy.dialects import postgresql
+
+from shared.db import idempotency
+from shared.db.idempotency import (
+    REPLAY_HEADER,
+    request_fingerprint,
+    run_idempotent,
+)
+from shared.db.models.idempotency import IdempotencyKey
+
+SCOPE = "new-bookings:book"
+FINGERPRINT = request_fingerprint({"user_ref_id": "USR001", "seats": 2})
+
+
+def _sql(db: AsyncMock) -> list[str]:
+    return [
+        str(call.args[0].compile(dialect=postgresql.dialect()))
+        for call in db.execute.call_args_list
+    ]
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    idempotency._cache.clear()
+    yield
+    idempotency._cache.clear()
+
+
+@pytest.fixture
+def mock_db():
+    """Session whose claim always succeeds."""
+    db = AsyncMock()
+    db.execute.return_value = MagicMock()
+    db.execute.return_value.scalar_one_or_none.return_value = "key-1"
+    db.execute.return_value.scalar_one.return_value = datetime.now(
+        timezone.utc
+    ) + timedelta(hours=1)
+    return db
+
+
+def counting_handler(response):
+    calls = []
+
+    async def handler():
+        calls.append(1)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    return handler, calls
+
+
+class TestFingerprint:
+    def test_key_order_does_not_matter(self):
+        assert request_fingerprint({"a": 1, "b": 2}) == request_fingerprint(
+            {"b": 2, "a": 1}
+        )
+
+    def test_different_requests_differ(self):
+        assert request_fingerprint({"a": 1}) != request_fingerprint({"a": 2})
+
+
+class TestRunIdempotent:
+    @pytest.mark.asyncio
+    async def test_without_key_just_runs(self, mock_db):
+        handler, calls = counting_handler(JSONResponse({"ok": True}))
+
+        await run_idempotent(mock_db, SCOPE, None, FINGERPRINT, handler)
+
+        assert calls == [1]
+        mock_db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_retry_replays_from_memory(self, mock_db):
+        handler, calls = counting_handler(
+            JSONResponse({"order_id": "ORD1"}, status_code=200)
+        )
+
+        first = await run_idempotent(
+            mock_db, SCOPE, "key-1", FINGERPRINT, handler
+        )
+        statements = len(mock_db.execute.call_args_list)
+        retry = await run_idempotent(
+            mock_db, SCOPE, "key-1", FINGERPRINT, handler
+        )
+
+        assert calls == [1]
+        assert len(mock_db.execute.call_args_list) == statements
+        assert retry.status_code == first.status_code
+        assert retry.body == first.body
+        assert retry.headers[REPLAY_HEADER] == "true"
+
+        claim, store = _sql(mock_db)
+        assert claim.startswith("INSERT INTO e2gidempotency_keys")
+        assert "ON CONFLICT (scope, idempotency_key) DO UPDATE" in claim
+        assert "WHERE e2gidempotency_keys.expires_at <=" in claim
+        assert store.startswith("UPDATE e2gidempotency_keys SET status_code=")
+
+    @pytest.mark.asyncio
+    async def test_reused_key_with_other_request_is_rejected(self, mock_db):
+        handler, _ = counting_handler(JSONResponse({}))
+        await run_idempotent(mock_db, SCOPE, "key-1", FINGERPRINT, handler)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await run_idempotent(
+                mock_db,
+                SCOPE,
+                "key-1",
+                request_fingerprint({"other": True}),
+                handler,
+            )
+
+        assert exc_info.value.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_replay_from_table_after_restart(self, mock_db):
+        mock_db.execute.return_value.scalar_one_or_none.return_value = None
+        mock_db.get.return_value = IdempotencyKey(
+            scope=SCOPE,
+            idempotency_key="key-1",
+            request_hash=FINGERPRINT,
+            status_code=302,
+            response_headers={"location": "https://example.test/ok"},
+            response_body="",
+            expires_at=datetime.now(timezone.utc) + timedelta(hours=1),
+        )
+        handler, calls = counting_handler(JSONResponse({}))
+
+        response = await run_idempotent(
+            mock_db, SCOPE, "key-1", FINGERPRINT, handler
+        )
+
+        assert calls == []
+        assert response.status_code == 302
+        assert response.headers["location"] == "https://example.test/ok"
+        mock_db.get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_retry_while_in_flight_conflicts(self, mock_db):
+        mock_db.execute.return_value.scalar_one_or_none.return_value = None
+        mock_db.get.return_value = IdempotencyKey(
+            scope=SCOPE,
+            idempotency_key="key-1",
+            request_hash=FINGERPRINT,
+            expires_at=datetime.now(timezone.utc) + timedelta(hours=1),
+        )
+        handler, calls = counting_handler(JSONResponse({}))
+
+        with pytest.raises(HTTPException) as exc_info:
+            await run_idempotent(mock_db, SCOPE, "key-1", FINGERPRINT, handler)
+
+        assert exc_info.value.status_code == 409
+        assert calls == []
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_stored(self, mock_db):
+        detail = {"statusCode": 400, "message": "Not enough seats"}
+        handler, calls = counting_handler(
+            HTTPException(status_code=400, detail=detail)
+        )
+
+        first = await run_idempotent(
+            mock_db, SCOPE, "key-1", FINGERPRINT, handler
+        )
+        retry = await run_idempotent(
+            mock_db, SCOPE, "key-1", FINGERPRINT, handler
+        )
+
+        assert calls == [1]
+        assert first.status_code == retry.status_code == 400
+        assert json.loads(retry.body) == detail
+
+    @pytest.mark.asyncio
+    async def test_server_errors_release_the_key(self, mock_db):
+        handler, calls = counting_handler(
+            JSONResponse({"message": "PayPal error"}, status_code=500)
+        )
+
+        await run_idempotent(mock_db, SCOPE, "key-1", FINGERPRINT, handler)
+        await run_idempotent(mock_db, SCOPE, "key-1", FINGERPRINT, handler)
+
+        assert calls == [1, 1]
+        assert _sql(mock_db)[1].startswith("DELETE FROM e2gidempotency_keys")
+
+    @pytest.mark.asyncio
+    async def test_exceptions_release_the_key(self, mock_db):
+        handler, _ = counting_handler(RuntimeError("boom"))
+
+        with pytest.raises(RuntimeError):
+            await run_idempotent(mock_db, SCOPE, "key-1", FINGERPRINT, handler)
+
+        mock_db.rollback.assert_awaited_once()
+        assert _sql(mock_db)[-1].startswith("DELETE FROM e2gidempotency_keys")
+
+    @pytest.mark.asyncio
+    async def test_redirects_keep_their_location(self, mock_db):
+        handler, _ = counting_handler(
+            RedirectResponse("https://example.test/booking-success", 302)
+        )
+        await run_idempotent(mock_db, SCOPE, "key-1", FINGERPRINT, handler)
+
+        retry = await run_idempotent(
+            mock_db, SCOPE, "key-1", FINGERPRINT, handler
+        )
+
+        assert retry.status_code == 302
+        assert retry.headers["location"] == (
+            "https://example.test/booking-success"
+        )
+
+
+class TestResponseCache:
+    def test_is_bounded_lru(self):
+        cache = idempotency._ResponseCache(maxsize=2)
+        entry = idempotency.StoredResponse(
+            FINGERPRINT,
+            200,
+            {},
+            "",
+            datetime.now(timezone.utc) + timedelta(hours=1),
+        )
+        cache.put(("s", "a"), entry)
+        cache.put(("s", "b"), entry)
+        cache.get(("s", "a"))
+        cache.put(("s", "c"), entry)
+
+        assert cache.get(("s", "a")) is entry
+        assert cache.get(("s", "b")) is None
+
+    def test_expired_entries_are_dropped(self):
+        cache = idempotency._ResponseCache(maxsize=2)
+        cache.put(
+            ("s", "a"),
+            idempotency.StoredResponse(
+                FINGERPRINT,
+                200,
+                {},
+                "",
+                datetime.now(timezone.utc) - timedelta(seconds=1),
+            ),
+        )
+
+        assert cache.get(("s", "a")) is None
+
+
+class TestPurgeExpiredKeys:
+    @pytest.mark.asyncio
+    @pytest.mark.db
+    async def test_purges_expired_keys_in_batches(
+        self, test_db_session, clean_db
+    ):
+        now = datetime.now(timezone.utc)
+        for i in range(3):
+            test_db_session.add(
+                IdempotencyKey(
+                    scope=SCOPE,
+                    idempotency_key=f"expired-{i}",
+                    request_hash=FINGERPRINT,
+                    expires_at=now - timedelta(minutes=1),
+                )
+            )
+        test_db_session.add(
+            IdempotencyKey(
+                scope=SCOPE,
+                idempotency_key="live",
+                request_hash=FINGERPRINT,
+                expires_at=now + timedelta(hours=1),
+            )
+        )
+        await test_db_session.commit()
+
+        purged = [
+            await idempotency.purge_expired_keys(test_db_session, batch_size=2)
+            for _ in range(3)
+        ]
+
+        assert purged == [2, 1, 0]
+        assert await test_db_session.get(IdempotencyKey, (SCOPE, "live"))
@@ -0,0 +1,59 @@
+"""
+Test cases for the named loader profiles on the event/booking graph
+"""
+
+import pytest
+from sqlalchemy import inspect, select
+from sqlalchemy.dialects import postgresql
+
+from shared.db.loader_profiles import LoaderProfile, loader_options
+from shared.db.models import AdminUser, Category, Coupon, SubCategory, User
+from shared.db.models.new_events import (
+    NewEvent,
+    NewEventBookingOrder,
+    NewEventSeatCategory,
+    NewEventSlot,
+)
+
+
+@pytest.mark.parametrize(
+    "model, attribute",
+    [
+        (NewEvent, "new_booking_orders"),
+        (NewEventSlot, "new_booking_orders"),
+        (NewEventSeatCategory, "new_bookings"),
+        (User, "new_event_booking_orders"),
+        (AdminUser, "organized_new_events"),
+        (Category, "new_events"),
+        (SubCategory, "new_events"),
+        (Coupon, "bookings"),
+    ],
+)
+def test_unbounded_collections_raise_by_default(model, attribute):
+    """Collections that grow with bookings must be loaded explicitly."""
+    relationship = inspect(model).relationships[attribute]
+    assert relationship.lazy == "raise"
+
+
+@pytest.mark.parametrize(
+    "profile, root",
+    [
+        (LoaderProfile.CARD, NewEvent),
+        (LoaderProfile.DETAIL, NewEvent),
+        (LoaderProfile.SETTLEMENT, NewEvent),
+        (LoaderProfile.BOOKING, NewEventBookingOrder),
+    ],
+)
+def test_profiles_compile_against_their_root_entity(profile, root):
+    """Every profile applies cleanly to the entity it is rooted at."""
+    stmt = select(root).options(*loader_options(profile))
+    compiled = stmt.compile(dialect=postgresql.dialect())
+    assert root.__tablename__ in str(compiled)
+
+
+def test_detail_profile_extends_card_profile():
+    """The detail profile is the card profile plus slots."""
+    card = loader_options(LoaderProfile.CARD)
+    detail = loader_options(LoaderProfile.DETAIL)
+    assert detail[: len(card)] == card
+    assert len(detail) > len(card)
@@ -0,0 +1,187 @@
+"""
+Test cases for keyset (cursor) pagination
+"""
+
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy import DateTime, String, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from shared.db.models import EventStatus, NewEvent
+from shared.db.pagination import (
+    CountMode,
+    InvalidCursorError,
+    count_rows,
+    decode_cursor,
+    encode_cursor,
+    fetch_page,
+)
+from tests.utils.db_helpers import AsyncDatabaseTestHelper
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class _Order(_Base):
+    __tablename__ = "orders"
+
+    order_id: Mapped[str] = mapped_column(String, primary_key=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime)
+
+
+@pytest_asyncio.fixture
+async def orders_session():
+    """25 orders; every pair shares a created_at to exercise the tie-break."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(_Base.metadata.create_all)
+    start = datetime(2025, 1, 1)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        session.add_all(
+            _Order(
+                order_id=f"ORD{i:03d}",
+                created_at=start + timedelta(minutes=i // 2),
+            )
+            for i in range(25)
+        )
+        await session.commit()
+        yield session
+    await engine.dispose()
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2025, 5, 1, 12, 30)
+    assert decode_cursor(encode_cursor(created_at, "ORD001")) == (
+        created_at,
+        "ORD001",
+    )
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "e30", "!!"])
+def test_invalid_cursor_is_rejected(cursor):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
+
+
+@pytest.mark.asyncio
+async def test_cursor_pages_match_offset_pages(orders_session):
+    """Following next_cursor visits the same rows as page=1..n."""
+    stmt = select(_Order)
+    by_cursor, cursor = [], None
+    while True:
+        rows, cursor = await fetch_page(
+            orders_session,
+            stmt,
+            _Order.created_at,
+            _Order.order_id,
+            limit=10,
+            cursor=cursor,
+        )
+        by_cursor.append([r.order_id for r in rows])
+        if cursor is None:
+            break
+
+    by_offset = []
+    for page in range(1, 4):
+        rows, _ = await fetch_page(
+            orders_session,
+            stmt,
+            _Order.created_at,
+            _Order.order_id,
+            limit=10,
+            page=page,
+        )
+        by_offset.append([r.order_id for r in rows])
+
+    assert by_cursor == by_offset
+    assert [len(p) for p in by_cursor] == [10, 10, 5]
+    assert by_cursor[0][:2] == ["ORD024", "ORD023"]
+
+
+@pytest.mark.asyncio
+async def test_ascending_cursor(orders_session):
+    rows, cursor = await fetch_page(
+        orders_session,
+        select(_Order),
+        _Order.created_at,
+        _Order.order_id,
+        limit=3,
+        descending=False,
+    )
+    rows, _ = await fetch_page(
+        orders_session,
+        select(_Order),
+        _Order.created_at,
+        _Order.order_id,
+        limit=3,
+        cursor=cursor,
+        descending=False,
+    )
+    assert [r.order_id for r in rows] == ["ORD003", "ORD004", "ORD005"]
+
+
+@pytest.mark.asyncio
+async def test_count_modes(orders_session):
+    stmt = select(_Order.order_id).where(_Order.order_id >= "ORD010")
+    assert await count_rows(orders_session, stmt, CountMode.EXACT) == 15
+    assert await count_rows(orders_session, stmt, CountMode.NONE) is None
+
+
+@pytest_asyncio.fixture
+async def upcoming_event_ids(test_db_session, clean_db):
+    """Five upcoming events, created one minute apart."""
+    helper = AsyncDatabaseTestHelper(test_db_session)
+    role = await helper.create_role()
+    organizer = await helper.create_admin_user(role_id=role.role_id)
+    category = await helper.create_category()
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    events = [
+        NewEvent(
+            event_id=f"PGEV0{i}",
+            category_id=category.category_id,
+            organizer_id=organizer.user_id,
+            event_slug=f"paged-event-{i}",
+            event_title=f"Paged Event {i}",
+            event_dates=[date.today() + timedelta(days=1)],
+            event_status=EventStatus.ACTIVE,
+            created_at=start + timedelta(minutes=i),
+        )
+        for i in range(5)
+    ]
+    test_db_session.add_all(events)
+    await test_db_session.commit()
+    return [event.event_id for event in reversed(events)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.db
+async def test_event_listing_follows_cursor(
+    test_client: AsyncClient, upcoming_event_ids
+):
+    """GET /new-events pages by cursor and can skip the total count."""
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 2, "count": "none"}
+        if cursor:
+            params["cursor"] = cursor
+        response = await test_client.get("/api/v1/new-events", params=params)
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["total"] is None
+        seen.extend(event["event_id"] for event in data["events"])
+        cursor = data["next_cursor"]
+        assert data["has_next"] is (cursor is not None)
+        if cursor is None:
+            break
+
+    assert seen == upcoming_event_ids
+
+    response = await test_client.get(
+        "/api/v1/new-events", params={"cursor": "not-a-cursor"}
+    )
+    assert response.status_code == 400
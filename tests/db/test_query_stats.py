@@ -0,0 +1,171 @@
+"""
+Test cases for per-request SQL statement accounting
+"""
+
+from datetime import date, timedelta
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from new_event_service.services.category_events import (
+    fetch_categories_with_all_events,
+)
+from shared.db.models import (
+    EventStatus,
+    NewEvent,
+    NewEventSeatCategory,
+    NewEventSlot,
+)
+from shared.db.query_stats import (
+    install_query_instrumentation,
+    statement_shape,
+    track_queries,
+)
+from tests.utils.assertions import assert_max_queries
+from tests.utils.db_helpers import AsyncDatabaseTestHelper
+
+# Event, its category/subcategory/organizer, slots and seat categories,
+# independent of how many slots the event has
+SLUG_EVENT_QUERY_BUDGET = 7
+
+
+@pytest_asyncio.fixture
+async def counted_engine():
+    """In-memory engine with the accounting hooks installed."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    install_query_instrumentation(engine, repeated_statement_threshold=3)
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE items (id INTEGER)"))
+        await conn.execute(text("INSERT INTO items VALUES (1), (2), (3)"))
+    yield engine
+    await engine.dispose()
+
+
+def test_statement_shape_ignores_bind_values_and_in_list_length():
+    """Same query with a different IN list length has the same shape."""
+    short = statement_shape("SELECT * FROM t WHERE id IN ($1, $2)")
+    long = statement_shape("SELECT *\n FROM t WHERE id IN ($1, $2, $3, $4)")
+    assert short == long == "SELECT * FROM t WHERE id IN (?)"
+
+
+@pytest.mark.asyncio
+async def test_track_queries_counts_statements_and_rows(counted_engine):
+    """Statements inside the block are counted with their rows."""
+    async with counted_engine.connect() as conn:
+        with track_queries() as stats:
+            await conn.execute(text("SELECT id FROM items"))
+            await conn.execute(text("UPDATE items SET id = id + 1"))
+
+    assert stats.statements == 2
+    assert stats.rows == 3
+    assert stats.db_time > 0
+
+
+@pytest.mark.asyncio
+async def test_repeated_statement_is_flagged_once(counted_engine):
+    """A shape running more than the threshold is flagged as N+1."""
+    async with counted_engine.connect() as conn:
+        with track_queries() as stats:
+            for item_id in range(5):
+                await conn.execute(
+                    text("SELECT id FROM items WHERE id = :id"),
+                    {"id": item_id},
+                )
+
+    assert stats.statements == 5
+    assert len(stats.flagged) == 1
+
+
+@pytest.mark.asyncio
+async def test_assert_max_queries_fails_over_budget(counted_engine):
+    """The test helper fails when the budget is exceeded."""
+    async with counted_engine.connect() as conn:
+        with pytest.raises(AssertionError):
+            with assert_max_queries(1):
+                await conn.execute(text("SELECT 1"))
+                await conn.execute(text("SELECT 2"))
+
+
+@pytest_asyncio.fixture
+async def event_with_slots(test_db_session, clean_db) -> NewEvent:
+    """An active event with several slots, each with two seat categories,
+    in a category that holds a few more events."""
+    helper = AsyncDatabaseTestHelper(test_db_session)
+    role = await helper.create_role()
+    organizer = await helper.create_admin_user(role_id=role.role_id)
+    category = await helper.create_category()
+
+    today = date.today()
+    events = [
+        NewEvent(
+            event_id=f"QBEV0{index}",
+            category_id=category.category_id,
+            organizer_id=organizer.user_id,
+            event_slug=f"query-budget-{index}",
+            event_title=f"Query Budget {index}",
+            event_dates=[today + timedelta(days=day) for day in range(4)],
+            event_status=EventStatus.ACTIVE,
+        )
+        for index in range(3)
+    ]
+    test_db_session.add_all(events)
+    for day in range(4):
+        slot = NewEventSlot(
+            slot_id=f"QBSLOT0{day}",
+            event_ref_id=events[0].event_id,
+            slot_date=today + timedelta(days=day),
+            start_time="10:00 AM",
+            duration_minutes=60,
+        )
+        test_db_session.add(slot)
+        for label in ("General", "VIP"):
+            test_db_session.add(
+                NewEventSeatCategory(
+                    seat_category_id=f"QBSEAT{day}{label[0]}",
+                    slot_ref_id=slot.slot_id,
+                    category_label=label,
+                    price=10,
+                    total_tickets=100,
+                )
+            )
+    await test_db_session.commit()
+    # Start the request from an empty identity map, as a real one would
+    test_db_session.expunge_all()
+    return events[0]
+
+
+@pytest.mark.asyncio
+@pytest.mark.db
+async def test_slug_event_endpoint_query_budget(
+    test_client: AsyncClient, event_with_slots: NewEvent
+):
+    """Seat categories come with the slots, not one query per slot."""
+    with assert_max_queries(SLUG_EVENT_QUERY_BUDGET):
+        response = await test_client.get(
+            f"/api/v1/new-events/slug/{event_with_slots.event_slug}"
+        )
+
+    assert response.status_code == 200
+    slots = response.json()["data"]["slots"][0]["slot_data"]
+    assert len(slots) == 4
+    assert all(
+        len(slot["seatCategories"]) == 2
+        for day in slots.values()
+        for slot in day
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.db
+async def test_categories_with_all_events_is_one_query(
+    test_db_session, event_with_slots: NewEvent
+):
+    """The latest events of every category come back in one statement."""
+    with assert_max_queries(1):
+        categories = await fetch_categories_with_all_events(test_db_session)
+
+    assert len(categories) == 1
+    assert categories[0]["events_count"] == 3
@@ -0,0 +1,125 @@
+"""
+Flash-sale benchmark for the atomic seat hold.
+
+Fires thousands of concurrent single-seat bookings at one seat category on
+the local test Postgres and checks that exactly ``total_tickets`` of them
+succeed. Run with: pytest -m slow tests/integration/test_seat_reservation_benchmark.py
+"""
+
+import asyncio
+import time
+from datetime import date
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from new_event_service.services.seat_inventory import reserve_seats
+from shared.db.models import (
+    EventStatus,
+    NewEvent,
+    NewEventSeatCategory,
+    NewEventSlot,
+)
+from tests.test_config import get_test_settings
+from tests.utils.db_helpers import AsyncDatabaseTestHelper
+
+TOTAL_TICKETS = 500
+ATTEMPTS = 3000
+CONNECTIONS = 20
+MIN_RESERVATIONS_PER_SECOND = 200
+
+
+@pytest_asyncio.fixture
+async def seat_category_id(test_db_session: AsyncSession, clean_db) -> str:
+    """One event, slot and seat category with TOTAL_TICKETS seats."""
+    helper = AsyncDatabaseTestHelper(test_db_session)
+    role = await helper.create_role()
+    organizer = await helper.create_admin_user(role_id=role.role_id)
+    category = await helper.create_category()
+
+    event = NewEvent(
+        event_id="BNCH01",
+        category_id=category.category_id,
+        organizer_id=organizer.user_id,
+        event_slug="flash-sale-benchmark",
+        event_title="Flash Sale Benchmark",
+        event_dates=[date.today()],
+        event_status=EventStatus.ACTIVE,
+    )
+    slot = NewEventSlot(
+        slot_id="BNCHSLOT01",
+        event_ref_id=event.event_id,
+        slot_date=date.today(),
+        start_time="10:00 AM",
+        duration_minutes=60,
+    )
+    seat_category = NewEventSeatCategory(
+        seat_category_id="BNCHSEAT01",
+        slot_ref_id=slot.slot_id,
+        category_label="General",
+        price=10,
+        total_tickets=TOTAL_TICKETS,
+    )
+    test_db_session.add_all([event, slot, seat_category])
+    await test_db_session.commit()
+    return seat_category.seat_category_id
+
+
+@pytest_asyncio.fixture
+async def wide_engine(test_engine: AsyncEngine):
+    """Engine with enough connections to contend on the seat row."""
+    engine = create_async_engine(
+        get_test_settings().database_url,
+        pool_size=CONNECTIONS,
+        max_overflow=0,
+    )
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.db
+@pytest.mark.slow
+@pytest.mark.integration
+async def test_flash_sale_never_oversells(
+    wide_engine: AsyncEngine,
+    test_db_session: AsyncSession,
+    seat_category_id: str,
+) -> None:
+    """ATTEMPTS concurrent holds of one seat: exactly TOTAL_TICKETS win."""
+    session_factory = async_sessionmaker(wide_engine, expire_on_commit=False)
+
+    async def book_one_seat() -> bool:
+        async with session_factory() as session:
+            reservation = await reserve_seats(session, seat_category_id, 1)
+            await session.commit()
+            return reservation is not None
+
+    started = time.perf_counter()
+    outcomes = await asyncio.gather(*(book_one_seat() for _ in range(ATTEMPTS)))
+    elapsed = time.perf_counter() - started
+
+    seat_category = (
+        await test_db_session.execute(
+            select(NewEventSeatCategory)
+            .where(NewEventSeatCategory.seat_category_id == seat_category_id)
+            .execution_options(populate_existing=True)
+        )
+    ).scalar_one()
+
+    throughput = ATTEMPTS / elapsed
+    assert sum(outcomes) == TOTAL_TICKETS
+    assert seat_category.held == TOTAL_TICKETS
+    assert (
+        seat_category.booked + seat_category.held <= seat_category.total_tickets
+    )
+    assert (
+        throughput >= MIN_RESERVATIONS_PER_SECOND
+    ), f"{ATTEMPTS} attempts in {elapsed:.2f}s ({throughput:.0f}/s)"
@@ -0,0 +1,332 @@
+"""
+Test cases for bulk attendee notifications
+"""
+
+import asyncio
+from datetime import date, datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from new_event_service.services.attendee_notifications import (
+    NOTIFY_STALE_AFTER,
+    SendRateLimiter,
+    attendees_query,
+    claim_notification_job,
+    create_notification_job,
+    deliver_notification_job,
+)
+from shared.db.models import (
+    AttendeeNotificationJob,
+    AttendeeNotificationKind,
+    EventStatus,
+    NewEvent,
+    NotificationJobStatus,
+)
+from shared.utils.email import EmailConfig, email_config
+from shared.utils.email_outbox import SmtpConnectionPool
+from tests.utils.db_helpers import AsyncDatabaseTestHelper
+from tests.utils.fake_smtp import FakeSmtp
+
+
+@pytest.fixture
+async def fake_smtp():
+    server = await FakeSmtp().start()
+    yield server
+    await server.close()
+
+
+@pytest.fixture
+async def pool(fake_smtp):
+    host, port = fake_smtp.address
+    pool = SmtpConnectionPool(
+        EmailConfig(
+            smtp_server=host,
+            smtp_port=port,
+            smtp_username=FakeSmtp.USERNAME,
+            smtp_password=FakeSmtp.PASSWORD,
+            from_email=email_config.from_email,
+            template_dir=email_config.template_dir,
+            connection_security="none",
+        ),
+        size=2,
+        timeout=5,
+    )
+    yield pool
+    await pool.aclose()
+
+
+def event():
+    return NewEvent(
+        event_id="EVT001",
+        organizer_id="ORG001",
+        event_title="Summer Music Festival",
+        event_slug="summer-music-festival",
+        location="Riverside Park",
+    )
+
+
+def attendee(i: int, first_name="Sam"):
+    return SimpleNamespace(
+        user_id=f"U{i:05d}",
+        email_encrypted=f"user{i}@example.com",
+        first_name_encrypted=first_name,
+        username_encrypted=f"user{i}",
+    )
+
+
+def compiled(query) -> str:
+    return str(
+        query.compile(
+            dialect=postgresql.dialect(),
+            compile_kwargs={"literal_binds": True},
+        )
+    )
+
+
+def streaming_db(*chunks):
+    async def partitions():
+        for chunk in chunks:
+            yield chunk
+
+    result = MagicMock()
+    result.partitions = partitions
+    stream_db = AsyncMock()
+    stream_db.stream.return_value = result
+    return stream_db
+
+
+async def running_job(db):
+    db.execute.return_value = MagicMock()
+    db.execute.return_value.scalar.return_value = 3
+    job = await create_notification_job(
+        db,
+        event(),
+        "ORG001",
+        AttendeeNotificationKind.RESCHEDULED,
+        message="Moved indoors because of the forecast.",
+        event_date="2026-07-25",
+    )
+    job.job_id = 7
+    job.status = NotificationJobStatus.RUNNING
+    return job
+
+
+class TestAttendeeQuery:
+    def test_each_attendee_once_in_user_id_order(self):
+        sql = compiled(attendees_query("EVT001"))
+
+        assert "EXISTS (SELECT" in sql
+        assert "e2gevent_booking_orders.booking_status = 'APPROVED'" in sql
+        assert "JOIN" not in sql
+        assert sql.endswith("ORDER BY e2gusers.user_id")
+
+    def test_resumes_after_the_cursor(self):
+        sql = compiled(attendees_query("EVT001", after_user_id="U00042"))
+
+        assert "e2gusers.user_id > 'U00042'" in sql
+
+
+class TestSendRateLimiter:
+    @pytest.mark.asyncio
+    async def test_spaces_sends(self):
+        limiter = SendRateLimiter(50)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
+        await asyncio.gather(*(limiter.wait() for _ in range(6)))
+
+        assert loop.time() - start >= 5 / 50 - 0.01
+
+    @pytest.mark.asyncio
+    async def test_zero_means_no_limit(self):
+        limiter = SendRateLimiter(0)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
+        await asyncio.gather(*(limiter.wait() for _ in range(100)))
+
+        assert loop.time() - start < 0.05
+
+
+class TestNotificationJobs:
+    @pytest.mark.asyncio
+    async def test_job_is_recorded_with_shared_context(self):
+        db = AsyncMock()
+        db.add = MagicMock()
+
+        job = await running_job(db)
+
+        db.add.assert_called_once_with(job)
+        db.commit.assert_awaited_once()
+        assert job.total_recipients == 3
+        assert job.subject == "Summer Music Festival has been rescheduled"
+        assert job.context["event_location"] == "Riverside Park"
+        assert job.context["event_date"] == "2026-07-25"
+        assert job.context["is_cancelled"] is False
+
+    @pytest.mark.asyncio
+    async def test_claim_marks_the_job_running(self):
+        job = AttendeeNotificationJob(status=NotificationJobStatus.PENDING)
+        db = AsyncMock()
+        db.execute.return_value = MagicMock()
+        db.execute.return_value.scalars.return_value.first.return_value = job
+
+        assert await claim_notification_job(db, 7) is job
+
+        assert job.status == NotificationJobStatus.RUNNING
+        assert job.started_at == job.heartbeat_at is not None
+        db.commit.assert_awaited_once()
+        sql = compiled(db.execute.call_args.args[0])
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert "e2gattendee_notification_jobs.job_id = 7" in sql
+
+    @pytest.mark.asyncio
+    async def test_claim_finds_nothing(self):
+        db = AsyncMock()
+        db.execute.return_value = MagicMock()
+        db.execute.return_value.scalars.return_value.first.return_value = None
+
+        assert await claim_notification_job(db) is None
+        db.commit.assert_not_awaited()
+
+
+class TestDeliverNotificationJob:
+    @pytest.mark.asyncio
+    async def test_chunks_are_sent_and_progress_committed(
+        self, fake_smtp, pool
+    ):
+        db = AsyncMock()
+        db.add = MagicMock()
+        job = await running_job(db)
+        db.commit.reset_mock()
+        chunks = [
+            [attendee(1, "Alex"), attendee(2)],
+            [attendee(3, first_name=None)],
+        ]
+        stream_db = streaming_db(*chunks)
+
+        await deliver_notification_job(db, stream_db, job, pool, rate=0)
+
+        assert sorted(fake_smtp.recipients) == [
+            "user1@example.com",
+            "user2@example.com",
+            "user3@example.com",
+        ]
+        bodies = {
+            message["To"]: message.get_payload(0).get_payload(decode=True)
+            for message in fake_smtp.messages
+        }
+        assert b"Hi <strong>Alex</strong>" in bodies["user1@example.com"]
+        assert b"Hi <strong>user3</strong>" in bodies["user3@example.com"]
+        assert b"Moved indoors" in bodies["user2@example.com"]
+        assert fake_smtp.connections <= 2
+        assert job.sent_count == 3
+        assert job.failed_count == 0
+        assert job.last_user_id == "U00003"
+        assert job.status == NotificationJobStatus.COMPLETED
+        assert job.finished_at is not None
+        # One commit per chunk, then the completion
+        assert db.commit.await_count == 3
+        query = stream_db.stream.call_args.args[0]
+        assert query.get_execution_options()["yield_per"] == 500
+
+    @pytest.mark.asyncio
+    async def test_resumed_job_streams_from_its_cursor(self, pool):
+        db = AsyncMock()
+        db.add = MagicMock()
+        job = await running_job(db)
+        job.last_user_id = "U00002"
+        stream_db = streaming_db()
+
+        await deliver_notification_job(db, stream_db, job, pool)
+
+        sql = compiled(stream_db.stream.call_args.args[0])
+        assert "e2gusers.user_id > 'U00002'" in sql
+        assert job.status == NotificationJobStatus.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_failed_recipients_are_counted(self, fake_smtp, pool):
+        db = AsyncMock()
+        db.add = MagicMock()
+        job = await running_job(db)
+        fake_smtp.reject.add("user2@example.com")
+
+        await deliver_notification_job(
+            db,
+            streaming_db([attendee(1), attendee(2), attendee(3)]),
+            job,
+            pool,
+            rate=0,
+        )
+
+        assert job.sent_count == 2
+        assert job.failed_count == 1
+        assert "user2@example.com" in job.last_error
+        assert job.status == NotificationJobStatus.COMPLETED
+
+
+class TestStaleJobRecovery:
+    @pytest.mark.asyncio
+    @pytest.mark.db
+    async def test_stale_running_job_resumes_from_its_cursor(
+        self, test_db_session, clean_db, pool
+    ):
+        """The poll takes over a job whose worker stopped heartbeating,
+        leaves live ones alone, and continues after the last recipient."""
+        helper = AsyncDatabaseTestHelper(test_db_session)
+        role = await helper.create_role()
+        organizer = await helper.create_admin_user(role_id=role.role_id)
+        category = await helper.create_category()
+        test_db_session.add(
+            NewEvent(
+                event_id="EVT001",
+                category_id=category.category_id,
+                organizer_id=organizer.user_id,
+                event_slug="stale-notification",
+                event_title="Stale Notification",
+                event_dates=[date.today()],
+                event_status=EventStatus.ACTIVE,
+            )
+        )
+        now = datetime.now(timezone.utc)
+        jobs = {
+            "stale": now - NOTIFY_STALE_AFTER - timedelta(minutes=1),
+            "live": now,
+        }
+        test_db_session.add_all(
+            AttendeeNotificationJob(
+                event_id="EVT001",
+                requested_by=organizer.user_id,
+                kind=AttendeeNotificationKind.RESCHEDULED,
+                subject=name,
+                context={},
+                status=NotificationJobStatus.RUNNING,
+                total_recipients=4,
+                sent_count=2,
+                failed_count=0,
+                last_user_id="U00002",
+                started_at=heartbeat_at,
+                heartbeat_at=heartbeat_at,
+            )
+            for name, heartbeat_at in jobs.items()
+        )
+        await test_db_session.commit()
+
+        job = await claim_notification_job(test_db_session)
+        assert job is not None and job.subject == "stale"
+        assert await claim_notification_job(test_db_session) is None
+
+        stream_db = streaming_db([attendee(3), attendee(4)])
+        await deliver_notification_job(
+            test_db_session, stream_db, job, pool, rate=0
+        )
+
+        sql = compiled(stream_db.stream.call_args.args[0])
+        assert "e2gusers.user_id > 'U00002'" in sql
+        await test_db_session.refresh(job)
+        assert job.status == NotificationJobStatus.COMPLETED
+        assert job.sent_count == 4
+        assert job.last_user_id == "U00004"
@@ -0,0 +1,204 @@
+"""
+Test cases for booking hold expiry and held count reconciliation
+"""
+
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+
+from schedulers.booking_status_updater import (
+    backfill_held_counts,
+    release_expired_holds,
+)
+from shared.db.models import User
+from shared.db.models.new_events import (
+    BookingStatus,
+    EventStatus,
+    NewEvent,
+    NewEventBooking,
+    NewEventBookingOrder,
+    NewEventSeatCategory,
+    NewEventSlot,
+    PaymentStatus,
+)
+from tests.test_config import get_test_settings
+from tests.utils.db_helpers import AsyncDatabaseTestHelper
+
+
+@pytest_asyncio.fixture
+async def held_orders(test_db_session, clean_db):
+    """
+    Seat categories whose held counts match these orders:
+
+    - EXPIRED: PROCESSING past expires_at (2 x S1, 1 x S2)
+    - OPEN: PROCESSING, expires in five minutes (3 x S1)
+    - PAID: APPROVED past expires_at (4 x S1, not held)
+    - LEGACY_OLD: PROCESSING, no expires_at, older than the hold window
+      (2 x S3)
+    - LEGACY_NEW: PROCESSING, no expires_at, just created (1 x S3)
+    """
+    helper = AsyncDatabaseTestHelper(test_db_session)
+    role = await helper.create_role()
+    organizer = await helper.create_admin_user(role_id=role.role_id)
+    category = await helper.create_category()
+    user = User(
+        user_id="HOLDUS",
+        username="holduser",
+        email="hold@example.com",
+        password_hash="not-a-real-hash",
+    )
+    event = NewEvent(
+        event_id="HOLDEV",
+        category_id=category.category_id,
+        organizer_id=organizer.user_id,
+        event_slug="hold-expiry",
+        event_title="Hold Expiry",
+        event_dates=[date.today()],
+        event_status=EventStatus.ACTIVE,
+    )
+    slot = NewEventSlot(
+        slot_id="HOLDSLOT",
+        event_ref_id=event.event_id,
+        slot_date=date.today(),
+        start_time="10:00 AM",
+        duration_minutes=60,
+    )
+    test_db_session.add_all([user, event, slot])
+    test_db_session.add_all(
+        NewEventSeatCategory(
+            seat_category_id=seat_category_id,
+            slot_ref_id=slot.slot_id,
+            category_label=seat_category_id,
+            price=10,
+            total_tickets=10,
+            held=held,
+        )
+        for seat_category_id, held in (("S1", 5), ("S2", 1), ("S3", 3))
+    )
+
+    now = datetime.now(timezone.utc)
+    hold_window = timedelta(minutes=get_test_settings().BOOKING_HOLD_MINUTES)
+    orders = {
+        "EXPIRED": (BookingStatus.PROCESSING, now - timedelta(minutes=1), now),
+        "OPEN": (BookingStatus.PROCESSING, now + timedelta(minutes=5), now),
+        "PAID": (BookingStatus.APPROVED, now - timedelta(minutes=1), now),
+        "LEGACY_OLD": (
+            BookingStatus.PROCESSING,
+            None,
+            now - hold_window - timedelta(minutes=5),
+        ),
+        "LEGACY_NEW": (BookingStatus.PROCESSING, None, now),
+    }
+    test_db_session.add_all(
+        NewEventBookingOrder(
+            order_id=order_id,
+            user_ref_id=user.user_id,
+            event_ref_id=event.event_id,
+            slot_ref_id=slot.slot_id,
+            total_amount=10,
+            booking_status=booking_status,
+            payment_status=PaymentStatus.PENDING,
+            expires_at=expires_at,
+            created_at=created_at,
+        )
+        for order_id, (booking_status, expires_at, created_at) in orders.items()
+    )
+    line_items = [
+        ("EXPIRED", "S1", 2),
+        ("EXPIRED", "S2", 1),
+        ("OPEN", "S1", 3),
+        ("PAID", "S1", 4),
+        ("LEGACY_OLD", "S3", 2),
+        ("LEGACY_NEW", "S3", 1),
+    ]
+    test_db_session.add_all(
+        NewEventBooking(
+            booking_id=f"LINE{index}",
+            order_id=order_id,
+            seat_category_ref_id=seat_category_id,
+            num_seats=seats,
+            price_per_seat=10,
+            subtotal=10 * seats,
+            total_amount=10 * seats,
+            total_price=10 * seats,
+        )
+        for index, (order_id, seat_category_id, seats) in enumerate(line_items)
+    )
+    await test_db_session.commit()
+    test_db_session.expunge_all()
+
+
+async def _held(db) -> dict[str, int]:
+    rows = await db.execute(
+        select(NewEventSeatCategory.seat_category_id, NewEventSeatCategory.held)
+    )
+    return dict(rows.all())
+
+
+async def _booking_statuses(db) -> dict[str, BookingStatus]:
+    rows = await db.execute(
+        select(
+            NewEventBookingOrder.order_id,
+            NewEventBookingOrder.booking_status,
+        )
+    )
+    return dict(rows.all())
+
+
+class TestHoldExpiry:
+    """Test cases for set-based hold expiry"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.db
+    async def test_expired_holds_are_released(
+        self, test_db_session, held_orders
+    ):
+        """Expired and legacy-expired orders give their seats back; open
+        and paid orders are untouched."""
+        released = await release_expired_holds(test_db_session)
+
+        assert released == 3
+        assert await _held(test_db_session) == {"S1": 3, "S2": 0, "S3": 1}
+        assert await _booking_statuses(test_db_session) == {
+            "EXPIRED": BookingStatus.CANCELLED,
+            "OPEN": BookingStatus.PROCESSING,
+            "PAID": BookingStatus.APPROVED,
+            "LEGACY_OLD": BookingStatus.CANCELLED,
+            "LEGACY_NEW": BookingStatus.PROCESSING,
+        }
+
+    @pytest.mark.asyncio
+    @pytest.mark.db
+    async def test_release_is_idempotent(self, test_db_session, held_orders):
+        """A second run finds nothing left to release."""
+        await release_expired_holds(test_db_session)
+
+        assert await release_expired_holds(test_db_session) == 0
+        assert await _held(test_db_session) == {"S1": 3, "S2": 0, "S3": 1}
+
+    def test_partial_index_covers_processing_orders(self):
+        index = next(
+            i
+            for i in NewEventBookingOrder.__table__.indexes
+            if i.name == "ix_booking_orders_processing_expires"
+        )
+        assert [c.name for c in index.columns] == ["expires_at"]
+        assert "PROCESSING" in str(index.dialect_options["postgresql"]["where"])
+
+    @pytest.mark.asyncio
+    @pytest.mark.db
+    async def test_reconcile_corrects_only_drifted_counts(
+        self, test_db_session, held_orders
+    ):
+        """Reconciliation recomputes held from PROCESSING orders and only
+        rewrites categories that drifted."""
+        seat_category = await test_db_session.get(NewEventSeatCategory, "S1")
+        seat_category.held = 9
+        await test_db_session.commit()
+
+        corrected = await backfill_held_counts(test_db_session)
+
+        assert corrected == 1
+        assert await _held(test_db_session) == {"S1": 5, "S2": 1, "S3": 3}
@@ -0,0 +1,432 @@
+"""
+Test cases for PayPal webhook ingestion and booking payment finalization
+"""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from new_event_service.api.v1.endpoints import bookings
+from new_event_service.services import booking_payments
+from new_event_service.services.booking_payments import (
+    CAPTURE_COMPLETED,
+    ORDER_APPROVED,
+    apply_webhook_event,
+    cancel_order,
+    capture_and_finalize,
+    record_webhook_event,
+)
+from schedulers import paypal_webhook_worker
+from schedulers.paypal_webhook_worker import (
+    WEBHOOK_MAX_ATTEMPTS,
+    claim_webhook_events,
+    process_webhook_batch,
+)
+from shared.db.models.new_events import BookingStatus, PaymentStatus
+from shared.db.models.payments import PayPalWebhookEvent, WebhookEventStatus
+from shared.utils.paypal import AsyncPayPalClient, PayPalError
+from tests.utils.fake_paypal import FakePayPal
+
+
+def approved_event(order_id: str = "ORD000000001") -> dict:
+    return {
+        "id": "WH-APPROVED-1",
+        "event_type": ORDER_APPROVED,
+        "resource": {
+            "id": "PAYPALORDER1",
+            "status": "APPROVED",
+            "purchase_units": [{"custom_id": order_id}],
+        },
+    }
+
+
+def capture_event(order_id: str = "ORD000000001") -> dict:
+    return {
+        "id": "WH-CAPTURE-1",
+        "event_type": CAPTURE_COMPLETED,
+        "resource": {
+            "id": "CAPTURE1",
+            "status": "COMPLETED",
+            "custom_id": order_id,
+            "supplementary_data": {"related_ids": {"order_id": "PAYPALORDER1"}},
+        },
+    }
+
+
+def inbox_row(event: dict, attempts: int = 0) -> PayPalWebhookEvent:
+    order_id, paypal_order_id, capture_id = (
+        booking_payments._webhook_references(event)
+    )
+    return PayPalWebhookEvent(
+        event_id=event["id"],
+        event_type=event["event_type"],
+        order_ref_id=order_id,
+        paypal_order_id=paypal_order_id,
+        capture_id=capture_id,
+        payload=event,
+        status=WebhookEventStatus.PENDING,
+        attempts=attempts,
+    )
+
+
+@pytest.fixture
+def mock_db():
+    db = AsyncMock()
+    db.execute.return_value = MagicMock()
+    db.begin_nested = MagicMock()
+    return db
+
+
+@pytest.fixture
+def fake_paypal():
+    """Fake PayPal wired into the booking payments module."""
+    fake = FakePayPal()
+    client = AsyncPayPalClient(
+        FakePayPal.CLIENT_ID,
+        FakePayPal.CLIENT_SECRET,
+        base_url="http://fake-paypal",
+        backoff_base=0.0,
+        transport=httpx.ASGITransport(app=fake.app),
+    )
+    with patch.object(
+        booking_payments, "paypal_client", SimpleNamespace(client=client)
+    ):
+        yield fake, client
+
+
+class TestWebhookRecording:
+    """Test cases for storing webhook deliveries"""
+
+    def test_references_from_order_approved(self):
+        assert booking_payments._webhook_references(approved_event()) == (
+            "ORD000000001",
+            "PAYPALORDER1",
+            None,
+        )
+
+    def test_references_from_capture_completed(self):
+        assert booking_payments._webhook_references(capture_event()) == (
+            "ORD000000001",
+            "PAYPALORDER1",
+            "CAPTURE1",
+        )
+
+    @pytest.mark.asyncio
+    async def test_redelivery_is_deduplicated_by_event_id(self, mock_db):
+        mock_db.execute.return_value.scalar_one_or_none.return_value = None
+
+        assert await record_webhook_event(mock_db, approved_event()) is False
+        sql = str(
+            mock_db.execute.call_args.args[0].compile(
+                dialect=postgresql.dialect()
+            )
+        )
+        assert sql.startswith("INSERT INTO e2gpaypal_webhook_events")
+        assert "ON CONFLICT (event_id) DO NOTHING" in sql
+        mock_db.commit.assert_not_awaited()
+
+
+class TestCaptureAndFinalize:
+    """Test cases for the shared capture path of /confirm and the worker"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_captures_charge_once(self, fake_paypal):
+        fake, client = fake_paypal
+        created = await client.create_order({"intent": "CAPTURE"})
+        order = MagicMock()
+
+        with (
+            patch.object(
+                booking_payments,
+                "lock_processing_order",
+                AsyncMock(side_effect=[order, None]),
+            ),
+            patch.object(
+                booking_payments, "complete_order", AsyncMock()
+            ) as complete_order,
+        ):
+            first = await capture_and_finalize(
+                AsyncMock(), "ORD000000001", created.result.id
+            )
+            second = await capture_and_finalize(
+                AsyncMock(), "ORD000000001", created.result.id
+            )
+        await client.aclose()
+
+        assert first is order
+        assert second is None
+        assert fake.captures == 1
+        complete_order.assert_awaited_once()
+        assert complete_order.await_args.args[2] == f"CAP{created.result.id}"
+
+    @pytest.mark.asyncio
+    async def test_order_captured_elsewhere_is_read_back(self, fake_paypal):
+        fake, client = fake_paypal
+        created = await client.create_order({"intent": "CAPTURE"})
+        await client.capture_order(created.result.id)
+
+        with (
+            patch.object(
+                booking_payments,
+                "lock_processing_order",
+                AsyncMock(return_value=MagicMock()),
+            ),
+            patch.object(
+                booking_payments, "complete_order", AsyncMock()
+            ) as complete_order,
+        ):
+            await capture_and_finalize(
+                AsyncMock(), "ORD000000001", created.result.id
+            )
+        await client.aclose()
+
+        assert fake.captures == 1
+        complete_order.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_rejected_capture_fails_order(self, fake_paypal):
+        _, client = fake_paypal
+        with (
+            patch.object(
+                booking_payments,
+                "lock_processing_order",
+                AsyncMock(return_value=MagicMock()),
+            ),
+            patch.object(
+                booking_payments, "fail_order", AsyncMock()
+            ) as fail_order,
+        ):
+            result = await capture_and_finalize(
+                AsyncMock(), "ORD000000001", "UNKNOWN"
+            )
+        await client.aclose()
+
+        assert result is None
+        fail_order.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_outage_keeps_the_hold(self, fake_paypal):
+        fake, client = fake_paypal
+        created = await client.create_order({"intent": "CAPTURE"})
+        fake.fail_next(10, status_code=503)
+
+        with patch.object(
+            booking_payments, "lock_processing_order", AsyncMock()
+        ) as lock_order:
+            with pytest.raises(PayPalError):
+                await capture_and_finalize(
+                    AsyncMock(), "ORD000000001", created.result.id
+                )
+        await client.aclose()
+
+        lock_order.assert_not_awaited()
+
+
+class TestCancelBooking:
+    """Test cases for the buyer cancelling at PayPal"""
+
+    @pytest.mark.asyncio
+    async def test_cancel_releases_seats_atomically(self, mock_db):
+        order = SimpleNamespace(
+            booking_status=BookingStatus.PROCESSING,
+            payment_status=PaymentStatus.PENDING,
+            coupon_status=False,
+            line_items=[
+                SimpleNamespace(
+                    seat_category_ref_id="S1", num_seats=2, coupon_id=None
+                ),
+                SimpleNamespace(
+                    seat_category_ref_id="S2", num_seats=1, coupon_id=None
+                ),
+            ],
+        )
+        with patch.object(
+            booking_payments, "release_held_seats", AsyncMock()
+        ) as release:
+            await cancel_order(mock_db, order)
+
+        assert order.booking_status == BookingStatus.CANCELLED
+        assert order.payment_status == PaymentStatus.CANCELLED
+        assert release.await_args_list == [
+            ((mock_db, "S1", 2),),
+            ((mock_db, "S2", 1),),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_cancel_after_capture_changes_nothing(self, mock_db):
+        """An order finalized first (webhook, /confirm) is left alone."""
+        with (
+            patch.object(
+                bookings, "lock_processing_order", AsyncMock(return_value=None)
+            ),
+            patch.object(
+                bookings,
+                "get_booking_status",
+                AsyncMock(return_value=BookingStatus.APPROVED),
+            ),
+            patch.object(bookings, "cancel_order", AsyncMock()) as cancel,
+        ):
+            response = await bookings._cancel_booking("ORD000000001", mock_db)
+
+        cancel.assert_not_awaited()
+        mock_db.commit.assert_not_awaited()
+        assert "booking-failure" in response.headers["location"]
+
+
+class TestApplyWebhookEvent:
+    """Test cases for applying one inbox event"""
+
+    @pytest.mark.asyncio
+    async def test_capture_completed_approves_order(self, mock_db):
+        order = MagicMock()
+        with (
+            patch.object(
+                booking_payments,
+                "lock_processing_order",
+                AsyncMock(return_value=order),
+            ),
+            patch.object(
+                booking_payments, "complete_order", AsyncMock()
+            ) as complete_order,
+        ):
+            status, approved = await apply_webhook_event(
+                mock_db, inbox_row(capture_event())
+            )
+
+        assert status == WebhookEventStatus.PROCESSED
+        assert approved is order
+        complete_order.assert_awaited_once_with(mock_db, order, "CAPTURE1")
+
+    @pytest.mark.asyncio
+    async def test_already_finalized_order_is_ignored(self, mock_db):
+        with (
+            patch.object(
+                booking_payments,
+                "lock_processing_order",
+                AsyncMock(return_value=None),
+            ),
+            patch.object(
+                booking_payments,
+                "get_booking_status",
+                AsyncMock(return_value=BookingStatus.APPROVED),
+            ),
+        ):
+            status, approved = await apply_webhook_event(
+                mock_db, inbox_row(capture_event())
+            )
+
+        assert status == WebhookEventStatus.IGNORED
+        assert approved is None
+
+    @pytest.mark.asyncio
+    async def test_event_without_order_reference_is_ignored(self, mock_db):
+        event = approved_event()
+        event["resource"]["purchase_units"] = [{}]
+
+        status, _ = await apply_webhook_event(mock_db, inbox_row(event))
+
+        assert status == WebhookEventStatus.IGNORED
+        mock_db.execute.assert_not_awaited()
+
+
+class TestWebhookWorker:
+    """Test cases for batch processing of the inbox"""
+
+    @pytest.mark.asyncio
+    async def test_claim_commits_before_paypal_is_called(self, mock_db):
+        """Rows are leased and committed, PayPal is called with no
+        transaction open, then each event is applied and committed."""
+        ok, broken = inbox_row(capture_event()), inbox_row(approved_event())
+        mock_db.execute.return_value.scalars.return_value.all.return_value = [
+            ok,
+            broken,
+        ]
+        order = MagicMock()
+        calls = []
+        mock_db.commit.side_effect = lambda: calls.append("commit")
+
+        async def capture(order_id, paypal_order_id):
+            calls.append("paypal")
+            raise PayPalError("PayPal unreachable")
+
+        async def apply(db, event, capture):
+            calls.append("apply")
+            return WebhookEventStatus.PROCESSED, order
+
+        with (
+            patch.object(paypal_webhook_worker, "capture_outcome", capture),
+            patch.object(paypal_webhook_worker, "apply_webhook_event", apply),
+            patch.object(
+                paypal_webhook_worker,
+                "queue_booking_confirmation",
+                MagicMock(side_effect=lambda db, o: calls.append("email")),
+            ),
+        ):
+            handled = await process_webhook_batch(mock_db)
+
+        assert handled == 2
+        assert calls == [
+            "commit",
+            "apply",
+            "email",
+            "commit",
+            "paypal",
+            "commit",
+        ]
+        assert ok.status == WebhookEventStatus.PROCESSED
+        assert ok.processed_at is not None
+        assert ok.leased_until is None
+        assert broken.status == WebhookEventStatus.PENDING
+        assert broken.attempts == 1
+        assert broken.leased_until is None
+        assert broken.last_error == "PayPal unreachable"
+        sql = str(
+            mock_db.execute.call_args.args[0].compile(
+                dialect=postgresql.dialect()
+            )
+        )
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert "leased_until" in sql
+
+    @pytest.mark.asyncio
+    async def test_event_fails_after_max_attempts(self, mock_db):
+        event = inbox_row(approved_event(), attempts=WEBHOOK_MAX_ATTEMPTS - 1)
+        mock_db.execute.return_value.scalars.return_value.all.return_value = [
+            event
+        ]
+
+        with patch.object(
+            paypal_webhook_worker,
+            "capture_outcome",
+            AsyncMock(side_effect=RuntimeError("boom")),
+        ):
+            await process_webhook_batch(mock_db)
+
+        assert event.status == WebhookEventStatus.FAILED
+        assert event.attempts == WEBHOOK_MAX_ATTEMPTS
+
+    @pytest.mark.asyncio
+    @pytest.mark.db
+    async def test_leased_events_are_not_claimed_twice(
+        self, test_session_factory, clean_db
+    ):
+        """A claimed event is skipped until its lease runs out."""
+        async with test_session_factory() as db:
+            db.add(inbox_row(approved_event()))
+            await db.commit()
+
+        async with test_session_factory() as first:
+            claimed = await claim_webhook_events(first)
+        async with test_session_factory() as second:
+            assert await claim_webhook_events(second) == []
+            claimed[0].leased_until = datetime.now(timezone.utc)
+            await second.merge(claimed[0])
+            await second.commit()
+            reclaimed = await claim_webhook_events(second)
+
+        assert [event.event_id for event in claimed] == ["WH-APPROVED-1"]
+        assert [event.attempts for event in reclaimed] == [2]
@@ -0,0 +1,226 @@
+"""
+Test cases for the single-query booking preflight
+"""
+
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from new_event_service.api.v1.endpoints.bookings import (
+    _create_event_booking_order,
+)
+from new_event_service.schemas.bookings import BookingCreateRequest
+from new_event_service.services.booking_preflight import (
+    build_preflight_query,
+    parse_preflight,
+)
+from shared.db.models.new_events import BookingStatus, EventStatus
+
+
+def booking_request(**overrides) -> BookingCreateRequest:
+    payload = {
+        "user_ref_id": "USR001",
+        "event_ref_id": "EVT001",
+        "slot_ref_id": "SLOT0001",
+        "event_date": date(2026, 12, 1),
+        "seatCategories": [
+            {
+                "seat_category_ref_id": "SEAT0001",
+                "price_per_seat": 25.0,
+                "num_seats": 2,
+                "coupon_id": "CPN00001",
+            },
+            {
+                "seat_category_ref_id": "SEAT0002",
+                "price_per_seat": 40.0,
+                "num_seats": 1,
+            },
+        ],
+    }
+    payload.update(overrides)
+    return BookingCreateRequest(**payload)
+
+
+def preflight_row(**overrides) -> SimpleNamespace:
+    row = {
+        "event": [{"event_status": "ACTIVE", "has_date": True}],
+        "slot": [{"slot_id": "SLOT0001", "slot_status": False}],
+        "seat_categories": [
+            {
+                "seat_category_id": "SEAT0001",
+                "category_label": "General",
+                "price": 25.0,
+                "available": 8,
+            },
+            {
+                "seat_category_id": "SEAT0002",
+                "category_label": "VIP",
+                "price": 40,
+                "available": 0,
+            },
+        ],
+        "pending_orders": [],
+        "coupons": [
+            {
+                "coupon_id": "CPN00001",
+                "coupon_name": "EARLY",
+                "coupon_percentage": 10,
+                "number_of_coupons": 50,
+                "sold_coupons": 3,
+            }
+        ],
+    }
+    row.update(overrides)
+    return SimpleNamespace(**row)
+
+
+@pytest.fixture
+def mock_db():
+    def with_row(row):
+        db = AsyncMock()
+        db.execute.return_value = MagicMock()
+        db.execute.return_value.one.return_value = row
+        return db
+
+    return with_row
+
+
+class TestPreflightQuery:
+    def test_one_statement_with_a_cte_per_check(self):
+        sql = str(
+            build_preflight_query(booking_request()).compile(
+                dialect=postgresql.dialect()
+            )
+        )
+
+        assert sql.startswith("WITH preflight_event AS")
+        for cte in (
+            "preflight_slot",
+            "preflight_seat_categories",
+            "preflight_pending_orders",
+            "preflight_coupons",
+        ):
+            assert f"{cte} AS \n(SELECT" in sql
+            assert f"json_agg({cte})" in sql
+        assert "= ANY (e2gevents_new.event_dates) AS has_date" in sql
+
+    def test_parse_types_rows(self):
+        preflight = parse_preflight(
+            preflight_row(
+                pending_orders=[
+                    {
+                        "seat_category_ref_id": "SEAT0002",
+                        "order_id": "ORD001",
+                        "booking_status": "PROCESSING",
+                    }
+                ]
+            )
+        )
+
+        assert preflight.event.event_status == EventStatus.ACTIVE
+        assert preflight.slot.slot_status is False
+        assert preflight.seat_categories["SEAT0002"].price == 40.0
+        assert preflight.seat_categories["SEAT0002"].available == 0
+        assert (
+            preflight.pending_orders["SEAT0002"].booking_status
+            == BookingStatus.PROCESSING
+        )
+        assert preflight.coupons["CPN00001"].sold_coupons == 3
+
+    def test_parse_missing_rows(self):
+        preflight = parse_preflight(
+            preflight_row(event=[], slot=[], seat_categories=[], coupons=[])
+        )
+
+        assert preflight.event is None
+        assert preflight.slot is None
+        assert preflight.seat_categories == {}
+        assert preflight.coupons == {}
+
+
+class TestBookingValidation:
+    """Validation failures cost exactly one query and keep their messages."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "overrides, status_code, message",
+        [
+            ({"event": []}, 404, "Event not found"),
+            (
+                {"event": [{"event_status": "INACTIVE", "has_date": True}]},
+                400,
+                "Event 'EVT001' is not active",
+            ),
+            (
+                {"event": [{"event_status": "ACTIVE", "has_date": False}]},
+                400,
+                "Invalid event date 2026-12-01 for event EVT001",
+            ),
+            (
+                {"slot": []},
+                404,
+                "Slot not found for this event on the given date",
+            ),
+            (
+                {"slot": [{"slot_id": "SLOT0001", "slot_status": True}]},
+                400,
+                "Slot is not active",
+            ),
+            (
+                {"seat_categories": []},
+                400,
+                "Some seat categories are invalid for this slot",
+            ),
+            ({"coupons": []}, 400, "Invalid coupon CPN00001"),
+        ],
+    )
+    async def test_rejections(self, mock_db, overrides, status_code, message):
+        db = mock_db(preflight_row(**overrides))
+
+        with pytest.raises(HTTPException) as exc_info:
+            await _create_event_booking_order(booking_request(), db)
+
+        assert exc_info.value.status_code == status_code
+        assert exc_info.value.detail["message"] == message
+        db.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_pending_order_is_reported(self, mock_db):
+        db = mock_db(
+            preflight_row(
+                pending_orders=[
+                    {
+                        "seat_category_ref_id": "SEAT0001",
+                        "order_id": "ORD001",
+                        "booking_status": "PROCESSING",
+                    }
+                ]
+            )
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            await _create_event_booking_order(booking_request(), db)
+
+        assert exc_info.value.detail["data"] == {
+            "order_id": "ORD001",
+            "status": "PROCESSING",
+        }
+        db.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_price_mismatch(self, mock_db):
+        db = mock_db(preflight_row())
+        request = booking_request()
+        request.seatCategories[1].price_per_seat = 39.0
+
+        with pytest.raises(HTTPException) as exc_info:
+            await _create_event_booking_order(request, db)
+
+        assert exc_info.value.detail["message"] == (
+            "Price mismatch for category VIP"
+        )
+        db.execute.assert_awaited_once()
@@ -0,0 +1,66 @@
+"""
+Test cases for the shared bounded TTL-LRU cache
+"""
+
+import time
+
+from shared.utils.bounded_cache import BoundedTTLCache
+
+
+class TestBoundedTTLCache:
+    def test_least_recently_used_drop_first(self):
+        cache = BoundedTTLCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert len(cache) == 2
+
+    def test_entries_expire_after_ttl(self):
+        cache = BoundedTTLCache(maxsize=2, ttl_seconds=0.01)
+        cache.put("a", 1)
+        assert cache.get("a") == 1
+        time.sleep(0.02)
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_explicit_expiry_uses_the_clock(self):
+        cache = BoundedTTLCache(maxsize=2, clock=time.time)
+        cache.put("old", 1, expires_at=time.time() - 1)
+        cache.put("new", 2, expires_at=time.time() + 60)
+
+        assert cache.get("old") is None
+        assert cache.get("new") == 2
+
+    def test_cached_none_is_distinct_from_a_miss(self):
+        missing = object()
+        cache = BoundedTTLCache(maxsize=2)
+        cache.put("a", None)
+
+        assert cache.get("a", missing) is None
+        assert cache.get("b", missing) is missing
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_disabled_caches_store_nothing(self):
+        no_room = BoundedTTLCache(maxsize=0)
+        no_ttl = BoundedTTLCache(maxsize=2, ttl_seconds=0)
+        no_room.put("a", 1)
+        no_ttl.put("a", 1)
+
+        assert len(no_room) == len(no_ttl) == 0
+
+    def test_discard_and_clear(self):
+        cache = BoundedTTLCache(maxsize=4)
+        for key in (("s", 1), ("s", 2), ("t", 1)):
+            cache.put(key, True)
+        cache.get(("s", 1))
+
+        cache.discard(lambda key: key[0] == "s")
+        assert len(cache) == 1
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.hits == cache.misses == 0
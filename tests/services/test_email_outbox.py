@@ -0,0 +1,276 @@
+"""
+Test cases for the transactional email outbox and its SMTP pool
+"""
+
+import asyncio
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from shared.db.models import EmailOutbox, EmailOutboxStatus
+from shared.utils.email import (
+    EmailConfig,
+    TemplatedEmail,
+    email_config,
+    email_sender,
+)
+from shared.utils.email_outbox import (
+    EMAIL_MAX_ATTEMPTS,
+    SmtpConnectionPool,
+    dispatch_outbox_batch,
+    enqueue_email,
+    purge_finished_emails,
+    retry_delay,
+)
+from shared.utils.email_utils import build_user_verification_email
+from tests.utils.fake_smtp import FakeSmtp
+
+
+@pytest.fixture
+async def fake_smtp():
+    server = await FakeSmtp().start()
+    yield server
+    await server.close()
+
+
+@pytest.fixture
+async def pool(fake_smtp):
+    host, port = fake_smtp.address
+    pool = SmtpConnectionPool(
+        EmailConfig(
+            smtp_server=host,
+            smtp_port=port,
+            smtp_username=FakeSmtp.USERNAME,
+            smtp_password=FakeSmtp.PASSWORD,
+            from_email=email_config.from_email,
+            template_dir=email_config.template_dir,
+            connection_security="none",
+        ),
+        size=2,
+        timeout=5,
+    )
+    yield pool
+    await pool.aclose()
+
+
+def outbox_row(recipient="user@example.com", attempts=0, **overrides):
+    email = build_user_verification_email(recipient, "user", "token-123")
+    row = EmailOutbox(
+        id=attempts + 1,
+        recipient=email.to,
+        subject=email.subject,
+        template_file=email.template_file,
+        context=email.context,
+        status=EmailOutboxStatus.PENDING,
+        attempts=attempts,
+    )
+    for name, value in overrides.items():
+        setattr(row, name, value)
+    return row
+
+
+def outbox_db(rows):
+    db = AsyncMock()
+    db.execute.return_value = MagicMock()
+    db.execute.return_value.scalars.return_value.all.return_value = rows
+    return db
+
+
+def message_to(to: str):
+    return email_sender.render(build_user_verification_email(to, "user", "t"))
+
+
+class TestEnqueueEmail:
+    def test_adds_row_to_callers_transaction(self):
+        db = MagicMock()
+        row = enqueue_email(
+            db,
+            TemplatedEmail(
+                "a@b.com",
+                "Hi",
+                "user/booking_success.html",
+                {"when": date(2026, 1, 2), "amount": 1.5},
+            ),
+        )
+
+        db.add.assert_called_once_with(row)
+        db.commit.assert_not_called()
+        assert row.status == EmailOutboxStatus.PENDING
+        assert row.context == {"when": "2026-01-02", "amount": 1.5}
+
+    def test_backoff_doubles_up_to_a_cap(self):
+        assert retry_delay(1) == timedelta(seconds=30)
+        assert retry_delay(3) == timedelta(seconds=120)
+        assert retry_delay(50) == timedelta(hours=1)
+
+
+class TestSmtpConnectionPool:
+    @pytest.mark.asyncio
+    async def test_connections_are_reused(self, fake_smtp, pool):
+        for _ in range(3):
+            await pool.send(message_to("a@b.com"))
+        await asyncio.gather(
+            *(pool.send(message_to("c@d.com")) for _ in range(6))
+        )
+
+        assert len(fake_smtp.messages) == 9
+        assert fake_smtp.connections == pool.connects <= 2
+        assert fake_smtp.logins == fake_smtp.connections
+
+    @pytest.mark.asyncio
+    async def test_dropped_idle_connection_is_replaced(self, fake_smtp, pool):
+        await pool.send(message_to("a@b.com"))
+        fake_smtp.drop_connections()
+        await asyncio.sleep(0.05)
+
+        await pool.send(message_to("a@b.com"))
+
+        assert len(fake_smtp.messages) == 2
+        assert pool.connects == 2
+
+    @pytest.mark.asyncio
+    async def test_sends_run_concurrently(self, fake_smtp, pool):
+        fake_smtp.latency = 0.2
+        start = asyncio.get_running_loop().time()
+
+        await asyncio.gather(
+            *(pool.send(message_to("a@b.com")) for _ in range(2))
+        )
+
+        assert asyncio.get_running_loop().time() - start < 0.35
+
+
+class TestDispatchOutbox:
+    @pytest.mark.asyncio
+    async def test_due_emails_are_sent(self, fake_smtp, pool):
+        rows = [outbox_row(f"user{i}@example.com") for i in range(4)]
+        db = outbox_db(rows)
+
+        assert await dispatch_outbox_batch(db, pool) == 4
+
+        assert sorted(fake_smtp.recipients) == sorted(r.recipient for r in rows)
+        assert "Verify Your Email" in fake_smtp.messages[0]["Subject"]
+        assert all(row.status == EmailOutboxStatus.SENT for row in rows)
+        assert all(row.sent_at is not None for row in rows)
+        assert db.commit.await_count == 2
+        sql = str(
+            db.execute.call_args.args[0].compile(dialect=postgresql.dialect())
+        )
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert "e2gemail_outbox.next_attempt_at <=" in sql
+
+    @pytest.mark.asyncio
+    async def test_claim_commits_before_sending(self, fake_smtp, pool):
+        """No row lock is held while talking to SMTP: the claim leases the
+        rows and commits before the first send."""
+        row = outbox_row()
+        db = outbox_db([row])
+        at_claim = {}
+
+        async def commit():
+            at_claim.setdefault("sent", len(fake_smtp.messages))
+            at_claim.setdefault("next_attempt_at", row.next_attempt_at)
+            at_claim.setdefault("attempts", row.attempts)
+
+        db.commit.side_effect = commit
+
+        await dispatch_outbox_batch(db, pool)
+
+        assert at_claim["sent"] == 0
+        assert at_claim["attempts"] == 1
+        assert at_claim["next_attempt_at"] > datetime.now(timezone.utc)
+        assert row.status == EmailOutboxStatus.SENT
+
+    @pytest.mark.asyncio
+    async def test_transient_failure_is_retried_later(self, fake_smtp, pool):
+        row = outbox_row()
+        fake_smtp.fail_next(1, 451)
+
+        await dispatch_outbox_batch(outbox_db([row]), pool)
+
+        assert row.status == EmailOutboxStatus.PENDING
+        assert row.attempts == 1
+        assert "451" in row.last_error
+        assert row.next_attempt_at > datetime.now(timezone.utc) + timedelta(
+            seconds=25
+        )
+
+        row.next_attempt_at = datetime.now(timezone.utc)
+        await dispatch_outbox_batch(outbox_db([row]), pool)
+
+        assert row.status == EmailOutboxStatus.SENT
+        assert row.attempts == 2
+        assert fake_smtp.recipients == [row.recipient]
+
+    @pytest.mark.asyncio
+    async def test_refused_recipient_is_dead_lettered(self, fake_smtp, pool):
+        refused, ok = outbox_row("gone@example.com"), outbox_row()
+        fake_smtp.reject.add(refused.recipient)
+
+        await dispatch_outbox_batch(outbox_db([refused, ok]), pool)
+
+        assert refused.status == EmailOutboxStatus.DEAD
+        assert refused.attempts == 1
+        assert ok.status == EmailOutboxStatus.SENT
+
+    @pytest.mark.asyncio
+    async def test_dead_lettered_after_max_attempts(self, fake_smtp, pool):
+        row = outbox_row(attempts=EMAIL_MAX_ATTEMPTS - 1)
+        fake_smtp.fail_next(1, 421)
+
+        await dispatch_outbox_batch(outbox_db([row]), pool)
+
+        assert row.status == EmailOutboxStatus.DEAD
+        assert row.attempts == EMAIL_MAX_ATTEMPTS
+
+    @pytest.mark.asyncio
+    async def test_broken_template_is_dead_lettered(self, fake_smtp, pool):
+        row = outbox_row(template_file="user/missing.html")
+
+        await dispatch_outbox_batch(outbox_db([row]), pool)
+
+        assert row.status == EmailOutboxStatus.DEAD
+        assert fake_smtp.connections == 0
+
+    @pytest.mark.asyncio
+    async def test_nothing_due(self, pool):
+        db = outbox_db([])
+
+        assert await dispatch_outbox_batch(db, pool) == 0
+        db.commit.assert_not_awaited()
+
+
+class TestPurgeFinishedEmails:
+    @pytest.mark.asyncio
+    @pytest.mark.db
+    async def test_only_old_sent_and_dead_rows_are_deleted(
+        self, test_db_session, clean_db
+    ):
+        now = datetime.now(timezone.utc)
+        old = now - timedelta(days=8)
+        rows = {
+            "old-sent": dict(status=EmailOutboxStatus.SENT, sent_at=old),
+            "new-sent": dict(status=EmailOutboxStatus.SENT, sent_at=now),
+            "old-dead": dict(status=EmailOutboxStatus.DEAD),
+            "old-pending": dict(status=EmailOutboxStatus.PENDING),
+        }
+        for name, fields in rows.items():
+            row = outbox_row(f"{name}@example.com", next_attempt_at=old)
+            row.id = None
+            for field, value in fields.items():
+                setattr(row, field, value)
+            test_db_session.add(row)
+        await test_db_session.commit()
+
+        assert await purge_finished_emails(test_db_session, 7) == 2
+
+        remaining = await test_db_session.scalars(
+            select(EmailOutbox.recipient).order_by(EmailOutbox.recipient)
+        )
+        assert remaining.all() == [
+            "new-sent@example.com",
+            "old-pending@example.com",
+        ]
@@ -0,0 +1,151 @@
+"""
+Test cases and a benchmark for precompiled email templates
+"""
+
+import os
+import time
+
+import pytest
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+from shared.utils.email import EmailConfig, EmailSender
+from shared.utils.email_templates import TemplateRegistry
+from shared.utils.email_utils import build_new_booking_success_email
+
+TEMPLATE_DIR = "shared/templates"
+BENCHMARK_EMAILS = 10_000
+
+
+def booking_email(i: int = 0):
+    return build_new_booking_success_email(
+        email=f"user{i}@example.com",
+        user_name=f"User {i}",
+        order_id=f"ORD{i:06d}",
+        event_title="Summer Music Festival",
+        event_slug="summer-music-festival",
+        event_date="2026-07-18",
+        event_time="18:30",
+        event_duration="4 hours",
+        event_location="Riverside Park",
+        event_category="Music",
+        booking_date="2026-06-01",
+        total_amount=150.0,
+        total_discount=10.0,
+        seat_categories=[
+            {
+                "label": "General",
+                "num_seats": 2,
+                "price_per_seat": 50.0,
+                "total_amount": 100.0,
+            },
+            {
+                "label": "VIP",
+                "num_seats": 1,
+                "price_per_seat": 60.0,
+                "total_amount": 60.0,
+                "discount_amount": 10.0,
+            },
+        ],
+    )
+
+
+class TestTemplateRegistry:
+    def test_all_templates_are_compiled(self):
+        registry = TemplateRegistry(TEMPLATE_DIR)
+
+        compiled = registry.compile_all()
+
+        assert (
+            compiled
+            == len(registry)
+            == sum(
+                len(os.listdir(os.path.join(TEMPLATE_DIR, group)))
+                for group in ("admin", "organizer", "user")
+            )
+        )
+        assert "user/booking_success.html" in registry
+
+    def test_bytecode_is_reused_across_restarts(self, tmp_path):
+        TemplateRegistry(TEMPLATE_DIR, str(tmp_path)).compile_all()
+        assert os.listdir(tmp_path)
+
+        restarted = TemplateRegistry(TEMPLATE_DIR, str(tmp_path))
+        compiled = []
+        restarted.env.compile = lambda *a, **kw: compiled.append(a)
+        restarted.compile_all()
+
+        assert compiled == []
+        email = booking_email()
+        assert "ORD000000" in restarted.render(
+            email.template_file, email.context
+        )
+
+    @pytest.mark.asyncio
+    async def test_render_async_matches_render(self):
+        registry = TemplateRegistry(TEMPLATE_DIR)
+        email = booking_email()
+
+        html = await registry.render_async(email.template_file, email.context)
+
+        assert html == registry.render(email.template_file, email.context)
+        assert "Summer Music Festival" in html
+
+    @pytest.mark.asyncio
+    async def test_sender_render_async_reports_broken_templates(self):
+        sender = EmailSender(
+            EmailConfig(
+                smtp_server="localhost",
+                smtp_port=25,
+                smtp_username="",
+                smtp_password="",
+                from_email="noreply@example.com",
+                template_dir=TEMPLATE_DIR,
+            )
+        )
+        email = booking_email()
+
+        message = await sender.render_async(email)
+        email.template_file = "user/missing.html"
+
+        assert message["To"] == "user0@example.com"
+        assert await sender.render_async(email) is None
+
+
+@pytest.mark.slow
+def test_booking_success_rendering_benchmark(tmp_path):
+    """Render 10k booking-success emails, per-send lookup vs registry."""
+    emails = [booking_email(i) for i in range(BENCHMARK_EMAILS)]
+    name = emails[0].template_file
+
+    # What EmailSender did before: an up-to-date check per send
+    env = Environment(
+        loader=FileSystemLoader(TEMPLATE_DIR),
+        autoescape=select_autoescape(["html", "xml"]),
+    )
+    start = time.perf_counter()
+    for email in emails:
+        env.get_template(name).render(**email.context)
+    lookup = time.perf_counter() - start
+
+    registry = TemplateRegistry(TEMPLATE_DIR, str(tmp_path))
+    start = time.perf_counter()
+    registry.compile_all()
+    cold_start = time.perf_counter() - start
+    start = time.perf_counter()
+    for email in emails:
+        registry.render(name, email.context)
+    precompiled = time.perf_counter() - start
+
+    start = time.perf_counter()
+    TemplateRegistry(TEMPLATE_DIR, str(tmp_path)).compile_all()
+    warm_start = time.perf_counter() - start
+
+    print(
+        f"\n{BENCHMARK_EMAILS} booking emails: per-send lookup "
+        f"{lookup:.3f}s, precompiled {precompiled:.3f}s; compiling all "
+        f"templates: cold {cold_start * 1000:.1f}ms, from bytecode "
+        f"{warm_start * 1000:.1f}ms"
+    )
+    # Rendering dominates either way; the win is startup and the loop
+    assert precompiled < lookup * 1.25
+    assert warm_start < cold_start
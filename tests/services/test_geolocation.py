@@ -0,0 +1,110 @@
+"""
+Test cases for offline IP geolocation
+"""
+
+import ipaddress
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from shared.utils.device_info import LocationService
+from shared.utils.geolocation import (
+    CachedResolver,
+    IpApiResolver,
+    RangeTableResolver,
+    create_geo_resolver,
+    parse_public_ip,
+)
+
+RANGES = """start_ip,end_ip,country_code,country,region,city,latitude,longitude,timezone
+81.2.69.0,81.2.69.255,GB,United Kingdom,England,London,51.5,-0.1,Europe/London
+1.1.1.0,1.1.1.255,AU,Australia,Queensland,Brisbane,-27.5,153.0,Australia/Brisbane
+2001:4860::,2001:4860:ffff:ffff:ffff:ffff:ffff:ffff,US,United States,,,,,
+not-an-ip,1.2.3.4,XX,Nowhere,,,,,
+"""
+
+
+@pytest.fixture
+def table(tmp_path):
+    path = tmp_path / "ip_ranges.csv"
+    path.write_text(RANGES)
+    return RangeTableResolver(str(path))
+
+
+def ip(value: str):
+    return ipaddress.ip_address(value)
+
+
+class TestRangeTableResolver:
+    @pytest.mark.asyncio
+    async def test_lookup_within_range(self, table):
+        location = await table.lookup(ip("81.2.69.160"))
+
+        assert location["city"] == "London"
+        assert location["country_code"] == "GB"
+        assert len(table) == 3
+
+    @pytest.mark.asyncio
+    async def test_range_bounds_are_inclusive(self, table):
+        assert (await table.lookup(ip("1.1.1.0")))["city"] == "Brisbane"
+        assert (await table.lookup(ip("1.1.1.255")))["city"] == "Brisbane"
+        assert await table.lookup(ip("1.1.2.0")) is None
+        assert await table.lookup(ip("1.0.0.1")) is None
+
+    @pytest.mark.asyncio
+    async def test_ipv6(self, table):
+        location = await table.lookup(ip("2001:4860:4860::8888"))
+
+        assert location["country"] == "United States"
+        assert location["city"] is None
+
+
+class TestCachedResolver:
+    @pytest.mark.asyncio
+    async def test_repeat_lookups_are_cached(self, table):
+        resolver = CachedResolver(table, maxsize=2)
+        with patch.object(table, "find", wraps=table.find) as find:
+            for _ in range(3):
+                await resolver.lookup(ip("81.2.69.160"))
+            await resolver.lookup(ip("8.8.8.8"))
+            await resolver.lookup(ip("8.8.8.8"))
+
+        assert find.call_count == 2
+        assert (resolver.hits, resolver.misses) == (3, 2)
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self):
+        backend = AsyncMock()
+        backend.lookup.side_effect = [RuntimeError("rate limited"), None]
+        resolver = CachedResolver(backend, maxsize=2)
+
+        with pytest.raises(RuntimeError):
+            await resolver.lookup(ip("8.8.8.8"))
+        assert await resolver.lookup(ip("8.8.8.8")) is None
+        assert backend.lookup.await_count == 2
+
+
+class TestLocationService:
+    def test_private_addresses_are_not_looked_up(self):
+        for value in ("127.0.0.1", "10.1.2.3", "::1", "unknown", ""):
+            assert parse_public_ip(value) is None
+
+    @pytest.mark.asyncio
+    async def test_location_columns(self, table):
+        with patch("shared.utils.device_info.geo_resolver", table):
+            location_info = await LocationService.get_location_from_ip(
+                "81.2.69.160"
+            )
+
+        columns = LocationService.location_columns(location_info)
+        assert columns["location"] == "London, United Kingdom"
+        assert columns["latitude"] == "51.5"
+        assert columns["isp"] is None
+
+
+def test_missing_table_falls_back_to_ipapi(tmp_path):
+    """A missing range table never leaves sessions without a location."""
+    resolver = create_geo_resolver("table", str(tmp_path / "missing.csv"))
+
+    assert isinstance(resolver, CachedResolver)
+    assert isinstance(resolver.resolver, IpApiResolver)
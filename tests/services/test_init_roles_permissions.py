@@ -0,0 +1,139 @@
+"""
+Test cases for seeding the default roles and permissions
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from rbac_service.services.init_roles_permissions import (
+    SEED_LOCK_ID,
+    defaults_checksum,
+    init_roles_permissions,
+)
+from shared.constants import (
+    PERMISSION_NAMES,
+    ROLE_NAMES,
+    ROLE_PERMISSION_NAME_MAP,
+)
+
+
+def result(scalar=None, rows=None):
+    res = MagicMock()
+    res.scalar.return_value = scalar
+    res.all.return_value = rows or []
+    return res
+
+
+def statements(db) -> list:
+    return [
+        str(
+            call.args[0].compile(
+                dialect=postgresql.dialect(),
+                compile_kwargs={"render_postcompile": True},
+            )
+        )
+        for call in db.execute.call_args_list
+    ]
+
+
+class TestInitRolesPermissions:
+    @pytest.mark.asyncio
+    async def test_unchanged_defaults_are_skipped(self):
+        db = AsyncMock()
+        db.execute.return_value = result(defaults_checksum())
+
+        assert await init_roles_permissions(db) is False
+
+        db.execute.assert_awaited_once()
+        assert "pg_advisory" not in statements(db)[0]
+
+    @pytest.mark.asyncio
+    async def test_worker_that_waited_for_the_lock_skips(self):
+        db = AsyncMock()
+        db.execute.side_effect = [
+            result("old"),
+            result(),
+            result(defaults_checksum()),
+        ]
+
+        assert await init_roles_permissions(db) is False
+
+        assert "pg_advisory_xact_lock" in statements(db)[1]
+        db.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_empty_database_is_seeded_in_bulk(self):
+        db = AsyncMock()
+        db.execute.side_effect = [
+            result(),  # checksum
+            result(),  # advisory lock
+            result(),  # checksum under the lock
+            result(rows=[]),  # existing permissions
+            result(),  # insert permissions
+            result(rows=[]),  # existing roles
+            result(),  # insert roles
+            result(),  # insert mappings
+            result(),  # version and checksum
+        ]
+
+        assert await init_roles_permissions(db) is True
+
+        sql = statements(db)
+        assert "pg_advisory_xact_lock" in sql[1]
+        lock_params = db.execute.call_args_list[1].args[0].compile().params
+        assert list(lock_params.values()) == [SEED_LOCK_ID]
+        assert sql[4].startswith("INSERT INTO e2gpermissions")
+        assert sql[4].count("(%(") == len(PERMISSION_NAMES)
+        assert sql[6].startswith("INSERT INTO e2groles")
+        assert sql[6].count("(%(") == len(ROLE_NAMES)
+        assert sql[7].startswith("INSERT INTO e2grolepermissions")
+        assert "ON CONFLICT ON CONSTRAINT uq_role_permission DO NOTHING" in (
+            sql[7]
+        )
+        assert sql[7].count("(%(") == sum(
+            len(names) for names in ROLE_PERMISSION_NAME_MAP.values()
+        )
+        assert "seed_checksum" in sql[8]
+        db.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_only_missing_rows_are_inserted(self):
+        db = AsyncMock()
+        db.execute.side_effect = [
+            result("old"),
+            result(),
+            result("old"),
+            result(
+                rows=[
+                    (name, f"p{i}") for i, name in enumerate(PERMISSION_NAMES)
+                ]
+            ),
+            result(
+                rows=[(name, f"r{i}") for i, name in enumerate(ROLE_NAMES[:-1])]
+            ),
+            result(),  # insert the last role
+            result(),  # insert mappings
+            result(),  # version and checksum
+        ]
+
+        assert await init_roles_permissions(db) is True
+
+        sql = statements(db)
+        assert sql[5].startswith("INSERT INTO e2groles")
+        assert sql[5].count("(%(") == 1
+        mappings = db.execute.call_args_list[6].args[0].compile().params
+        assert mappings["role_id_m0"] == "r0"
+        assert mappings["permission_id_m0"] == "p0"
+
+    @pytest.mark.asyncio
+    async def test_failure_rolls_back(self):
+        db = AsyncMock()
+        db.execute.side_effect = [result("old"), RuntimeError("db down")]
+
+        with pytest.raises(RuntimeError):
+            await init_roles_permissions(db)
+
+        db.rollback.assert_awaited_once()
+        db.commit.assert_not_awaited()
@@ -0,0 +1,149 @@
+"""
+Test cases for the shared media storage client, against a fake S3
+"""
+
+import asyncio
+import io
+
+import pytest
+from fastapi import HTTPException, UploadFile
+from starlette.datastructures import Headers
+
+from shared.utils.file_uploads import remove_file_if_exists, save_uploaded_file
+from shared.utils.upload_files import (
+    MediaStorage,
+    delete_file_from_s3,
+    upload_file_to_s3,
+)
+from tests.utils.fake_s3 import FakeS3, serve_fake_s3
+
+BUCKET = "media"
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 64
+
+
+@pytest.fixture
+def fake_s3():
+    fake = FakeS3()
+    with serve_fake_s3(fake) as endpoint_url:
+        fake.endpoint_url = endpoint_url
+        yield fake
+
+
+def make_storage(fake_s3: FakeS3, max_connections: int = 4) -> MediaStorage:
+    return MediaStorage(
+        bucket=BUCKET,
+        public_url="https://cdn.example.com",
+        region_name="syd1",
+        endpoint_url=fake_s3.endpoint_url,
+        access_key_id=FakeS3.ACCESS_KEY_ID,
+        secret_access_key=FakeS3.SECRET_ACCESS_KEY,
+        max_connections=max_connections,
+        addressing_style="path",
+    )
+
+
+@pytest.fixture
+async def storage(fake_s3):
+    storage = make_storage(fake_s3)
+    await storage.start()
+    yield storage
+    await storage.aclose()
+
+
+class TestMediaStorage:
+    @pytest.mark.asyncio
+    async def test_uploads_share_one_connection(self, fake_s3, storage):
+        for i in range(5):
+            url = await upload_file_to_s3(
+                PNG, f"events/E1/{i}.png", storage=storage
+            )
+
+        assert url == "https://cdn.example.com/events/E1/4.png"
+        assert fake_s3.keys(BUCKET) == [f"events/E1/{i}.png" for i in range(5)]
+        stored = fake_s3.objects[(BUCKET, "events/E1/0.png")]
+        assert stored["body"] == PNG
+        assert stored["content_type"] == "image/png"
+        assert stored["acl"] == "public-read"
+        assert fake_s3.connections == 1
+        stats = storage.stats()
+        assert stats["started"] is True
+        assert stats["uploads"] == 5
+        assert stats["in_flight"] == 0
+        assert stats["p95_upload_ms"] > 0
+
+    @pytest.mark.asyncio
+    async def test_unstarted_storage_uses_short_lived_clients(self, fake_s3):
+        storage = make_storage(fake_s3)
+
+        for i in range(3):
+            await storage.upload(PNG, f"{i}.png", "image/png")
+
+        assert storage.started is False
+        assert fake_s3.connections == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrent_uploads_are_bounded_by_the_pool(
+        self, fake_s3, storage
+    ):
+        fake_s3.latency = 0.05
+        uploads = [
+            asyncio.create_task(storage.upload(PNG, f"{i}.png", "image/png"))
+            for i in range(12)
+        ]
+        await asyncio.sleep(0.02)
+
+        assert storage.stats()["in_flight"] == 12
+        await asyncio.gather(*uploads)
+
+        assert storage.stats()["in_flight"] == 0
+        assert len(fake_s3.keys(BUCKET)) == 12
+        assert fake_s3.connections <= storage.max_connections
+
+    @pytest.mark.asyncio
+    async def test_failed_upload_is_counted(self, fake_s3, storage):
+        fake_s3.fail_next()
+
+        with pytest.raises(HTTPException) as exc:
+            await upload_file_to_s3(PNG, "denied.png", storage=storage)
+
+        assert exc.value.status_code == 500
+        assert "AccessDenied" in exc.value.detail
+        stats = storage.stats()
+        assert stats["upload_failures"] == 1
+        assert stats["uploads"] == 0
+        assert stats["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_folder_delete(self, fake_s3, storage):
+        for key in ("events/E1/a.png", "events/E1/b/c.png", "events/E2.png"):
+            await storage.upload(PNG, key, "image/png")
+
+        assert await delete_file_from_s3(
+            "events/E1", delete_folder=True, storage=storage
+        )
+        assert fake_s3.keys(BUCKET) == ["events/E2.png"]
+        assert not await delete_file_from_s3(
+            "events/E1", delete_folder=True, storage=storage
+        )
+
+
+class TestFileUploads:
+    @pytest.mark.asyncio
+    async def test_save_and_remove_use_the_injected_storage(
+        self, fake_s3, storage
+    ):
+        upload = UploadFile(
+            io.BytesIO(PNG),
+            filename="banner.png",
+            headers=Headers({"content-type": "image/png"}),
+        )
+
+        path = await save_uploaded_file(upload, "/events/E1/", storage)
+
+        assert path.startswith("events/E1/") and path.endswith("_banner.png")
+        assert fake_s3.keys(BUCKET) == [path]
+
+        await remove_file_if_exists(path, storage)
+
+        assert fake_s3.keys(BUCKET) == []
+        assert fake_s3.connections == 1
@@ -0,0 +1,124 @@
+"""
+Test cases for the thread-pooled async bcrypt hasher
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import HTTPException
+
+from admin_service.services import auth as admin_auth
+from shared.utils.password_hashing import PasswordHasher
+
+
+@pytest.fixture
+def hasher():
+    hasher = PasswordHasher(rounds=4, max_workers=2, max_pending=8)
+    yield hasher
+    hasher.shutdown()
+
+
+class TestPasswordHasher:
+    @pytest.mark.asyncio
+    async def test_hash_and_verify(self, hasher):
+        hashed = await hasher.hash("Password123!")
+
+        assert hashed.startswith("$2b$04$")
+        assert await hasher.verify("Password123!", hashed)
+        assert not await hasher.verify("wrong", hashed)
+        assert hasher.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_event_loop_keeps_running(self):
+        hasher = PasswordHasher(rounds=12, max_workers=1, max_pending=8)
+        gaps = []
+
+        async def ticker(done: asyncio.Event):
+            last = time.perf_counter()
+            while not done.is_set():
+                await asyncio.sleep(0.005)
+                now = time.perf_counter()
+                gaps.append(now - last)
+                last = now
+
+        done = asyncio.Event()
+        ticks = asyncio.create_task(ticker(done))
+        started = time.perf_counter()
+        await hasher.hash("Password123!")
+        elapsed = time.perf_counter() - started
+        done.set()
+        await ticks
+        hasher.shutdown()
+
+        # The loop ticked throughout a hash far longer than any one gap
+        assert len(gaps) > 5
+        assert max(gaps) < elapsed / 2
+
+    @pytest.mark.asyncio
+    async def test_full_queue_is_rejected_with_429(self):
+        hasher = PasswordHasher(rounds=10, max_workers=1, max_pending=1)
+        stored = hasher.context.hash("Password123!")
+        first = asyncio.create_task(hasher.hash("Password123!"))
+        await asyncio.sleep(0)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await hasher.verify("Password123!", stored)
+
+        assert exc_info.value.status_code == 429
+        await first
+        assert hasher.pending == 0
+        hasher.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_changed_cost_rehashes(self, hasher):
+        stored = await hasher.hash("Password123!")
+        stronger = PasswordHasher(rounds=5, max_workers=1, max_pending=8)
+
+        assert stronger.needs_rehash(stored)
+        verified, new_hash = await stronger.verify_and_update(
+            "Password123!", stored
+        )
+        assert verified
+        assert new_hash.startswith("$2b$05$")
+        assert await stronger.verify_and_update("Password123!", new_hash) == (
+            True,
+            None,
+        )
+        stronger.shutdown()
+
+
+class TestRehashOnLogin:
+    @pytest.mark.asyncio
+    async def test_outdated_hash_is_replaced(self, hasher, monkeypatch):
+        stored = hasher.context.hash("Password123!")
+        stronger = PasswordHasher(rounds=5, max_workers=1, max_pending=8)
+        monkeypatch.setattr(admin_auth, "password_hasher", stronger)
+        user = SimpleNamespace(password_hash=stored, failure_login_attempts=0)
+        db = AsyncMock()
+
+        assert await admin_auth.check_password(user, "Password123!", db) is None
+
+        assert user.password_hash != stored
+        assert user.password_hash.startswith("$2b$05$")
+        db.commit.assert_awaited_once()
+        stronger.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_wrong_password_keeps_hash(self, hasher, monkeypatch):
+        stored = hasher.context.hash("Password123!")
+        monkeypatch.setattr(
+            admin_auth,
+            "password_hasher",
+            PasswordHasher(rounds=5, max_workers=1, max_pending=8),
+        )
+        user = SimpleNamespace(password_hash=stored, failure_login_attempts=0)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await admin_auth.check_password(user, "wrong", AsyncMock())
+
+        assert exc_info.value.status_code == 401
+        assert user.password_hash == stored
+        assert user.failure_login_attempts == 1
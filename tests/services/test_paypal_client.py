@@ -0,0 +1,201 @@
+"""
+Tests for the pooled async PayPal client against the in-process fake PayPal.
+"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from shared.utils.paypal import AsyncPayPalClient, PayPalError
+from tests.utils.fake_paypal import FakePayPal, serve_fake_paypal
+
+
+@pytest.fixture
+def fake_paypal() -> FakePayPal:
+    return FakePayPal()
+
+
+def make_client(fake: FakePayPal, **kwargs) -> AsyncPayPalClient:
+    kwargs.setdefault("backoff_base", 0.0)
+    return AsyncPayPalClient(
+        FakePayPal.CLIENT_ID,
+        FakePayPal.CLIENT_SECRET,
+        base_url="http://fake-paypal",
+        transport=httpx.ASGITransport(app=fake.app),
+        **kwargs,
+    )
+
+
+class TestTokenCache:
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_fetch_one_token(self, fake_paypal):
+        client = make_client(fake_paypal)
+        await asyncio.gather(
+            *(client.create_order({"intent": "CAPTURE"}) for _ in range(20))
+        )
+        await client.aclose()
+
+        assert fake_paypal.tokens_issued == 1
+        assert len(fake_paypal.orders) == 20
+
+    @pytest.mark.asyncio
+    async def test_refresh_ahead_keeps_serving_current_token(self, fake_paypal):
+        client = make_client(fake_paypal, token_refresh_margin=60)
+        fake_paypal.token_expires_in = 30  # already inside the margin
+        first = await client.get_access_token()
+
+        # Still valid, so it is returned while a refresh runs in background
+        assert await client.get_access_token() == first
+        await client._refresh_task
+        assert fake_paypal.tokens_issued == 2
+        assert await client.get_access_token() != first
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_expired_token_is_refetched(self, fake_paypal):
+        client = make_client(fake_paypal)
+        await client.get_access_token()
+        client._token_expires_at = time.monotonic() - 1
+
+        await client.get_access_token()
+        await client.aclose()
+
+        assert fake_paypal.tokens_issued == 2
+
+    @pytest.mark.asyncio
+    async def test_unauthorized_refreshes_token_once(self, fake_paypal):
+        client = make_client(fake_paypal)
+        await client.get_access_token()
+        fake_paypal.revoke_tokens()
+
+        response = await client.create_order({"intent": "CAPTURE"})
+        await client.aclose()
+
+        assert response.result.status == "CREATED"
+        assert fake_paypal.tokens_issued == 2
+
+
+class TestRetries:
+    @pytest.mark.asyncio
+    async def test_server_errors_are_retried_with_same_request_id(
+        self, fake_paypal
+    ):
+        client = make_client(fake_paypal)
+        await client.get_access_token()
+        fake_paypal.fail_next(2, status_code=503)
+
+        created = await client.create_order({"intent": "CAPTURE"})
+        await client.aclose()
+
+        assert created.status_code == 201
+        assert len(fake_paypal.orders) == 1
+        assert fake_paypal.requests.count("POST /v2/checkout/orders") == 3
+
+    @pytest.mark.asyncio
+    async def test_replayed_capture_is_applied_once(self, fake_paypal):
+        client = make_client(fake_paypal)
+        created = await client.create_order({"intent": "CAPTURE"})
+
+        response = await client.request(
+            "POST",
+            f"/v2/checkout/orders/{created.result.id}/capture",
+            headers={"PayPal-Request-Id": "capture-1"},
+        )
+        replay = await client.request(
+            "POST",
+            f"/v2/checkout/orders/{created.result.id}/capture",
+            headers={"PayPal-Request-Id": "capture-1"},
+        )
+        await client.aclose()
+
+        assert fake_paypal.captures == 1
+        assert replay.result.id == response.result.id
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self, fake_paypal):
+        client = make_client(fake_paypal, max_retries=2)
+        await client.get_access_token()
+        fake_paypal.fail_next(5, status_code=503)
+
+        with pytest.raises(PayPalError) as exc_info:
+            await client.create_order({"intent": "CAPTURE"})
+        await client.aclose()
+
+        assert exc_info.value.status_code == 503
+        assert fake_paypal.requests.count("POST /v2/checkout/orders") == 3
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_not_retried(self, fake_paypal):
+        client = make_client(fake_paypal)
+
+        with pytest.raises(PayPalError) as exc_info:
+            await client.capture_order("MISSING")
+        await client.aclose()
+
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.details == {"name": "RESOURCE_NOT_FOUND"}
+
+    @pytest.mark.asyncio
+    async def test_unreachable_host_raises_paypal_error(self):
+        client = AsyncPayPalClient(
+            "id",
+            "secret",
+            base_url="http://127.0.0.1:9",
+            max_retries=1,
+            backoff_base=0.0,
+            connect_timeout=0.5,
+        )
+        with pytest.raises(PayPalError):
+            await client.get_access_token()
+        await client.aclose()
+
+
+class TestResponses:
+    @pytest.mark.asyncio
+    async def test_capture_result_has_attribute_access(self, fake_paypal):
+        client = make_client(fake_paypal)
+        created = await client.create_order({"intent": "CAPTURE"})
+        approve = next(
+            link.href for link in created.result.links if link.rel == "approve"
+        )
+
+        captured = await client.capture_order(created.result.id)
+        fetched = await client.get_order(created.result.id)
+        await client.aclose()
+
+        assert approve.endswith(created.result.id)
+        capture = captured.result.purchase_units[0].payments.captures[0]
+        assert capture.status == "COMPLETED"
+        assert fetched.result.status == "COMPLETED"
+
+
+@pytest.mark.asyncio
+@pytest.mark.slow
+@pytest.mark.integration
+async def test_keep_alive_pool_under_load(fake_paypal):
+    """Many concurrent checkouts over real sockets reuse pooled
+    connections and one token."""
+    fake_paypal.latency = 0.01
+    with serve_fake_paypal(fake_paypal) as base_url:
+        client = AsyncPayPalClient(
+            FakePayPal.CLIENT_ID,
+            FakePayPal.CLIENT_SECRET,
+            base_url=base_url,
+            max_connections=20,
+        )
+
+        async def checkout() -> str:
+            created = await client.create_order({"intent": "CAPTURE"})
+            captured = await client.capture_order(created.result.id)
+            return captured.result.status
+
+        started = time.perf_counter()
+        statuses = await asyncio.gather(*(checkout() for _ in range(200)))
+        elapsed = time.perf_counter() - started
+        await client.aclose()
+
+    print(f"\n[Benchmark] 200 checkouts in {elapsed:.2f}s")
+    assert statuses == ["COMPLETED"] * 200
+    assert fake_paypal.tokens_issued == 1
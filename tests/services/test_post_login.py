@@ -0,0 +1,174 @@
+"""
+Test cases for the admin post-login pipeline and onboarding query
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from admin_service.api.v1.endpoints.login import get_organizer_profile_info
+from admin_service.services.post_login import run_post_login_checks
+from admin_service.services.session_management import SessionManager
+from shared.constants import ONBOARDING_APPROVED, ONBOARDING_REJECTED
+
+SESSION = SimpleNamespace(
+    session_id=7,
+    device_name="Chrome - Windows",
+    device_fingerprint="fp-new",
+    country="Australia",
+    ip_address="203.0.113.7",
+    location="Sydney, Australia",
+)
+
+
+def onboarding_db(row):
+    db = AsyncMock()
+    db.execute.return_value = MagicMock()
+    db.execute.return_value.one_or_none.return_value = row
+    return db
+
+
+def onboarding_row(role_name, is_approved=None, reviewer_comment=None):
+    return SimpleNamespace(
+        role_name=role_name,
+        is_approved=is_approved,
+        ref_number="REF001" if is_approved is not None else None,
+        reviewer_comment=reviewer_comment,
+    )
+
+
+class TestOrganizerProfileInfo:
+    @pytest.mark.asyncio
+    async def test_one_joined_query(self):
+        db = onboarding_db(onboarding_row("Organizer", ONBOARDING_APPROVED))
+        user = SimpleNamespace(user_id="ADM001", is_verified=True)
+
+        info = await get_organizer_profile_info(user, db)
+
+        db.execute.assert_awaited_once()
+        sql = str(
+            db.execute.call_args.args[0].compile(dialect=postgresql.dialect())
+        )
+        assert sql.count("LEFT OUTER JOIN") == 2
+        assert info["onboarding_status"] == "approved"
+        assert info["ref_number"] == "REF001"
+
+    @pytest.mark.asyncio
+    async def test_organizer_without_profile(self):
+        db = onboarding_db(onboarding_row("organizer"))
+        user = SimpleNamespace(user_id="ADM001", is_verified=False)
+
+        info = await get_organizer_profile_info(user, db)
+
+        assert info["onboarding_status"] == "not_started"
+        assert info["user_role_name"] == "organizer"
+
+    @pytest.mark.asyncio
+    async def test_rejected_organizer_gets_comment(self):
+        db = onboarding_db(
+            onboarding_row("Organizer", ONBOARDING_REJECTED, "Bad ABN")
+        )
+        user = SimpleNamespace(user_id="ADM001", is_verified=False)
+
+        info = await get_organizer_profile_info(user, db)
+
+        assert info["onboarding_status"] == "rejected"
+        assert info["reviewer_comment"] == "Bad ABN"
+
+    @pytest.mark.asyncio
+    async def test_non_organizer(self):
+        db = onboarding_db(onboarding_row("Superadmin"))
+        user = SimpleNamespace(user_id="ADM001", is_verified=True)
+
+        info = await get_organizer_profile_info(user, db)
+
+        assert info["user_role_name"] == "admin"
+        assert info["is_approved"] == ONBOARDING_APPROVED
+
+
+@pytest.fixture
+def pipeline_db():
+    db = AsyncMock()
+    db.get.return_value = SESSION
+    session_factory = MagicMock()
+    session_factory.return_value.__aenter__.return_value = db
+    with patch(
+        "admin_service.services.post_login.AsyncSessionLocal", session_factory
+    ):
+        yield db
+
+
+class TestPostLoginChecks:
+    @pytest.mark.asyncio
+    async def test_medium_alert_emails_the_user(self, pipeline_db):
+        alerts = [
+            {"type": "new_device", "message": "new device", "severity": "low"},
+            {"type": "new_location", "message": "AU", "severity": "medium"},
+        ]
+        with (
+            patch.object(
+                SessionManager,
+                "detect_suspicious_activity",
+                AsyncMock(return_value=alerts),
+            ),
+            patch(
+                "admin_service.services.post_login."
+                "send_admin_login_alert_email"
+            ) as send,
+        ):
+            await run_post_login_checks("ADM001", 7, "a@b.com", "admin")
+
+        send.assert_called_once()
+        assert send.call_args.args[:3] == ("a@b.com", "admin", alerts[1:])
+        assert send.call_args.kwargs["ip_address"] == "203.0.113.7"
+
+    @pytest.mark.asyncio
+    async def test_low_alerts_are_only_logged(self, pipeline_db):
+        alerts = [{"type": "new_device", "message": "x", "severity": "low"}]
+        with (
+            patch.object(
+                SessionManager,
+                "detect_suspicious_activity",
+                AsyncMock(return_value=alerts),
+            ),
+            patch(
+                "admin_service.services.post_login."
+                "send_admin_login_alert_email"
+            ) as send,
+        ):
+            await run_post_login_checks("ADM001", 7, "a@b.com", "admin")
+
+        send.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failures_do_not_raise(self, pipeline_db):
+        pipeline_db.get.side_effect = RuntimeError("db down")
+
+        await run_post_login_checks("ADM001", 7, "a@b.com", "admin")
+
+
+class TestDetectSuspiciousActivity:
+    @pytest.mark.asyncio
+    async def test_current_session_is_not_its_own_baseline(self):
+        earlier = SimpleNamespace(
+            session_id=3, device_fingerprint="fp-old", country="Australia"
+        )
+        with (
+            patch.object(
+                SessionManager,
+                "_get_recent_sessions",
+                AsyncMock(return_value=[SESSION, earlier]),
+            ),
+            patch.object(
+                SessionManager,
+                "_get_active_sessions",
+                AsyncMock(return_value=[SESSION]),
+            ),
+        ):
+            alerts = await SessionManager.detect_suspicious_activity(
+                "ADM001", SESSION, AsyncMock()
+            )
+
+        assert [alert["type"] for alert in alerts] == ["new_device"]
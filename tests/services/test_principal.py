@@ -0,0 +1,122 @@
+"""
+Test cases for the lightweight Principal dependency
+"""
+
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from shared.dependencies.admin import get_current_principal
+from shared.dependencies.principal import (
+    PrincipalStatusCache,
+    admin_principal_cache,
+)
+
+PAYLOAD = {"uid": "ADM001", "sid": 7}
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    admin_principal_cache.clear()
+    yield
+    admin_principal_cache.clear()
+
+
+@pytest.fixture
+def mock_db():
+    db = AsyncMock()
+    db.execute.return_value = MagicMock()
+    db.execute.return_value.one_or_none.return_value = (
+        False,
+        "ROLE01",
+        "BIZ001",
+    )
+    return db
+
+
+@pytest.fixture(autouse=True)
+def verified_token():
+    with patch(
+        "shared.dependencies.admin.verify_token_and_session",
+        AsyncMock(return_value=PAYLOAD),
+    ):
+        yield
+
+
+async def principal(db):
+    return await get_current_principal(MagicMock(), "token", db)
+
+
+class TestGetCurrentPrincipal:
+    @pytest.mark.asyncio
+    async def test_built_from_claims_and_status(self, mock_db):
+        caller = await principal(mock_db)
+
+        assert caller.user_id == "ADM001"
+        assert caller.session_id == 7
+        assert (caller.role_id, caller.business_id) == ("ROLE01", "BIZ001")
+        sql = str(
+            mock_db.execute.call_args.args[0].compile(
+                dialect=postgresql.dialect()
+            )
+        )
+        assert sql.startswith(
+            "SELECT e2gadminusers.is_deleted, e2gadminusers.role_id, "
+            "e2gadminusers.business_id"
+        )
+
+    @pytest.mark.asyncio
+    async def test_status_is_cached(self, mock_db):
+        for _ in range(3):
+            await principal(mock_db)
+
+        mock_db.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_deleted_user_is_rejected(self, mock_db):
+        mock_db.execute.return_value.one_or_none.return_value = (
+            True,
+            "ROLE01",
+            None,
+        )
+
+        with pytest.raises(HTTPException) as exc:
+            await principal(mock_db)
+
+        assert exc.value.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_invalidate_reloads_status(self, mock_db):
+        await principal(mock_db)
+        mock_db.execute.return_value.one_or_none.return_value = (
+            True,
+            "ROLE01",
+            None,
+        )
+        admin_principal_cache.invalidate("ADM001")
+
+        with pytest.raises(HTTPException):
+            await principal(mock_db)
+
+        assert mock_db.execute.await_count == 2
+
+
+class TestPrincipalStatusCache:
+    def test_entries_expire(self):
+        cache = PrincipalStatusCache(0.01)
+        cache.put("ADM001", MagicMock())
+        assert cache.get("ADM001") is not None
+        time.sleep(0.02)
+
+        assert cache.get("ADM001") is None
+
+    def test_is_bounded(self):
+        cache = PrincipalStatusCache(30, maxsize=2)
+        for user_id in ("A", "B", "C"):
+            cache.put(user_id, MagicMock())
+
+        assert cache.get("A") is None
+        assert cache.get("C") is not None
@@ -0,0 +1,179 @@
+"""
+Test cases for the in-memory RBAC permission matrix
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from shared.dependencies.admin import require_permission
+from shared.dependencies.principal import Principal
+from shared.utils.rbac_matrix import (
+    RbacMatrixCache,
+    commit_rbac_change,
+    get_role_name,
+    rbac_matrix,
+)
+
+ROLES = [("r0001", "SUPERADMIN"), ("r0002", "ORGANIZER"), ("r0003", "OLD")]
+GRANTS = [
+    ("r0001", "MANAGE"),
+    ("r0001", "edit"),
+    ("r0002", "VIEW"),
+]
+
+
+def result(scalar=None, rows=None):
+    res = MagicMock()
+    res.scalar.return_value = scalar
+    res.all.return_value = rows or []
+    return res
+
+
+def load_results(version, roles=ROLES, grants=GRANTS):
+    return [result(version), result(rows=roles), result(rows=grants)]
+
+
+def compiled(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+@pytest.fixture
+def matrix():
+    return RbacMatrixCache()
+
+
+@pytest.fixture(autouse=True)
+def empty_matrix():
+    rbac_matrix.clear()
+    yield
+    rbac_matrix.clear()
+
+
+class TestRbacMatrixCache:
+    @pytest.mark.asyncio
+    async def test_load(self, matrix):
+        db = AsyncMock()
+        db.execute.side_effect = load_results(4)
+
+        await matrix.load(db)
+
+        assert matrix.version == 4
+        assert matrix.role_name("r0002") == "ORGANIZER"
+        assert matrix.role_id("organizer") == "r0002"
+        assert matrix.permissions("r0001") == {"MANAGE", "EDIT"}
+        assert matrix.has_permission("r0001", "edit")
+        assert not matrix.has_permission("r0002", "EDIT")
+
+    @pytest.mark.asyncio
+    async def test_only_active_rows_grant(self, matrix):
+        db = AsyncMock()
+        db.execute.side_effect = load_results(1)
+
+        await matrix.load(db)
+
+        sql = compiled(db.execute.call_args_list[2].args[0])
+        assert "e2grolepermissions.rp_status IS false" in sql
+        assert "e2gpermissions.permission_status IS false" in sql
+        assert "e2groles.role_status IS false" in sql
+        # Inactive roles still have a name but no permissions
+        assert matrix.role_name("r0003") == "OLD"
+        assert matrix.permissions("r0003") == frozenset()
+
+    def test_unloaded_matrix_grants_nothing(self, matrix):
+        assert not matrix.loaded
+        assert matrix.role_name("r0001") is None
+        assert not matrix.has_permission("r0001", "MANAGE")
+
+    @pytest.mark.asyncio
+    async def test_refresh_reloads_only_on_new_version(self, matrix):
+        db = AsyncMock()
+        db.execute.side_effect = load_results(2) + [result(2)]
+        await matrix.load(db)
+
+        assert await matrix.refresh(db) is False
+        assert db.execute.await_count == 4
+
+        db.execute.side_effect = [result(3)] + load_results(3)
+        assert await matrix.refresh(db) is True
+        assert matrix.version == 3
+
+    @pytest.mark.asyncio
+    async def test_missing_version_row_is_zero(self, matrix):
+        db = AsyncMock()
+        db.execute.side_effect = load_results(None)
+
+        await matrix.load(db)
+
+        assert matrix.version == 0
+
+
+class TestRbacChanges:
+    @pytest.mark.asyncio
+    async def test_commit_bumps_version_and_reloads(self):
+        db = AsyncMock()
+        db.execute.side_effect = [result()] + load_results(7)
+
+        await commit_rbac_change(db)
+
+        sql = compiled(db.execute.call_args_list[0].args[0])
+        assert "INSERT INTO e2grbacversion" in sql
+        assert "ON CONFLICT (id) DO UPDATE" in sql
+        assert "e2grbacversion.version + " in sql
+        db.commit.assert_awaited_once()
+        assert rbac_matrix.version == 7
+
+    @pytest.mark.asyncio
+    async def test_reload_failure_does_not_fail_the_change(self):
+        db = AsyncMock()
+        db.execute.side_effect = [result(), RuntimeError("db down")]
+
+        await commit_rbac_change(db)
+
+        db.commit.assert_awaited_once()
+        assert not rbac_matrix.loaded
+
+    @pytest.mark.asyncio
+    async def test_unknown_role_id_refreshes_once(self):
+        db = AsyncMock()
+        db.execute.side_effect = load_results(1)
+        await rbac_matrix.load(db)
+
+        db.execute.side_effect = [result(2)] + load_results(
+            2, ROLES + [("r0004", "EDITOR")]
+        )
+        assert await get_role_name(db, "r0004") == "EDITOR"
+        assert await get_role_name(db, "r0004") == "EDITOR"
+        assert db.execute.await_count == 7
+        assert await get_role_name(db, None) is None
+
+
+class TestRequirePermission:
+    @pytest.fixture
+    async def loaded(self):
+        db = AsyncMock()
+        db.execute.side_effect = load_results(1)
+        await rbac_matrix.load(db)
+
+    @staticmethod
+    def principal(role_id):
+        return Principal(
+            user_id="ADM001", session_id=1, is_deleted=False, role_id=role_id
+        )
+
+    @pytest.mark.asyncio
+    async def test_granted(self, loaded):
+        check = require_permission("MANAGE", "EDIT")
+        principal = self.principal("r0001")
+
+        assert await check(principal, AsyncMock()) is principal
+
+    @pytest.mark.asyncio
+    async def test_denied(self, loaded):
+        check = require_permission("EDIT")
+
+        with pytest.raises(HTTPException) as exc:
+            await check(self.principal("r0002"), AsyncMock())
+        assert exc.value.status_code == 403
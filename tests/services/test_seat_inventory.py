@@ -0,0 +1,57 @@
+"""
+Test cases for the atomic seat hold
+"""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from new_event_service.services.seat_inventory import (
+    get_available_seats,
+    reserve_seats,
+)
+from shared.db.models import NewEventSeatCategory
+
+
+@pytest_asyncio.fixture
+async def seat_session():
+    """In-memory seat category table with 10 seats, 3 booked, 2 held."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(NewEventSeatCategory.__table__.create)
+    async with AsyncSession(engine) as session:
+        session.add(
+            NewEventSeatCategory(
+                seat_category_id="SEAT01",
+                slot_ref_id="SLOT01",
+                category_label="General",
+                price=10,
+                total_tickets=10,
+                booked=3,
+                held=2,
+            )
+        )
+        await session.commit()
+        yield session
+    await engine.dispose()
+
+
+class TestReserveSeats:
+    """Test cases for reserve_seats"""
+
+    @pytest.mark.asyncio
+    async def test_hold_within_availability(self, seat_session):
+        reservation = await reserve_seats(seat_session, "SEAT01", 5)
+        assert reservation is not None
+        assert reservation.held == 7
+        assert reservation.available == 0
+
+    @pytest.mark.asyncio
+    async def test_hold_beyond_availability_changes_nothing(self, seat_session):
+        assert await reserve_seats(seat_session, "SEAT01", 6) is None
+        assert await get_available_seats(seat_session, "SEAT01") == 5
+
+    @pytest.mark.asyncio
+    async def test_unknown_seat_category(self, seat_session):
+        assert await reserve_seats(seat_session, "MISSING", 1) is None
+        assert await get_available_seats(seat_session, "MISSING") == 0
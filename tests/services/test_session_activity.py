@@ -0,0 +1,132 @@
+"""
+Test cases for the device-session activity buffer
+"""
+
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from admin_service.services.session_management import (
+    SessionManager,
+    TokenSessionManager,
+)
+from shared.db.models import AdminUserDeviceSession
+from shared.utils.session_activity import (
+    SessionActivityBuffer,
+    admin_session_activity,
+)
+
+PAYLOAD = {"uid": "ADM001", "sid": 7}
+
+
+@pytest.fixture(autouse=True)
+def empty_buffer():
+    admin_session_activity.clear()
+    yield
+    admin_session_activity.clear()
+
+
+@pytest.fixture
+def mock_db():
+    db = AsyncMock()
+    db.execute.return_value = MagicMock()
+    db.execute.return_value.scalar_one_or_none.return_value = 7
+    return db
+
+
+class TestValidateTokenSession:
+    @pytest.mark.asyncio
+    async def test_repeat_requests_skip_the_query_and_never_commit(
+        self, mock_db
+    ):
+        for _ in range(3):
+            assert await TokenSessionManager.validate_token_session(
+                PAYLOAD, mock_db
+            ) == (True, None)
+
+        mock_db.execute.assert_awaited_once()
+        mock_db.commit.assert_not_awaited()
+        assert admin_session_activity.pending == 1
+
+    @pytest.mark.asyncio
+    async def test_inactive_session_is_not_cached(self, mock_db):
+        mock_db.execute.return_value.scalar_one_or_none.return_value = None
+
+        for _ in range(2):
+            assert await TokenSessionManager.validate_token_session(
+                PAYLOAD, mock_db
+            ) == (False, "Session no longer active")
+
+        assert mock_db.execute.await_count == 2
+        assert admin_session_activity.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_logout_invalidates_immediately(self, mock_db):
+        await TokenSessionManager.validate_token_session(PAYLOAD, mock_db)
+        mock_db.execute.return_value.scalar_one_or_none.return_value = (
+            SimpleNamespace(session_id=7, is_active=True, logged_out_at=None)
+        )
+        assert await SessionManager.terminate_session(7, mock_db)
+
+        mock_db.execute.return_value.scalar_one_or_none.return_value = None
+        assert await TokenSessionManager.validate_token_session(
+            PAYLOAD, mock_db
+        ) == (False, "Session no longer active")
+
+
+class TestFlush:
+    @pytest.mark.asyncio
+    async def test_one_batched_update(self, mock_db):
+        buffer = SessionActivityBuffer(AdminUserDeviceSession, 30)
+        for session_id in (3, 1, 3, 2):
+            buffer.touch(session_id)
+
+        assert await buffer.flush(mock_db) == 3
+
+        mock_db.execute.assert_awaited_once()
+        mock_db.commit.assert_awaited_once()
+        sql = str(
+            mock_db.execute.call_args.args[0].compile(
+                dialect=postgresql.dialect()
+            )
+        )
+        assert sql.startswith(
+            "UPDATE e2gadminuserdevicesessions SET "
+            "last_used_at=activity.last_used_at FROM (VALUES"
+        )
+        assert "AS activity (session_id, last_used_at)" in sql
+        assert buffer.pending == 0
+        assert await buffer.flush(mock_db) == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_values(self, mock_db):
+        buffer = SessionActivityBuffer(AdminUserDeviceSession, 30)
+        buffer.touch(1)
+        mock_db.execute.side_effect = RuntimeError("db down")
+
+        with pytest.raises(RuntimeError):
+            await buffer.flush(mock_db)
+
+        mock_db.rollback.assert_awaited_once()
+        assert buffer.pending == 1
+
+
+class TestActiveCache:
+    def test_entries_expire(self):
+        buffer = SessionActivityBuffer(AdminUserDeviceSession, 0.01)
+        buffer.mark_active(1, "ADM001")
+        assert buffer.is_active(1, "ADM001")
+        time.sleep(0.02)
+
+        assert not buffer.is_active(1, "ADM001")
+
+    def test_is_bounded(self):
+        buffer = SessionActivityBuffer(AdminUserDeviceSession, 30, maxsize=2)
+        for session_id in (1, 2, 3):
+            buffer.mark_active(session_id, "ADM001")
+
+        assert not buffer.is_active(1, "ADM001")
+        assert buffer.is_active(3, "ADM001")
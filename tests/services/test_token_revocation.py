@@ -0,0 +1,147 @@
+"""
+Test cases for the token revocation stores
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from shared.utils.token_blacklist import (
+    BloomFilter,
+    InMemoryRevocationStore,
+    PostgresRevocationStore,
+)
+
+
+def in_an_hour() -> float:
+    return time.time() + 3600
+
+
+@pytest.fixture
+def mock_db():
+    db = AsyncMock()
+    db.execute.return_value = MagicMock()
+    db.execute.return_value.all.return_value = []
+    return db
+
+
+def compiled(call) -> str:
+    return str(call.args[0].compile(dialect=postgresql.dialect()))
+
+
+class TestInMemoryRevocationStore:
+    def test_contains_until_expiry(self):
+        store = InMemoryRevocationStore()
+        store.add("live", in_an_hour())
+        store.add("expired", time.time() - 1)
+
+        assert store.contains("live")
+        assert not store.contains("expired")
+        assert not store.contains("never-revoked")
+        assert len(store) == 1
+
+    def test_later_expiry_wins(self):
+        store = InMemoryRevocationStore()
+        store.add("jti", time.time() + 0.01)
+        store.add("jti", in_an_hour())
+        time.sleep(0.02)
+
+        assert store.contains("jti")
+
+
+class TestBloomFilter:
+    def test_no_false_negatives(self):
+        bloom = BloomFilter(1000)
+        for i in range(1000):
+            bloom.add(f"jti-{i}")
+
+        assert all(f"jti-{i}" in bloom for i in range(1000))
+
+    def test_false_positive_rate_is_low(self):
+        bloom = BloomFilter(1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"jti-{i}")
+
+        false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+        assert false_positives < 300
+
+
+class TestPostgresRevocationStore:
+    @pytest.mark.asyncio
+    async def test_local_revocation_is_immediate_and_written(self, mock_db):
+        store = PostgresRevocationStore(bloom_capacity=100)
+        store.add("jti-1", in_an_hour())
+
+        assert store.contains("jti-1")
+        assert not store.contains("jti-2")
+
+        await store.sync(mock_db)
+
+        insert_sql = compiled(mock_db.execute.call_args_list[0])
+        assert insert_sql.startswith("INSERT INTO e2grevoked_tokens")
+        assert "ON CONFLICT (jti) DO NOTHING" in insert_sql
+        mock_db.commit.assert_awaited_once()
+        assert store.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_learns_other_workers_revocations(self, mock_db):
+        store = PostgresRevocationStore(bloom_capacity=100)
+        expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+        mock_db.execute.return_value.all.return_value = [
+            (41, "elsewhere", expires_at),
+        ]
+
+        assert await store.sync(mock_db) == 1
+        assert store.contains("elsewhere")
+        # Rows already known are not counted again
+        assert await store.sync(mock_db) == 0
+
+        select_sql = compiled(mock_db.execute.call_args_list[-1])
+        assert "WHERE e2grevoked_tokens.id >" in select_sql
+
+    @pytest.mark.asyncio
+    async def test_failed_sync_keeps_pending(self, mock_db):
+        store = PostgresRevocationStore(bloom_capacity=100)
+        store.add("jti-1", in_an_hour())
+        mock_db.execute.side_effect = RuntimeError("db down")
+
+        with pytest.raises(RuntimeError):
+            await store.sync(mock_db)
+
+        mock_db.rollback.assert_awaited_once()
+        assert store.pending == 1
+
+    def test_filter_is_rebuilt_without_expired_ids(self):
+        store = PostgresRevocationStore(bloom_capacity=10)
+        for i in range(20):
+            store.add(f"expired-{i}", time.time() - 1)
+        store.add("live", in_an_hour())
+
+        assert store.contains("live")
+        assert store._bloom.count <= store._bloom.capacity
+
+
+class TestSharedRevocations:
+    @pytest.mark.asyncio
+    @pytest.mark.db
+    async def test_workers_see_each_others_revocations(
+        self, test_session_factory, clean_db
+    ):
+        """Two workers' stores, one table: a revocation made in one is
+        honoured by the other after both have synced."""
+        revoking = PostgresRevocationStore(bloom_capacity=100)
+        other = PostgresRevocationStore(bloom_capacity=100)
+        revoking.add("logged-out", in_an_hour())
+
+        async with test_session_factory() as db:
+            assert await other.sync(db) == 0
+            assert not other.contains("logged-out")
+
+            await revoking.sync(db)
+            assert await other.sync(db) == 1
+
+        assert other.contains("logged-out")
+        assert not other.contains("still-valid")
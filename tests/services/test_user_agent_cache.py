@@ -0,0 +1,147 @@
+"""
+Test cases and a microbenchmark for cached user-agent parsing
+"""
+
+import time
+from unittest.mock import patch
+
+import pytest
+from starlette.requests import Request
+
+from shared.utils.device_info import (
+    DeviceInfoExtractor,
+    UserAgentCache,
+    parse_user_agent,
+    user_agent_cache,
+)
+
+USER_AGENTS = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (iPhone; CPU iPhone OS 17_1 like Mac OS X) "
+    "AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 "
+    "Mobile/15E148 Safari/604.1",
+    "Mozilla/5.0 (Linux; Android 14; Pixel 8) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 "
+    "(KHTML, like Gecko) Version/17.1 Safari/605.1.15",
+    "Mozilla/5.0 (iPad; CPU OS 17_1 like Mac OS X) AppleWebKit/605.1.15 "
+    "(KHTML, like Gecko) Version/17.1 Mobile/15E148 Safari/604.1",
+    "Mozilla/5.0 (X11; Linux x86_64; rv:121.0) Gecko/20100101 " "Firefox/121.0",
+    "Googlebot/2.1 (+http://www.google.com/bot.html)",
+]
+
+BENCHMARK_REQUESTS = 1200
+DISTINCT_PER_AGENT = 40
+MIN_SPEEDUP = 5
+
+
+def make_request(user_agent: str) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "POST",
+            "path": "/login",
+            "headers": [
+                (b"user-agent", user_agent.encode()),
+                (b"accept-language", b"en-AU,en;q=0.9"),
+                (b"x-forwarded-for", b"203.0.113.7"),
+            ],
+            "client": ("10.0.0.1", 1234),
+        }
+    )
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    user_agent_cache.clear()
+    yield
+    user_agent_cache.clear()
+
+
+class TestUserAgentCache:
+    def test_cached_fields_match_a_fresh_parse(self):
+        for user_agent in USER_AGENTS:
+            user_agent_cache.get(user_agent)
+
+        for user_agent in USER_AGENTS:
+            assert user_agent_cache.get(user_agent) == parse_user_agent(
+                user_agent
+            )
+
+        assert user_agent_cache.stats() == {
+            "size": len(USER_AGENTS),
+            "maxsize": user_agent_cache.maxsize,
+            "hits": len(USER_AGENTS),
+            "misses": len(USER_AGENTS),
+            "hit_rate": 0.5,
+        }
+
+    def test_is_bounded_lru(self):
+        cache = UserAgentCache(maxsize=2)
+        cache.get(USER_AGENTS[0])
+        cache.get(USER_AGENTS[1])
+        cache.get(USER_AGENTS[0])
+        cache.get(USER_AGENTS[2])
+        cache.get(USER_AGENTS[0])
+
+        assert cache.stats()["size"] == 2
+        assert (cache.hits, cache.misses) == (2, 3)
+
+    def test_callers_cannot_change_cached_fields(self):
+        user_agent_cache.get(USER_AGENTS[0])["device_type"] = "Toaster"
+
+        assert user_agent_cache.get(USER_AGENTS[0])["device_type"] == (
+            "Windows PC"
+        )
+
+    def test_device_info_uses_cache(self):
+        first = DeviceInfoExtractor.extract_comprehensive_device_info(
+            make_request(USER_AGENTS[1])
+        )
+        second = DeviceInfoExtractor.extract_comprehensive_device_info(
+            make_request(USER_AGENTS[1])
+        )
+
+        assert first["device_type"] == "iPhone"
+        assert first["fingerprint"] == second["fingerprint"]
+        assert first["ip_address"] == "203.0.113.7"
+        assert user_agent_cache.hit_rate == 0.5
+
+
+@pytest.mark.slow
+def test_extraction_microbenchmark():
+    """Device-info extraction over a few hundred repeating user agents."""
+    # Distinct strings, as real traffic has (browser builds vary)
+    user_agents = [
+        f"{user_agent} Build/{build}"
+        for user_agent in USER_AGENTS
+        for build in range(DISTINCT_PER_AGENT)
+    ]
+    requests = [
+        make_request(user_agents[i % len(user_agents)])
+        for i in range(BENCHMARK_REQUESTS)
+    ]
+
+    def extract_all() -> float:
+        start = time.perf_counter()
+        for request in requests:
+            DeviceInfoExtractor.extract_comprehensive_device_info(request)
+        return time.perf_counter() - start
+
+    with patch(
+        "shared.utils.device_info.user_agent_cache", UserAgentCache(maxsize=0)
+    ):
+        uncached = extract_all()
+    # Steady state: every distinct string has been seen once
+    for user_agent in user_agents:
+        user_agent_cache.get(user_agent)
+    cached = extract_all()
+
+    print(
+        f"\n{BENCHMARK_REQUESTS} extractions over {len(user_agents)} user "
+        f"agents: uncached {uncached:.3f}s, cached {cached:.3f}s, "
+        f"hit rate {user_agent_cache.hit_rate:.1%}"
+    )
+    assert user_agent_cache.misses == len(user_agents)
+    assert cached * MIN_SPEEDUP < uncached
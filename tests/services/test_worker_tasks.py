@@ -0,0 +1,100 @@
+"""
+Test cases for the per-worker periodic jobs
+"""
+
+import asyncio
+
+import pytest
+
+from schedulers import worker_tasks
+from schedulers.attendee_notifier import attendee_notification_job
+from schedulers.email_outbox_dispatcher import (
+    email_outbox_job,
+    email_outbox_retention_job,
+)
+from schedulers.idempotency_cleanup import cleanup_idempotency_keys
+from schedulers.paypal_webhook_worker import webhook_inbox_job
+from schedulers.rbac_matrix_refresh import rbac_matrix_refresh_job
+from schedulers.session_activity_flush import session_activity_flush_job
+from schedulers.token_revocation_sync import token_revocation_sync_job
+
+
+@pytest.mark.asyncio
+async def test_jobs_run_until_stopped(monkeypatch):
+    """Started jobs keep running on their interval until stopped."""
+    calls = []
+
+    async def job():
+        calls.append(1)
+
+    monkeypatch.setattr(worker_tasks, "worker_jobs", lambda: [(job, 0.01)])
+    worker_tasks.start_worker_tasks()
+    worker_tasks.start_worker_tasks()
+    await asyncio.sleep(0.1)
+    await worker_tasks.stop_worker_tasks()
+    ran = len(calls)
+    await asyncio.sleep(0.05)
+
+    assert ran >= 3
+    assert len(calls) == ran
+    assert worker_tasks._tasks == []
+
+
+@pytest.mark.asyncio
+async def test_failing_job_does_not_end_the_loop():
+    """An exception in one run is logged and the next run still happens."""
+    calls = []
+
+    async def job():
+        calls.append(1)
+        raise RuntimeError("boom")
+
+    task = asyncio.create_task(worker_tasks.run_periodically(job, 0.01))
+    await asyncio.sleep(0.1)
+    task.cancel()
+
+    assert len(calls) >= 3
+
+
+def test_session_activity_flush_runs_in_every_worker():
+    assert session_activity_flush_job in [
+        job for job, _ in worker_tasks.worker_jobs()
+    ]
+
+
+def test_revocation_sync_runs_in_every_worker():
+    assert token_revocation_sync_job in [
+        job for job, _ in worker_tasks.worker_jobs()
+    ]
+
+
+def test_rbac_matrix_refresh_runs_in_every_worker():
+    assert rbac_matrix_refresh_job in [
+        job for job, _ in worker_tasks.worker_jobs()
+    ]
+
+
+def test_email_outbox_dispatch_runs_in_every_worker():
+    assert email_outbox_job in [job for job, _ in worker_tasks.worker_jobs()]
+
+
+def test_email_outbox_retention_runs_in_every_worker():
+    assert email_outbox_retention_job in [
+        job for job, _ in worker_tasks.worker_jobs()
+    ]
+
+
+def test_webhook_inbox_runs_in_every_worker():
+    assert webhook_inbox_job in [job for job, _ in worker_tasks.worker_jobs()]
+
+
+def test_attendee_notification_poll_runs_in_every_worker():
+    assert attendee_notification_job in [
+        job for job, _ in worker_tasks.worker_jobs()
+    ]
+
+
+def test_idempotency_key_purge_runs_in_every_worker():
+    assert cleanup_idempotency_keys in [
+        job for job, _ in worker_tasks.worker_jobs()
+    ]
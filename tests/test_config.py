@@ -31,6 +31,13 @@ class AppTestSettings(BaseSettings):
     POSTGRES_USER: str = "postgres"
     POSTGRES_PASSWORD: str = "postgres"
     POSTGRES_DB: str = "events2go_testdb"
+    DB_REPEATED_STATEMENT_THRESHOLD: int = 10
+    BOOKING_HOLD_MINUTES: int = 15
+    IDEMPOTENCY_KEY_TTL_HOURS: int = 24
+    # Cheap bcrypt keeps fixtures that hash passwords fast
+    BCRYPT_ROUNDS: int = 4
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 64
 
     @property
     def database_url(self) -> str:
@@ -90,12 +97,33 @@ class AppTestSettings(BaseSettings):
     EMAIL_FROM: str = "your-email@gmail.com"
     EMAIL_FROM_NAME: str = "Events2Go API"
     EMAIL_TEMPLATES_DIR: str = "templates"
+    EMAIL_TEMPLATE_CACHE_DIR: str = ".cache/email_templates"
+    SMTP_POOL_SIZE: int = 3
+    EMAIL_OUTBOX_DISPATCH_SECONDS: int = 5
+    EMAIL_OUTBOX_RETENTION_DAYS: int = 7
+    ATTENDEE_NOTIFY_RATE_PER_SECOND: float = 10
+    ATTENDEE_NOTIFY_POLL_SECONDS: int = 30
 
     # === JWT ===
     JWT_ALGORITHM: str = "RS256"
     JWT_ACCESS_TOKEN_EXPIRE_SECONDS: int = 3600
     REFRESH_TOKEN_EXPIRE_DAYS_IN_SECONDS: int = 604800
     JWT_KEYS_DIR: str = "keys/test"
+    JWT_VERIFIED_CACHE_SIZE: int = 4096
+    SESSION_ACTIVE_CACHE_SECONDS: int = 30
+    SESSION_ACTIVITY_FLUSH_SECONDS: int = 5
+    PRINCIPAL_STATUS_CACHE_SECONDS: int = 30
+    TOKEN_REVOCATION_BACKEND: str = "memory"
+    TOKEN_REVOCATION_SYNC_SECONDS: int = 5
+
+    # === RBAC ===
+    RBAC_MATRIX_REFRESH_SECONDS: int = 30
+
+    # === GeoIP ===
+    GEOIP_BACKEND: str = "none"
+    GEOIP_DATABASE_PATH: str = ""
+    GEOIP_CACHE_SIZE: int = 256
+    GEOIP_ENRICH_IN_BACKGROUND: bool = False
 
     # === DigitalOcean Spaces (for mocking in test) ===
     SPACES_REGION_NAME: str = "nyc3"
@@ -103,6 +131,7 @@ class AppTestSettings(BaseSettings):
     SPACES_BUCKET_NAME: str = "events2go-test"
     SPACES_ACCESS_KEY_ID: str = "test-access-key"
     SPACES_SECRET_ACCESS_KEY: str = "test-secret-key"
+    SPACES_MAX_POOL_CONNECTIONS: int = 20
 
     @property
     def spaces_public_url(self) -> str:
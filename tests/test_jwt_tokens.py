@@ -0,0 +1,129 @@
+import time
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from shared.core.config import PRIVATE_KEY, PUBLIC_KEY, key_registry
+from shared.utils.verified_tokens import VerifiedTokenCache, verified_tokens
+from user_service.utils.auth import (
+    create_jwt_token,
+    revoke_token,
+    verify_jwt_token,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    verified_tokens.clear()
+    yield
+    verified_tokens.clear()
+
+
+@pytest.fixture
+def rotated_key():
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+    public_pem = private_key.public_key().public_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    key_registry.register("rotated-kid", public_pem, private_pem)
+    yield private_pem
+    key_registry.retire("rotated-kid")
+
+
+def issue(private_key=None) -> str:
+    return create_jwt_token(
+        data={"uid": "USR001"},
+        private_key=private_key or PRIVATE_KEY.get_secret_value(),
+    )
+
+
+def test_token_names_its_key():
+    token = issue()
+
+    assert jwt.get_unverified_header(token)["kid"] == key_registry.current_kid
+    assert verify_jwt_token(token, PUBLIC_KEY.get_secret_value())["uid"] == (
+        "USR001"
+    )
+
+
+def test_repeat_verification_is_cached():
+    token = issue()
+
+    first = verify_jwt_token(token, PUBLIC_KEY.get_secret_value())
+    second = verify_jwt_token(token, PUBLIC_KEY.get_secret_value())
+
+    assert first == second
+    assert (verified_tokens.misses, verified_tokens.hits) == (1, 1)
+
+
+def test_revoked_token_is_dropped_from_cache():
+    token = issue()
+    verify_jwt_token(token, PUBLIC_KEY.get_secret_value())
+
+    assert revoke_token(token, PUBLIC_KEY.get_secret_value())
+    assert len(verified_tokens) == 0
+    with pytest.raises(ValueError, match="revoked"):
+        verify_jwt_token(token, PUBLIC_KEY.get_secret_value())
+
+
+def test_tampered_token_is_rejected():
+    token = issue()
+    verify_jwt_token(token, PUBLIC_KEY.get_secret_value())
+    header, payload, signature = token.split(".")
+
+    with pytest.raises((ValueError, RuntimeError)):
+        verify_jwt_token(
+            f"{header}.{payload}.{signature[::-1]}",
+            PUBLIC_KEY.get_secret_value(),
+        )
+
+
+def test_token_from_another_registered_key_verifies(rotated_key):
+    token = issue(rotated_key)
+
+    assert jwt.get_unverified_header(token)["kid"] == "rotated-kid"
+    assert verify_jwt_token(token, PUBLIC_KEY.get_secret_value())["uid"] == (
+        "USR001"
+    )
+
+
+def test_retired_key_no_longer_verifies(rotated_key):
+    token = issue(rotated_key)
+    key_registry.retire("rotated-kid")
+
+    with pytest.raises(ValueError, match="signature"):
+        verify_jwt_token(token, PUBLIC_KEY.get_secret_value())
+
+
+class TestVerifiedTokenCache:
+    def test_entries_expire_with_the_token(self):
+        cache = VerifiedTokenCache(maxsize=4)
+        cache.put("kid", "token", {"exp": time.time() - 1})
+
+        assert cache.get("kid", "token") is None
+        assert len(cache) == 0
+
+    def test_is_bounded_lru(self):
+        cache = VerifiedTokenCache(maxsize=2)
+        payload = {"exp": time.time() + 60}
+        cache.put("kid", "a", payload)
+        cache.put("kid", "b", payload)
+        cache.get("kid", "a")
+        cache.put("kid", "c", payload)
+
+        assert cache.get("kid", "a") is payload
+        assert cache.get("kid", "b") is None
+
+    def test_entries_are_per_key(self):
+        cache = VerifiedTokenCache(maxsize=2)
+        cache.put("kid-1", "token", {"exp": time.time() + 60})
+
+        assert cache.get("kid-2", "token") is None
@@ -1,4 +1,7 @@
-from typing import Any, Dict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
+
+from shared.db.query_stats import QueryStats, track_queries
 
 
 def assert_dict_contains(
@@ -31,3 +34,25 @@ def assert_response_error(
         "detail" in resp["data"] or "message" in resp["data"]
     ):
         raise AssertionError("Error response should contain detail or message")
+
+
+@contextmanager
+def assert_max_queries(max_queries: int) -> Iterator[QueryStats]:
+    """Fail when the enclosed block issues more SQL statements than
+    ``max_queries``. Wrap an API call to pin an endpoint's query budget:
+
+        with assert_max_queries(3):
+            await test_client.get("/api/v1/new-events/slug/some-slug")
+    """
+    with track_queries() as stats:
+        yield stats
+    if stats.statements > max_queries:
+        repeated = stats.shapes.most_common(1)
+        raise AssertionError(
+            f"Expected at most {max_queries} queries, got {stats.statements}"
+            + (
+                f" (most repeated x{repeated[0][1]}: {repeated[0][0][:200]})"
+                if repeated
+                else ""
+            )
+        )
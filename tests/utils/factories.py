@@ -31,7 +31,9 @@ class AsyncTestDataFactory:
             "username": fake.user_name(),
             "email": fake.email(),
             "password_hash": fake.sha256(),
-            "is_active": fake.boolean(),
+            "profile_id": fake.unique.lexify(text="PRF???"),
+            "business_id": fake.unique.lexify(text="BUS???"),
+            "is_deleted": False,
             **kwargs,
         }
 
@@ -0,0 +1,209 @@
+import asyncio
+import base64
+import socket
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+import uvicorn
+from fastapi import FastAPI, Header, HTTPException, Request
+from fastapi.responses import JSONResponse
+
+
+class FakePayPal:
+    """In-memory stand-in for the PayPal OAuth and Orders v2 APIs.
+
+    Knobs for tests: ``latency`` delays every response, ``fail_next(n,
+    status)`` makes the next n API calls fail, ``token_expires_in`` sets
+    the lifetime of issued tokens. ``PayPal-Request-Id`` replays return
+    the first response, as PayPal does.
+    """
+
+    CLIENT_ID = "fake-client-id"
+    CLIENT_SECRET = "fake-client-secret"
+    # Webhook deliveries signed with this fail verification
+    INVALID_SIGNATURE = "invalid-signature"
+
+    def __init__(self) -> None:
+        self.latency = 0.0
+        self.token_expires_in = 32400
+        self.tokens_issued = 0
+        self.orders: Dict[str, Dict[str, Any]] = {}
+        self.captures = 0
+        self.requests: List[str] = []
+        self._valid_tokens: set[str] = set()
+        self._failures: List[int] = []
+        self._replies: Dict[str, Dict[str, Any]] = {}
+        self.app = self._build_app()
+
+    def fail_next(self, times: int = 1, status_code: int = 503) -> None:
+        self._failures.extend([status_code] * times)
+
+    def revoke_tokens(self) -> None:
+        self._valid_tokens.clear()
+
+    async def _delay_and_maybe_fail(self) -> Optional[JSONResponse]:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self._failures:
+            status_code = self._failures.pop(0)
+            return JSONResponse({"name": "INTERNAL_ERROR"}, status_code)
+        return None
+
+    def _check_token(self, authorization: Optional[str]) -> None:
+        token = (authorization or "").removeprefix("Bearer ")
+        if token not in self._valid_tokens:
+            raise HTTPException(status_code=401, detail="invalid_token")
+
+    def _build_app(self) -> FastAPI:
+        app = FastAPI()
+
+        @app.middleware("http")
+        async def record(request: Request, call_next):
+            self.requests.append(f"{request.method} {request.url.path}")
+            return await call_next(request)
+
+        @app.post("/v1/oauth2/token")
+        async def token(authorization: str = Header("")):
+            failure = await self._delay_and_maybe_fail()
+            if failure:
+                return failure
+            expected = base64.b64encode(
+                f"{self.CLIENT_ID}:{self.CLIENT_SECRET}".encode()
+            ).decode()
+            if authorization != f"Basic {expected}":
+                return JSONResponse({"error": "invalid_client"}, 401)
+            self.tokens_issued += 1
+            access_token = f"token-{self.tokens_issued}"
+            self._valid_tokens.add(access_token)
+            return {
+                "access_token": access_token,
+                "token_type": "Bearer",
+                "expires_in": self.token_expires_in,
+            }
+
+        @app.post("/v2/checkout/orders", status_code=201)
+        async def create_order(
+            request: Request,
+            authorization: Optional[str] = Header(None),
+            paypal_request_id: Optional[str] = Header(None),
+        ):
+            failure = await self._delay_and_maybe_fail()
+            if failure:
+                return failure
+            self._check_token(authorization)
+            if paypal_request_id in self._replies:
+                return self._replies[paypal_request_id]
+            body = await request.json()
+            order_id = uuid.uuid4().hex[:17].upper()
+            order = {
+                "id": order_id,
+                "status": "CREATED",
+                "purchase_units": body.get("purchase_units", []),
+                "links": [
+                    {
+                        "rel": "approve",
+                        "href": f"https://paypal.test/checkoutnow?token={order_id}",
+                        "method": "GET",
+                    }
+                ],
+            }
+            self.orders[order_id] = order
+            if paypal_request_id:
+                self._replies[paypal_request_id] = order
+            return order
+
+        @app.post("/v2/checkout/orders/{order_id}/capture", status_code=201)
+        async def capture_order(
+            order_id: str,
+            authorization: Optional[str] = Header(None),
+            paypal_request_id: Optional[str] = Header(None),
+        ):
+            failure = await self._delay_and_maybe_fail()
+            if failure:
+                return failure
+            self._check_token(authorization)
+            if paypal_request_id in self._replies:
+                return self._replies[paypal_request_id]
+            order = self.orders.get(order_id)
+            if order is None:
+                return JSONResponse({"name": "RESOURCE_NOT_FOUND"}, 404)
+            if order["status"] == "COMPLETED":
+                return JSONResponse(
+                    {
+                        "name": "UNPROCESSABLE_ENTITY",
+                        "details": [{"issue": "ORDER_ALREADY_CAPTURED"}],
+                    },
+                    422,
+                )
+            self.captures += 1
+            order["status"] = "COMPLETED"
+            order["purchase_units"] = [
+                {
+                    **(order["purchase_units"] or [{}])[0],
+                    "payments": {
+                        "captures": [
+                            {"id": f"CAP{order_id}", "status": "COMPLETED"}
+                        ]
+                    },
+                }
+            ]
+            if paypal_request_id:
+                self._replies[paypal_request_id] = order
+            return order
+
+        @app.post("/v1/notifications/verify-webhook-signature")
+        async def verify_webhook_signature(
+            request: Request, authorization: Optional[str] = Header(None)
+        ):
+            self._check_token(authorization)
+            body = await request.json()
+            valid = body.get("transmission_sig") != self.INVALID_SIGNATURE
+            return {"verification_status": "SUCCESS" if valid else "FAILURE"}
+
+        @app.get("/v2/checkout/orders/{order_id}")
+        async def get_order(
+            order_id: str, authorization: Optional[str] = Header(None)
+        ):
+            failure = await self._delay_and_maybe_fail()
+            if failure:
+                return failure
+            self._check_token(authorization)
+            order = self.orders.get(order_id)
+            if order is None:
+                return JSONResponse({"name": "RESOURCE_NOT_FOUND"}, 404)
+            return order
+
+        return app
+
+
+@contextmanager
+def serve_fake_paypal(fake: FakePayPal) -> Iterator[str]:
+    """Run ``fake`` on a real 127.0.0.1 socket in a background thread.
+
+    Yields the base URL. Point ``PAYPAL_BASE_URL`` at it to load test the
+    booking endpoints offline, over real keep-alive connections.
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    server = uvicorn.Server(
+        uvicorn.Config(
+            fake.app, host="127.0.0.1", port=port, log_level="warning"
+        )
+    )
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 10
+    while not server.started:
+        if time.monotonic() > deadline:
+            raise RuntimeError("Fake PayPal server did not start")
+        time.sleep(0.01)
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        server.should_exit = True
+        thread.join(timeout=10)
@@ -0,0 +1,159 @@
+import asyncio
+import socket
+import threading
+import time
+import xml.etree.ElementTree as ET
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+import uvicorn
+from fastapi import FastAPI, Query, Request, Response
+
+S3_NS = "http://s3.amazonaws.com/doc/2006-03-01/"
+
+
+class FakeS3:
+    """In-memory stand-in for the S3 object API DigitalOcean Spaces speaks.
+
+    Path-style only: PutObject, DeleteObject, ListObjectsV2 and
+    DeleteObjects on any bucket. Knobs for tests: ``latency`` delays every
+    response, ``fail_next(n, code)`` answers the next n requests with a 403
+    S3 error (not retried by botocore). ``connections`` counts distinct
+    client sockets, to show whether connections are reused.
+    """
+
+    ACCESS_KEY_ID = "fake-access-key"
+    SECRET_ACCESS_KEY = "fake-secret-key"
+
+    def __init__(self) -> None:
+        self.latency = 0.0
+        self.objects: Dict[Tuple[str, str], Dict[str, object]] = {}
+        self.requests: List[str] = []
+        self._sockets: Set[Tuple[str, int]] = set()
+        self._failures: List[str] = []
+        self.app = self._build_app()
+
+    @property
+    def connections(self) -> int:
+        return len(self._sockets)
+
+    def keys(self, bucket: str) -> List[str]:
+        return sorted(key for b, key in self.objects if b == bucket)
+
+    def fail_next(self, times: int = 1, code: str = "AccessDenied") -> None:
+        self._failures.extend([code] * times)
+
+    @staticmethod
+    def _error(code: str, status_code: int = 403) -> Response:
+        body = (
+            f"<?xml version='1.0' encoding='UTF-8'?>"
+            f"<Error><Code>{code}</Code><Message>{code}</Message></Error>"
+        )
+        return Response(body, status_code, media_type="application/xml")
+
+    def _build_app(self) -> FastAPI:
+        app = FastAPI()
+
+        @app.middleware("http")
+        async def record(request: Request, call_next):
+            self._sockets.add((request.client.host, request.client.port))
+            self.requests.append(f"{request.method} {request.url.path}")
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            if f"Credential={self.ACCESS_KEY_ID}/" not in request.headers.get(
+                "authorization", ""
+            ):
+                return self._error("InvalidAccessKeyId")
+            if self._failures:
+                return self._error(self._failures.pop(0))
+            return await call_next(request)
+
+        @app.put("/{bucket}/{key:path}")
+        async def put_object(bucket: str, key: str, request: Request):
+            self.objects[(bucket, key)] = {
+                "body": await request.body(),
+                "content_type": request.headers.get("content-type"),
+                "acl": request.headers.get("x-amz-acl"),
+            }
+            return Response(headers={"ETag": '"fake-etag"'})
+
+        @app.delete("/{bucket}/{key:path}")
+        async def delete_object(bucket: str, key: str):
+            self.objects.pop((bucket, key), None)
+            return Response(status_code=204)
+
+        @app.get("/{bucket}")
+        async def list_objects_v2(
+            bucket: str,
+            prefix: str = "",
+            max_keys: int = Query(1000, alias="max-keys"),
+            continuation_token: Optional[str] = Query(
+                None, alias="continuation-token"
+            ),
+        ):
+            keys = [k for k in self.keys(bucket) if k.startswith(prefix)]
+            if continuation_token:
+                keys = [k for k in keys if k > continuation_token]
+            page, truncated = keys[:max_keys], len(keys) > max_keys
+            root = ET.Element("ListBucketResult", xmlns=S3_NS)
+            ET.SubElement(root, "Name").text = bucket
+            ET.SubElement(root, "Prefix").text = prefix
+            ET.SubElement(root, "KeyCount").text = str(len(page))
+            ET.SubElement(root, "IsTruncated").text = str(truncated).lower()
+            if truncated:
+                ET.SubElement(root, "NextContinuationToken").text = page[-1]
+            for key in page:
+                item = ET.SubElement(root, "Contents")
+                ET.SubElement(item, "Key").text = key
+                ET.SubElement(item, "Size").text = str(
+                    len(self.objects[(bucket, key)]["body"])
+                )
+            return Response(ET.tostring(root), media_type="application/xml")
+
+        @app.post("/{bucket}")
+        async def delete_objects(bucket: str, request: Request):
+            root = ET.Element("DeleteResult", xmlns=S3_NS)
+            for element in ET.fromstring(await request.body()).iter():
+                if element.tag.endswith("Key"):
+                    self.objects.pop((bucket, element.text), None)
+                    deleted = ET.SubElement(root, "Deleted")
+                    ET.SubElement(deleted, "Key").text = element.text
+            return Response(ET.tostring(root), media_type="application/xml")
+
+        return app
+
+
+@contextmanager
+def serve_fake_s3(fake: FakeS3) -> Iterator[str]:
+    """Run ``fake`` on a real 127.0.0.1 socket in a background thread.
+
+    Yields the endpoint URL, for ``MediaStorage(endpoint_url=...)`` with
+    path-style addressing.
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    server = uvicorn.Server(
+        uvicorn.Config(
+            fake.app,
+            host="127.0.0.1",
+            port=port,
+            log_level="warning",
+            # "auto" installs the uvloop policy process-wide, which leaves
+            # the test's own thread without a current event loop
+            loop="asyncio",
+        )
+    )
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 10
+    while not server.started:
+        if time.monotonic() > deadline:
+            raise RuntimeError("Fake S3 server did not start")
+        time.sleep(0.01)
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        server.should_exit = True
+        thread.join(timeout=10)
@@ -0,0 +1,150 @@
+import asyncio
+import base64
+from email import message_from_bytes
+from email.message import Message
+from typing import List, Optional, Set, Tuple
+
+
+class FakeSmtp:
+    """Local stand-in for an authenticated SMTP relay.
+
+    Speaks enough ESMTP for ``aiosmtplib`` (EHLO, AUTH PLAIN/LOGIN, MAIL,
+    RCPT, DATA, RSET, NOOP, QUIT) on a random localhost port. Knobs for
+    tests: ``latency`` delays every reply to DATA, ``fail_next(n, code)``
+    makes the next n MAIL commands fail, ``reject`` lists recipients
+    refused with 550, ``drop_connections()`` hangs up on idle clients.
+    """
+
+    USERNAME = "mailer@example.com"
+    PASSWORD = "fake-smtp-password"
+
+    def __init__(self) -> None:
+        self.latency = 0.0
+        self.reject: Set[str] = set()
+        self.messages: List[Message] = []
+        self.connections = 0
+        self.logins = 0
+        self._failures: List[int] = []
+        self._writers: Set[asyncio.StreamWriter] = set()
+        self._server: Optional[asyncio.base_events.Server] = None
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        return self._server.sockets[0].getsockname()[:2]
+
+    @property
+    def recipients(self) -> List[str]:
+        return [message["To"] for message in self.messages]
+
+    def fail_next(self, times: int = 1, code: int = 451) -> None:
+        self._failures.extend([code] * times)
+
+    def drop_connections(self) -> None:
+        for writer in list(self._writers):
+            writer.close()
+
+    async def start(self) -> "FakeSmtp":
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self
+
+    async def close(self) -> None:
+        self.drop_connections()
+        self._server.close()
+        await self._server.wait_closed()
+
+    def _credentials_ok(self, username: str, password: str) -> bool:
+        return (username, password) == (self.USERNAME, self.PASSWORD)
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+        self._writers.add(writer)
+
+        async def reply(line: str) -> None:
+            writer.write(f"{line}\r\n".encode())
+            await writer.drain()
+
+        async def read_line() -> Optional[str]:
+            line = await reader.readline()
+            return line.decode().rstrip("\r\n") if line else None
+
+        authenticated = False
+        recipients: List[str] = []
+        try:
+            await reply("220 fake-smtp ESMTP ready")
+            while (line := await read_line()) is not None:
+                command, _, argument = line.partition(" ")
+                command = command.upper()
+
+                if command == "EHLO":
+                    await reply("250-fake-smtp")
+                    await reply("250-AUTH PLAIN LOGIN")
+                    await reply("250 8BITMIME")
+                elif command == "HELO":
+                    await reply("250 fake-smtp")
+                elif command == "AUTH":
+                    mechanism, _, initial = argument.partition(" ")
+                    if mechanism.upper() == "PLAIN":
+                        if not initial:
+                            await reply("334 ")
+                            initial = await read_line() or ""
+                        _, username, password = (
+                            base64.b64decode(initial).decode().split("\0")
+                        )
+                    else:
+                        await reply("334 VXNlcm5hbWU6")
+                        username = base64.b64decode(
+                            await read_line() or ""
+                        ).decode()
+                        await reply("334 UGFzc3dvcmQ6")
+                        password = base64.b64decode(
+                            await read_line() or ""
+                        ).decode()
+                    if self._credentials_ok(username, password):
+                        authenticated = True
+                        self.logins += 1
+                        await reply("235 Authentication successful")
+                    else:
+                        await reply("535 Authentication failed")
+                elif command == "MAIL":
+                    if not authenticated:
+                        await reply("530 Authentication required")
+                    elif self._failures:
+                        code = self._failures.pop(0)
+                        await reply(f"{code} Try again later")
+                    else:
+                        recipients = []
+                        await reply("250 OK")
+                elif command == "RCPT":
+                    address = argument.split(":", 1)[1].strip(" <>")
+                    if address in self.reject:
+                        await reply("550 No such user")
+                    else:
+                        recipients.append(address)
+                        await reply("250 OK")
+                elif command == "DATA":
+                    await reply("354 End data with <CR><LF>.<CR><LF>")
+                    lines = []
+                    while (data := await reader.readline()) not in (
+                        b".\r\n",
+                        b"",
+                    ):
+                        lines.append(data[1:] if data[:2] == b".." else data)
+                    if self.latency:
+                        await asyncio.sleep(self.latency)
+                    self.messages.append(message_from_bytes(b"".join(lines)))
+                    await reply("250 Queued")
+                elif command in ("RSET", "NOOP"):
+                    recipients = []
+                    await reply("250 OK")
+                elif command == "QUIT":
+                    await reply("221 Bye")
+                    break
+                else:
+                    await reply("502 Command not implemented")
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
@@ -1,9 +1,10 @@
 from datetime import datetime, timezone
-from typing import Annotated, Union
+from typing import Annotated, Optional, Union
 
 import jwt
 from fastapi import (
     APIRouter,
+    BackgroundTasks,
     Depends,
     Request,
     Response,
@@ -18,9 +19,10 @@ from shared.core.config import PRIVATE_KEY, PUBLIC_KEY, settings
 from shared.core.logging_config import get_logger
 from shared.db.models import User
 from shared.db.sessions.database import get_db
+from shared.dependencies.principal import Principal
 from shared.dependencies.user import (
     extract_token_from_request,
-    get_current_active_user,
+    get_current_principal,
 )
 from shared.utils.exception_handlers import exception_handler
 from user_service.services.auth import (
@@ -55,6 +57,7 @@ async def login(
     request: Request,
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
     response: Response,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ) -> JSONResponse:
     """Handle user login with various validation checks"""
@@ -66,7 +69,9 @@ async def login(
     user = validation_result
 
     # Process successful authentication
-    return await process_successful_login(user, request, response, db)
+    return await process_successful_login(
+        user, request, response, db, background_tasks
+    )
 
 
 async def validate_login_attempt(
@@ -101,7 +106,11 @@ async def validate_login_attempt(
 
 
 async def process_successful_login(
-    user: User, request: Request, response: Response, db: AsyncSession
+    user: User,
+    request: Request,
+    response: Response,
+    db: AsyncSession,
+    background_tasks: Optional[BackgroundTasks] = None,
 ) -> JSONResponse:
     """Process successful login and generate response"""
     # Step 5: 180-day password expiration policy
@@ -124,7 +133,11 @@ async def process_successful_login(
 
     # Step 7: Create a comprehensive device session record
     session = await SessionManager.create_session(
-        user, request, db, include_location=True
+        user,
+        request,
+        db,
+        include_location=True,
+        background_tasks=background_tasks,
     )
 
     # Step 7.1: Check for suspicious activity
@@ -195,7 +208,7 @@ async def process_successful_login(
 async def logout(
     request: Request,
     response: Response,
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_principal)],
     db: AsyncSession = Depends(get_db),
 ) -> JSONResponse:
     """Handle user logout by clearing cookies, revoking tokens, and deactivating sessions"""
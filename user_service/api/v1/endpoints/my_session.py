@@ -1,6 +1,5 @@
 from typing import Annotated
 
-import jwt
 from fastapi import (
     APIRouter,
     Depends,
@@ -11,14 +10,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.responses import JSONResponse
 
 from shared.core.api_response import api_response
-from shared.core.config import PUBLIC_KEY, settings
 from shared.core.logging_config import get_logger
-from shared.db.models import User, UserDeviceSession
+from shared.db.models import UserDeviceSession
 from shared.db.sessions.database import get_db
-from shared.dependencies.user import (
-    extract_token_from_request,
-    get_current_active_user,
-)
+from shared.dependencies.principal import Principal
+from shared.dependencies.user import get_current_principal
 from shared.utils.exception_handlers import exception_handler
 from user_service.schemas.session import (
     SessionInfo,
@@ -35,7 +31,7 @@ router = APIRouter()
 @router.get("", response_model=SessionListResponse)
 @exception_handler
 async def get_user_sessions(
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_principal)],
     db: AsyncSession = Depends(get_db),
     active_only: bool = True,
     limit: int = 10,
@@ -79,31 +75,12 @@ async def get_user_sessions(
             )
         )
 
-    # Mark current session
-    # Get session ID from token
-    request = getattr(current_user, "_request", None)
-    if request:
-        token = extract_token_from_request(request)
-        if token:
-            try:
-                public_key = PUBLIC_KEY.get_secret_value()
-                if public_key:
-                    payload = jwt.decode(
-                        token,
-                        public_key,
-                        algorithms=[settings.JWT_ALGORITHM],
-                        options={"verify_exp": False},
-                    )
-                    current_session_id = payload.get("sid")
-                    if current_session_id:
-                        for session in formatted_sessions:
-                            if session.session_id == current_session_id:
-                                session.is_current = True
-                                break
-            except Exception as e:
-                logger.warning(
-                    f"Failed to decode token for session identification: {e}"
-                )
+    # Mark current session (the token's session)
+    if current_user.session_id:
+        for session in formatted_sessions:
+            if session.session_id == current_user.session_id:
+                session.is_current = True
+                break
 
     return api_response(
         status_code=200,
@@ -116,7 +93,7 @@ async def get_user_sessions(
 @exception_handler
 async def terminate_user_session(
     session_id: int,
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_principal)],
     db: AsyncSession = Depends(get_db),
 ) -> JSONResponse:
     """Terminate a specific session for the current user"""
@@ -135,27 +112,7 @@ async def terminate_user_session(
         )
 
     # Check if this is the current session
-    is_current_session = False
-    request = getattr(current_user, "_request", None)
-    if request:
-        token = extract_token_from_request(request)
-        if token:
-            try:
-                public_key = PUBLIC_KEY.get_secret_value()
-                if public_key:
-                    payload = jwt.decode(
-                        token,
-                        public_key,
-                        algorithms=[settings.JWT_ALGORITHM],
-                        options={"verify_exp": False},
-                    )
-                    current_session_id = payload.get("sid")
-                    if current_session_id and current_session_id == session_id:
-                        is_current_session = True
-            except Exception as e:
-                logger.warning(
-                    f"Failed to decode token for session identification: {e}"
-                )
+    is_current_session = current_user.session_id == session_id
 
     # Terminate the session
     terminated = await SessionManager.terminate_session(
@@ -189,32 +146,13 @@ async def terminate_user_session(
 @router.delete("", response_model=SessionTerminateResponse)
 @exception_handler
 async def terminate_all_user_sessions(
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_principal)],
     db: AsyncSession = Depends(get_db),
     keep_current: bool = True,
 ) -> JSONResponse:
     """Terminate all sessions for the current user except the current one"""
-    # Get current session ID from token
-    current_session_id = None
-    if keep_current:
-        request = getattr(current_user, "_request", None)
-        if request:
-            token = extract_token_from_request(request)
-            if token:
-                try:
-                    public_key = PUBLIC_KEY.get_secret_value()
-                    if public_key:
-                        payload = jwt.decode(
-                            token,
-                            public_key,
-                            algorithms=[settings.JWT_ALGORITHM],
-                            options={"verify_exp": False},
-                        )
-                        current_session_id = payload.get("sid")
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to decode token for session identification: {e}"
-                    )
+    # Current session ID from the token
+    current_session_id = current_user.session_id if keep_current else None
 
     # Terminate all sessions except current one
     terminated_count = await SessionManager.terminate_all_user_sessions(
@@ -11,6 +11,7 @@ from shared.db.sessions.database import get_db
 from shared.utils.email_utils import send_password_reset_email
 from shared.utils.email_validators import EmailValidator
 from shared.utils.exception_handlers import exception_handler
+from shared.utils.password_hashing import password_hasher
 from user_service.schemas.password import (
     ForgotPassword,
     ResetPasswordWithToken,
@@ -27,10 +28,6 @@ from user_service.services.response_builders import (
     user_not_found_response,
 )
 from user_service.services.user_service import get_user_by_email, get_user_by_id
-from user_service.utils.auth import (
-    hash_password,
-    verify_password,
-)
 
 logger = get_logger(__name__)
 
@@ -130,14 +127,14 @@ async def reset_password_with_token(
             )
 
         # Step 2: Prevent using the same password
-        if verify_password(data.new_password, user.password_hash):
+        if await password_hasher.verify(data.new_password, user.password_hash):
             return api_response(
                 status_code=status.HTTP_409_CONFLICT,
                 message="New password cannot be the same as old password.",
             )
 
         # Step 3: Update the password
-        user.password_hash = hash_password(data.new_password)
+        user.password_hash = await password_hasher.hash(data.new_password)
         user.login_status = 0  # Normal login status
         user.failure_login_attempts = 0  # Reset login attempts
 
@@ -197,7 +194,7 @@ async def change_password(
             return account_deactivated()
 
         # Step 2: Verify current password
-        if not verify_password(
+        if not await password_hasher.verify(
             data.current_password, current_user.password_hash
         ):
             logger.warning(
@@ -210,7 +207,9 @@ async def change_password(
             )
 
         # Step 3: Prevent using the same password
-        if verify_password(data.new_password, current_user.password_hash):
+        if await password_hasher.verify(
+            data.new_password, current_user.password_hash
+        ):
             logger.info(
                 f"User {current_user.user_id} attempted to use same password"
             )
@@ -221,7 +220,9 @@ async def change_password(
             )
 
         # Step 4: Update password and reset security fields
-        current_user.password_hash = hash_password(data.new_password)
+        current_user.password_hash = await password_hasher.hash(
+            data.new_password
+        )
         current_user.failure_login_attempts = 0  # Reset failed login attempts
         current_user.login_status = 0  # Ensure normal login status
         current_user.updated_at = datetime.now(timezone.utc)  # Update timestamp
@@ -9,7 +9,8 @@ from shared.core.api_response import api_response
 from shared.core.config import settings
 from shared.db.models import User
 from shared.db.sessions.database import get_db
-from shared.dependencies.user import get_current_active_user
+from shared.dependencies.principal import Principal, user_principal_cache
+from shared.dependencies.user import get_current_principal
 from shared.utils.exception_handlers import exception_handler
 from shared.utils.file_uploads import (
     get_media_url,
@@ -28,7 +29,7 @@ router = APIRouter()
 @router.get("", response_model=UserProfile, summary="Get current user profile")
 @exception_handler
 async def get_profile(
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_principal)],
     db: AsyncSession = Depends(get_db),
 ) -> JSONResponse:
     """
@@ -73,7 +74,7 @@ async def get_profile(
 @router.put("", response_model=UserProfile, summary="Update user profile")
 @exception_handler
 async def update_profile(
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_principal)],
     profile_data: UpdateProfileRequest,
     db: AsyncSession = Depends(get_db),
 ) -> JSONResponse:
@@ -170,7 +171,7 @@ async def update_profile(
 @router.patch("/picture", summary="Update profile picture")
 @exception_handler
 async def update_profile_picture(
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_principal)],
     profile_picture: UploadFile = File(...),
     db: AsyncSession = Depends(get_db),
 ) -> JSONResponse:
@@ -231,7 +232,7 @@ async def update_profile_picture(
 @router.delete("", summary="Delete current user account")
 @exception_handler
 async def delete_account(
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_principal)],
     db: AsyncSession = Depends(get_db),
 ) -> JSONResponse:
     """
@@ -264,6 +265,7 @@ async def delete_account(
     # Soft delete the user
     user.is_deleted = True
     await db.commit()
+    user_principal_cache.invalidate(user.user_id)
 
     return api_response(
         status_code=status.HTTP_200_OK,
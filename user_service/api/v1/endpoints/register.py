@@ -2,15 +2,18 @@ from fastapi import APIRouter, BackgroundTasks, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.responses import JSONResponse
 
+from schedulers.email_outbox_dispatcher import email_outbox_job
 from shared.core.api_response import api_response
 from shared.db.models import User, UserVerification
 from shared.db.sessions.database import get_db
-from shared.utils.email_utils import send_user_verification_email
+from shared.utils.email_outbox import enqueue_email
+from shared.utils.email_utils import build_user_verification_email
 from shared.utils.exception_handlers import exception_handler
 from shared.utils.id_generators import (
     generate_lower_uppercase,
 )
 from shared.utils.otp_and_tokens import generate_verification_tokens
+from shared.utils.password_hashing import password_hasher
 from user_service.schemas.register import (
     UsernameAvailabilityRequest,
     UsernameAvailabilityResponse,
@@ -20,7 +23,6 @@ from user_service.schemas.register import (
 from user_service.services.response_builders import config_not_found_response
 from user_service.services.user_service import get_config_or_404
 from user_service.services.user_validation import validate_unique_user
-from user_service.utils.auth import hash_password
 
 router = APIRouter()
 
@@ -62,7 +64,7 @@ async def register_user(
     user_id = generate_lower_uppercase(length=6)
 
     # Hash the password
-    password_hash = hash_password(user_data.password)
+    password_hash = await password_hasher.hash(user_data.password)
 
     # Get system configuration
     config = await get_config_or_404(db)
@@ -90,20 +92,23 @@ async def register_user(
         phone_verified=False,
     )
 
-    # Add to database
+    # Add to database, with the welcome email and its verification link
     db.add(new_user)
     db.add(verification)
+    enqueue_email(
+        db,
+        build_user_verification_email(
+            email=user_data.email,
+            username=user_data.username,
+            verification_token=verification_token,
+            expires_in_minutes=60,  # Set expiration to 60 minutes
+        ),
+    )
     await db.commit()
     await db.refresh(new_user)
 
-    # Send welcome email with verification link in background
-    background_tasks.add_task(
-        send_user_verification_email,
-        email=user_data.email,
-        username=user_data.username,
-        verification_token=verification_token,
-        expires_in_minutes=60,  # Set expiration to 60 minutes
-    )
+    # Send the queued email after the response
+    background_tasks.add_task(email_outbox_job)
 
     # Return success response
     return api_response(
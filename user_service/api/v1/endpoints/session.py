@@ -11,6 +11,7 @@ from shared.core.config import PUBLIC_KEY
 from shared.db.models import User, UserDeviceSession
 from shared.db.sessions.database import get_db
 from shared.utils.exception_handlers import exception_handler
+from shared.utils.session_activity import user_session_activity
 from user_service.schemas.session import DeviceSessionResponse
 from user_service.services.auth import update_session_activity
 from user_service.utils.auth import verify_jwt_token
@@ -182,6 +183,7 @@ async def terminate_session(
     # Deactivate the session
     session.is_active = False
     await db.commit()
+    user_session_activity.invalidate([session.session_id])
 
     # Update the current session's last_used_at timestamp
     if current_session_id:
@@ -229,12 +231,15 @@ async def terminate_all_sessions(
 
     # Deactivate all sessions except the current one
     terminated_count = 0
+    terminated_ids = []
     for session in sessions:
         if not current_session_id or session.session_id != current_session_id:
             session.is_active = False
+            terminated_ids.append(session.session_id)
             terminated_count += 1
 
     await db.commit()
+    user_session_activity.invalidate(terminated_ids)
 
     # Update the current session's last_used_at timestamp
     if current_session_id:
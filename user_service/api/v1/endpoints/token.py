@@ -18,6 +18,7 @@ from shared.core.logging_config import get_logger
 from shared.db.models import User, UserDeviceSession
 from shared.db.sessions.database import get_db
 from shared.utils.exception_handlers import exception_handler
+from shared.utils.session_activity import user_session_activity
 from user_service.schemas.token import TokenRefreshRequest, TokenResponse
 from user_service.services.session_management import TokenSessionManager
 from user_service.utils.auth import create_jwt_token, verify_jwt_token
@@ -261,6 +262,7 @@ async def revoke_token(
             if session:
                 session.is_active = False
                 await db.commit()
+                user_session_activity.invalidate([session_id])
 
                 return api_response(
                     status_code=status.HTTP_200_OK,
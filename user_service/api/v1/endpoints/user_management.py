@@ -9,7 +9,8 @@ from shared.core.api_response import api_response
 from shared.core.logging_config import get_logger
 from shared.db.models import User
 from shared.db.sessions.database import get_db
-from shared.dependencies.user import get_current_active_user
+from shared.dependencies.principal import Principal, user_principal_cache
+from shared.dependencies.user import get_current_principal
 from shared.utils.exception_handlers import exception_handler
 from shared.utils.file_uploads import get_media_url
 from user_service.schemas.user import UserMeOut
@@ -23,7 +24,7 @@ router = APIRouter()
 @router.get("", response_model=List[UserMeOut], summary="Get all users")
 @exception_handler
 async def get_app_users(
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_principal)],
     is_deleted: Optional[bool] = Query(
         None,
         description=(
@@ -151,7 +152,7 @@ async def get_app_users_for_admins(
 @exception_handler
 async def get_app_user_by_id(
     user_id: str,
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_principal)],
     db: AsyncSession = Depends(get_db),
 ) -> JSONResponse:
     """
@@ -298,7 +299,7 @@ async def get_app_user_by_id(
 @exception_handler
 async def deactivate_user(
     user_id: str,
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_principal)],
     db: AsyncSession = Depends(get_db),
 ) -> JSONResponse:
     """
@@ -326,6 +327,7 @@ async def deactivate_user(
     user.is_deleted = True
     await db.commit()
     await db.refresh(user)
+    user_principal_cache.invalidate(user.user_id)
 
     return api_response(
         status_code=status.HTTP_200_OK,
@@ -337,7 +339,7 @@ async def deactivate_user(
 @exception_handler
 async def reactivate_user(
     user_id: str,
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_principal)],
     db: AsyncSession = Depends(get_db),
 ) -> JSONResponse:
     """
@@ -365,6 +367,7 @@ async def reactivate_user(
     user.is_deleted = False
     await db.commit()
     await db.refresh(user)
+    user_principal_cache.invalidate(user.user_id)
 
     return api_response(
         status_code=status.HTTP_200_OK,
@@ -376,7 +379,7 @@ async def reactivate_user(
 @exception_handler
 async def hard_delete_user(
     user_id: str,
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_principal)],
     db: AsyncSession = Depends(get_db),
 ) -> JSONResponse:
     """
@@ -396,6 +399,7 @@ async def hard_delete_user(
 
     await db.delete(user)
     await db.commit()
+    user_principal_cache.invalidate(user_id)
 
     return api_response(
         status_code=status.HTTP_200_OK,
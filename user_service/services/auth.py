@@ -16,7 +16,8 @@ from shared.constants import (
 from shared.core.api_response import api_response
 from shared.core.config import PRIVATE_KEY, settings
 from shared.db.models import User, UserDeviceSession
-from user_service.utils.auth import create_jwt_token, verify_password
+from shared.utils.password_hashing import password_hasher
+from user_service.utils.auth import create_jwt_token
 
 
 async def check_account_lock(
@@ -43,7 +44,10 @@ async def check_account_lock(
 async def check_password(
     user: User, password: str, db: AsyncSession
 ) -> JSONResponse | None:
-    if not verify_password(password, user.password_hash):
+    verified, new_hash = await password_hasher.verify_and_update(
+        password, user.password_hash
+    )
+    if not verified:
         user.failure_login_attempts += 1
         await db.commit()
 
@@ -70,6 +74,10 @@ async def check_password(
             log_error=True,
         )
 
+    if new_hash:
+        # Stored with an outdated bcrypt cost (BCRYPT_ROUNDS changed)
+        user.password_hash = new_hash
+        await db.commit()
     return None
 
 
@@ -1,7 +1,7 @@
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
-from fastapi import Request
+from fastapi import BackgroundTasks, Request
 from sqlalchemy import desc, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -13,6 +13,7 @@ from shared.utils.device_info import (
     DeviceSessionManager,
     LocationService,
 )
+from shared.utils.session_activity import user_session_activity
 from user_service.utils.auth import create_jwt_token
 
 logger = get_logger(__name__)
@@ -32,6 +33,7 @@ class SessionManager:
         request: Request,
         db: AsyncSession,
         include_location: bool = True,
+        background_tasks: Optional[BackgroundTasks] = None,
     ) -> UserDeviceSession:
         """
         Create a new device session with comprehensive device information.
@@ -42,6 +44,8 @@ class SessionManager:
             request: FastAPI request object
             db: Database session
             include_location: Whether to fetch location information
+            background_tasks: With GEOIP_ENRICH_IN_BACKGROUND, location is
+                filled in by a task added here, after the response
 
         Returns:
             UserDeviceSession: The created or reused session
@@ -80,7 +84,13 @@ class SessionManager:
 
         # Get location information if requested
         location_info = None
-        if include_location and ip_address:
+        enrich_later = (
+            include_location
+            and ip_address
+            and background_tasks is not None
+            and settings.GEOIP_ENRICH_IN_BACKGROUND
+        )
+        if include_location and ip_address and not enrich_later:
             location_info = await LocationService.get_location_from_ip(
                 ip_address
             )
@@ -124,29 +134,23 @@ class SessionManager:
 
         # Add location information if available
         if location_info:
-            city = location_info.get("city", "")
-            country = location_info.get("country", "")
-            session.location = f"{city}, {country}"
-            session.country = location_info.get("country")
-            session.country_code = location_info.get("country_code")
-            session.city = location_info.get("city")
-            session.latitude = (
-                str(location_info.get("latitude"))
-                if location_info.get("latitude")
-                else None
-            )
-            session.longitude = (
-                str(location_info.get("longitude"))
-                if location_info.get("longitude")
-                else None
-            )
-            session.timezone = location_info.get("timezone")
-            session.isp = location_info.get("isp")
+            for column, value in LocationService.location_columns(
+                location_info
+            ).items():
+                setattr(session, column, value)
 
         db.add(session)
         await db.commit()
         await db.refresh(session)
 
+        if enrich_later:
+            background_tasks.add_task(
+                LocationService.enrich_session_location,
+                UserDeviceSession,
+                session.session_id,
+                ip_address,
+            )
+
         logger.info(
             f"Created new session {session.session_id} for user {user.user_id}"
         )
@@ -226,6 +230,7 @@ class SessionManager:
                     session.is_active = False
                     session.logged_out_at = datetime.now(timezone.utc)
                     await db.commit()
+                    user_session_activity.invalidate([session_id])
                     logger.info(
                         f"Terminated session {session_id} (reason: {reason})"
                     )
@@ -281,6 +286,7 @@ class SessionManager:
 
             if terminated_count > 0:
                 await db.commit()
+                user_session_activity.invalidate(s.session_id for s in sessions)
                 logger.info(
                     f"Terminated {terminated_count} sessions for user {user_id}"
                 )
@@ -485,6 +491,9 @@ class SessionManager:
             session.logged_out_at = logout_time
 
         await db.commit()
+        user_session_activity.invalidate(
+            s.session_id for s in sessions_to_terminate
+        )
 
         logger.info(
             f"Cleaned up {len(sessions_to_terminate)} old sessions for user {user_id}"
@@ -553,22 +562,21 @@ class TokenSessionManager:
             return True, None  # No session validation needed for older tokens
 
         try:
-            # Check if session exists and is active
-            stmt = select(UserDeviceSession).where(
-                UserDeviceSession.session_id == session_id,
-                UserDeviceSession.user_id == user_id,
-                UserDeviceSession.is_active.is_(True),
-            )
-
-            result = await db.execute(stmt)
-            session = result.scalar_one_or_none()
+            # Check if session exists and is active, unless recently seen
+            if not user_session_activity.is_active(session_id, user_id):
+                stmt = select(UserDeviceSession.session_id).where(
+                    UserDeviceSession.session_id == session_id,
+                    UserDeviceSession.user_id == user_id,
+                    UserDeviceSession.is_active.is_(True),
+                )
 
-            if not session:
-                return False, "Session no longer active"
+                result = await db.execute(stmt)
+                if result.scalar_one_or_none() is None:
+                    return False, "Session no longer active"
+                user_session_activity.mark_active(session_id, user_id)
 
-            # Update last used time
-            session.last_used_at = datetime.now(timezone.utc)
-            await db.commit()
+            # last_used_at is written by the next batched flush
+            user_session_activity.touch(session_id)
 
             return True, None
 